@@ -69,6 +69,28 @@ langfuse_default_tags: Optional[List[str]] = None
 langsmith_batch_size: Optional[int] = None
 argilla_batch_size: Optional[int] = None
 argilla_transformation_object: Optional[Dict[str, Any]] = None
+batch_logging_json_backend: Literal["json", "orjson"] = "json"
+batch_logging_encode_workers: int = 2
+batch_logging_max_queue_size: int = 10000
+batch_logging_overflow_policy: Literal[
+    "drop_oldest", "drop_newest", "sample", "spill_to_disk"
+] = "drop_oldest"
+batch_logging_max_in_flight_flushes: int = 1
+batch_logging_max_flush_retries: int = 2
+logging_worker_count: int = 16  # threads running sync logging callbacks
+logging_worker_max_queue_size: int = 10000
+logging_worker_overflow_policy: Literal["drop_oldest", "drop_newest", "block"] = (
+    "drop_oldest"
+)
+logging_worker_batch_size: int = 32
+prometheus_label_profiles: Optional[Dict[str, List[str]]] = (
+    None  # metric name -> labels to emit for that metric
+)
+prometheus_label_cardinality_limits: Optional[Dict[str, int]] = (
+    None  # label -> max distinct values, values above it are emitted as "__other__"
+)
+prometheus_series_ttl_seconds: Optional[float] = None
+prometheus_max_series_per_metric: Optional[int] = None
 _async_input_callback: List[Callable] = (
     []
 )  # internal variable - async custom callbacks are routed here.
@@ -297,6 +319,19 @@ module_level_aclient = AsyncHTTPHandler(
     timeout=request_timeout, client_alias="module level aclient"
 )
 module_level_client = HTTPHandler(timeout=request_timeout)
+connection_pool_http2: bool = False  # multiplex provider requests over HTTP/2 connections, requires `h2`
+connection_pool_limits: Optional[Dict[str, Dict[str, Any]]] = (
+    None  # per provider connection pool limits, e.g. {"openai": {"max_connections": 200}}
+)
+connection_pool_idle_ttl: float = (
+    3600  # seconds an unused provider connection pool is kept open
+)
+image_url_cache_max_size_bytes: int = 50 * 1024 * 1024  # max total size of downloaded images kept in memory
+image_url_cache_ttl: float = 300  # seconds before a cached image url is revalidated
+image_url_prefetch_max_concurrency: int = 10  # max concurrent image downloads per request
+pass_through_raw_logging_max_bytes: int = (
+    64 * 1024  # bytes of a raw pass-through response kept for logging
+)
 
 #### RETRIES ####
 num_retries: Optional[int] = None  # per model endpoint
@@ -310,6 +345,9 @@ num_retries_per_request: Optional[int] = (
     None  # for the request overall (incl. fallbacks + model retries)
 )
 ####### SECRET MANAGERS #####################
+secret_manager_cache_ttl: Optional[Dict[str, float]] = (
+    None  # seconds secrets are cached for, per key manager / oidc provider e.g. {"azure_key_vault": 600}
+)
 secret_manager_client: Optional[Any] = (
     None  # list of instantiated key management clients - e.g. azure kv, infisical, etc.
 )
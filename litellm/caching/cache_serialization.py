@@ -0,0 +1,139 @@
+"""
+Binary envelope for cached LLM responses
+
+The default ("json") format stores `{"timestamp", "response": <model_dump_json() string>}`, which backends json-encode again,
+so every write double-encodes the response and every hit double-decodes it.
+
+The "binary" format stores the same `{"timestamp", "response": <dict>}` as a single msgpack payload:
+
+    | magic (3 bytes) | version (1 byte) | codec (1 byte) | msgpack payload (optionally compressed) |
+
+- embedding vectors are stored as packed float32 arrays, instead of lists of floats
+- payloads larger than `compression_threshold_bytes` are zstd compressed (zlib, if `zstandard` is not installed)
+- values without the magic prefix are returned as-is, so entries written in the json format are still readable
+
+Requires the `msgpack` package.
+"""
+
+import sys
+import zlib
+from array import array
+from typing import Any, Optional
+
+CACHE_ENVELOPE_MAGIC = b"\x00LC"
+CACHE_ENVELOPE_VERSION = 1
+_CACHE_ENVELOPE_HEADER_SIZE = len(CACHE_ENVELOPE_MAGIC) + 2
+
+_CODEC_NONE = 0
+_CODEC_ZSTD = 1
+_CODEC_ZLIB = 2
+
+# msgpack ext type for a packed float32 (little endian) embedding vector
+_FLOAT32_ARRAY_EXT_TYPE = 1
+
+
+def is_cache_envelope(value: Any) -> bool:
+    return isinstance(value, (bytes, bytearray)) and bytes(
+        value[: len(CACHE_ENVELOPE_MAGIC)]
+    ) == bytes(CACHE_ENVELOPE_MAGIC)
+
+
+def encode_cache_envelope(
+    cached_data: dict, compression_threshold_bytes: Optional[int] = None
+) -> bytes:
+    """
+    Encodes `{"timestamp", "response"}` into a binary cache envelope
+
+    Args:
+        cached_data: dict with the response to cache, `response` must be json-compatible (e.g. `model_dump(mode="json")`)
+        compression_threshold_bytes: compress payloads larger than this. None disables compression
+    """
+    import msgpack
+
+    payload: bytes = msgpack.packb(
+        _pack_embeddings(cached_data), use_bin_type=True
+    )  # type: ignore
+    codec = _CODEC_NONE
+    if (
+        compression_threshold_bytes is not None
+        and len(payload) > compression_threshold_bytes
+    ):
+        try:
+            import zstandard
+
+            payload = zstandard.ZstdCompressor().compress(payload)
+            codec = _CODEC_ZSTD
+        except ImportError:
+            payload = zlib.compress(payload)
+            codec = _CODEC_ZLIB
+    return CACHE_ENVELOPE_MAGIC + bytes([CACHE_ENVELOPE_VERSION, codec]) + payload
+
+
+def decode_cache_envelope(value: bytes) -> Optional[dict]:
+    """
+    Decodes a binary cache envelope, returns None if the envelope version is not supported
+    """
+    import msgpack
+
+    version = value[len(CACHE_ENVELOPE_MAGIC)]
+    if version != CACHE_ENVELOPE_VERSION:
+        return None
+    codec = value[len(CACHE_ENVELOPE_MAGIC) + 1]
+    payload = bytes(value[_CACHE_ENVELOPE_HEADER_SIZE:])
+    if codec == _CODEC_ZSTD:
+        import zstandard
+
+        payload = zstandard.ZstdDecompressor().decompress(payload)
+    elif codec == _CODEC_ZLIB:
+        payload = zlib.decompress(payload)
+    return msgpack.unpackb(payload, raw=False, ext_hook=_unpack_ext)
+
+
+def _pack_float32_array(values: list) -> Any:
+    import msgpack
+
+    packed = array("f", values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return msgpack.ExtType(_FLOAT32_ARRAY_EXT_TYPE, packed.tobytes())
+
+
+def _unpack_ext(code: int, data: bytes) -> Any:
+    import msgpack
+
+    if code == _FLOAT32_ARRAY_EXT_TYPE:
+        unpacked = array("f")
+        unpacked.frombytes(data)
+        if sys.byteorder == "big":
+            unpacked.byteswap()
+        return unpacked.tolist()
+    return msgpack.ExtType(code, data)
+
+
+def _is_float_list(value: Any) -> bool:
+    return (
+        isinstance(value, list)
+        and len(value) > 0
+        and all(isinstance(v, float) for v in value)
+    )
+
+
+def _pack_embeddings(obj: Any) -> Any:
+    """
+    Replaces embedding vectors with packed float32 arrays.
+
+    Handles a cached EmbeddingResponse (`{"data": [{"embedding": [...]}]}`) and a single cached Embedding (`{"embedding": [...]}`)
+    """
+    if not isinstance(obj, dict):
+        return obj
+    if _is_float_list(obj.get("embedding")):
+        return {**obj, "embedding": _pack_float32_array(obj["embedding"])}
+    packed = {}
+    for key, value in obj.items():
+        if key in ("response", "data"):
+            if isinstance(value, list):
+                value = [_pack_embeddings(item) for item in value]
+            else:
+                value = _pack_embeddings(value)
+        packed[key] = value
+    return packed
@@ -40,12 +40,19 @@ from litellm.types.rerank import RerankRequest
 from litellm.types.utils import all_litellm_params
 
 from .base_cache import BaseCache
+from .cache_serialization import (
+    decode_cache_envelope,
+    encode_cache_envelope,
+    is_cache_envelope,
+)
 from .disk_cache import DiskCache
 from .dual_cache import DualCache
 from .in_memory_cache import InMemoryCache
+from .local_semantic_cache import LocalSemanticCache
 from .qdrant_semantic_cache import QdrantSemanticCache
 from .redis_cache import RedisCache
 from .redis_semantic_cache import RedisSemanticCache
+from .request_coalescer import RequestCoalescer
 from .s3_cache import S3Cache
 
 
@@ -113,13 +120,20 @@ class Cache:
         qdrant_collection_name: Optional[str] = None,
         qdrant_quantization_config: Optional[str] = None,
         qdrant_semantic_cache_embedding_model="text-embedding-ada-002",
+        local_semantic_cache_embedding_model="text-embedding-ada-002",
+        local_semantic_cache_max_size: int = 10000,
+        local_semantic_cache_persist_dir: Optional[str] = None,
+        serialization_format: CacheSerializationFormat = "json",
+        compression_threshold_bytes: Optional[int] = None,
+        request_coalescing: bool = False,
+        request_coalescing_timeout: float = 60,
         **kwargs,
     ):
         """
         Initializes the cache based on the given type.
 
         Args:
-            type (str, optional): The type of cache to initialize. Can be "local", "redis", "redis-semantic", "qdrant-semantic", "s3" or "disk". Defaults to "local".
+            type (str, optional): The type of cache to initialize. Can be "local", "redis", "redis-semantic", "qdrant-semantic", "local-semantic", "s3" or "disk". Defaults to "local".
 
             # Redis Cache Args
             host (str, optional): The host address for the Redis cache. Required if type is "redis".
@@ -134,7 +148,12 @@ class Cache:
             qdrant_api_base (str, optional): The url for your qdrant cluster. Required if type is "qdrant-semantic".
             qdrant_api_key (str, optional): The api_key for the local or cloud qdrant cluster.
             qdrant_collection_name (str, optional): The name for your qdrant collection. Required if type is "qdrant-semantic".
-            similarity_threshold (float, optional): The similarity threshold for semantic-caching, Required if type is "redis-semantic" or "qdrant-semantic".
+            similarity_threshold (float, optional): The similarity threshold for semantic-caching, Required if type is "redis-semantic", "qdrant-semantic" or "local-semantic".
+
+            # Local Semantic Cache Args
+            local_semantic_cache_embedding_model (str, optional): The model used to embed prompts. Defaults to "text-embedding-ada-002".
+            local_semantic_cache_max_size (int, optional): The max number of cached responses, least recently used responses are evicted first. Defaults to 10000.
+            local_semantic_cache_persist_dir (str, optional): The directory to persist the index to. Defaults to None (in-memory only).
 
             # Disk Cache Args
             disk_cache_dir (str, optional): The directory for the disk cache. Defaults to None.
@@ -153,6 +172,10 @@ class Cache:
 
             # Common Cache Args
             supported_call_types (list, optional): List of call types to cache for. Defaults to cache == on for all call types.
+            serialization_format (str, optional): How responses are stored - "json" or "binary" (msgpack, requires the `msgpack` package). Defaults to "json". Only used for "local", "redis", "s3" and "disk" caches.
+            compression_threshold_bytes (int, optional): Compress "binary" cache entries larger than this many bytes. Defaults to None (no compression).
+            request_coalescing (bool, optional): Identical concurrent requests that miss the cache wait for the first request and are served from the cache. Coordinated across instances for "redis" caches. Defaults to False.
+            request_coalescing_timeout (float, optional): Max seconds a coalesced request waits for the first request. Defaults to 60.
             **kwargs: Additional keyword arguments for redis.Redis() cache
 
         Raises:
@@ -189,6 +212,13 @@ class Cache:
                 quantization_config=qdrant_quantization_config,
                 embedding_model=qdrant_semantic_cache_embedding_model,
             )
+        elif type == LiteLLMCacheType.LOCAL_SEMANTIC:
+            self.cache = LocalSemanticCache(
+                similarity_threshold=similarity_threshold,
+                embedding_model=local_semantic_cache_embedding_model,
+                max_size=local_semantic_cache_max_size,
+                persist_dir=local_semantic_cache_persist_dir,
+            )
         elif type == LiteLLMCacheType.LOCAL:
             self.cache = InMemoryCache()
         elif type == LiteLLMCacheType.S3:
@@ -220,6 +250,16 @@ class Cache:
         self.redis_flush_size = redis_flush_size
         self.ttl = ttl
         self.mode: CacheMode = mode or CacheMode.default_on
+        self.serialization_format: CacheSerializationFormat = serialization_format
+        self.compression_threshold_bytes = compression_threshold_bytes
+        self.request_coalescer: Optional[RequestCoalescer] = None
+        if request_coalescing is True:
+            self.request_coalescer = RequestCoalescer(
+                redis_cache=self.cache if isinstance(self.cache, RedisCache) else None,
+                wait_timeout=request_coalescing_timeout,
+            )
+        if self._uses_binary_serialization():
+            import msgpack  # noqa: F401 - fail on startup if msgpack is not installed
 
         if self.type == LiteLLMCacheType.LOCAL and default_in_memory_ttl is not None:
             self.ttl = default_in_memory_ttl
@@ -252,22 +292,10 @@ class Cache:
             return preset_cache_key
 
         combined_kwargs = self._get_relevant_args_to_use_for_cache_key()
-        litellm_param_kwargs = all_litellm_params
         for param in kwargs:
-            if param in combined_kwargs:
-                param_value: Optional[str] = self._get_param_value(param, kwargs)
-                if param_value is not None:
-                    cache_key += f"{str(param)}: {str(param_value)}"
-            elif (
-                param not in litellm_param_kwargs
-            ):  # check if user passed in optional param - e.g. top_k
-                if (
-                    litellm.enable_caching_on_provider_specific_optional_params is True
-                ):  # feature flagged for now
-                    if kwargs[param] is None:
-                        continue  # ignore None params
-                    param_value = kwargs[param]
-                    cache_key += f"{str(param)}: {str(param_value)}"
+            cache_key += self._get_cache_key_part(
+                param=param, kwargs=kwargs, combined_kwargs=combined_kwargs
+            )
 
         verbose_logger.debug("\nCreated cache key: %s", cache_key)
         hashed_cache_key = Cache._get_hashed_cache_key(cache_key)
@@ -279,6 +307,71 @@ class Cache:
         )
         return hashed_cache_key
 
+    def get_embedding_cache_keys(self, **kwargs) -> List[str]:
+        """
+        Get the cache key for each element in kwargs["input"], for embedding calls with a list input.
+
+        Returns the same keys as `get_cache_key(**{**kwargs, "input": i})` for each input `i`,
+        but the params shared by all inputs are only stringified + hashed once.
+
+        Args:
+            **kwargs: kwargs to litellm.embedding()
+
+        Returns:
+            List[str]: The cache keys, in the same order as kwargs["input"].
+        """
+        combined_kwargs = self._get_relevant_args_to_use_for_cache_key()
+        key_prefix = ""
+        key_suffix = ""
+        seen_input = False
+        for param in kwargs:
+            if param == "input":
+                seen_input = True
+                continue
+            cache_key_part = self._get_cache_key_part(
+                param=param, kwargs=kwargs, combined_kwargs=combined_kwargs
+            )
+            if seen_input:
+                key_suffix += cache_key_part
+            else:
+                key_prefix += cache_key_part
+
+        # sha256 of `prefix + input + suffix` - hash the shared prefix once, then copy the hash state per input
+        prefix_hash = hashlib.sha256(key_prefix.encode())
+        namespace = kwargs.get("metadata", {}).get("redis_namespace") or self.namespace
+        cache_keys: List[str] = []
+        for _input in kwargs["input"]:
+            input_part = f"input: {str(_input)}" if _input is not None else ""
+            hash_object = prefix_hash.copy()
+            hash_object.update((input_part + key_suffix).encode())
+            hash_hex = hash_object.hexdigest()
+            if namespace:
+                hash_hex = f"{namespace}:{hash_hex}"
+            cache_keys.append(hash_hex)
+        verbose_logger.debug("Created %s embedding cache keys", len(cache_keys))
+        return cache_keys
+
+    def _get_cache_key_part(
+        self, param: str, kwargs: dict, combined_kwargs: Set[str]
+    ) -> str:
+        """
+        Get the part of the cache key for the given param, "" if the param is not part of the cache key
+        """
+        if param in combined_kwargs:
+            param_value: Optional[str] = self._get_param_value(param, kwargs)
+            if param_value is not None:
+                return f"{str(param)}: {str(param_value)}"
+        elif (
+            param not in all_litellm_params
+        ):  # check if user passed in optional param - e.g. top_k
+            if (
+                litellm.enable_caching_on_provider_specific_optional_params is True
+            ):  # feature flagged for now
+                if kwargs[param] is None:
+                    return ""  # ignore None params
+                return f"{str(param)}: {str(kwargs[param])}"
+        return ""
+
     def _get_param_value(
         self,
         param: str,
@@ -489,6 +582,8 @@ class Cache:
         """
         Common get cache logic across sync + async implementations
         """
+        if is_cache_envelope(cached_result):
+            cached_result = decode_cache_envelope(cached_result)
         # Check if a timestamp was stored with the cached response
         if (
             cached_result is not None
@@ -581,6 +676,45 @@ class Cache:
             print_verbose(f"An exception occurred: {traceback.format_exc()}")
             return None
 
+    async def async_batch_get_cache(
+        self, cache_keys: List[str], **kwargs
+    ) -> List[Optional[Any]]:
+        """
+        Async get for a list of cache keys, e.g. the keys for each input of an embedding call.
+
+        Redis reads all keys with a single MGET. Caches without bulk reads fall back to one get per key.
+
+        Returns:
+            List[Optional[Any]]: The cached result for each key, None on a cache miss.
+        """
+        try:
+            if self.should_use_cache(**kwargs) is not True:
+                return [None] * len(cache_keys)
+            cache_control_args = kwargs.get("cache", {})
+            max_age = cache_control_args.get(
+                "s-max-age", cache_control_args.get("s-maxage", float("inf"))
+            )
+            cached_results: List[Optional[Any]]
+            if isinstance(self.cache, RedisCache):
+                key_value_dict = await self.cache.async_batch_get_cache(
+                    key_list=cache_keys,
+                    parent_otel_span=kwargs.get("litellm_parent_otel_span"),
+                )
+                cached_results = [key_value_dict.get(key) for key in cache_keys]
+            elif isinstance(self.cache, (InMemoryCache, DiskCache)):
+                cached_results = await self.cache.async_batch_get_cache(keys=cache_keys)
+            else:
+                return await asyncio.gather(
+                    *[self.async_get_cache(cache_key=key) for key in cache_keys]
+                )
+            return [
+                self._get_cache_logic(cached_result=cached_result, max_age=max_age)
+                for cached_result in cached_results
+            ]
+        except Exception:
+            print_verbose(f"An exception occurred: {traceback.format_exc()}")
+            return [None] * len(cache_keys)
+
     def _add_cache_logic(self, result, **kwargs):
         """
         Common implementation across sync + async add_cache functions
@@ -591,7 +725,10 @@ class Cache:
             else:
                 cache_key = self.get_cache_key(**kwargs)
             if cache_key is not None:
-                if isinstance(result, BaseModel):
+                if self._uses_binary_serialization():
+                    if isinstance(result, BaseModel):
+                        result = result.model_dump(mode="json")
+                elif isinstance(result, BaseModel):
                     result = result.model_dump_json()
 
                 ## DEFAULT TTL ##
@@ -604,7 +741,15 @@ class Cache:
                         if k == "ttl":
                             kwargs["ttl"] = v
 
-                cached_data = {"timestamp": time.time(), "response": result}
+                cached_data: Union[dict, bytes] = {
+                    "timestamp": time.time(),
+                    "response": result,
+                }
+                if self._uses_binary_serialization():
+                    cached_data = encode_cache_envelope(
+                        cached_data=cached_data,  # type: ignore
+                        compression_threshold_bytes=self.compression_threshold_bytes,
+                    )
                 return cache_key, cached_data, kwargs
             else:
                 raise Exception("cache key is None")
@@ -666,9 +811,9 @@ class Cache:
                 kwargs["ttl"] = self.ttl
 
             cache_list = []
-            for idx, i in enumerate(kwargs["input"]):
-                preset_cache_key = self.get_cache_key(**{**kwargs, "input": i})
-                kwargs["cache_key"] = preset_cache_key
+            cache_keys = self.get_embedding_cache_keys(**kwargs)
+            for idx, cache_key in enumerate(cache_keys):
+                kwargs["cache_key"] = cache_key
                 embedding_response = result.data[idx]
                 cache_key, cached_data, kwargs = self._add_cache_logic(
                     result=embedding_response,
@@ -687,6 +832,17 @@ class Cache:
         except Exception as e:
             verbose_logger.exception(f"LiteLLM Cache: Excepton add_cache: {str(e)}")
 
+    def _uses_binary_serialization(self) -> bool:
+        """
+        Semantic caches look up entries by prompt, they always use the json format
+        """
+        return self.serialization_format == "binary" and self.type in (
+            LiteLLMCacheType.LOCAL,
+            LiteLLMCacheType.REDIS,
+            LiteLLMCacheType.S3,
+            LiteLLMCacheType.DISK,
+        )
+
     def should_use_cache(self, **kwargs):
         """
         Returns true if we should use the cache for LLM API calls
@@ -18,11 +18,13 @@ import asyncio
 import datetime
 import inspect
 import threading
+import weakref
 from typing import (
     TYPE_CHECKING,
     Any,
     AsyncGenerator,
     Callable,
+    Coroutine,
     Dict,
     Generator,
     List,
@@ -42,9 +44,11 @@ from litellm.caching.caching import (
     RedisSemanticCache,
     S3Cache,
 )
+from litellm.caching.request_coalescer import RequestCoalescer
 from litellm.litellm_core_utils.logging_utils import (
     _assemble_complete_response_from_streaming_chunks,
 )
+from litellm.litellm_core_utils.logging_worker_pool import logging_worker_pool
 from litellm.types.rerank import RerankResponse
 from litellm.types.utils import (
     CallTypes,
@@ -89,6 +93,9 @@ class LLMCachingHandler:
         self.request_kwargs = request_kwargs
         self.original_function = original_function
         self.start_time = start_time
+        # set if this request is the single-flight leader for its cache key
+        self._single_flight_cache_key: Optional[str] = None
+        self._single_flight_loop: Optional[asyncio.AbstractEventLoop] = None
         pass
 
     async def _async_get_cache(
@@ -286,10 +293,13 @@ class LLMCachingHandler:
                         is_async=False,
                     )
 
-                    threading.Thread(
-                        target=logging_obj.success_handler,
-                        args=(cached_result, start_time, end_time, cache_hit),
-                    ).start()
+                    logging_worker_pool.submit(
+                        logging_obj.success_handler,
+                        cached_result,
+                        start_time,
+                        end_time,
+                        cache_hit,
+                    )
                     cache_key = litellm.cache._get_preset_cache_key_from_kwargs(
                         **kwargs
                     )
@@ -455,10 +465,9 @@ class LLMCachingHandler:
                 cached_result, start_time, end_time, cache_hit
             )
         )
-        threading.Thread(
-            target=logging_obj.success_handler,
-            args=(cached_result, start_time, end_time, cache_hit),
-        ).start()
+        logging_worker_pool.submit(
+            logging_obj.success_handler, cached_result, start_time, end_time, cache_hit
+        )
 
     async def _retrieve_from_cache(
         self, call_type: str, kwargs: Dict[str, Any], args: Tuple[Any, ...]
@@ -494,25 +503,120 @@ class LLMCachingHandler:
         if call_type == CallTypes.aembedding.value and isinstance(
             new_kwargs["input"], list
         ):
-            tasks = []
-            for idx, i in enumerate(new_kwargs["input"]):
-                preset_cache_key = litellm.cache.get_cache_key(
-                    **{**new_kwargs, "input": i}
-                )
-                tasks.append(litellm.cache.async_get_cache(cache_key=preset_cache_key))
-            cached_result = await asyncio.gather(*tasks)
+            cache_keys = litellm.cache.get_embedding_cache_keys(**new_kwargs)
+            cached_result = await litellm.cache.async_batch_get_cache(
+                cache_keys=cache_keys, **new_kwargs
+            )
             ## check if cached result is None ##
             if cached_result is not None and isinstance(cached_result, list):
                 # set cached_result to None if all elements are None
                 if all(result is None for result in cached_result):
                     cached_result = None
         else:
-            if litellm.cache._supports_async() is True:
-                cached_result = await litellm.cache.async_get_cache(**new_kwargs)
-            else:  # for s3 caching. [NOT RECOMMENDED IN PROD - this will slow down responses since boto3 is sync]
-                cached_result = litellm.cache.get_cache(**new_kwargs)
+            cached_result = await self._async_get_cache_result(new_kwargs)
+            if cached_result is None and self._should_coalesce_request(new_kwargs):
+                cached_result = await self._async_coalesce_request(new_kwargs)
         return cached_result
 
+    async def _async_get_cache_result(
+        self, new_kwargs: Dict[str, Any]
+    ) -> Optional[Any]:
+        if litellm.cache is None:
+            return None
+        if litellm.cache._supports_async() is True:
+            return await litellm.cache.async_get_cache(**new_kwargs)
+        else:  # for s3 caching. [NOT RECOMMENDED IN PROD - this will slow down responses since boto3 is sync]
+            return litellm.cache.get_cache(**new_kwargs)
+
+    def _should_coalesce_request(self, new_kwargs: Dict[str, Any]) -> bool:
+        """
+        Only coalesce requests whose response will be written to the cache
+        """
+        return (
+            litellm.cache is not None
+            and isinstance(litellm.cache.request_coalescer, RequestCoalescer)
+            and litellm.cache.should_use_cache(**new_kwargs) is True
+            and (new_kwargs.get("cache") or {}).get("no-store", False) is not True
+        )
+
+    async def _async_coalesce_request(
+        self, new_kwargs: Dict[str, Any]
+    ) -> Optional[Any]:
+        """
+        Single-flight for identical in-flight requests
+
+        - the first request for a cache key becomes the leader and calls the provider, returns None
+        - other requests wait for the leader to cache its response, and return the cached response
+        """
+        if litellm.cache is None or litellm.cache.request_coalescer is None:
+            return None
+        cache_key = litellm.cache.get_cache_key(**new_kwargs)
+        is_leader = await litellm.cache.request_coalescer.async_acquire(cache_key)
+        if is_leader:
+            self._single_flight_cache_key = cache_key
+            self._single_flight_loop = asyncio.get_running_loop()
+            return None
+        verbose_logger.debug("Coalesced request served from cache: %s", cache_key)
+        return await self._async_get_cache_result(new_kwargs)
+
+    async def _async_release_single_flight(
+        self, cache_key: Optional[str] = None
+    ) -> None:
+        """
+        Called once the leader's response is in the cache, or the leader's call failed
+        """
+        if cache_key is None:
+            cache_key = self._single_flight_cache_key
+            self._single_flight_cache_key = None
+        if cache_key is None:
+            return
+        if litellm.cache is not None and litellm.cache.request_coalescer is not None:
+            await litellm.cache.request_coalescer.async_release(cache_key)
+
+    def _release_single_flight_threadsafe(self) -> None:
+        """
+        Releases waiting requests from any thread, e.g. a sync stream's worker thread or a finalizer
+        """
+        loop = self._single_flight_loop
+        if self._single_flight_cache_key is None or loop is None or loop.is_closed():
+            return
+        asyncio.run_coroutine_threadsafe(self._async_release_single_flight(), loop)
+
+    def _release_single_flight_when_stream_ends(self, stream: Any) -> None:
+        """
+        A streaming leader releases waiting requests once its complete response is cached.
+
+        If the stream fails, ends without a complete response, or is dropped by the caller before it ends,
+        waiting requests are released then - so they don't wait for `request_coalescing_timeout`.
+        """
+        if self._single_flight_cache_key is None:
+            return
+        finalizer = weakref.finalize(stream, self._release_single_flight_threadsafe)
+        finalizer.atexit = False
+
+    async def _async_add_cache_and_release_single_flight(
+        self, add_cache_coro: Coroutine, cache_key: Optional[str]
+    ) -> None:
+        try:
+            await add_cache_coro
+        finally:
+            await self._async_release_single_flight(cache_key=cache_key)
+
+    def _create_add_cache_task(self, add_cache_coro: Coroutine) -> None:
+        """
+        Writes to the cache in the background. If this request is the single-flight leader, waiting requests are released once the write is done
+        """
+        cache_key = self._single_flight_cache_key
+        self._single_flight_cache_key = None
+        if cache_key is None:
+            asyncio.create_task(add_cache_coro)
+        else:
+            asyncio.create_task(
+                self._async_add_cache_and_release_single_flight(
+                    add_cache_coro, cache_key=cache_key
+                )
+            )
+
     def _convert_cached_result_to_model_response(
         self,
         cached_result: Any,
@@ -709,7 +813,7 @@ class LLMCachingHandler:
                         litellm.cache.cache, S3Cache
                     )  # s3 doesn't support bulk writing. Exclude.
                 ):
-                    asyncio.create_task(
+                    self._create_add_cache_task(
                         litellm.cache.async_add_cache_pipeline(result, **new_kwargs)
                     )
                 elif isinstance(litellm.cache.cache, S3Cache):
@@ -719,13 +823,15 @@ class LLMCachingHandler:
                         kwargs=new_kwargs,
                     ).start()
                 else:
-                    asyncio.create_task(
-                        litellm.cache.async_add_cache(
-                            result.model_dump_json(), **new_kwargs
-                        )
+                    self._create_add_cache_task(
+                        litellm.cache.async_add_cache(result, **new_kwargs)
                     )
             else:
-                asyncio.create_task(litellm.cache.async_add_cache(result, **new_kwargs))
+                self._create_add_cache_task(
+                    litellm.cache.async_add_cache(result, **new_kwargs)
+                )
+        # response is not written to the cache in the background, release waiting requests now
+        await self._async_release_single_flight()
 
     def sync_set_cache(
         self,
@@ -840,6 +946,8 @@ class LLMCachingHandler:
                 result=complete_streaming_response,
                 kwargs=self.request_kwargs,
             )
+            # sync streams are consumed in a worker thread, release waiting requests on the request's event loop
+            self._release_single_flight_threadsafe()
 
     def _update_litellm_logging_obj_environment(
         self,
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Any, Optional
 from litellm._logging import print_verbose
 
 from .base_cache import BaseCache
+from .cache_serialization import is_cache_envelope
 
 if TYPE_CHECKING:
     from opentelemetry.trace import Span as _Span
@@ -42,6 +43,8 @@ class DiskCache(BaseCache):
     def get_cache(self, key, **kwargs):
         original_cached_response = self.disk_cache.get(key)
         if original_cached_response:
+            if is_cache_envelope(original_cached_response):
+                return original_cached_response
             try:
                 cached_response = json.loads(original_cached_response)  # type: ignore
             except Exception:
@@ -13,6 +13,7 @@ import time
 from typing import List, Optional
 
 from .base_cache import BaseCache
+from .cache_serialization import is_cache_envelope
 
 
 class InMemoryCache(BaseCache):
@@ -96,6 +97,8 @@ class InMemoryCache(BaseCache):
                     self.cache_dict.pop(key, None)
                     return None
             original_cached_response = self.cache_dict[key]
+            if is_cache_envelope(original_cached_response):
+                return original_cached_response
             try:
                 cached_response = json.loads(original_cached_response)
             except Exception:
@@ -0,0 +1,433 @@
+"""
+In-process Semantic Cache implementation
+
+Semantic cache backed by an in-memory NumPy vector index - no vector database required.
+
+- cosine similarity search over normalized float32 vectors
+- bounded to `max_size` entries, the least recently used entry is evicted first
+- optional persistence - vectors are stored in a mmap'd `.npy` file and responses in an append-only `.jsonl` file in `persist_dir`
+  - the mmap is flushed to disk by a background timer, at most once every `VECTORS_FLUSH_INTERVAL_SECONDS`
+  - the `.jsonl` file is compacted once it holds more than `2 * max_size` overwritten lines
+- on a cache miss, the prompt embedding computed for the lookup is reused when the response is stored, so each miss costs 1 embedding call
+
+Has 4 methods:
+    - set_cache
+    - get_cache
+    - async_set_cache
+    - async_get_cache
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import litellm
+from litellm._logging import print_verbose, verbose_logger
+
+from .base_cache import BaseCache
+
+# max number of prompt embeddings kept between a cache miss and storing the response
+MAX_PENDING_EMBEDDINGS = 1000
+VECTORS_FILE_NAME = "vectors.npy"
+PAYLOADS_FILE_NAME = "payloads.jsonl"
+VECTORS_FLUSH_INTERVAL_SECONDS = 5.0
+
+
+class LocalSemanticCache(BaseCache):
+    def __init__(
+        self,
+        similarity_threshold: Optional[float] = None,
+        embedding_model: str = "text-embedding-ada-002",
+        max_size: int = 10000,
+        persist_dir: Optional[str] = None,
+        default_ttl: Optional[int] = None,
+    ):
+        """
+        Args:
+            similarity_threshold: min cosine similarity for a cache hit
+            embedding_model: model used to embed prompts
+            max_size: max number of cached responses, the least recently used response is evicted first
+            persist_dir: directory to persist the index to. None keeps the index in memory only
+            default_ttl: seconds a response stays cached. None caches responses until they are evicted
+        """
+        if similarity_threshold is None:
+            raise Exception("similarity_threshold must be provided, passed None")
+        self.similarity_threshold = similarity_threshold
+        self.embedding_model = embedding_model
+        self.max_size = max_size
+        self.persist_dir = persist_dir
+        self.default_ttl = default_ttl  # type: ignore
+
+        self._lock = threading.Lock()
+        # set on the first insert, once the embedding dimension is known
+        self._vectors: Any = None
+        self._payloads: List[Optional[Dict[str, Any]]] = [None] * max_size
+        self._last_used: Any = None
+        self._expires_at: Any = None
+        self._num_entries = 0
+        # number of lines in the payloads file, including lines overwritten by a later line for the same slot
+        self._num_payload_lines = 0
+        self._flush_timer: Optional[threading.Timer] = None
+        # cache key -> prompt embedding, for prompts that missed the cache
+        self._pending_embeddings: "OrderedDict[str, List[float]]" = OrderedDict()
+
+        if self.persist_dir is not None:
+            self._load_persisted_index()
+
+    def _get_prompt(self, **kwargs) -> str:
+        messages = kwargs["messages"]
+        prompt = ""
+        for message in messages:
+            content = message.get("content")
+            if isinstance(content, str):
+                prompt += content
+            elif content is not None:
+                prompt += json.dumps(content)
+        return prompt
+
+    def _get_ttl_for_entry(self, **kwargs) -> Optional[float]:
+        ttl = kwargs.get("ttl", self.default_ttl)
+        if ttl is None:
+            return None
+        return float(ttl)
+
+    def _add_pending_embedding(self, key: str, embedding: List[float]) -> None:
+        with self._lock:
+            self._pending_embeddings[key] = embedding
+            self._pending_embeddings.move_to_end(key)
+            while len(self._pending_embeddings) > MAX_PENDING_EMBEDDINGS:
+                self._pending_embeddings.popitem(last=False)
+
+    def _pop_pending_embedding(self, key: str) -> Optional[List[float]]:
+        with self._lock:
+            return self._pending_embeddings.pop(key, None)
+
+    def _get_embedding(self, prompt: str) -> List[float]:
+        embedding_response = litellm.embedding(
+            model=self.embedding_model,
+            input=prompt,
+            cache={"no-store": True, "no-cache": True},
+        )
+        return embedding_response["data"][0]["embedding"]
+
+    async def _async_get_embedding(self, prompt: str, **kwargs) -> List[float]:
+        from litellm.proxy.proxy_server import llm_model_list, llm_router
+
+        router_model_names = (
+            [m["model_name"] for m in llm_model_list]
+            if llm_model_list is not None
+            else []
+        )
+        if llm_router is not None and self.embedding_model in router_model_names:
+            user_api_key = kwargs.get("metadata", {}).get("user_api_key", "")
+            embedding_response = await llm_router.aembedding(
+                model=self.embedding_model,
+                input=prompt,
+                cache={"no-store": True, "no-cache": True},
+                metadata={
+                    "user_api_key": user_api_key,
+                    "semantic-cache-embedding": True,
+                    "trace_id": kwargs.get("metadata", {}).get("trace_id", None),
+                },
+            )
+        else:
+            embedding_response = await litellm.aembedding(
+                model=self.embedding_model,
+                input=prompt,
+                cache={"no-store": True, "no-cache": True},
+            )
+        return embedding_response["data"][0]["embedding"]
+
+    ### INDEX ###
+
+    def _normalize(self, embedding: List[float]) -> Any:
+        import numpy as np
+
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector = vector / norm
+        return vector
+
+    def _init_index(self, dimensions: int) -> None:
+        import numpy as np
+
+        if self.persist_dir is not None:
+            os.makedirs(self.persist_dir, exist_ok=True)
+            self._vectors = np.lib.format.open_memmap(
+                os.path.join(self.persist_dir, VECTORS_FILE_NAME),
+                mode="w+",
+                dtype=np.float32,
+                shape=(self.max_size, dimensions),
+            )
+        else:
+            self._vectors = np.zeros((self.max_size, dimensions), dtype=np.float32)
+        self._last_used = np.full(self.max_size, -np.inf)
+        self._expires_at = np.full(self.max_size, np.inf)
+
+    def _get_slot_for_new_entry(self, now: float) -> int:
+        import numpy as np
+
+        if self._num_entries < self.max_size:
+            slot = self._num_entries
+            self._num_entries += 1
+            return slot
+        # evict an expired entry, else the least recently used entry
+        expired_slots = np.flatnonzero(self._expires_at <= now)
+        if len(expired_slots) > 0:
+            return int(expired_slots[0])
+        return int(np.argmin(self._last_used))
+
+    def _add_to_index(
+        self, embedding: List[float], payload: Dict[str, Any], ttl: Optional[float]
+    ) -> None:
+        now = time.time()
+        vector = self._normalize(embedding)
+        with self._lock:
+            if self._vectors is None:
+                self._init_index(dimensions=len(vector))
+            if len(vector) != self._vectors.shape[1]:
+                verbose_logger.warning(
+                    "LocalSemanticCache: embedding dimension changed from %s to %s, not caching response",
+                    self._vectors.shape[1],
+                    len(vector),
+                )
+                return
+            slot = self._get_slot_for_new_entry(now=now)
+            self._vectors[slot] = vector
+            self._payloads[slot] = payload
+            self._last_used[slot] = now
+            self._expires_at[slot] = now + ttl if ttl is not None else float("inf")
+            if self.persist_dir is not None:
+                self._persist_entry(slot=slot)
+
+    def _search_index(
+        self, embedding: List[float]
+    ) -> Tuple[float, Optional[Dict[str, Any]]]:
+        """
+        Returns the cosine similarity + payload of the closest non-expired entry
+
+        The payload is read while holding the lock, so a concurrent insert can't reuse the slot in between.
+        On a cache hit the entry is marked as recently used.
+        """
+        import numpy as np
+
+        vector = self._normalize(embedding)
+        with self._lock:
+            if self._vectors is None or self._num_entries == 0:
+                return 0.0, None
+            if len(vector) != self._vectors.shape[1]:
+                return 0.0, None
+            similarities = self._vectors[: self._num_entries] @ vector
+            similarities[self._expires_at[: self._num_entries] <= time.time()] = -np.inf
+            slot = int(np.argmax(similarities))
+            similarity = float(similarities[slot])
+            if similarity == -np.inf:
+                return 0.0, None
+            if similarity >= self.similarity_threshold:
+                self._last_used[slot] = time.time()
+            return similarity, self._payloads[slot]
+
+    def _get_cached_response(self, embedding: List[float], prompt: str, **kwargs):
+        similarity, payload = self._search_index(embedding)
+        # update kwargs["metadata"] with similarity, don't rewrite the original metadata
+        kwargs.setdefault("metadata", {})["semantic-similarity"] = similarity
+        if payload is None:
+            return None
+
+        print_verbose(
+            f"semantic cache: similarity threshold: {self.similarity_threshold}, similarity: {similarity}, prompt: {prompt}, closest_cached_prompt: {payload.get('text')}"
+        )
+        if similarity >= self.similarity_threshold:
+            # cache hit !
+            return payload.get("response")
+        # cache miss !
+        return None
+
+    ### PERSISTENCE ###
+
+    def _get_persisted_entry(self, slot: int) -> Dict[str, Any]:
+        return {
+            "slot": slot,
+            "expires_at": float(self._expires_at[slot]),
+            "payload": self._payloads[slot],
+        }
+
+    def _persist_entry(self, slot: int) -> None:
+        """
+        Appends the payload for `slot` to the payloads file. The last line written for a slot wins on load.
+
+        Called while holding the lock.
+        """
+        payloads_path = os.path.join(self.persist_dir, PAYLOADS_FILE_NAME)  # type: ignore
+        if self._num_payload_lines - self._num_entries >= 2 * self.max_size:
+            # too many overwritten lines, rewrite the file with only the live entries
+            self._write_payloads_file(
+                payloads_path=payloads_path,
+                entries=[
+                    self._get_persisted_entry(slot=s)
+                    for s in range(self._num_entries)
+                    if self._payloads[s] is not None
+                ],
+            )
+        else:
+            with open(payloads_path, "a") as f:
+                f.write(
+                    json.dumps(self._get_persisted_entry(slot=slot), default=str) + "\n"
+                )
+            self._num_payload_lines += 1
+        self._schedule_vectors_flush()
+
+    def _write_payloads_file(
+        self, payloads_path: str, entries: List[Dict[str, Any]]
+    ) -> None:
+        with open(payloads_path, "w") as f:
+            for entry in entries:
+                f.write(json.dumps(entry, default=str) + "\n")
+        self._num_payload_lines = len(entries)
+
+    def _schedule_vectors_flush(self) -> None:
+        """
+        Flushes the mmap'd vectors from a background timer, instead of on every insert.
+
+        Called while holding the lock.
+        """
+        if self._flush_timer is not None:
+            return
+        self._flush_timer = threading.Timer(
+            VECTORS_FLUSH_INTERVAL_SECONDS, self._flush_vectors
+        )
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def _flush_vectors(self) -> None:
+        with self._lock:
+            self._flush_timer = None
+            vectors = self._vectors
+        if vectors is not None and hasattr(vectors, "flush"):
+            vectors.flush()
+
+    def _load_persisted_index(self) -> None:
+        import numpy as np
+
+        vectors_path = os.path.join(self.persist_dir, VECTORS_FILE_NAME)  # type: ignore
+        payloads_path = os.path.join(self.persist_dir, PAYLOADS_FILE_NAME)  # type: ignore
+        if not os.path.exists(vectors_path) or not os.path.exists(payloads_path):
+            return
+        try:
+            vectors = np.load(vectors_path, mmap_mode="r+")
+            if vectors.shape[0] != self.max_size:
+                verbose_logger.warning(
+                    "LocalSemanticCache: persisted index has max_size=%s, expected %s. Ignoring persisted index.",
+                    vectors.shape[0],
+                    self.max_size,
+                )
+                return
+
+            entries: Dict[int, Dict[str, Any]] = {}
+            with open(payloads_path) as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        entries[entry["slot"]] = entry
+        except Exception as e:
+            verbose_logger.warning(
+                "LocalSemanticCache: unable to load persisted index from %s - %s",
+                self.persist_dir,
+                e,
+            )
+            return
+
+        self._vectors = vectors
+        self._last_used = np.full(self.max_size, -np.inf)
+        self._expires_at = np.full(self.max_size, np.inf)
+        # slots are filled in order, so persisted entries are always the first `len(entries)` slots
+        self._num_entries = len(entries)
+        for slot, entry in entries.items():
+            self._payloads[slot] = entry["payload"]
+            self._expires_at[slot] = entry["expires_at"]
+            self._last_used[slot] = 0
+
+        # compact the payloads file, only keep the latest line per slot
+        self._write_payloads_file(
+            payloads_path=payloads_path,
+            entries=[entries[slot] for slot in sorted(entries)],
+        )
+
+    ### CACHE INTERFACE ###
+
+    def set_cache(self, key, value, **kwargs):
+        print_verbose(f"local semantic-cache set_cache, kwargs: {kwargs}")
+        prompt = self._get_prompt(**kwargs)
+        embedding = self._pop_pending_embedding(key) or self._get_embedding(prompt)
+        self._add_to_index(
+            embedding=embedding,
+            payload={"text": prompt, "response": value},
+            ttl=self._get_ttl_for_entry(**kwargs),
+        )
+
+    def get_cache(self, key, **kwargs):
+        print_verbose(f"sync local semantic-cache get_cache, kwargs: {kwargs}")
+        prompt = self._get_prompt(**kwargs)
+        embedding = self._get_embedding(prompt)
+        cached_response = self._get_cached_response(
+            embedding=embedding, prompt=prompt, **kwargs
+        )
+        if cached_response is None:
+            self._add_pending_embedding(key=key, embedding=embedding)
+        return cached_response
+
+    async def async_set_cache(self, key, value, **kwargs):
+        print_verbose(f"async local semantic-cache set_cache, kwargs: {kwargs}")
+        prompt = self._get_prompt(**kwargs)
+        embedding = self._pop_pending_embedding(key) or await self._async_get_embedding(
+            prompt, **kwargs
+        )
+        self._add_to_index(
+            embedding=embedding,
+            payload={"text": prompt, "response": value},
+            ttl=self._get_ttl_for_entry(**kwargs),
+        )
+
+    async def async_get_cache(self, key, **kwargs):
+        print_verbose(f"async local semantic-cache get_cache, kwargs: {kwargs}")
+        prompt = self._get_prompt(**kwargs)
+        embedding = await self._async_get_embedding(prompt, **kwargs)
+        cached_response = self._get_cached_response(
+            embedding=embedding, prompt=prompt, **kwargs
+        )
+        if cached_response is None:
+            self._add_pending_embedding(key=key, embedding=embedding)
+        return cached_response
+
+    async def async_set_cache_pipeline(self, cache_list, **kwargs):
+        tasks = []
+        for val in cache_list:
+            tasks.append(self.async_set_cache(val[0], val[1], **kwargs))
+        await asyncio.gather(*tasks)
+
+    def flush_cache(self):
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._vectors = None
+            self._payloads = [None] * self.max_size
+            self._num_entries = 0
+            self._num_payload_lines = 0
+            self._pending_embeddings.clear()
+        if self.persist_dir is not None:
+            for file_name in (VECTORS_FILE_NAME, PAYLOADS_FILE_NAME):
+                file_path = os.path.join(self.persist_dir, file_name)
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+
+    async def disconnect(self):
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+        self._flush_vectors()
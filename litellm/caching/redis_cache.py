@@ -25,6 +25,7 @@ from litellm.types.services import ServiceLoggerPayload, ServiceTypes
 from litellm.types.utils import all_litellm_params
 
 from .base_cache import BaseCache
+from .cache_serialization import is_cache_envelope
 
 if TYPE_CHECKING:
     from opentelemetry.trace import Span as _Span
@@ -149,7 +150,11 @@ class RedisCache(BaseCache):
         key = self.check_and_fix_namespace(key=key)
         try:
             start_time = time.time()
-            self.redis_client.set(name=key, value=str(value), ex=ttl)
+            self.redis_client.set(
+                name=key,
+                value=value if is_cache_envelope(value) else str(value),
+                ex=ttl,
+            )
             end_time = time.time()
             _duration = end_time - start_time
             self.service_logger_obj.service_success_hook(
@@ -308,7 +313,13 @@ class RedisCache(BaseCache):
                     raise Exception(
                         "Redis client cannot set cache. Attribute not found."
                     )
-                await redis_client.set(name=key, value=json.dumps(value), ex=ttl)
+                nx = kwargs.get("nx", False)
+                set_result = await redis_client.set(
+                    name=key,
+                    value=value if is_cache_envelope(value) else json.dumps(value),
+                    ex=ttl,
+                    nx=nx,
+                )
                 print_verbose(
                     f"Successfully Set ASYNC Redis Cache: key: {key}\nValue {value}\nttl={ttl}"
                 )
@@ -325,6 +336,8 @@ class RedisCache(BaseCache):
                         event_metadata={"key": key},
                     )
                 )
+                # with `nx=True`, False if the key already exists
+                return set_result
             except Exception as e:
                 end_time = time.time()
                 _duration = end_time - start_time
@@ -357,7 +370,11 @@ class RedisCache(BaseCache):
             print_verbose(
                 f"Set ASYNC Redis Cache PIPELINE: key: {cache_key}\nValue {cache_value}\nttl={ttl}"
             )
-            json_cache_value = json.dumps(cache_value)
+            json_cache_value = (
+                cache_value
+                if is_cache_envelope(cache_value)
+                else json.dumps(cache_value)
+            )
             # Set the value with a TTL if it's provided.
             _td: Optional[timedelta] = None
             if ttl is not None:
@@ -599,7 +616,8 @@ class RedisCache(BaseCache):
         """
         Common 'get_cache_logic' across sync + async redis client implementations
         """
-        if cached_response is None:
+        if cached_response is None or is_cache_envelope(cached_response):
+            # binary cache envelopes are decoded by `Cache`
             return cached_response
         # cached_response is in `b{} convert it to ModelResponse
         cached_response = cached_response.decode("utf-8")  # Convert bytes to string
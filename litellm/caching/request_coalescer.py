@@ -0,0 +1,129 @@
+"""
+Request coalescing (single-flight) for identical in-flight cacheable calls
+
+When a burst of identical requests misses the cache, only the first request (the leader) calls the provider.
+The other requests (followers) wait for the leader to write its response to the cache, and are then served from the cache.
+
+- in-process: followers wait on an asyncio.Event for the cache key
+- across instances: if the cache is redis, the leader also holds a redis lock (`SET NX`) for the cache key,
+  followers on other instances poll the lock until it is released
+
+Followers only wait up to `wait_timeout` seconds. If the leader fails, or its response is not cached,
+followers fall through and call the provider themselves.
+"""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from litellm._logging import verbose_logger
+
+if TYPE_CHECKING:
+    from .redis_cache import RedisCache
+else:
+    RedisCache = Any
+
+REQUEST_COALESCING_LOCK_PREFIX = "litellm:single_flight:"
+
+
+class RequestCoalescer:
+    def __init__(
+        self,
+        redis_cache: Optional[RedisCache] = None,
+        wait_timeout: float = 60,
+        poll_interval: float = 0.05,
+    ):
+        """
+        Args:
+            redis_cache: if set, leaders are coordinated across instances with a redis lock
+            wait_timeout: max seconds a follower waits for the leader
+            poll_interval: seconds between checks of the redis lock
+        """
+        self.redis_cache = redis_cache
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        # cache key -> (event set when the leader is done, time the leader started)
+        self._in_flight: Dict[str, Tuple[asyncio.Event, float]] = {}
+
+    def _get_lock_key(self, cache_key: str) -> str:
+        return f"{REQUEST_COALESCING_LOCK_PREFIX}{cache_key}"
+
+    async def async_acquire(self, cache_key: str) -> bool:
+        """
+        Returns True if the caller is the leader for `cache_key` and must call `async_release()` when done.
+
+        Returns False once the in-flight leader is done, the caller should re-check the cache.
+        """
+        in_flight = self._in_flight.get(cache_key)
+        if in_flight is not None and time.time() - in_flight[1] < self.wait_timeout:
+            await self._async_wait_for_event(in_flight[0])
+            return False
+
+        # leader for this process, other requests in this process wait on the event
+        event = asyncio.Event()
+        self._in_flight[cache_key] = (event, time.time())
+        if self.redis_cache is None:
+            return True
+
+        try:
+            is_leader = await self.redis_cache.async_set_cache(
+                self._get_lock_key(cache_key),
+                "1",
+                ttl=int(self.wait_timeout),
+                nx=True,
+            )
+        except Exception as e:
+            verbose_logger.debug(
+                "RequestCoalescer: unable to acquire redis lock, continuing as leader - %s",
+                str(e),
+            )
+            return True
+        if is_leader:
+            return True
+
+        # another instance is the leader
+        await self._async_wait_for_redis_lock(cache_key)
+        self._release_local(cache_key, event)
+        return False
+
+    async def async_release(self, cache_key: str) -> None:
+        """
+        Called by the leader once its response is in the cache (or the call failed)
+        """
+        in_flight = self._in_flight.get(cache_key)
+        if in_flight is not None:
+            self._release_local(cache_key, in_flight[0])
+        if self.redis_cache is not None:
+            try:
+                await self.redis_cache.async_delete_cache(self._get_lock_key(cache_key))
+            except Exception as e:
+                verbose_logger.debug(
+                    "RequestCoalescer: unable to release redis lock - %s", str(e)
+                )
+
+    def _release_local(self, cache_key: str, event: asyncio.Event) -> None:
+        in_flight = self._in_flight.get(cache_key)
+        if in_flight is not None and in_flight[0] is event:
+            self._in_flight.pop(cache_key, None)
+        event.set()
+
+    async def _async_wait_for_event(self, event: asyncio.Event) -> None:
+        try:
+            await asyncio.wait_for(event.wait(), timeout=self.wait_timeout)
+        except asyncio.TimeoutError:
+            verbose_logger.debug(
+                "RequestCoalescer: timed out waiting for in-flight request"
+            )
+
+    async def _async_wait_for_redis_lock(self, cache_key: str) -> None:
+        if self.redis_cache is None:
+            return
+        lock_key = self._get_lock_key(cache_key)
+        deadline = time.time() + self.wait_timeout
+        while time.time() < deadline:
+            if await self.redis_cache.async_get_cache(lock_key) is None:
+                return
+            await asyncio.sleep(self.poll_interval)
+        verbose_logger.debug(
+            "RequestCoalescer: timed out waiting for in-flight request on another instance"
+        )
@@ -19,6 +19,7 @@ from litellm._logging import print_verbose, verbose_logger
 from litellm.types.caching import LiteLLMCacheType
 
 from .base_cache import BaseCache
+from .cache_serialization import is_cache_envelope
 
 
 class S3Cache(BaseCache):
@@ -62,7 +63,12 @@ class S3Cache(BaseCache):
             print_verbose(f"LiteLLM SET Cache - S3. Key={key}. Value={value}")
             ttl = kwargs.get("ttl", None)
             # Convert value to JSON before storing in S3
-            serialized_value = json.dumps(value)
+            if is_cache_envelope(value):
+                serialized_value = value
+                content_type = "application/octet-stream"
+            else:
+                serialized_value = json.dumps(value)
+                content_type = "application/json"
             key = self.key_prefix + key
 
             if ttl is not None:
@@ -79,7 +85,7 @@ class S3Cache(BaseCache):
                     Body=serialized_value,
                     Expires=expiration_time,
                     CacheControl=cache_control,
-                    ContentType="application/json",
+                    ContentType=content_type,
                     ContentLanguage="en",
                     ContentDisposition=f'inline; filename="{key}.json"',
                 )
@@ -91,7 +97,7 @@ class S3Cache(BaseCache):
                     Key=key,
                     Body=serialized_value,
                     CacheControl=cache_control,
-                    ContentType="application/json",
+                    ContentType=content_type,
                     ContentLanguage="en",
                     ContentDisposition=f'inline; filename="{key}.json"',
                 )
@@ -116,9 +122,13 @@ class S3Cache(BaseCache):
             )
 
             if cached_response is not None:
+                cached_response = cached_response["Body"].read()
+                if is_cache_envelope(cached_response):
+                    # binary cache envelopes are decoded by `Cache`
+                    return cached_response
                 # cached_response is in `b{} convert it to ModelResponse
-                cached_response = (
-                    cached_response["Body"].read().decode("utf-8")
+                cached_response = cached_response.decode(
+                    "utf-8"
                 )  # Convert bytes to string
                 try:
                     cached_response = json.loads(
@@ -1,18 +1,120 @@
 """
-Custom Logger that handles batching logic 
+Custom Logger that handles batching logic
 
 Use this if you want your logs to be stored in memory and flushed periodically
 """
 
 import asyncio
+import functools
+import gzip
+import json
+import os
+import random
+import tempfile
 import time
-from typing import List, Literal, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Literal, Optional
 
+import httpx
+
+import litellm
 from litellm._logging import verbose_logger
 from litellm.integrations.custom_logger import CustomLogger
+from litellm.types.integrations.custom_batch_logger import (
+    BatchLoggerOverflowPolicy,
+    BatchLoggerQueueMetrics,
+)
 
 DEFAULT_BATCH_SIZE = 512
 DEFAULT_FLUSH_INTERVAL_SECONDS = 5
+DEFAULT_ENCODE_WORKERS = 2
+DEFAULT_FLUSH_RETRY_BASE_BACKOFF_SECONDS = 0.5
+DEFAULT_FLUSH_RETRY_MAX_BACKOFF_SECONDS = 8
+# 4xx responses that are worth retrying, any other 4xx will fail again
+RETRYABLE_4XX_STATUS_CODES = (408, 429)
+
+_encode_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_encode_executor() -> ThreadPoolExecutor:
+    """
+    Returns the thread pool shared by all batch loggers for payload encoding.
+
+    Created lazily, so importing a logger does not spawn threads.
+    """
+    global _encode_executor
+    if _encode_executor is None:
+        _encode_executor = ThreadPoolExecutor(
+            max_workers=litellm.batch_logging_encode_workers or DEFAULT_ENCODE_WORKERS,
+            thread_name_prefix="litellm-batch-encode",
+        )
+    return _encode_executor
+
+
+def encode_batch_payload(
+    data: Any,
+    json_backend: Literal["json", "orjson"] = "json",
+    compression: Optional[Literal["gzip", "zstd"]] = None,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    """
+    Serializes `data` to JSON bytes and optionally compresses them.
+
+    Args:
+        data: JSON-serializable payload
+        json_backend: "json" (stdlib) or "orjson" - orjson falls back to stdlib json if not installed
+        compression: None, "gzip" or "zstd" (requires the `zstandard` package)
+        default: called for objects that are not JSON serializable (same as `json.dumps(default=...)`)
+    """
+    encoded: Optional[bytes] = None
+    if json_backend == "orjson":
+        try:
+            import orjson
+
+            encoded = orjson.dumps(
+                data, default=default, option=orjson.OPT_NON_STR_KEYS
+            )
+        except ImportError:
+            verbose_logger.debug(
+                "orjson is not installed, falling back to json for batch logging"
+            )
+    if encoded is None:
+        encoded = json.dumps(data, default=default).encode("utf-8")
+
+    if compression == "gzip":
+        encoded = gzip.compress(encoded)
+    elif compression == "zstd":
+        import zstandard
+
+        encoded = zstandard.ZstdCompressor().compress(encoded)
+    return encoded
+
+
+def _is_retryable_send_error(e: Exception) -> bool:
+    if isinstance(e, httpx.HTTPStatusError):
+        status_code = e.response.status_code
+        if 400 <= status_code < 500:
+            return status_code in RETRYABLE_4XX_STATUS_CODES
+    return True
+
+
+class _BoundedLogQueue(list):
+    """
+    `list` used for `CustomBatchLogger.log_queue`.
+
+    `append` / `extend` go through the owning logger, which enforces `max_queue_size` + `overflow_policy`
+    """
+
+    def __init__(self, iterable: Iterable, logger: "CustomBatchLogger"):
+        super().__init__(iterable)
+        self._logger = logger
+
+    def append(self, item: Any) -> None:
+        self._logger._add_to_log_queue(item)
+
+    def extend(self, items: Iterable) -> None:
+        for item in items:
+            self._logger._add_to_log_queue(item)
 
 
 class CustomBatchLogger(CustomLogger):
@@ -22,21 +124,165 @@ class CustomBatchLogger(CustomLogger):
         flush_lock: Optional[asyncio.Lock] = None,
         batch_size: Optional[int] = DEFAULT_BATCH_SIZE,
         flush_interval: Optional[int] = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_queue_size: Optional[int] = None,
+        overflow_policy: Optional[BatchLoggerOverflowPolicy] = None,
+        max_in_flight_flushes: Optional[int] = None,
+        max_flush_retries: Optional[int] = None,
         **kwargs,
     ) -> None:
         """
         Args:
             flush_lock (Optional[asyncio.Lock], optional): Lock to use when flushing the queue. Defaults to None. Only used for custom loggers that do batching
+            max_queue_size (Optional[int], optional): Max number of events held in memory. Defaults to `litellm.batch_logging_max_queue_size`
+            overflow_policy (Optional[BatchLoggerOverflowPolicy], optional): What to do with new events once the queue is full - "drop_oldest", "drop_newest", "sample" or "spill_to_disk". Defaults to `litellm.batch_logging_overflow_policy`
+            max_in_flight_flushes (Optional[int], optional): Max number of flushes running / waiting on the flush lock, extra flushes are skipped. Defaults to `litellm.batch_logging_max_in_flight_flushes`
+            max_flush_retries (Optional[int], optional): Number of retries (with jittered exponential backoff) when `async_send_batch` raises. Defaults to `litellm.batch_logging_max_flush_retries`
         """
-        self.log_queue: List = []
         self.flush_interval = flush_interval or DEFAULT_FLUSH_INTERVAL_SECONDS
         self.batch_size: int = batch_size or DEFAULT_BATCH_SIZE
+        self.max_queue_size: int = max(
+            max_queue_size or litellm.batch_logging_max_queue_size, self.batch_size
+        )
+        self.overflow_policy: BatchLoggerOverflowPolicy = (
+            overflow_policy or litellm.batch_logging_overflow_policy
+        )
+        self.max_in_flight_flushes: int = (
+            max_in_flight_flushes or litellm.batch_logging_max_in_flight_flushes
+        )
+        self.max_flush_retries: int = (
+            max_flush_retries
+            if max_flush_retries is not None
+            else litellm.batch_logging_max_flush_retries
+        )
+        self.queue_metrics = BatchLoggerQueueMetrics(
+            queue_depth=0,
+            max_queue_size=self.max_queue_size,
+            dropped_events=0,
+            spilled_events=0,
+            failed_flushes=0,
+            skipped_flushes=0,
+            last_flush_latency_seconds=None,
+            total_flush_latency_seconds=0.0,
+            total_flushes=0,
+        )
+        self._in_flight_flushes = 0
+        self._overflow_events_seen = 0
+        # while a batch is being sent, new events are held here, so retries send exactly the same batch
+        self._incoming_log_queue: Optional[List] = None
+        self._spill_file_path: Optional[str] = None
+        # subclasses may have already set `self.log_queue` before calling super().__init__()
+        self.log_queue = getattr(self, "_log_queue", [])
         self.last_flush_time = time.time()
         self.flush_lock = flush_lock
 
         super().__init__(**kwargs)
         pass
 
+    @property
+    def log_queue(self) -> List:
+        return self._log_queue
+
+    @log_queue.setter
+    def log_queue(self, value: List) -> None:
+        self._log_queue = _BoundedLogQueue(value, logger=self)
+
+    def _add_to_log_queue(self, item: Any) -> None:
+        """
+        Adds an event to the log queue, applying `overflow_policy` if the queue is full
+        """
+        queue = getattr(self, "_incoming_log_queue", None)
+        if queue is None:
+            queue = self._log_queue
+        max_queue_size = getattr(self, "max_queue_size", None)
+        if max_queue_size is None or len(queue) < max_queue_size:
+            list.append(queue, item)
+            return
+
+        overflow_policy = self.overflow_policy
+        if overflow_policy == "drop_newest":
+            self.queue_metrics["dropped_events"] += 1
+        elif overflow_policy == "sample":
+            # reservoir sampling - every overflowing event has an equal chance of being kept
+            self._overflow_events_seen += 1
+            idx = random.randint(0, max_queue_size + self._overflow_events_seen - 1)
+            if idx < max_queue_size:
+                queue[idx] = item
+            self.queue_metrics["dropped_events"] += 1
+        elif overflow_policy == "spill_to_disk" and self._spill_to_disk(item):
+            self.queue_metrics["spilled_events"] += 1
+        else:  # drop_oldest
+            queue.pop(0)
+            list.append(queue, item)
+            self.queue_metrics["dropped_events"] += 1
+
+        verbose_logger.debug(
+            "%s: log queue full (max_queue_size=%s), applied overflow_policy=%s",
+            self.__class__.__name__,
+            max_queue_size,
+            overflow_policy,
+        )
+
+    def _get_spill_file_path(self) -> str:
+        if self._spill_file_path is None:
+            spill_dir = os.path.join(
+                tempfile.gettempdir(), "litellm_batch_logger_spill"
+            )
+            os.makedirs(spill_dir, exist_ok=True)
+            self._spill_file_path = os.path.join(
+                spill_dir,
+                f"{self.__class__.__name__}-{os.getpid()}-{id(self)}.jsonl",
+            )
+        return self._spill_file_path
+
+    def _spill_to_disk(self, item: Any) -> bool:
+        """
+        Appends an event to this logger's spill file. Returns False if the event could not be spilled.
+        """
+        try:
+            with open(self._get_spill_file_path(), "a") as f:
+                f.write(json.dumps(item, default=str) + "\n")
+            return True
+        except Exception as e:
+            verbose_logger.debug(
+                "%s: unable to spill event to disk - %s", self.__class__.__name__, e
+            )
+            return False
+
+    def _restore_spilled_logs(self) -> None:
+        """
+        Moves spilled events back into the log queue, up to `max_queue_size`
+        """
+        if self._spill_file_path is None or not os.path.exists(self._spill_file_path):
+            return
+        free_slots = self.max_queue_size - len(self._log_queue)
+        if free_slots <= 0:
+            return
+        try:
+            with open(self._spill_file_path, "r") as f:
+                lines = f.readlines()
+            for line in lines[:free_slots]:
+                list.append(self._log_queue, json.loads(line))
+            remaining = lines[free_slots:]
+            if remaining:
+                with open(self._spill_file_path, "w") as f:
+                    f.writelines(remaining)
+            else:
+                os.remove(self._spill_file_path)
+        except Exception as e:
+            verbose_logger.debug(
+                "%s: unable to restore spilled events - %s",
+                self.__class__.__name__,
+                e,
+            )
+
+    def get_queue_metrics(self) -> BatchLoggerQueueMetrics:
+        """
+        Returns a snapshot of this logger's queue metrics
+        """
+        metrics = self.queue_metrics.copy()
+        metrics["queue_depth"] = len(self._log_queue)
+        return metrics
+
     async def periodic_flush(self):
         while True:
             await asyncio.sleep(self.flush_interval)
@@ -49,14 +295,109 @@ class CustomBatchLogger(CustomLogger):
         if self.flush_lock is None:
             return
 
-        async with self.flush_lock:
-            if self.log_queue:
+        if self._in_flight_flushes >= self.max_in_flight_flushes:
+            # a flush is already in progress, events stay queued for the next one
+            self.queue_metrics["skipped_flushes"] += 1
+            return
+
+        self._in_flight_flushes += 1
+        try:
+            async with self.flush_lock:
+                if self.log_queue:
+                    batch_size = len(self.log_queue)
+                    verbose_logger.debug(
+                        "CustomLogger: Flushing batch of %s events", batch_size
+                    )
+                    start_time = time.perf_counter()
+                    # `log_queue` is the batch being sent until it's removed, new events are queued separately
+                    self._incoming_log_queue = []
+                    self._overflow_events_seen = 0
+                    try:
+                        sent = await self._async_send_batch_with_retries()
+                    finally:
+                        list.clear(self._log_queue)
+                        list.extend(self._log_queue, self._incoming_log_queue)
+                        self._incoming_log_queue = None
+                        self._overflow_events_seen = 0
+                    flush_latency = time.perf_counter() - start_time
+                    self.last_flush_time = time.time()
+
+                    self.queue_metrics["last_flush_latency_seconds"] = flush_latency
+                    self.queue_metrics["total_flush_latency_seconds"] += flush_latency
+                    self.queue_metrics["total_flushes"] += 1
+                    if not sent:
+                        self.queue_metrics["failed_flushes"] += 1
+                        self.queue_metrics["dropped_events"] += batch_size
+                    self._restore_spilled_logs()
+        finally:
+            self._in_flight_flushes -= 1
+
+    async def _async_send_batch_with_retries(self) -> bool:
+        """
+        Calls `async_send_batch`, retrying with jittered exponential backoff if it raises
+
+        4xx responses other than 408 / 429 are not retried
+
+        Returns:
+            bool: True if the batch was sent
+        """
+        for attempt in range(self.max_flush_retries + 1):
+            try:
+                await self.async_send_batch()
+                return True
+            except Exception as e:
+                is_retryable = _is_retryable_send_error(e)
+                if attempt >= self.max_flush_retries or not is_retryable:
+                    verbose_logger.exception(
+                        "%s: failed to send batch after %s attempts, dropping %s events - %s",
+                        self.__class__.__name__,
+                        attempt + 1,
+                        len(self.log_queue),
+                        str(e),
+                    )
+                    return False
+                backoff = random.uniform(
+                    0,
+                    min(
+                        DEFAULT_FLUSH_RETRY_MAX_BACKOFF_SECONDS,
+                        DEFAULT_FLUSH_RETRY_BASE_BACKOFF_SECONDS * (2**attempt),
+                    ),
+                )
                 verbose_logger.debug(
-                    "CustomLogger: Flushing batch of %s events", len(self.log_queue)
+                    "%s: error sending batch, retrying in %.2fs - %s",
+                    self.__class__.__name__,
+                    backoff,
+                    str(e),
                 )
-                await self.async_send_batch()
-                self.log_queue.clear()
-                self.last_flush_time = time.time()
+                await asyncio.sleep(backoff)
+        return False
 
     async def async_send_batch(self, *args, **kwargs):
         pass
+
+    async def async_encode_payload(
+        self,
+        data: Any,
+        compression: Optional[Literal["gzip", "zstd"]] = None,
+        default: Optional[Callable[[Any], Any]] = None,
+    ) -> bytes:
+        """
+        Serializes (and optionally compresses) `data` on the shared encode thread pool,
+        so large batches do not block the event loop while they are being flushed.
+
+        Pass a snapshot of the queue (e.g. `list(self.log_queue)`), since new events can be appended while encoding.
+
+        Returns:
+            bytes: ready to send request body
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_encode_executor(),
+            functools.partial(
+                encode_batch_payload,
+                data,
+                json_backend=litellm.batch_logging_json_backend,
+                compression=compression,
+                default=default,
+            ),
+        )
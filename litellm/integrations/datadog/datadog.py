@@ -119,7 +119,7 @@ class DataDogLogger(CustomBatchLogger):
             )
 
             if len(self.log_queue) >= self.batch_size:
-                await self.async_send_batch()
+                await self.flush_queue()
 
         except Exception as e:
             verbose_logger.exception(
@@ -136,7 +136,7 @@ class DataDogLogger(CustomBatchLogger):
         DD Ref: https://docs.datadoghq.com/api/latest/logs/
 
         Raises:
-            Raises a NON Blocking verbose_logger.exception if an error occurs
+            Re-raises errors from the datadog api, so `CustomBatchLogger.flush_queue` can retry the batch
         """
         try:
             if not self.log_queue:
@@ -169,6 +169,7 @@ class DataDogLogger(CustomBatchLogger):
             verbose_logger.exception(
                 f"Datadog Error sending batch API - {str(e)}\n{traceback.format_exc()}"
             )
+            raise e
 
     def log_success_event(self, kwargs, response_obj, start_time, end_time):
         """
@@ -314,11 +315,12 @@ class DataDogLogger(CustomBatchLogger):
         https://docs.datadoghq.com/api/latest/logs/
 
         "Datadog recommends sending your logs compressed. Add the Content-Encoding: gzip header to the request when sending"
-        """
-        import gzip
-        import json
 
-        compressed_data = gzip.compress(json.dumps(data).encode("utf-8"))
+        Serialization + compression run on the CustomBatchLogger encode thread pool, not on the event loop
+        """
+        compressed_data = await self.async_encode_payload(
+            list(data), compression="gzip"
+        )
         response = await self.async_client.post(
             url=self.intake_url,
             data=compressed_data,  # type: ignore
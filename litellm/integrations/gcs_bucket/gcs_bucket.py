@@ -1,5 +1,4 @@
 import asyncio
-import json
 import os
 import uuid
 from datetime import datetime
@@ -125,10 +124,14 @@ class GCSBucketLogger(GCSBucketBase):
             - collect the logs to flush every `GCS_FLUSH_INTERVAL` seconds
             - during async_send_batch, we make 1 POST request per log to GCS Bucket
 
+        Raises:
+            Re-raises errors from the GCS api, so `CustomBatchLogger.flush_queue` can retry the batch.
+            Logs that were uploaded are removed from the queue first, so a retry only re-sends the remaining logs.
         """
         if not self.log_queue:
             return
 
+        num_sent = 0
         try:
             for log_item in self.log_queue:
                 logging_payload = log_item["payload"]
@@ -152,12 +155,15 @@ class GCSBucketLogger(GCSBucketBase):
                     object_name=object_name,
                     logging_payload=logging_payload,
                 )
+                num_sent += 1
 
             # Clear the queue after processing
             self.log_queue.clear()
 
         except Exception as e:
             verbose_logger.exception(f"GCS Bucket batch logging error: {str(e)}")
+            del self.log_queue[:num_sent]
+            raise e
 
     def _get_object_name(
         self, kwargs: Dict, logging_payload: StandardLoggingPayload, response_obj: Any
@@ -210,7 +216,9 @@ class GCSBucketLogger(GCSBucketBase):
         """
         Helper function to make POST request to GCS Bucket in the specified bucket.
         """
-        json_logged_payload = json.dumps(logging_payload, default=str)
+        json_logged_payload = await self.async_encode_payload(
+            logging_payload, default=str
+        )
 
         bucket_name, object_name = self._handle_folders_in_bucket_name(
             bucket_name=bucket_name,
@@ -220,7 +228,7 @@ class GCSBucketLogger(GCSBucketBase):
         response = await self.async_httpx_client.post(
             headers=headers,
             url=f"https://storage.googleapis.com/upload/storage/v1/b/{bucket_name}/o?uploadType=media&name={object_name}",
-            data=json_logged_payload,
+            data=json_logged_payload,  # type: ignore
         )
 
         if response.status_code != 200:
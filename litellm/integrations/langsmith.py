@@ -329,16 +329,30 @@ class LangsmithLogger(CustomBatchLogger):
 
 
         This was added to support key/team based logging on langsmith
+
+        Raises:
+            Re-raises the last error from the langsmith api, so `CustomBatchLogger.flush_queue` can retry the batch.
+            Batches that were sent are removed from the queue first, so a retry only re-sends the failed batches.
         """
         if not self.log_queue:
             return
 
         batch_groups = self._group_batches_by_credentials()
+        failed_queue_objects: List[LangsmithQueueObject] = []
+        last_exception: Optional[Exception] = None
         for batch_group in batch_groups.values():
-            await self._log_batch_on_langsmith(
-                credentials=batch_group.credentials,
-                queue_objects=batch_group.queue_objects,
-            )
+            try:
+                await self._log_batch_on_langsmith(
+                    credentials=batch_group.credentials,
+                    queue_objects=batch_group.queue_objects,
+                )
+            except Exception as e:
+                failed_queue_objects.extend(batch_group.queue_objects)
+                last_exception = e
+
+        if last_exception is not None:
+            self.log_queue[:] = failed_queue_objects
+            raise last_exception
 
     async def _log_batch_on_langsmith(
         self,
@@ -355,18 +369,22 @@ class LangsmithLogger(CustomBatchLogger):
 
         Returns: None
 
-        Raises: Does not raise an exception, will only verbose_logger.exception()
+        Raises: Re-raises errors from the langsmith api, after logging them with verbose_logger.exception()
         """
         langsmith_api_base = credentials["LANGSMITH_BASE_URL"]
         langsmith_api_key = credentials["LANGSMITH_API_KEY"]
         url = f"{langsmith_api_base}/runs/batch"
-        headers = {"x-api-key": langsmith_api_key}
+        headers = {
+            "x-api-key": langsmith_api_key,
+            "Content-Type": "application/json",
+        }
         elements_to_log = [queue_object["data"] for queue_object in queue_objects]
 
         try:
+            request_body = await self.async_encode_payload({"post": elements_to_log})
             response = await self.async_httpx_client.post(
                 url=url,
-                json={"post": elements_to_log},
+                data=request_body,  # type: ignore
                 headers=headers,
             )
             response.raise_for_status()
@@ -383,10 +401,12 @@ class LangsmithLogger(CustomBatchLogger):
             verbose_logger.exception(
                 f"Langsmith HTTP Error: {e.response.status_code} - {e.response.text}"
             )
-        except Exception:
+            raise e
+        except Exception as e:
             verbose_logger.exception(
                 f"Langsmith Layer Error - {traceback.format_exc()}"
             )
+            raise e
 
     def _group_batches_by_credentials(self) -> Dict[CredentialsKey, BatchGroup]:
         """Groups queue objects by credentials using a proper key structure"""
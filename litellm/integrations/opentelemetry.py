@@ -7,6 +7,10 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 import litellm
 from litellm._logging import verbose_logger
 from litellm.integrations.custom_logger import CustomLogger
+from litellm.integrations.opentelemetry_sampling import (
+    OpenTelemetrySampler,
+    get_sampling_span_processor,
+)
 from litellm.types.services import ServiceLoggerPayload
 from litellm.types.utils import (
     ChatCompletionMessageToolCall,
@@ -53,6 +57,16 @@ class OpenTelemetryConfig:
     exporter: Union[str, SpanExporter] = "console"
     endpoint: Optional[str] = None
     headers: Optional[str] = None
+    # fraction of traces to export. Errors + slow requests are always exported
+    sampling_rate: float = 1.0
+    # always export spans slower than this
+    slow_request_threshold_ms: Optional[float] = None
+    # truncate string attributes (e.g. messages, raw responses) longer than this
+    max_attribute_length: Optional[int] = None
+    # BatchSpanProcessor settings, defaults to the OTEL_BSP_* env vars used by the otel sdk
+    max_queue_size: Optional[int] = None
+    max_export_batch_size: Optional[int] = None
+    schedule_delay_millis: Optional[float] = None
 
     @classmethod
     def from_env(cls):
@@ -62,19 +76,39 @@ class OpenTelemetryConfig:
         OTEL_ENDPOINT="https://api.honeycomb.io/v1/traces"
 
         OTEL_HEADERS gets sent as headers = {"x-honeycomb-team": "B85YgLm96******"}
+
+        OTEL_SAMPLING_RATE="0.1"
+        OTEL_SLOW_REQUEST_THRESHOLD_MS="5000"
+        OTEL_MAX_ATTRIBUTE_LENGTH="4096"
         """
         from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
             InMemorySpanExporter,
         )
 
+        _sampling_rate = os.getenv("OTEL_SAMPLING_RATE")
+        _slow_request_threshold_ms = os.getenv("OTEL_SLOW_REQUEST_THRESHOLD_MS")
+        _max_attribute_length = os.getenv("OTEL_MAX_ATTRIBUTE_LENGTH")
+        sampling_params: Dict[str, Any] = {
+            "sampling_rate": float(_sampling_rate) if _sampling_rate else 1.0,
+            "slow_request_threshold_ms": (
+                float(_slow_request_threshold_ms)
+                if _slow_request_threshold_ms
+                else None
+            ),
+            "max_attribute_length": (
+                int(_max_attribute_length) if _max_attribute_length else None
+            ),
+        }
+
         if os.getenv("OTEL_EXPORTER") == "in_memory":
-            return cls(exporter=InMemorySpanExporter())
+            return cls(exporter=InMemorySpanExporter(), **sampling_params)
         return cls(
             exporter=os.getenv("OTEL_EXPORTER", "console"),
             endpoint=os.getenv("OTEL_ENDPOINT"),
             headers=os.getenv(
                 "OTEL_HEADERS"
             ),  # example: OTEL_HEADERS=x-honeycomb-team=B85YgLm96VGdFisfJVme1H"
+            **sampling_params,
         )
 
 
@@ -96,8 +130,17 @@ class OpenTelemetry(CustomLogger):
         self.OTEL_EXPORTER = self.config.exporter
         self.OTEL_ENDPOINT = self.config.endpoint
         self.OTEL_HEADERS = self.config.headers
+        self.sampler = OpenTelemetrySampler(
+            sampling_rate=self.config.sampling_rate,
+            slow_span_threshold_ms=self.config.slow_request_threshold_ms,
+        )
         provider = TracerProvider(resource=Resource(attributes=LITELLM_RESOURCE))
-        provider.add_span_processor(self._get_span_processor())
+        span_processor = self._get_span_processor()
+        if self.sampler.is_sampling_enabled:
+            span_processor = get_sampling_span_processor(
+                span_processor=span_processor, sampler=self.sampler
+            )
+        provider.add_span_processor(span_processor)
         self.callback_name = callback_name
 
         trace.set_tracer_provider(provider)
@@ -157,7 +200,10 @@ class OpenTelemetry(CustomLogger):
         else:
             _end_time_ns = self._to_ns(end_time)
 
-        if parent_otel_span is not None:
+        if parent_otel_span is not None and self.sampler.should_export(
+            trace_id=parent_otel_span.get_span_context().trace_id,
+            duration_ns=_end_time_ns - _start_time_ns,
+        ):
             _span_name = payload.service
             service_logging_span = self.tracer.start_span(
                 name=_span_name,
@@ -306,6 +352,16 @@ class OpenTelemetry(CustomLogger):
             context=_parent_context,
         )
         span.set_status(Status(StatusCode.OK))
+        if not self.sampler.should_export(
+            trace_id=span.get_span_context().trace_id,
+            duration_ns=self._to_ns(end_time) - self._to_ns(start_time),
+        ):
+            # not sampled - the span is dropped by the span processor, skip building its attributes
+            span.end(end_time=self._to_ns(end_time))
+            if parent_otel_span is not None:
+                parent_otel_span.end(end_time=self._to_ns(datetime.now()))
+            return
+
         self.set_attributes(span, kwargs, response_obj)
 
         if litellm.turn_off_message_logging is True:
@@ -656,6 +712,13 @@ class OpenTelemetry(CustomLogger):
         Safely sets an attribute on the span, ensuring the value is a primitive type.
         """
         primitive_value = self._cast_as_primitive_value_type(value)
+        max_attribute_length = self.config.max_attribute_length
+        if (
+            max_attribute_length is not None
+            and isinstance(primitive_value, str)
+            and len(primitive_value) > max_attribute_length
+        ):
+            primitive_value = primitive_value[:max_attribute_length] + "...(truncated)"
         span.set_attribute(key, primitive_value)
 
     def set_raw_request_attributes(self, span: Span, kwargs, response_obj):
@@ -765,11 +828,13 @@ class OpenTelemetry(CustomLogger):
             OTLPSpanExporter as OTLPSpanExporterHTTP,
         )
         from opentelemetry.sdk.trace.export import (
-            BatchSpanProcessor,
             ConsoleSpanExporter,
             SimpleSpanProcessor,
             SpanExporter,
         )
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+            InMemorySpanExporter,
+        )
 
         verbose_logger.debug(
             "OpenTelemetry Logger, initializing span processor \nself.OTEL_EXPORTER: %s\nself.OTEL_ENDPOINT: %s\nself.OTEL_HEADERS: %s",
@@ -782,25 +847,29 @@ class OpenTelemetry(CustomLogger):
             _split_otel_headers = self.OTEL_HEADERS.split("=")
             _split_otel_headers = {_split_otel_headers[0]: _split_otel_headers[1]}
 
+        if isinstance(self.OTEL_EXPORTER, InMemorySpanExporter):
+            # used for testing - spans need to be readable as soon as they end
+            return SimpleSpanProcessor(self.OTEL_EXPORTER)
+
         if isinstance(self.OTEL_EXPORTER, SpanExporter):
             verbose_logger.debug(
                 "OpenTelemetry: intiializing SpanExporter. Value of OTEL_EXPORTER: %s",
                 self.OTEL_EXPORTER,
             )
-            return SimpleSpanProcessor(self.OTEL_EXPORTER)
+            return self._get_batch_span_processor(self.OTEL_EXPORTER)
 
         if self.OTEL_EXPORTER == "console":
             verbose_logger.debug(
                 "OpenTelemetry: intiializing console exporter. Value of OTEL_EXPORTER: %s",
                 self.OTEL_EXPORTER,
             )
-            return BatchSpanProcessor(ConsoleSpanExporter())
+            return self._get_batch_span_processor(ConsoleSpanExporter())
         elif self.OTEL_EXPORTER == "otlp_http":
             verbose_logger.debug(
                 "OpenTelemetry: intiializing http exporter. Value of OTEL_EXPORTER: %s",
                 self.OTEL_EXPORTER,
             )
-            return BatchSpanProcessor(
+            return self._get_batch_span_processor(
                 OTLPSpanExporterHTTP(
                     endpoint=self.OTEL_ENDPOINT, headers=_split_otel_headers
                 ),
@@ -810,7 +879,7 @@ class OpenTelemetry(CustomLogger):
                 "OpenTelemetry: intiializing grpc exporter. Value of OTEL_EXPORTER: %s",
                 self.OTEL_EXPORTER,
             )
-            return BatchSpanProcessor(
+            return self._get_batch_span_processor(
                 OTLPSpanExporterGRPC(
                     endpoint=self.OTEL_ENDPOINT, headers=_split_otel_headers
                 ),
@@ -820,7 +889,20 @@ class OpenTelemetry(CustomLogger):
                 "OpenTelemetry: intiializing console exporter. Value of OTEL_EXPORTER: %s",
                 self.OTEL_EXPORTER,
             )
-            return BatchSpanProcessor(ConsoleSpanExporter())
+            return self._get_batch_span_processor(ConsoleSpanExporter())
+
+    def _get_batch_span_processor(self, span_exporter: SpanExporter):
+        """
+        Spans are exported from a bounded queue on a background thread, never on the request path
+        """
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+        return BatchSpanProcessor(
+            span_exporter,
+            max_queue_size=self.config.max_queue_size,
+            schedule_delay_millis=self.config.schedule_delay_millis,
+            max_export_batch_size=self.config.max_export_batch_size,
+        )
 
     async def async_management_endpoint_success_hook(
         self,
@@ -0,0 +1,99 @@
+"""
+Head + tail based sampling for the OpenTelemetry logger
+
+- head sampling: keep `sampling_rate` of traces, decided on the trace id (same rule as otel's `TraceIdRatioBased`), so all spans of a trace are kept / dropped together
+- tail sampling: always keep spans that errored, or took longer than `slow_span_threshold_ms`
+
+LiteLLM creates request spans after the LLM call completes, so status + latency are known when the decision is made.
+`OpenTelemetry` uses `should_export()` to skip building span attributes for dropped spans,
+`SamplingSpanProcessor` applies the same rule to every span before it reaches the exporter.
+"""
+
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from opentelemetry.sdk.trace import ReadableSpan as _ReadableSpan
+    from opentelemetry.sdk.trace import Span as _SDKSpan
+    from opentelemetry.sdk.trace import SpanProcessor as _SpanProcessor
+
+    ReadableSpan = _ReadableSpan
+    SDKSpan = _SDKSpan
+    SpanProcessor = _SpanProcessor
+else:
+    ReadableSpan = Any
+    SDKSpan = Any
+    SpanProcessor = Any
+
+_TRACE_ID_LIMIT = (1 << 64) - 1
+
+
+class OpenTelemetrySampler:
+    def __init__(
+        self,
+        sampling_rate: float = 1.0,
+        slow_span_threshold_ms: Optional[float] = None,
+    ):
+        self.sampling_rate = sampling_rate
+        self.slow_span_threshold_ms = slow_span_threshold_ms
+        self._trace_id_upper_bound = round(sampling_rate * (_TRACE_ID_LIMIT + 1))
+
+    @property
+    def is_sampling_enabled(self) -> bool:
+        return self.sampling_rate < 1.0
+
+    def is_head_sampled(self, trace_id: Optional[int]) -> bool:
+        if self.sampling_rate >= 1.0:
+            return True
+        if self.sampling_rate <= 0.0 or trace_id is None:
+            return False
+        return (trace_id & _TRACE_ID_LIMIT) < self._trace_id_upper_bound
+
+    def should_export(
+        self,
+        trace_id: Optional[int],
+        is_error: bool = False,
+        duration_ns: Optional[int] = None,
+    ) -> bool:
+        if is_error:
+            return True
+        if (
+            self.slow_span_threshold_ms is not None
+            and duration_ns is not None
+            and duration_ns >= self.slow_span_threshold_ms * 1e6
+        ):
+            return True
+        return self.is_head_sampled(trace_id)
+
+
+def get_sampling_span_processor(
+    span_processor: SpanProcessor, sampler: OpenTelemetrySampler
+) -> SpanProcessor:
+    """
+    Returns a SpanProcessor that only forwards sampled spans to `span_processor`
+    """
+    from opentelemetry.sdk.trace import SpanProcessor
+    from opentelemetry.trace import StatusCode
+
+    class SamplingSpanProcessor(SpanProcessor):
+        def on_start(self, span: SDKSpan, parent_context=None) -> None:
+            span_processor.on_start(span, parent_context=parent_context)
+
+        def on_end(self, span: ReadableSpan) -> None:
+            duration_ns = None
+            if span.start_time is not None and span.end_time is not None:
+                duration_ns = span.end_time - span.start_time
+            trace_id = span.context.trace_id if span.context is not None else None
+            if sampler.should_export(
+                trace_id=trace_id,
+                is_error=span.status.status_code == StatusCode.ERROR,
+                duration_ns=duration_ns,
+            ):
+                span_processor.on_end(span)
+
+        def shutdown(self) -> None:
+            span_processor.shutdown()
+
+        def force_flush(self, timeout_millis: int = 30000) -> bool:
+            return span_processor.force_flush(timeout_millis)
+
+    return SamplingSpanProcessor()
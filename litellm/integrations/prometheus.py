@@ -173,6 +173,7 @@ class PrometheusLogger(CustomLogger):
                 "litellm_remaining_team_budget_metric",
                 "Remaining budget for team",
                 labelnames=["team_id", "team_alias"],
+                multiprocess_mode=GAUGE_MULTIPROCESS_MODE,
             )
 
             # Remaining Budget for API Key
@@ -180,6 +181,7 @@ class PrometheusLogger(CustomLogger):
                 "litellm_remaining_api_key_budget_metric",
                 "Remaining budget for api key",
                 labelnames=["hashed_api_key", "api_key_alias"],
+                multiprocess_mode=GAUGE_MULTIPROCESS_MODE,
             )
 
             ########################################
@@ -190,6 +192,7 @@ class PrometheusLogger(CustomLogger):
                 "litellm_remaining_api_key_requests_for_model",
                 "Remaining Requests API Key can make for model (model based rpm limit on key)",
                 labelnames=["hashed_api_key", "api_key_alias", "model"],
+                multiprocess_mode=GAUGE_MULTIPROCESS_MODE,
             )
 
             # Remaining MODEL TPM limit for API Key
@@ -197,6 +200,7 @@ class PrometheusLogger(CustomLogger):
                 "litellm_remaining_api_key_tokens_for_model",
                 "Remaining Tokens API Key can make for model (model based tpm limit on key)",
                 labelnames=["hashed_api_key", "api_key_alias", "model"],
+                multiprocess_mode=GAUGE_MULTIPROCESS_MODE,
             )
 
             ########################################
@@ -215,6 +219,7 @@ class PrometheusLogger(CustomLogger):
                     "hashed_api_key",
                     "api_key_alias",
                 ],
+                multiprocess_mode=GAUGE_MULTIPROCESS_MODE,
             )
 
             self.litellm_remaining_tokens_metric = Gauge(
@@ -228,12 +233,14 @@ class PrometheusLogger(CustomLogger):
                     "hashed_api_key",
                     "api_key_alias",
                 ],
+                multiprocess_mode=GAUGE_MULTIPROCESS_MODE,
             )
             # llm api provider budget metrics
             self.litellm_provider_remaining_budget_metric = Gauge(
                 "litellm_provider_remaining_budget_metric",
                 "Remaining budget for provider - used when you set provider budget limits",
                 labelnames=["api_provider"],
+                multiprocess_mode=GAUGE_MULTIPROCESS_MODE,
             )
 
             # Get all keys
@@ -255,6 +262,7 @@ class PrometheusLogger(CustomLogger):
                 "litellm_deployment_state",
                 "LLM Deployment Analytics - The state of the deployment: 0 = healthy, 1 = partial outage, 2 = complete outage",
                 labelnames=_logged_llm_labels,
+                multiprocess_mode=GAUGE_MULTIPROCESS_MODE,
             )
 
             self.litellm_deployment_cooled_down = Counter(
@@ -338,10 +346,44 @@ class PrometheusLogger(CustomLogger):
                 ],
             )
 
+            self._bound_metric_label_cardinality()
+
         except Exception as e:
             print_verbose(f"Got exception on init prometheus client {str(e)}")
             raise e
 
+    def _bound_metric_label_cardinality(self):
+        """
+        Wraps every metric in a BoundedLabelsMetric, so series growth from high cardinality labels (end_user, api keys, users) is bounded
+
+        Controlled by:
+        - `litellm.prometheus_label_profiles` - {metric name: labels to keep}
+        - `litellm.prometheus_label_cardinality_limits` - {label: max distinct values}, values above it are emitted as "__other__"
+        - `litellm.prometheus_series_ttl_seconds` - drop series not updated within this many seconds
+        - `litellm.prometheus_max_series_per_metric` - drop least recently used series above this limit
+        """
+        from prometheus_client.metrics import MetricWrapperBase
+
+        from litellm.integrations.prometheus_helpers.prometheus_label_limiter import (
+            BoundedLabelsMetric,
+        )
+
+        label_profiles = litellm.prometheus_label_profiles or {}
+        for attr_name, metric in list(vars(self).items()):
+            if not isinstance(metric, MetricWrapperBase):
+                continue
+            setattr(
+                self,
+                attr_name,
+                BoundedLabelsMetric(
+                    metric=metric,
+                    label_profile=label_profiles.get(metric._name),
+                    label_cardinality_limits=litellm.prometheus_label_cardinality_limits,
+                    series_ttl_seconds=litellm.prometheus_series_ttl_seconds,
+                    max_series=litellm.prometheus_max_series_per_metric,
+                ),
+            )
+
     async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
         # Define prometheus client
         from litellm.types.utils import StandardLoggingPayload
@@ -0,0 +1,158 @@
+"""
+Bounds the number of label sets (series) emitted by a prometheus metric
+
+Labels like `end_user`, `hashed_api_key` or `user` have unbounded values. Every new value creates a new series,
+which stays in proxy memory and in every scrape forever.
+
+`BoundedLabelsMetric` wraps a prometheus_client metric and, on `.labels()`:
+    - label profile: only keeps the configured labels for the metric, other labels are emitted as "" (prometheus treats an empty label as not set)
+    - cardinality cap: once a label has `limit` distinct values, new values are emitted as "__other__". Existing series
+      are not touched, a value's slot is freed once all of its series expired
+    - series expiry: series not updated for `series_ttl_seconds` (or the least recently used ones, above `max_series`) are dropped with `metric.remove()`
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from litellm._logging import verbose_logger
+
+# expired series are checked for at most once per interval, not on every `.labels()` call
+SERIES_EXPIRY_CHECK_INTERVAL_SECONDS = 60
+# label value emitted for new values of a label at its cardinality limit
+OTHER_LABEL_VALUE = "__other__"
+
+
+class BoundedLabelsMetric:
+    def __init__(
+        self,
+        metric: Any,
+        label_profile: Optional[List[str]] = None,
+        label_cardinality_limits: Optional[Dict[str, int]] = None,
+        series_ttl_seconds: Optional[float] = None,
+        max_series: Optional[int] = None,
+    ):
+        """
+        Args:
+            metric: prometheus_client Counter / Gauge / Histogram
+            label_profile: labels to keep for this metric. None keeps all labels
+            label_cardinality_limits: max distinct values per label, e.g. {"end_user": 1000}. Values above the limit are emitted as "__other__"
+            series_ttl_seconds: drop series not updated within this many seconds
+            max_series: max number of series for this metric, least recently used series are dropped first
+        """
+        self._metric = metric
+        self._labelnames: Tuple[str, ...] = tuple(getattr(metric, "_labelnames", ()))
+        self._dropped_label_idxs = {
+            idx
+            for idx, labelname in enumerate(self._labelnames)
+            if label_profile is not None and labelname not in label_profile
+        }
+        label_cardinality_limits = label_cardinality_limits or {}
+        self._label_cardinality_limits: Dict[int, int] = {
+            idx: label_cardinality_limits[labelname]
+            for idx, labelname in enumerate(self._labelnames)
+            if labelname in label_cardinality_limits
+        }
+        self._series_ttl_seconds = series_ttl_seconds
+        self._max_series = max_series
+
+        # label idx -> {label value: last used}, for labels with a cardinality limit
+        self._label_values: Dict[int, "OrderedDict[str, float]"] = {
+            idx: OrderedDict() for idx in self._label_cardinality_limits
+        }
+        # label values -> last used
+        self._series: "OrderedDict[Tuple[str, ...], float]" = OrderedDict()
+        # label idx -> {label value: series with that value}, for labels with a cardinality limit
+        self._series_by_label_value: Dict[int, Dict[str, Set[Tuple[str, ...]]]] = {
+            idx: {} for idx in self._label_cardinality_limits
+        }
+        self._last_expiry_check = time.time()
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        # everything except `.labels()` goes to the wrapped metric
+        return getattr(self._metric, name)
+
+    def labels(self, *labelvalues: Any, **labelkwargs: Any) -> Any:
+        if labelkwargs:
+            values = [str(labelkwargs[labelname]) for labelname in self._labelnames]
+        else:
+            values = [str(value) for value in labelvalues]
+
+        now = time.time()
+        with self._lock:
+            # expire first, so slots freed by expired series are available to this call's label values
+            self._expire_series(now=now)
+            for idx in self._dropped_label_idxs:
+                values[idx] = ""
+            for idx, limit in self._label_cardinality_limits.items():
+                values[idx] = self._get_bounded_label_value(
+                    idx=idx, value=values[idx], limit=limit, now=now
+                )
+
+            series_key = tuple(values)
+            if series_key not in self._series:
+                for idx, series_by_value in self._series_by_label_value.items():
+                    series_by_value.setdefault(series_key[idx], set()).add(series_key)
+            self._series[series_key] = now
+            self._series.move_to_end(series_key)
+            if self._max_series is not None:
+                while len(self._series) > self._max_series:
+                    self._remove_series(next(iter(self._series)))
+
+        return self._metric.labels(*series_key)
+
+    def _get_bounded_label_value(
+        self, idx: int, value: str, limit: int, now: float
+    ) -> str:
+        seen_values = self._label_values[idx]
+        if value in seen_values:
+            seen_values[value] = now
+            seen_values.move_to_end(value)
+            return value
+        if len(seen_values) >= limit:
+            return OTHER_LABEL_VALUE
+        seen_values[value] = now
+        return value
+
+    def _expire_series(self, now: float) -> None:
+        if (
+            self._series_ttl_seconds is None
+            or now - self._last_expiry_check < SERIES_EXPIRY_CHECK_INTERVAL_SECONDS
+        ):
+            return
+        self._last_expiry_check = now
+        expire_before = now - self._series_ttl_seconds
+        # both dicts are ordered from least to most recently used
+        while self._series:
+            series_key, last_used = next(iter(self._series.items()))
+            if last_used >= expire_before:
+                break
+            self._remove_series(series_key)
+        for seen_values in self._label_values.values():
+            while seen_values:
+                _, last_used = next(iter(seen_values.items()))
+                if last_used >= expire_before:
+                    break
+                seen_values.popitem(last=False)
+
+    def _remove_series(self, series_key: Tuple[str, ...]) -> None:
+        self._series.pop(series_key, None)
+        for idx, series_by_value in self._series_by_label_value.items():
+            series_with_value = series_by_value.get(series_key[idx])
+            if series_with_value is None:
+                continue
+            series_with_value.discard(series_key)
+            if not series_with_value:
+                # the value's last series expired, free its slot under the cardinality limit
+                series_by_value.pop(series_key[idx])
+                self._label_values[idx].pop(series_key[idx], None)
+        try:
+            self._metric.remove(*series_key)
+        except KeyError:
+            pass
+        except Exception as e:
+            verbose_logger.debug(
+                "Prometheus: unable to remove series %s - %s", series_key, e
+            )
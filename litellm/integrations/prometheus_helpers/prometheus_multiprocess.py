@@ -0,0 +1,95 @@
+"""
+Helpers for running prometheus_client in multiprocess mode
+
+Used when the proxy runs with multiple gunicorn workers (`--num_workers`). Each worker writes its metrics
+to mmap'd files in `PROMETHEUS_MULTIPROC_DIR`, and `/metrics` aggregates the files of all workers, so a scrape
+that hits any worker returns the numbers for the whole proxy.
+
+Docs: https://prometheus.github.io/client_python/multiprocess/
+"""
+
+import glob
+import os
+from typing import Any, Optional
+
+from litellm._logging import verbose_logger
+
+PROMETHEUS_MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+
+def get_prometheus_multiproc_dir() -> Optional[str]:
+    """
+    Returns the shared metrics directory, if prometheus multiprocess mode is enabled
+    """
+    return os.getenv("PROMETHEUS_MULTIPROC_DIR") or None
+
+
+def is_prometheus_multiprocess_enabled() -> bool:
+    return get_prometheus_multiproc_dir() is not None
+
+
+def setup_prometheus_multiproc_dir() -> None:
+    """
+    Creates the shared metrics directory and removes metric files left over from a previous run.
+
+    Must be called once, in the gunicorn master, before workers are started.
+    """
+    multiproc_dir = get_prometheus_multiproc_dir()
+    if multiproc_dir is None:
+        return
+
+    os.makedirs(multiproc_dir, exist_ok=True)
+    for stale_file in glob.glob(os.path.join(multiproc_dir, "*.db")):
+        try:
+            os.remove(stale_file)
+        except OSError as e:
+            verbose_logger.debug(
+                "Prometheus: unable to remove stale metrics file %s - %s",
+                stale_file,
+                e,
+            )
+    verbose_logger.debug(
+        "Prometheus: multiprocess mode enabled, metrics dir=%s", multiproc_dir
+    )
+
+
+def mark_prometheus_worker_dead(pid: int) -> None:
+    """
+    Cleans up the live gauge files of a worker that exited.
+
+    Counters / histograms written by the worker are kept, so totals don't go down when a worker restarts.
+    """
+    if not is_prometheus_multiprocess_enabled():
+        return
+    try:
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(pid)
+    except Exception as e:
+        verbose_logger.debug(
+            "Prometheus: unable to clean up metrics for worker pid=%s - %s", pid, e
+        )
+
+
+def gunicorn_child_exit(server: Any, worker: Any) -> None:
+    """
+    gunicorn `child_exit` server hook - https://docs.gunicorn.org/en/stable/settings.html#child-exit
+    """
+    mark_prometheus_worker_dead(worker.pid)
+
+
+def get_prometheus_metrics_asgi_app():
+    """
+    Returns the ASGI app served on `/metrics`
+
+    In multiprocess mode this collects metrics from all workers, instead of the worker handling the scrape.
+    """
+    from prometheus_client import CollectorRegistry, make_asgi_app
+
+    if is_prometheus_multiprocess_enabled():
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return make_asgi_app(registry=registry)
+    return make_asgi_app()
@@ -0,0 +1,267 @@
+"""
+Shared worker pool for sync logging callbacks
+
+Sync logging (`Logging.success_handler`, `Logging.failure_handler`) used to run on a new OS thread per request - and per chunk for streaming.
+All of it now goes through one bounded queue, drained by a fixed number of worker threads.
+
+- `litellm.logging_worker_count`: number of worker threads
+- `litellm.logging_worker_max_queue_size`: max number of pending logging calls
+- `litellm.logging_worker_overflow_policy`: what to do when the queue is full
+    - "drop_oldest": drop the oldest pending call, enqueue the new one
+    - "drop_newest": drop the new call
+    - "block": block the caller until there is space in the queue. Called from an event loop, the call is queued
+      past `max_queue_size` instead, blocking would stall every request on the loop
+- `litellm.logging_worker_batch_size`: max calls a worker runs per wake-up
+
+Calls submitted with `submit_no_drop` (the per-chunk streaming success_handler calls, the complete streaming response
+is built from every chunk) are never dropped, and are queued even if the queue is full.
+
+Workers start lazily on the first submit. Pending calls are flushed on interpreter exit.
+"""
+
+import asyncio
+import atexit
+import os
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import litellm
+from litellm._logging import verbose_logger
+
+LOGGING_WORKER_EXIT_FLUSH_TIMEOUT = 5  # seconds
+
+# fn, args, kwargs, droppable
+_LoggingTask = Tuple[Callable, Tuple[Any, ...], Dict[str, Any], bool]
+
+
+class _LoggingQueue(queue.Queue):
+    """
+    Unbounded queue - `LoggingWorkerPool` applies `max_queue_size` to droppable calls only
+    """
+
+    def put_bounded(self, task: _LoggingTask, max_size: int, block: bool) -> bool:
+        """
+        Queues `task` if fewer than `max_size` calls are pending, or waits for space if `block`.
+        """
+        with self.not_full:
+            while self._qsize() >= max_size:
+                if not block:
+                    return False
+                self.not_full.wait()
+            self._put(task)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+            return True
+
+    def drop_oldest(self) -> bool:
+        """
+        Removes the oldest droppable call. Returns False if none of the pending calls can be dropped.
+        """
+        with self.mutex:
+            for i, (_, _, _, droppable) in enumerate(self.queue):
+                if droppable:
+                    del self.queue[i]
+                    self.unfinished_tasks -= 1
+                    if self.unfinished_tasks == 0:
+                        self.all_tasks_done.notify_all()
+                    self.not_full.notify()
+                    return True
+        return False
+
+
+def _in_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
+class LoggingWorkerPool:
+    def __init__(
+        self,
+        num_workers: Optional[int] = None,
+        max_queue_size: Optional[int] = None,
+        overflow_policy: Optional[str] = None,
+        batch_size: Optional[int] = None,
+    ):
+        """
+        Args left as None are read from the `litellm.logging_worker_*` settings when the workers start
+        """
+        self.num_workers = num_workers
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self.batch_size = batch_size
+
+        self._lock = threading.Lock()
+        self._metrics_lock = threading.Lock()
+        self._queue: Optional[_LoggingQueue] = None
+        self._workers: List[threading.Thread] = []
+        self._pid: Optional[int] = None
+
+        self.submitted_count = 0
+        self.completed_count = 0
+        self.failed_count = 0
+        self.dropped_count = 0
+        self.max_queue_depth = 0
+
+    def submit(self, fn: Callable, *args: Any, **kwargs: Any) -> bool:
+        """
+        Queues `fn(*args, **kwargs)` to run on a logging worker.
+
+        Returns False if the call was dropped because the queue is full.
+        """
+        return self._submit(task=(fn, args, kwargs, True))
+
+    def submit_no_drop(self, fn: Callable, *args: Any, **kwargs: Any) -> None:
+        """
+        Queues `fn(*args, **kwargs)` to run on a logging worker, even if the queue is full. It's never dropped.
+        """
+        self._submit(task=(fn, args, kwargs, False))
+
+    def _submit(self, task: _LoggingTask) -> bool:
+        _queue = self._get_queue()
+        with self._metrics_lock:
+            self.submitted_count += 1
+        droppable = task[3]
+        if not droppable:
+            _queue.put_nowait(task)
+        elif not _queue.put_bounded(
+            task, max_size=max(self.max_queue_size or 1, 1), block=False
+        ):
+            if not self._handle_overflow(_queue, task):
+                return False
+
+        queue_depth = _queue.qsize()
+        with self._metrics_lock:
+            if queue_depth > self.max_queue_depth:
+                self.max_queue_depth = queue_depth
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until all queued calls have run. Returns False if `timeout` expired first.
+        """
+        _queue = self._queue
+        if _queue is None or self._pid != os.getpid():
+            return True
+        deadline = None if timeout is None else time.time() + timeout
+        with _queue.all_tasks_done:
+            while _queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    return False
+                _queue.all_tasks_done.wait(remaining)
+        return True
+
+    def get_metrics(self) -> Dict[str, int]:
+        return {
+            "workers": len(self._workers),
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue_depth": self.max_queue_depth,
+            "submitted": self.submitted_count,
+            "completed": self.completed_count,
+            "failed": self.failed_count,
+            "dropped": self.dropped_count,
+        }
+
+    def _get_queue(self) -> _LoggingQueue:
+        _queue = self._queue
+        if _queue is not None and self._pid == os.getpid():
+            return _queue
+        with self._lock:
+            # (re)start workers lazily, and after a fork - threads are not copied to the child process
+            if self._queue is None or self._pid != os.getpid():
+                self._start_workers()
+            return self._queue  # type: ignore
+
+    def _start_workers(self) -> None:
+        if self.num_workers is None:
+            self.num_workers = litellm.logging_worker_count
+        if self.max_queue_size is None:
+            self.max_queue_size = litellm.logging_worker_max_queue_size
+        if self.overflow_policy is None:
+            self.overflow_policy = litellm.logging_worker_overflow_policy
+        if self.batch_size is None:
+            self.batch_size = litellm.logging_worker_batch_size
+
+        _queue = _LoggingQueue()
+        self._workers = []
+        for i in range(max(self.num_workers, 1)):
+            worker = threading.Thread(
+                target=self._worker_loop,
+                args=(_queue,),
+                name=f"litellm-logging-worker-{i}",
+                daemon=True,
+            )
+            worker.start()
+            self._workers.append(worker)
+        self._queue = _queue
+        self._pid = os.getpid()
+
+    def _handle_overflow(self, _queue: _LoggingQueue, task: _LoggingTask) -> bool:
+        if self.overflow_policy == "block":
+            if _in_event_loop():
+                _queue.put_nowait(task)
+            else:
+                _queue.put_bounded(
+                    task, max_size=max(self.max_queue_size or 1, 1), block=True
+                )
+            return True
+
+        self._record_dropped()
+        if self.overflow_policy == "drop_newest":
+            return False
+
+        # drop_oldest - if none of the pending calls can be dropped, the new call is dropped instead
+        if not _queue.drop_oldest():
+            return False
+        _queue.put_nowait(task)
+        return True
+
+    def _record_dropped(self) -> None:
+        with self._metrics_lock:
+            self.dropped_count += 1
+            dropped_count = self.dropped_count
+        if dropped_count == 1 or dropped_count % 1000 == 0:
+            verbose_logger.warning(
+                "LoggingWorkerPool: logging queue is full (max_queue_size=%s), dropped %s logging calls so far. Increase `litellm.logging_worker_count` or `litellm.logging_worker_max_queue_size`.",
+                self.max_queue_size,
+                dropped_count,
+            )
+
+    def _worker_loop(self, _queue: _LoggingQueue) -> None:
+        batch_size = max(self.batch_size or 1, 1)
+        while True:
+            batch = [_queue.get()]
+            # drain whatever else is pending, so a busy queue is not woken up per call
+            while len(batch) < batch_size:
+                try:
+                    batch.append(_queue.get_nowait())
+                except queue.Empty:
+                    break
+            for fn, args, kwargs, _ in batch:
+                try:
+                    fn(*args, **kwargs)
+                    with self._metrics_lock:
+                        self.completed_count += 1
+                except Exception as e:
+                    with self._metrics_lock:
+                        self.failed_count += 1
+                    verbose_logger.exception(
+                        "LoggingWorkerPool: logging call failed - %s", str(e)
+                    )
+                finally:
+                    _queue.task_done()
+
+
+logging_worker_pool = LoggingWorkerPool()
+
+
+def _flush_logging_worker_pool() -> None:
+    logging_worker_pool.flush(timeout=LOGGING_WORKER_EXIT_FLUSH_TIMEOUT)
+
+
+atexit.register(_flush_logging_worker_pool)
@@ -1,10 +1,8 @@
 import asyncio
 import json
-import threading
 import time
 import traceback
 import uuid
-from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable, List, Optional
 
 import httpx
@@ -29,12 +27,11 @@ from ..exceptions import OpenAIError
 from .core_helpers import map_finish_reason, process_response_headers
 from .default_encoding import encoding
 from .exception_mapping_utils import exception_type
+from .logging_worker_pool import logging_worker_pool
 from .rules import Rules
 
-MAX_THREADS = 100
-
-# Create a ThreadPoolExecutor
-executor = ThreadPoolExecutor(max_workers=MAX_THREADS)
+# backwards compatible alias, `executor.submit(fn, ...)` queues on the logging worker pool
+executor = logging_worker_pool
 
 
 def print_verbose(print_statement):
@@ -1655,10 +1652,9 @@ class CustomStreamWrapper:
                     if response is None:
                         continue
                     ## LOGGING
-                    threading.Thread(
-                        target=self.run_success_logging_and_cache_storage,
-                        args=(response, cache_hit),
-                    ).start()  # log response
+                    logging_worker_pool.submit_no_drop(
+                        self.run_success_logging_and_cache_storage, response, cache_hit
+                    )  # log response
                     choice = response.choices[0]
                     if isinstance(choice, StreamingChoices):
                         self.response_uptil_now += choice.delta.get("content", "") or ""
@@ -1704,10 +1700,9 @@ class CustomStreamWrapper:
                     )
 
                 ## LOGGING
-                threading.Thread(
-                    target=self.logging_obj.success_handler,
-                    args=(response, None, None, cache_hit),
-                ).start()  # log response
+                logging_worker_pool.submit_no_drop(
+                    self.logging_obj.success_handler, response, None, None, cache_hit
+                )  # log response
 
                 if self.sent_stream_usage is False and self.send_stream_usage is True:
                     self.sent_stream_usage = True
@@ -1720,17 +1715,18 @@ class CustomStreamWrapper:
                     usage = calculate_total_usage(chunks=self.chunks)
                     processed_chunk._hidden_params["usage"] = usage
                 ## LOGGING
-                threading.Thread(
-                    target=self.run_success_logging_and_cache_storage,
-                    args=(processed_chunk, cache_hit),
-                ).start()  # log response
+                logging_worker_pool.submit_no_drop(
+                    self.run_success_logging_and_cache_storage,
+                    processed_chunk,
+                    cache_hit,
+                )  # log response
                 return processed_chunk
         except Exception as e:
             traceback_exception = traceback.format_exc()
             # LOG FAILURE - handle streaming failure logging in the _next_ object, remove `handle_failure` once it's deprecated
-            threading.Thread(
-                target=self.logging_obj.failure_handler, args=(e, traceback_exception)
-            ).start()
+            logging_worker_pool.submit(
+                self.logging_obj.failure_handler, e, traceback_exception
+            )
             if isinstance(e, OpenAIError):
                 raise e
             else:
@@ -1758,6 +1754,14 @@ class CustomStreamWrapper:
 
         return self.completion_stream
 
+    def _release_single_flight(self):
+        """
+        The stream failed - let coalesced requests waiting on it call the provider themselves
+        """
+        caching_handler = getattr(self.logging_obj, "_llm_caching_handler", None)
+        if caching_handler is not None:
+            asyncio.create_task(caching_handler._async_release_single_flight())
+
     async def __anext__(self):  # noqa: PLR0915
         cache_hit = False
         if (
@@ -1818,8 +1822,7 @@ class CustomStreamWrapper:
                     if processed_chunk is None:
                         continue
                     ## LOGGING
-                    ## LOGGING
-                    executor.submit(
+                    logging_worker_pool.submit_no_drop(
                         self.logging_obj.success_handler,
                         result=processed_chunk,
                         start_time=None,
@@ -1884,10 +1887,13 @@ class CustomStreamWrapper:
                         if processed_chunk is None:
                             continue
                         ## LOGGING
-                        threading.Thread(
-                            target=self.logging_obj.success_handler,
-                            args=(processed_chunk, None, None, cache_hit),
-                        ).start()  # log processed_chunk
+                        logging_worker_pool.submit_no_drop(
+                            self.logging_obj.success_handler,
+                            processed_chunk,
+                            None,
+                            None,
+                            cache_hit,
+                        )  # log processed_chunk
                         asyncio.create_task(
                             self.logging_obj.async_success_handler(
                                 processed_chunk, cache_hit=cache_hit
@@ -1921,10 +1927,9 @@ class CustomStreamWrapper:
                         getattr(complete_streaming_response, "usage"),
                     )
                 ## LOGGING
-                threading.Thread(
-                    target=self.logging_obj.success_handler,
-                    args=(response, None, None, cache_hit),
-                ).start()  # log response
+                logging_worker_pool.submit_no_drop(
+                    self.logging_obj.success_handler, response, None, None, cache_hit
+                )  # log response
                 asyncio.create_task(
                     self.logging_obj.async_success_handler(
                         response, cache_hit=cache_hit
@@ -1938,10 +1943,13 @@ class CustomStreamWrapper:
                 self.sent_last_chunk = True
                 processed_chunk = self.finish_reason_handler()
                 ## LOGGING
-                threading.Thread(
-                    target=self.logging_obj.success_handler,
-                    args=(processed_chunk, None, None, cache_hit),
-                ).start()  # log response
+                logging_worker_pool.submit_no_drop(
+                    self.logging_obj.success_handler,
+                    processed_chunk,
+                    None,
+                    None,
+                    cache_hit,
+                )  # log response
                 asyncio.create_task(
                     self.logging_obj.async_success_handler(
                         processed_chunk, cache_hit=cache_hit
@@ -1956,27 +1964,27 @@ class CustomStreamWrapper:
             )
             if self.logging_obj is not None:
                 ## LOGGING
-                threading.Thread(
-                    target=self.logging_obj.failure_handler,
-                    args=(e, traceback_exception),
-                ).start()  # log response
+                logging_worker_pool.submit(
+                    self.logging_obj.failure_handler, e, traceback_exception
+                )  # log response
                 # Handle any exceptions that might occur during streaming
                 asyncio.create_task(
                     self.logging_obj.async_failure_handler(e, traceback_exception)
                 )
+                self._release_single_flight()
             raise e
         except Exception as e:
             traceback_exception = traceback.format_exc()
             if self.logging_obj is not None:
                 ## LOGGING
-                threading.Thread(
-                    target=self.logging_obj.failure_handler,
-                    args=(e, traceback_exception),
-                ).start()  # log response
+                logging_worker_pool.submit(
+                    self.logging_obj.failure_handler, e, traceback_exception
+                )  # log response
                 # Handle any exceptions that might occur during streaming
                 asyncio.create_task(
                     self.logging_obj.async_failure_handler(e, traceback_exception)  # type: ignore
                 )
+                self._release_single_flight()
             ## Map to OpenAI Exception
             raise exception_type(
                 model=self.model,
@@ -18,6 +18,7 @@ import litellm
 from litellm import LlmProviders
 from litellm._logging import verbose_logger
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj
+from litellm.llms.custom_httpx.connection_pool_registry import connection_pool_registry
 from litellm.llms.custom_httpx.http_handler import _DEFAULT_TTL_FOR_HTTPX_CLIENTS
 from litellm.secret_managers.main import get_secret_str
 from litellm.types.utils import ProviderField
@@ -566,11 +567,18 @@ class OpenAIChatCompletion(BaseLLM):
             _cached_client = litellm.in_memory_llm_clients_cache.get_cache(_cache_key)
             if _cached_client:
                 return _cached_client
+            # the sdk client is re-created when the cache entry expires, its connections are re-used from the shared pool
             if is_async:
                 _new_client: Union[OpenAI, AsyncOpenAI] = AsyncOpenAI(
                     api_key=api_key,
                     base_url=api_base,
-                    http_client=litellm.aclient_session,
+                    http_client=litellm.aclient_session
+                    or connection_pool_registry.get_async_client(
+                        llm_provider="openai",
+                        api_base=api_base,
+                        max_keepalive_connections=100,
+                        follow_redirects=True,
+                    ),
                     timeout=timeout,
                     max_retries=max_retries,
                     organization=organization,
@@ -579,7 +587,13 @@ class OpenAIChatCompletion(BaseLLM):
                 _new_client = OpenAI(
                     api_key=api_key,
                     base_url=api_base,
-                    http_client=litellm.client_session,
+                    http_client=litellm.client_session
+                    or connection_pool_registry.get_sync_client(
+                        llm_provider="openai",
+                        api_base=api_base,
+                        max_keepalive_connections=100,
+                        follow_redirects=True,
+                    ),
                     timeout=timeout,
                     max_retries=max_retries,
                     organization=organization,
@@ -1,21 +1,28 @@
-import hashlib
-import json
 import os
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, List, NamedTuple, Optional, Tuple
 
 import httpx
 from pydantic import BaseModel
 
 from litellm._logging import verbose_logger
-from litellm.caching.caching import DualCache, InMemoryCache
 from litellm.secret_managers.main import get_secret, get_secret_str
 
 from .base import BaseLLM
 
 if TYPE_CHECKING:
+    from botocore.auth import SigV4Auth
     from botocore.credentials import Credentials
 else:
     Credentials = Any
+    SigV4Auth = Any
+
+# seconds, temporary credentials expiring sooner are re-fetched
+AWS_CREDENTIALS_EXPIRY_MARGIN = 60
+AWS_CREDENTIALS_CACHE_MAX_SIZE = 1000
 
 
 class Boto3CredentialsInfo(BaseModel):
@@ -37,18 +44,96 @@ class AwsAuthError(Exception):
         )  # Call the base class constructor with the parameters it needs
 
 
+class _CachedAWSCredentials(NamedTuple):
+    credentials: Credentials
+    expires_at: Optional[float]
+
+
+class AWSCredentialsCache:
+    """
+    LRU cache of resolved aws credentials, keyed by the credential args, and of the SigV4 signers built from them.
+
+    - temporary credentials (sts assume role / web identity) are cached until shortly before their `Expiration`
+    - refreshable credentials (default credential chain - instance profile, container role, sso profile) are cached as
+      is, botocore refreshes them before they expire
+    - static credentials are cached until evicted
+    """
+
+    def __init__(self, max_size: int = AWS_CREDENTIALS_CACHE_MAX_SIZE):
+        self.max_size = max_size
+        self._credentials: "OrderedDict[Tuple, _CachedAWSCredentials]" = OrderedDict()
+        self._signers: "OrderedDict[Tuple, SigV4Auth]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_credentials(self, key: Tuple) -> Optional[Credentials]:
+        with self._lock:
+            cached_credentials = self._credentials.get(key)
+            if cached_credentials is None:
+                return None
+            if (
+                cached_credentials.expires_at is not None
+                and cached_credentials.expires_at - AWS_CREDENTIALS_EXPIRY_MARGIN
+                < time.time()
+            ):
+                del self._credentials[key]
+                return None
+            self._credentials.move_to_end(key)
+            return cached_credentials.credentials
+
+    def set_credentials(
+        self, key: Tuple, credentials: Credentials, expires_at: Optional[float] = None
+    ):
+        with self._lock:
+            self._credentials[key] = _CachedAWSCredentials(
+                credentials=credentials, expires_at=expires_at
+            )
+            self._credentials.move_to_end(key)
+            while len(self._credentials) > self.max_size:
+                self._credentials.popitem(last=False)
+
+    def get_signer(
+        self, credentials: Credentials, service_name: str, region_name: str
+    ) -> SigV4Auth:
+        """
+        Returns a SigV4 signer for the credentials. Signers don't hold any per-request state, so one is built per
+        (credentials, service, region) and re-used.
+        """
+        from botocore.auth import SigV4Auth
+
+        key = (id(credentials), service_name, region_name)
+        with self._lock:
+            signer = self._signers.get(key)
+            # the id of garbage collected credentials can be re-used, so check the signer still holds these credentials
+            if signer is not None and signer.credentials is credentials:
+                self._signers.move_to_end(key)
+                return signer
+            signer = SigV4Auth(credentials, service_name, region_name)
+            self._signers[key] = signer
+            while len(self._signers) > self.max_size:
+                self._signers.popitem(last=False)
+            return signer
+
+    def flush_cache(self):
+        with self._lock:
+            self._credentials.clear()
+            self._signers.clear()
+
+
+aws_credentials_cache = AWSCredentialsCache()
+
+
 class BaseAWSLLM(BaseLLM):
     def __init__(self) -> None:
-        self.iam_cache = DualCache()
         super().__init__()
 
-    def get_cache_key(self, credential_args: Dict[str, Optional[str]]) -> str:
-        """
-        Generate a unique cache key based on the credential arguments.
-        """
-        # Convert credential arguments to a JSON string and hash it to create a unique key
-        credential_str = json.dumps(credential_args, sort_keys=True)
-        return hashlib.sha256(credential_str.encode()).hexdigest()
+    def get_sigv4_signer(
+        self, credentials: Credentials, service_name: str, aws_region_name: str
+    ) -> SigV4Auth:
+        return aws_credentials_cache.get_signer(
+            credentials=credentials,
+            service_name=service_name,
+            region_name=aws_region_name,
+        )
 
     def get_credentials(  # noqa: PLR0915
         self,
@@ -117,9 +202,10 @@ class BaseAWSLLM(BaseLLM):
             aws_sts_endpoint,
         ) = params_to_check
 
-        # create cache key for non-expiring auth flows
-        args = {k: v for k, v in locals().items() if k.startswith("aws_")}
-        cache_key = self.get_cache_key(args)
+        cache_key = tuple(params_to_check)
+        cached_credentials = aws_credentials_cache.get_credentials(cache_key)
+        if cached_credentials is not None:
+            return cached_credentials
 
         verbose_logger.debug(
             "in get credentials\n"
@@ -143,6 +229,9 @@ class BaseAWSLLM(BaseLLM):
             aws_sts_endpoint,
         )
 
+        # expiry of temporary credentials, None if they don't expire or botocore refreshes them
+        expires_at: Optional[float] = None
+
         ### CHECK STS ###
         if (
             aws_web_identity_token is not None
@@ -158,65 +247,36 @@ class BaseAWSLLM(BaseLLM):
             else:
                 sts_endpoint = aws_sts_endpoint
 
-            iam_creds_cache_key = json.dumps(
-                {
-                    "aws_web_identity_token": aws_web_identity_token,
-                    "aws_role_name": aws_role_name,
-                    "aws_session_name": aws_session_name,
-                }
-            )
-
-            iam_creds_dict = self.iam_cache.get_cache(iam_creds_cache_key)
-            if iam_creds_dict is None:
-                oidc_token = get_secret(aws_web_identity_token)
-
-                if oidc_token is None:
-                    raise AwsAuthError(
-                        message="OIDC token could not be retrieved from secret manager.",
-                        status_code=401,
-                    )
-
-                sts_client = boto3.client(
-                    "sts",
-                    region_name=aws_region_name,
-                    endpoint_url=sts_endpoint,
-                )
-
-                # https://docs.aws.amazon.com/STS/latest/APIReference/API_AssumeRoleWithWebIdentity.html
-                # https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/sts/client/assume_role_with_web_identity.html
-                sts_response = sts_client.assume_role_with_web_identity(
-                    RoleArn=aws_role_name,
-                    RoleSessionName=aws_session_name,
-                    WebIdentityToken=oidc_token,
-                    DurationSeconds=3600,
-                    Policy='{"Version":"2012-10-17","Statement":[{"Sid":"BedrockLiteLLM","Effect":"Allow","Action":["bedrock:InvokeModel","bedrock:InvokeModelWithResponseStream"],"Resource":"*","Condition":{"Bool":{"aws:SecureTransport":"true"},"StringLike":{"aws:UserAgent":"litellm/*"}}}]}',
-                )
+            oidc_token = get_secret(aws_web_identity_token)
 
-                iam_creds_dict = {
-                    "aws_access_key_id": sts_response["Credentials"]["AccessKeyId"],
-                    "aws_secret_access_key": sts_response["Credentials"][
-                        "SecretAccessKey"
-                    ],
-                    "aws_session_token": sts_response["Credentials"]["SessionToken"],
-                    "region_name": aws_region_name,
-                }
-
-                self.iam_cache.set_cache(
-                    key=iam_creds_cache_key,
-                    value=json.dumps(iam_creds_dict),
-                    ttl=3600 - 60,
+            if oidc_token is None:
+                raise AwsAuthError(
+                    message="OIDC token could not be retrieved from secret manager.",
+                    status_code=401,
                 )
 
-                if sts_response["PackedPolicySize"] > 75:
-                    verbose_logger.warning(
-                        f"The policy size is greater than 75% of the allowed size, PackedPolicySize: {sts_response['PackedPolicySize']}"
-                    )
+            sts_client = boto3.client(
+                "sts",
+                region_name=aws_region_name,
+                endpoint_url=sts_endpoint,
+            )
 
-            session = boto3.Session(**iam_creds_dict)
+            # https://docs.aws.amazon.com/STS/latest/APIReference/API_AssumeRoleWithWebIdentity.html
+            # https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/sts/client/assume_role_with_web_identity.html
+            sts_response = sts_client.assume_role_with_web_identity(
+                RoleArn=aws_role_name,
+                RoleSessionName=aws_session_name,
+                WebIdentityToken=oidc_token,
+                DurationSeconds=3600,
+                Policy='{"Version":"2012-10-17","Statement":[{"Sid":"BedrockLiteLLM","Effect":"Allow","Action":["bedrock:InvokeModel","bedrock:InvokeModelWithResponseStream"],"Resource":"*","Condition":{"Bool":{"aws:SecureTransport":"true"},"StringLike":{"aws:UserAgent":"litellm/*"}}}]}',
+            )
 
-            iam_creds = session.get_credentials()
+            if sts_response["PackedPolicySize"] > 75:
+                verbose_logger.warning(
+                    f"The policy size is greater than 75% of the allowed size, PackedPolicySize: {sts_response['PackedPolicySize']}"
+                )
 
-            return iam_creds
+            credentials, expires_at = self._get_sts_credentials(sts_response)
         elif aws_role_name is not None and aws_session_name is not None:
             sts_client = boto3.client(
                 "sts",
@@ -228,46 +288,27 @@ class BaseAWSLLM(BaseLLM):
                 RoleArn=aws_role_name, RoleSessionName=aws_session_name
             )
 
-            # Extract the credentials from the response and convert to Session Credentials
-            sts_credentials = sts_response["Credentials"]
-
-            credentials = Credentials(
-                access_key=sts_credentials["AccessKeyId"],
-                secret_key=sts_credentials["SecretAccessKey"],
-                token=sts_credentials["SessionToken"],
-            )
-            return credentials
+            credentials, expires_at = self._get_sts_credentials(sts_response)
         elif aws_profile_name is not None:  ### CHECK SESSION ###
             # uses auth values from AWS profile usually stored in ~/.aws/credentials
             client = boto3.Session(profile_name=aws_profile_name)
 
-            return client.get_credentials()
+            credentials = client.get_credentials()
         elif (
             aws_access_key_id is not None
             and aws_secret_access_key is not None
             and aws_session_token is not None
         ):  ### CHECK FOR AWS SESSION TOKEN ###
-            from botocore.credentials import Credentials
-
             credentials = Credentials(
                 access_key=aws_access_key_id,
                 secret_key=aws_secret_access_key,
                 token=aws_session_token,
             )
-
-            return credentials
         elif (
             aws_access_key_id is not None
             and aws_secret_access_key is not None
             and aws_region_name is not None
         ):
-            # Check if credentials are already in cache. These credentials have no expiry time.
-            cached_credentials: Optional[Credentials] = self.iam_cache.get_cache(
-                cache_key
-            )
-            if cached_credentials:
-                return cached_credentials
-
             session = boto3.Session(
                 aws_access_key_id=aws_access_key_id,
                 aws_secret_access_key=aws_secret_access_key,
@@ -275,20 +316,36 @@ class BaseAWSLLM(BaseLLM):
             )
 
             credentials = session.get_credentials()
-
-            if (
-                credentials.token is None
-            ):  # don't cache if session token exists. The expiry time for that is not known.
-                self.iam_cache.set_cache(cache_key, credentials, ttl=3600 - 60)
-
-            return credentials
         else:
-            # check env var. Do not cache the response from this.
+            # default credential chain - env vars, shared credentials file, container / instance profile role
             session = boto3.Session()
 
             credentials = session.get_credentials()
 
-            return credentials
+        if credentials is not None:
+            aws_credentials_cache.set_credentials(
+                cache_key, credentials, expires_at=expires_at
+            )
+        return credentials
+
+    def _get_sts_credentials(self, sts_response: dict) -> Tuple[Credentials, float]:
+        """
+        Returns the credentials in an sts assume role response, and when they expire
+        """
+        from botocore.credentials import Credentials
+
+        sts_credentials = sts_response["Credentials"]
+        credentials = Credentials(
+            access_key=sts_credentials["AccessKeyId"],
+            secret_key=sts_credentials["SecretAccessKey"],
+            token=sts_credentials["SessionToken"],
+        )
+        expiration = sts_credentials.get("Expiration")
+        if isinstance(expiration, datetime):
+            expires_at = expiration.timestamp()
+        else:  # sts returns credentials valid for 1 hour by default
+            expires_at = time.time() + 3600
+        return credentials, expires_at
 
     def get_runtime_endpoint(
         self,
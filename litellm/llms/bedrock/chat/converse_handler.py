@@ -297,7 +297,7 @@ class BedrockConverseLLM(BaseAWSLLM):
             endpoint_url = f"{endpoint_url}/model/{modelId}/converse"
             proxy_endpoint_url = f"{proxy_endpoint_url}/model/{modelId}/converse"
 
-        sigv4 = SigV4Auth(credentials, "bedrock", aws_region_name)
+        sigv4 = self.get_sigv4_signer(credentials, "bedrock", aws_region_name)
 
         ## TRANSFORMATION ##
 
@@ -168,8 +168,8 @@ class BedrockEmbedding(BaseAWSLLM):
             raise ImportError("Missing boto3 to call bedrock. Run 'pip install boto3'.")
 
         responses: List[dict] = []
+        sigv4 = self.get_sigv4_signer(credentials, "bedrock", aws_region_name)
         for data in batch_data:
-            sigv4 = SigV4Auth(credentials, "bedrock", aws_region_name)
             headers = {"Content-Type": "application/json"}
             if extra_headers is not None:
                 headers = {"Content-Type": "application/json", **extra_headers}
@@ -259,8 +259,8 @@ class BedrockEmbedding(BaseAWSLLM):
             raise ImportError("Missing boto3 to call bedrock. Run 'pip install boto3'.")
 
         responses: List[dict] = []
+        sigv4 = self.get_sigv4_signer(credentials, "bedrock", aws_region_name)
         for data in batch_data:
-            sigv4 = SigV4Auth(credentials, "bedrock", aws_region_name)
             headers = {"Content-Type": "application/json"}
             if extra_headers is not None:
                 headers = {"Content-Type": "application/json", **extra_headers}
@@ -450,7 +450,7 @@ class BedrockEmbedding(BaseAWSLLM):
         elif data is None:
             raise Exception("Unable to map request to provider")
 
-        sigv4 = SigV4Auth(credentials, "bedrock", aws_region_name)
+        sigv4 = self.get_sigv4_signer(credentials, "bedrock", aws_region_name)
         headers = {"Content-Type": "application/json"}
         if extra_headers is not None:
             headers = {"Content-Type": "application/json", **extra_headers}
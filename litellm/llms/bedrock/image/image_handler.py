@@ -177,7 +177,7 @@ class BedrockImageGeneration(BaseAWSLLM):
             aws_region_name=boto3_credentials_info.aws_region_name,
         )
         proxy_endpoint_url = f"{proxy_endpoint_url}/model/{modelId}/invoke"
-        sigv4 = SigV4Auth(
+        sigv4 = self.get_sigv4_signer(
             boto3_credentials_info.credentials,
             "bedrock",
             boto3_credentials_info.aws_region_name,
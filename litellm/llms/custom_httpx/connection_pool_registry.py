@@ -0,0 +1,602 @@
+"""
+Shared HTTP connection pools for LLM provider clients
+
+Provider clients (`AsyncHTTPHandler`, `AsyncOpenAI`, router clients) are cached with a TTL. Each new client used to create
+its own connection pool, so when a cached client expired, its warm keep-alive connections were dropped and the old pool
+was never closed.
+
+Clients now get their connections from `connection_pool_registry`. Pools are keyed by
+(provider, api base origin, proxy, TLS settings, http2, limits), so a new client for the same key re-uses the warm pool.
+
+Environment proxies (HTTP_PROXY / HTTPS_PROXY / ALL_PROXY / NO_PROXY) are applied the same way httpx does - a client
+for a known api base uses the proxy for its origin, other clients mount a pool per proxied url pattern.
+
+- each client holds a reference to its pool, released when the client is closed or garbage collected
+- a pool with no references and no in-flight requests is closed after `litellm.connection_pool_idle_ttl` seconds
+- `litellm.connection_pool_http2`: multiplex requests over HTTP/2 connections (requires `h2`)
+- `litellm.connection_pool_limits`: per-provider limits, e.g. `{"openai": {"max_connections": 200, "max_keepalive_connections": 50, "keepalive_expiry": 30}}`
+
+`connection_pool_registry.get_metrics()` returns the size, idle connections, in-flight requests and pool wait time of each pool.
+"""
+
+import asyncio
+import importlib.util
+import os
+import threading
+import time
+import weakref
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+from httpx._utils import URLPattern, get_environment_proxies
+
+import litellm
+from litellm._logging import verbose_logger
+from litellm.types.llms.custom_http import ConnectionPoolMetrics
+
+DEFAULT_CONNECTION_POOL_KEEPALIVE_EXPIRY = 5.0  # seconds, same as httpx
+
+ConnectionPoolKey = Tuple[Any, ...]
+
+
+def _get_origin(api_base: Optional[str]) -> str:
+    if not api_base:
+        return ""
+    try:
+        url = httpx.URL(api_base)
+        if not url.host:
+            return api_base
+        return "{}://{}{}".format(
+            url.scheme, url.host, f":{url.port}" if url.port is not None else ""
+        )
+    except Exception:
+        return api_base
+
+
+def _get_environment_proxy(
+    origin: str, proxy_map: Dict[str, Optional[str]]
+) -> Optional[str]:
+    """
+    Returns the proxy httpx would use for `origin`, from `get_environment_proxies()`
+    """
+    try:
+        url = httpx.URL(origin)
+    except Exception:
+        return None
+    for pattern in sorted(URLPattern(key) for key in proxy_map):
+        if pattern.matches(url):
+            return proxy_map[pattern.pattern]
+    return None
+
+
+def _is_http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+class ConnectionPool:
+    """
+    One httpcore connection pool, shared by all the httpx clients created for its key
+    """
+
+    def __init__(
+        self,
+        key: ConnectionPoolKey,
+        llm_provider: str,
+        api_base: str,
+        is_async: bool,
+        limits: httpx.Limits,
+        http2: bool,
+        transport_kwargs: dict,
+    ):
+        self.key = key
+        self.llm_provider = llm_provider
+        self.api_base = api_base
+        self.is_async = is_async
+        self.limits = limits
+        self.http2 = http2
+        if is_async:
+            self.httpcore_pool: Any = httpx.AsyncHTTPTransport(
+                limits=limits, http2=http2, **transport_kwargs
+            )._pool
+        else:
+            self.httpcore_pool = httpx.HTTPTransport(
+                limits=limits, http2=http2, **transport_kwargs
+            )._pool
+
+        self._lock = threading.Lock()
+        self.ref_count = 0
+        self.in_flight_requests = 0
+        self.total_requests = 0
+        self.total_pool_wait_time = 0.0
+        self.max_pool_wait_time = 0.0
+        self.last_used_at = time.time()
+
+    def acquire_reference(self):
+        with self._lock:
+            self.ref_count += 1
+            self.last_used_at = time.time()
+
+    def release_reference(self):
+        with self._lock:
+            self.ref_count = max(self.ref_count - 1, 0)
+            self.last_used_at = time.time()
+
+    def on_request_start(self):
+        with self._lock:
+            self.in_flight_requests += 1
+            self.total_requests += 1
+            self.last_used_at = time.time()
+
+    def on_request_end(self):
+        with self._lock:
+            self.in_flight_requests = max(self.in_flight_requests - 1, 0)
+            self.last_used_at = time.time()
+
+    def record_pool_wait_time(self, pool_wait_time: float):
+        with self._lock:
+            self.total_pool_wait_time += pool_wait_time
+            self.max_pool_wait_time = max(self.max_pool_wait_time, pool_wait_time)
+
+    def is_idle(self, idle_ttl: float) -> bool:
+        return (
+            self.ref_count == 0
+            and self.in_flight_requests == 0
+            and time.time() - self.last_used_at > idle_ttl
+        )
+
+    def get_metrics(self) -> ConnectionPoolMetrics:
+        connections = list(getattr(self.httpcore_pool, "connections", []))
+        num_idle_connections = 0
+        for connection in connections:
+            try:
+                if connection.is_idle():
+                    num_idle_connections += 1
+            except Exception:
+                pass
+        return ConnectionPoolMetrics(
+            llm_provider=self.llm_provider,
+            api_base=self.api_base,
+            is_async=self.is_async,
+            http2=self.http2,
+            max_connections=self.limits.max_connections,
+            max_keepalive_connections=self.limits.max_keepalive_connections,
+            connections=len(connections),
+            idle_connections=num_idle_connections,
+            in_flight_requests=self.in_flight_requests,
+            clients=self.ref_count,
+            total_requests=self.total_requests,
+            avg_pool_wait_time=(
+                self.total_pool_wait_time / self.total_requests
+                if self.total_requests
+                else 0.0
+            ),
+            max_pool_wait_time=self.max_pool_wait_time,
+        )
+
+    async def aclose(self):
+        await self.httpcore_pool.aclose()
+
+    def close(self):
+        self.httpcore_pool.close()
+
+
+class _ReleasingAsyncByteStream(httpx.AsyncByteStream):
+    """
+    A response is in-flight until its body is closed
+    """
+
+    def __init__(self, stream: httpx.AsyncByteStream, connection_pool: ConnectionPool):
+        self._stream = stream
+        self._connection_pool = connection_pool
+        self._released = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._connection_pool.on_request_end()
+
+
+class _ReleasingSyncByteStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, connection_pool: ConnectionPool):
+        self._stream = stream
+        self._connection_pool = connection_pool
+        self._released = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._stream:
+            yield chunk
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            if not self._released:
+                self._released = True
+                self._connection_pool.on_request_end()
+
+
+class PooledAsyncHTTPTransport(httpx.AsyncHTTPTransport):
+    """
+    httpx transport for one client, sending requests over a shared `ConnectionPool`.
+
+    Closing the transport (i.e. closing the client) releases the client's reference, it doesn't close the shared connections.
+    """
+
+    def __init__(self, connection_pool: ConnectionPool):
+        """
+        `connection_pool` must have a reference acquired for this transport, it's released when the transport is closed
+        """
+        # don't call super().__init__() - it would create a new connection pool
+        self._pool = connection_pool.httpcore_pool
+        self.connection_pool = connection_pool
+        self._release_reference = weakref.finalize(
+            self, connection_pool.release_reference
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        connection_pool = self.connection_pool
+        start_time = time.perf_counter()
+        trace = request.extensions.get("trace")
+        connection_acquired = False
+
+        async def _trace(event_name: str, info: dict):
+            # the first trace event is sent once the pool assigned a connection to the request
+            nonlocal connection_acquired
+            if not connection_acquired:
+                connection_acquired = True
+                connection_pool.record_pool_wait_time(time.perf_counter() - start_time)
+            if trace is not None:
+                await trace(event_name, info)
+
+        request.extensions = {**request.extensions, "trace": _trace}
+        connection_pool.on_request_start()
+        try:
+            response = await super().handle_async_request(request)
+        except BaseException:
+            connection_pool.on_request_end()
+            raise
+        response.stream = _ReleasingAsyncByteStream(response.stream, connection_pool)  # type: ignore
+        return response
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type=None, exc_value=None, traceback=None) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        self._release_reference()
+
+
+class PooledHTTPTransport(httpx.HTTPTransport):
+    """
+    Sync version of `PooledAsyncHTTPTransport`
+    """
+
+    def __init__(self, connection_pool: ConnectionPool):
+        self._pool = connection_pool.httpcore_pool
+        self.connection_pool = connection_pool
+        self._release_reference = weakref.finalize(
+            self, connection_pool.release_reference
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        connection_pool = self.connection_pool
+        start_time = time.perf_counter()
+        trace = request.extensions.get("trace")
+        connection_acquired = False
+
+        def _trace(event_name: str, info: dict):
+            nonlocal connection_acquired
+            if not connection_acquired:
+                connection_acquired = True
+                connection_pool.record_pool_wait_time(time.perf_counter() - start_time)
+            if trace is not None:
+                trace(event_name, info)
+
+        request.extensions = {**request.extensions, "trace": _trace}
+        connection_pool.on_request_start()
+        try:
+            response = super().handle_request(request)
+        except BaseException:
+            connection_pool.on_request_end()
+            raise
+        response.stream = _ReleasingSyncByteStream(response.stream, connection_pool)  # type: ignore
+        return response
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type=None, exc_value=None, traceback=None) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._release_reference()
+
+
+class ConnectionPoolRegistry:
+    def __init__(self):
+        self._pools: Dict[ConnectionPoolKey, ConnectionPool] = {}
+        self._lock = threading.Lock()
+        self._http2_unavailable_warned = False
+
+    def get_async_client(
+        self,
+        llm_provider: str,
+        api_base: Optional[str] = None,
+        concurrent_limit: int = 1000,
+        max_keepalive_connections: Optional[int] = None,
+        **client_kwargs: Any,
+    ) -> httpx.AsyncClient:
+        """
+        Returns a new httpx.AsyncClient, sending requests over the shared connection pool for these settings.
+
+        `client_kwargs` are passed to httpx.AsyncClient - e.g. `timeout`, `event_hooks`, `headers`
+        """
+        connection_pool, proxy_connection_pools = self._get_client_connection_pools(
+            is_async=True,
+            llm_provider=llm_provider,
+            api_base=api_base,
+            concurrent_limit=concurrent_limit,
+            max_keepalive_connections=max_keepalive_connections,
+            trust_env=client_kwargs.get("trust_env", True),
+        )
+        verify, cert = self._get_ssl_settings()
+        return httpx.AsyncClient(
+            transport=PooledAsyncHTTPTransport(connection_pool=connection_pool),
+            mounts={
+                pattern: (
+                    PooledAsyncHTTPTransport(connection_pool=proxy_connection_pool)
+                    if proxy_connection_pool is not None
+                    else None
+                )
+                for pattern, proxy_connection_pool in proxy_connection_pools.items()
+            },
+            verify=verify,
+            cert=cert,
+            **client_kwargs,
+        )
+
+    def get_sync_client(
+        self,
+        llm_provider: str,
+        api_base: Optional[str] = None,
+        concurrent_limit: int = 1000,
+        max_keepalive_connections: Optional[int] = None,
+        **client_kwargs: Any,
+    ) -> httpx.Client:
+        """
+        Sync version of `get_async_client`
+        """
+        connection_pool, proxy_connection_pools = self._get_client_connection_pools(
+            is_async=False,
+            llm_provider=llm_provider,
+            api_base=api_base,
+            concurrent_limit=concurrent_limit,
+            max_keepalive_connections=max_keepalive_connections,
+            trust_env=client_kwargs.get("trust_env", True),
+        )
+        verify, cert = self._get_ssl_settings()
+        return httpx.Client(
+            transport=PooledHTTPTransport(connection_pool=connection_pool),
+            mounts={
+                pattern: (
+                    PooledHTTPTransport(connection_pool=proxy_connection_pool)
+                    if proxy_connection_pool is not None
+                    else None
+                )
+                for pattern, proxy_connection_pool in proxy_connection_pools.items()
+            },
+            verify=verify,
+            cert=cert,
+            **client_kwargs,
+        )
+
+    def get_metrics(self) -> List[ConnectionPoolMetrics]:
+        with self._lock:
+            connection_pools = list(self._pools.values())
+        return [connection_pool.get_metrics() for connection_pool in connection_pools]
+
+    async def aclose(self):
+        """
+        Closes all connections. Clients still using a pool open new connections on their next request.
+        """
+        with self._lock:
+            connection_pools = list(self._pools.values())
+            self._pools = {}
+        for connection_pool in connection_pools:
+            try:
+                if connection_pool.is_async:
+                    await connection_pool.aclose()
+                else:
+                    connection_pool.close()
+            except Exception as e:
+                verbose_logger.debug("Error closing connection pool - %s", str(e))
+
+    def _get_ssl_settings(self) -> Tuple[Any, Any]:
+        # SSL certificates (a.k.a CA bundle) used to verify the identity of requested hosts.
+        ssl_verify = os.getenv("SSL_VERIFY", litellm.ssl_verify)
+        # An SSL certificate used by the requested host to authenticate the client.
+        cert = os.getenv("SSL_CERTIFICATE", litellm.ssl_certificate)
+        return ssl_verify, cert
+
+    def _get_limits(
+        self,
+        llm_provider: str,
+        concurrent_limit: int,
+        max_keepalive_connections: Optional[int],
+    ) -> httpx.Limits:
+        pool_limits = (litellm.connection_pool_limits or {}).get(llm_provider) or {}
+        return httpx.Limits(
+            max_connections=pool_limits.get("max_connections", concurrent_limit),
+            max_keepalive_connections=pool_limits.get(
+                "max_keepalive_connections",
+                (
+                    max_keepalive_connections
+                    if max_keepalive_connections is not None
+                    else concurrent_limit
+                ),
+            ),
+            keepalive_expiry=pool_limits.get(
+                "keepalive_expiry", DEFAULT_CONNECTION_POOL_KEEPALIVE_EXPIRY
+            ),
+        )
+
+    def _use_http2(self) -> bool:
+        if litellm.connection_pool_http2 is not True:
+            return False
+        if _is_http2_available():
+            return True
+        if not self._http2_unavailable_warned:
+            self._http2_unavailable_warned = True
+            verbose_logger.warning(
+                "litellm.connection_pool_http2 is set, but the `h2` package is not installed. Using HTTP/1.1. Run `pip install 'httpx[http2]'` to enable HTTP/2."
+            )
+        return False
+
+    def _get_client_connection_pools(
+        self,
+        is_async: bool,
+        llm_provider: str,
+        api_base: Optional[str],
+        concurrent_limit: int,
+        max_keepalive_connections: Optional[int],
+        trust_env: bool,
+    ) -> Tuple[ConnectionPool, Dict[str, Optional[ConnectionPool]]]:
+        """
+        Returns the client's connection pool, and the connection pool to mount per url pattern of the environment proxies.
+
+        A client with a custom transport doesn't read the environment proxies, so they are applied here:
+        - known api base: the client's pool uses the proxy for the api base origin, nothing is mounted
+        - unknown api base: each proxied url pattern is mounted with a pool for its proxy, NO_PROXY patterns with None
+        """
+        proxy_map: Dict[str, Optional[str]] = (
+            get_environment_proxies() if trust_env else {}
+        )
+        origin = _get_origin(api_base)
+        proxy: Optional[str] = None
+        proxy_connection_pools: Dict[str, Optional[ConnectionPool]] = {}
+        if origin:
+            proxy = _get_environment_proxy(origin=origin, proxy_map=proxy_map)
+        else:
+            for pattern, pattern_proxy in proxy_map.items():
+                proxy_connection_pools[pattern] = (
+                    self._get_connection_pool(
+                        is_async=is_async,
+                        llm_provider=llm_provider,
+                        api_base=api_base,
+                        concurrent_limit=concurrent_limit,
+                        max_keepalive_connections=max_keepalive_connections,
+                        proxy=pattern_proxy,
+                    )
+                    if pattern_proxy is not None
+                    else None
+                )
+        connection_pool = self._get_connection_pool(
+            is_async=is_async,
+            llm_provider=llm_provider,
+            api_base=api_base,
+            concurrent_limit=concurrent_limit,
+            max_keepalive_connections=max_keepalive_connections,
+            proxy=proxy,
+        )
+        return connection_pool, proxy_connection_pools
+
+    def _get_connection_pool(
+        self,
+        is_async: bool,
+        llm_provider: str,
+        api_base: Optional[str],
+        concurrent_limit: int,
+        max_keepalive_connections: Optional[int],
+        proxy: Optional[str],
+    ) -> ConnectionPool:
+        """
+        Returns the connection pool for these settings, with a reference acquired for the caller
+        """
+        llm_provider = str(getattr(llm_provider, "value", llm_provider))
+        origin = _get_origin(api_base)
+        limits = self._get_limits(
+            llm_provider=llm_provider,
+            concurrent_limit=concurrent_limit,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        http2 = self._use_http2()
+        ssl_verify, cert = self._get_ssl_settings()
+        key: ConnectionPoolKey = (
+            is_async,
+            llm_provider,
+            origin,
+            proxy,
+            str(ssl_verify),
+            str(cert),
+            litellm.force_ipv4,
+            http2,
+            limits.max_connections,
+            limits.max_keepalive_connections,
+            limits.keepalive_expiry,
+        )
+
+        with self._lock:
+            connection_pool = self._pools.get(key)
+            if connection_pool is None:
+                transport_kwargs: Dict[str, Any] = {"verify": ssl_verify, "cert": cert}
+                if proxy is not None:
+                    transport_kwargs["proxy"] = proxy
+                if litellm.force_ipv4:
+                    transport_kwargs["local_address"] = "0.0.0.0"
+                connection_pool = ConnectionPool(
+                    key=key,
+                    llm_provider=llm_provider,
+                    api_base=origin,
+                    is_async=is_async,
+                    limits=limits,
+                    http2=http2,
+                    transport_kwargs=transport_kwargs,
+                )
+                self._pools[key] = connection_pool
+            connection_pool.acquire_reference()
+            idle_connection_pools = self._pop_idle_connection_pools()
+
+        for idle_connection_pool in idle_connection_pools:
+            self._close_idle_connection_pool(idle_connection_pool)
+        return connection_pool
+
+    def _pop_idle_connection_pools(self) -> List[ConnectionPool]:
+        idle_ttl = litellm.connection_pool_idle_ttl
+        idle_connection_pools = [
+            connection_pool
+            for connection_pool in self._pools.values()
+            if connection_pool.is_idle(idle_ttl=idle_ttl)
+        ]
+        for connection_pool in idle_connection_pools:
+            self._pools.pop(connection_pool.key, None)
+        return idle_connection_pools
+
+    def _close_idle_connection_pool(self, connection_pool: ConnectionPool):
+        verbose_logger.debug(
+            "Closing idle connection pool for llm_provider=%s, api_base=%s",
+            connection_pool.llm_provider,
+            connection_pool.api_base,
+        )
+        try:
+            if not connection_pool.is_async:
+                connection_pool.close()
+                return
+            loop = asyncio.get_running_loop()
+            loop.create_task(connection_pool.aclose())
+        except RuntimeError:
+            # no running event loop, the connections are closed when the pool is garbage collected
+            pass
+        except Exception as e:
+            verbose_logger.debug("Error closing connection pool - %s", str(e))
+
+
+connection_pool_registry = ConnectionPoolRegistry()
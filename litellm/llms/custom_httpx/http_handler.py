@@ -8,6 +8,7 @@ from httpx import USE_CLIENT_DEFAULT, AsyncHTTPTransport, HTTPTransport
 
 import litellm
 from litellm.caching import InMemoryCache
+from litellm.llms.custom_httpx.connection_pool_registry import connection_pool_registry
 from litellm.types.llms.custom_http import *
 
 if TYPE_CHECKING:
@@ -36,12 +37,17 @@ class AsyncHTTPHandler:
         event_hooks: Optional[Mapping[str, List[Callable[..., Any]]]] = None,
         concurrent_limit=1000,
         client_alias: Optional[str] = None,  # name for client in logs
+        client: Optional[httpx.AsyncClient] = None,
     ):
         self.timeout = timeout
         self.event_hooks = event_hooks
-        self.client = self.create_client(
-            timeout=timeout, concurrent_limit=concurrent_limit, event_hooks=event_hooks
-        )
+        if client is None:
+            client = self.create_client(
+                timeout=timeout,
+                concurrent_limit=concurrent_limit,
+                event_hooks=event_hooks,
+            )
+        self.client = client
         self.client_alias = client_alias
 
     def create_client(
@@ -481,12 +487,19 @@ def get_async_httpx_client(
     if _cached_client:
         return _cached_client
 
-    if params is not None:
-        _new_client = AsyncHTTPHandler(**params)
-    else:
-        _new_client = AsyncHTTPHandler(
-            timeout=httpx.Timeout(timeout=600.0, connect=5.0)
-        )
+    if params is None:
+        params = {"timeout": httpx.Timeout(timeout=600.0, connect=5.0)}
+    # the handler is re-created when the cache entry expires, its connections are re-used from the shared pool
+    _new_client = AsyncHTTPHandler(
+        **params,
+        client=connection_pool_registry.get_async_client(
+            llm_provider=llm_provider,
+            concurrent_limit=params.get("concurrent_limit", 1000),
+            timeout=params.get("timeout") or _DEFAULT_TIMEOUT,
+            event_hooks=params.get("event_hooks"),
+            headers=headers,
+        ),
+    )
     litellm.in_memory_llm_clients_cache.set_cache(
         key=_cache_key_name,
         value=_new_client,
@@ -515,10 +528,17 @@ def _get_httpx_client(params: Optional[dict] = None) -> HTTPHandler:
     if _cached_client:
         return _cached_client
 
-    if params is not None:
-        _new_client = HTTPHandler(**params)
-    else:
-        _new_client = HTTPHandler(timeout=httpx.Timeout(timeout=600.0, connect=5.0))
+    if params is None:
+        params = {"timeout": httpx.Timeout(timeout=600.0, connect=5.0)}
+    _new_client = HTTPHandler(
+        **params,
+        client=connection_pool_registry.get_sync_client(
+            llm_provider="httpx_client",
+            concurrent_limit=params.get("concurrent_limit", 1000),
+            timeout=params.get("timeout") or _DEFAULT_TIMEOUT,
+            headers=headers,
+        ),
+    )
 
     litellm.in_memory_llm_clients_cache.set_cache(
         key=_cache_key_name,
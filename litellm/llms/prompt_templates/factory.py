@@ -2153,23 +2153,18 @@ from litellm.types.llms.bedrock import ToolUseBlock as BedrockToolUseBlock
 
 def get_image_details(image_url) -> Tuple[str, str]:
     try:
-        import base64
-
-        client = HTTPHandler(concurrent_limit=1)
-        # Send a GET request to the image URL
-        response = client.get(image_url)
-        response.raise_for_status()  # Raise an exception for HTTP errors
+        # goes through the image url cache, so images prefetched on `acompletion` are not downloaded again
+        image_data_url = convert_url_to_base64(url=image_url)
+        content_type, base64_bytes = image_data_url.split("data:")[1].split(
+            ";base64,"
+        )
 
         # Check the response's content type to ensure it is an image
-        content_type = response.headers.get("content-type")
         if not content_type or "image" not in content_type:
             raise ValueError(
                 f"URL does not point to a valid image (content-type: {content_type})"
             )
 
-        # Convert the image content to base64 bytes
-        base64_bytes = base64.b64encode(response.content).decode("utf-8")
-
         # Get mime-type
         mime_type = content_type.split("/")[
             1
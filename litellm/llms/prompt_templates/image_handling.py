@@ -2,24 +2,148 @@
 Helper functions to handle images passed in messages
 """
 
+import asyncio
 import base64
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional
 
 from httpx import Response
 
 import litellm
 from litellm import verbose_logger
-from litellm.caching.caching import InMemoryCache
 from litellm.llms.custom_httpx.http_handler import (
     _get_httpx_client,
     get_async_httpx_client,
 )
 
-MAX_IMGS_IN_MEMORY = 10
+# providers whose prompt conversion downloads image urls, instead of passing them to the provider
+IMAGE_URL_PREFETCH_PROVIDERS = {"anthropic", "bedrock", "ollama", "ollama_chat"}
 
-in_memory_cache = InMemoryCache(max_size_in_memory=MAX_IMGS_IN_MEMORY)
+
+class CachedImage(NamedTuple):
+    data_url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+
+class ImageURLCache:
+    """
+    LRU cache of downloaded images, keyed by url and bounded by the total size of the cached images.
+
+    Entries are fresh for `ttl` seconds. After that they are revalidated with `If-None-Match` / `If-Modified-Since`
+    if the image server sent an `ETag` / `Last-Modified` header, and re-downloaded otherwise.
+    """
+
+    def __init__(
+        self, max_size_bytes: Optional[int] = None, ttl: Optional[float] = None
+    ):
+        """
+        Args left as None are read from `litellm.image_url_cache_max_size_bytes` / `litellm.image_url_cache_ttl`
+        """
+        self.max_size_bytes = max_size_bytes
+        self.ttl = ttl
+        self.current_size_bytes = 0
+        self._cache: "OrderedDict[str, CachedImage]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_max_size_bytes(self) -> int:
+        if self.max_size_bytes is not None:
+            return self.max_size_bytes
+        return litellm.image_url_cache_max_size_bytes
+
+    def _get_ttl(self) -> float:
+        if self.ttl is not None:
+            return self.ttl
+        return litellm.image_url_cache_ttl
+
+    def get_cache(self, url: str) -> Optional[CachedImage]:
+        with self._lock:
+            cached_image = self._cache.get(url)
+            if cached_image is not None:
+                self._cache.move_to_end(url)
+            return cached_image
+
+    def get_fresh_cache(self, url: str) -> Optional[str]:
+        """
+        Returns the cached data url, if it doesn't need to be revalidated
+        """
+        cached_image = self.get_cache(url)
+        if cached_image is None or self.is_stale(cached_image):
+            return None
+        return cached_image.data_url
+
+    def is_stale(self, cached_image: CachedImage) -> bool:
+        return time.time() - cached_image.fetched_at > self._get_ttl()
+
+    def set_cache(
+        self,
+        url: str,
+        data_url: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        size_bytes = len(data_url)
+        max_size_bytes = self._get_max_size_bytes()
+        with self._lock:
+            self._remove(url)
+            if size_bytes > max_size_bytes:
+                return
+            self._cache[url] = CachedImage(
+                data_url=data_url,
+                etag=etag,
+                last_modified=last_modified,
+                fetched_at=time.time(),
+            )
+            self.current_size_bytes += size_bytes
+            while self.current_size_bytes > max_size_bytes:
+                oldest_url = next(iter(self._cache))
+                self._remove(oldest_url)
+
+    def mark_revalidated(self, url: str) -> Optional[str]:
+        """
+        Called on a `304 Not Modified` - the cached image is fresh again
+        """
+        with self._lock:
+            cached_image = self._cache.get(url)
+            if cached_image is None:
+                return None
+            self._cache[url] = cached_image._replace(fetched_at=time.time())
+            self._cache.move_to_end(url)
+            return cached_image.data_url
+
+    def get_revalidation_headers(self, url: str) -> Optional[dict]:
+        cached_image = self.get_cache(url)
+        if cached_image is None:
+            return None
+        headers: Dict[str, str] = {}
+        if cached_image.etag is not None:
+            headers["If-None-Match"] = cached_image.etag
+        if cached_image.last_modified is not None:
+            headers["If-Modified-Since"] = cached_image.last_modified
+        return headers or None
+
+    def flush_cache(self):
+        with self._lock:
+            self._cache.clear()
+            self.current_size_bytes = 0
+
+    def _remove(self, url: str):
+        cached_image = self._cache.pop(url, None)
+        if cached_image is not None:
+            self.current_size_bytes -= len(cached_image.data_url)
+
+
+in_memory_cache = ImageURLCache()
 
 
 def _process_image_response(response: Response, url: str) -> str:
+    if response.status_code == 304:
+        cached_result = in_memory_cache.mark_revalidated(url)
+        if cached_result is not None:
+            return cached_result
     if response.status_code != 200:
         raise Exception(
             f"Error: Unable to fetch image from URL. Status code: {response.status_code}, url={url}"
@@ -47,19 +171,28 @@ def _process_image_response(response: Response, url: str) -> str:
         img_type = image_type
 
     result = f"data:{img_type};base64,{base64_image}"
-    in_memory_cache.set_cache(url, result)
+    in_memory_cache.set_cache(
+        url,
+        result,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+    )
     return result
 
 
 async def async_convert_url_to_base64(url: str) -> str:
-    cached_result = in_memory_cache.get_cache(url)
+    cached_result = in_memory_cache.get_fresh_cache(url)
     if cached_result:
         return cached_result
 
     client = litellm.module_level_aclient
     for _ in range(3):
         try:
-            response = await client.get(url, follow_redirects=True)
+            response = await client.get(
+                url,
+                headers=in_memory_cache.get_revalidation_headers(url),
+                follow_redirects=True,
+            )
             return _process_image_response(response, url)
         except Exception:
             pass
@@ -69,14 +202,18 @@ async def async_convert_url_to_base64(url: str) -> str:
 
 
 def convert_url_to_base64(url: str) -> str:
-    cached_result = in_memory_cache.get_cache(url)
+    cached_result = in_memory_cache.get_fresh_cache(url)
     if cached_result:
         return cached_result
 
     client = litellm.module_level_client
     for _ in range(3):
         try:
-            response = client.get(url, follow_redirects=True)
+            response = client.get(
+                url,
+                headers=in_memory_cache.get_revalidation_headers(url),
+                follow_redirects=True,
+            )
             return _process_image_response(response, url)
         except Exception as e:
             verbose_logger.exception(e)
@@ -85,3 +222,58 @@ def convert_url_to_base64(url: str) -> str:
     raise Exception(
         f"Error: Unable to fetch image from URL after 3 attempts. url={url}"
     )
+
+
+def get_image_urls_from_messages(messages: List) -> List[str]:
+    """
+    Returns the unique http(s) image urls in the messages, in order
+    """
+    image_urls: Dict[str, None] = {}
+    for message in messages:
+        if not isinstance(message, dict):
+            continue
+        content = message.get("content")
+        if not isinstance(content, list):
+            continue
+        for element in content:
+            if not isinstance(element, dict) or element.get("type") != "image_url":
+                continue
+            image_url = element.get("image_url")
+            if isinstance(image_url, dict):
+                image_url = image_url.get("url")
+            if isinstance(image_url, str) and image_url.startswith("http"):
+                image_urls[image_url] = None
+    return list(image_urls)
+
+
+async def async_prefetch_image_urls(
+    messages: List, max_concurrency: Optional[int] = None
+) -> None:
+    """
+    Downloads the image urls in the messages concurrently, into `in_memory_cache`.
+
+    The prompt conversion in `factory.py` is sync, so it downloads images one by one - prefetching them first means
+    it reads them from the cache instead.
+
+    Errors are not raised here, the prompt conversion re-tries the url and raises the error.
+    """
+    image_urls = [
+        url
+        for url in get_image_urls_from_messages(messages)
+        if in_memory_cache.get_fresh_cache(url) is None
+    ]
+    if len(image_urls) == 0:
+        return
+
+    semaphore = asyncio.Semaphore(
+        max(max_concurrency or litellm.image_url_prefetch_max_concurrency, 1)
+    )
+
+    async def _prefetch(url: str):
+        async with semaphore:
+            try:
+                await async_convert_url_to_base64(url)
+            except Exception as e:
+                verbose_logger.debug("Unable to prefetch image url=%s - %s", url, e)
+
+    await asyncio.gather(*[_prefetch(url) for url in image_urls])
@@ -178,7 +178,7 @@ class SagemakerLLM(BaseAWSLLM):
         except ImportError:
             raise ImportError("Missing boto3 to call bedrock. Run 'pip install boto3'.")
 
-        sigv4 = SigV4Auth(credentials, "sagemaker", aws_region_name)
+        sigv4 = self.get_sigv4_signer(credentials, "sagemaker", aws_region_name)
         if optional_params.get("stream") is True:
             api_base = f"https://runtime.sagemaker.{aws_region_name}.amazonaws.com/endpoints/{model}/invocations-response-stream"
         else:
@@ -6,10 +6,9 @@ Handles Authentication and generating request urls for Vertex AI and Google AI S
 
 import json
 import os
-from typing import TYPE_CHECKING, Any, Dict, Literal, Optional, Tuple
+from typing import Any, Dict, Literal, Optional, Tuple
 
 from litellm._logging import verbose_logger
-from litellm.litellm_core_utils.asyncify import asyncify
 from litellm.llms.base import BaseLLM
 from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler
 
@@ -20,11 +19,7 @@ from .common_utils import (
     all_gemini_url_modes,
     get_supports_system_message,
 )
-
-if TYPE_CHECKING:
-    from google.auth.credentials import Credentials as GoogleCredentialsObject
-else:
-    GoogleCredentialsObject = Any
+from .vertex_token_manager import VertexTokenManager
 
 
 class VertexBase(BaseLLM):
@@ -32,9 +27,11 @@ class VertexBase(BaseLLM):
         super().__init__()
         self.access_token: Optional[str] = None
         self.refresh_token: Optional[str] = None
-        self._credentials: Optional[GoogleCredentialsObject] = None
-        self.project_id: Optional[str] = None
         self.async_handler: Optional[AsyncHTTPHandler] = None
+        # credentials + tokens, per vertex credentials / project
+        self.token_manager = VertexTokenManager(
+            load_auth=self.load_auth, refresh_auth=self.refresh_auth
+        )
 
     def get_vertex_region(self, vertex_region: Optional[str]) -> str:
         return vertex_region or "us-central1"
@@ -127,32 +124,12 @@ class VertexBase(BaseLLM):
         """
         if custom_llm_provider == "gemini":
             return "", ""
-        if self.access_token is not None:
-            if project_id is not None:
-                return self.access_token, project_id
-            elif self.project_id is not None:
-                return self.access_token, self.project_id
-
-        if not self._credentials:
-            self._credentials, cred_project_id = self.load_auth(
-                credentials=credentials, project_id=project_id
-            )
-            if not self.project_id:
-                self.project_id = project_id or cred_project_id
-        else:
-            if self._credentials.expired or not self._credentials.token:
-                self.refresh_auth(self._credentials)
-
-            if not self.project_id:
-                self.project_id = self._credentials.quota_project_id
+        if self.access_token is not None and project_id is not None:
+            return self.access_token, project_id
 
-        if not self.project_id:
-            raise ValueError("Could not resolve project_id")
-
-        if not self._credentials or not self._credentials.token:
-            raise RuntimeError("Could not resolve API token from the environment")
-
-        return self._credentials.token, project_id or self.project_id
+        return self.token_manager.get_access_token(
+            credentials=credentials, project_id=project_id
+        )
 
     def is_using_v1beta1_features(self, optional_params: dict) -> bool:
         """
@@ -271,38 +248,12 @@ class VertexBase(BaseLLM):
         """
         if custom_llm_provider == "gemini":
             return "", ""
-        if self.access_token is not None:
-            if project_id is not None:
-                return self.access_token, project_id
-            elif self.project_id is not None:
-                return self.access_token, self.project_id
-
-        if not self._credentials:
-            try:
-                self._credentials, cred_project_id = await asyncify(self.load_auth)(
-                    credentials=credentials, project_id=project_id
-                )
-            except Exception:
-                verbose_logger.exception(
-                    "Failed to load vertex credentials. Check to see if credentials containing partial/invalid information."
-                )
-                raise
-            if not self.project_id:
-                self.project_id = project_id or cred_project_id
-        else:
-            if self._credentials.expired or not self._credentials.token:
-                await asyncify(self.refresh_auth)(self._credentials)
+        if self.access_token is not None and project_id is not None:
+            return self.access_token, project_id
 
-            if not self.project_id:
-                self.project_id = self._credentials.quota_project_id
-
-        if not self.project_id:
-            raise ValueError("Could not resolve project_id")
-
-        if not self._credentials or not self._credentials.token:
-            raise RuntimeError("Could not resolve API token from the environment")
-
-        return self._credentials.token, project_id or self.project_id
+        return await self.token_manager.async_get_access_token(
+            credentials=credentials, project_id=project_id
+        )
 
     def set_headers(
         self, auth_header: Optional[str], extra_headers: Optional[dict]
@@ -0,0 +1,234 @@
+"""
+Vertex AI access token cache
+
+Credentials are cached per fingerprint of (vertex credentials, project id), so deployments using different service
+accounts don't overwrite each other's token.
+
+- a cached token is returned without any network call
+- on the async path, a token expiring within `refresh_before_expiry` seconds is refreshed on a background task, while
+  requests keep using the current token. Credentials used since their last refresh are refreshed again before they expire.
+- concurrent loads / refreshes of the same credentials share one call to the token endpoint
+- loading and refreshing credentials (sync google-auth calls) runs in a thread, not on the event loop
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from litellm._logging import verbose_logger
+from litellm.litellm_core_utils.asyncify import asyncify
+
+VERTEX_TOKEN_REFRESH_BEFORE_EXPIRY = 300  # seconds
+VERTEX_TOKEN_EXPIRY_MARGIN = 10  # seconds, a token expiring sooner is not used
+
+
+class _VertexCredentialsEntry:
+    def __init__(self, credentials: Any, project_id: str):
+        self.credentials = credentials
+        self.project_id = project_id
+        self.refreshed_at = time.time()
+        self.last_used_at = self.refreshed_at
+        self.token_lifetime: Optional[float] = None
+
+
+class VertexTokenManager:
+    def __init__(
+        self,
+        load_auth: Callable[..., Tuple[Any, str]],
+        refresh_auth: Callable[[Any], None],
+        refresh_before_expiry: float = VERTEX_TOKEN_REFRESH_BEFORE_EXPIRY,
+    ):
+        """
+        - load_auth: `(credentials, project_id) -> (google credentials, project_id)`, loads and refreshes the credentials
+        - refresh_auth: `(google credentials) -> None`, refreshes the credentials' token
+        """
+        self.load_auth = load_auth
+        self.refresh_auth = refresh_auth
+        self.refresh_before_expiry = refresh_before_expiry
+        self._entries: Dict[str, _VertexCredentialsEntry] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._refresh_tasks: Dict[str, asyncio.Task] = {}
+        self._scheduled_refreshes: Dict[str, asyncio.TimerHandle] = {}
+
+    @staticmethod
+    def get_credentials_fingerprint(
+        credentials: Optional[str], project_id: Optional[str]
+    ) -> str:
+        return hashlib.sha256(
+            "{}:{}".format(credentials, project_id).encode()
+        ).hexdigest()
+
+    def get_access_token(
+        self, credentials: Optional[str], project_id: Optional[str]
+    ) -> Tuple[str, str]:
+        """
+        Returns auth token and project id. Loads / refreshes the credentials inline if there is no usable token.
+        """
+        key = self.get_credentials_fingerprint(credentials, project_id)
+        entry = self._entries.get(key)
+        if entry is None or not self._is_token_usable(entry.credentials):
+            self._load_or_refresh(
+                key=key, credentials=credentials, project_id=project_id
+            )
+        return self._get_token_and_project_id(key=key, project_id=project_id)
+
+    async def async_get_access_token(
+        self, credentials: Optional[str], project_id: Optional[str]
+    ) -> Tuple[str, str]:
+        """
+        Async version of `get_access_token`.
+
+        Only waits on the token endpoint if there is no usable token yet, e.g. on the first request for these credentials.
+        """
+        key = self.get_credentials_fingerprint(credentials, project_id)
+        entry = self._entries.get(key)
+        if entry is not None and self._is_token_usable(entry.credentials):
+            if self._should_refresh(entry):
+                self._start_refresh_task(
+                    key=key, credentials=credentials, project_id=project_id
+                )
+            return self._get_token_and_project_id(key=key, project_id=project_id)
+
+        await asyncio.shield(
+            self._start_refresh_task(
+                key=key, credentials=credentials, project_id=project_id
+            )
+        )
+        return self._get_token_and_project_id(key=key, project_id=project_id)
+
+    def _get_token_and_project_id(
+        self, key: str, project_id: Optional[str]
+    ) -> Tuple[str, str]:
+        entry = self._entries[key]
+        entry.last_used_at = time.time()
+        resolved_project_id = (
+            project_id
+            or entry.project_id
+            or getattr(entry.credentials, "quota_project_id", None)
+        )
+        if not resolved_project_id:
+            raise ValueError("Could not resolve project_id")
+        if not entry.credentials.token:
+            raise RuntimeError("Could not resolve API token from the environment")
+        return entry.credentials.token, resolved_project_id
+
+    def _seconds_until_expiry(self, credentials: Any) -> float:
+        expiry: Optional[datetime] = getattr(credentials, "expiry", None)
+        if expiry is None:
+            return float("inf")
+        if expiry.tzinfo is None:  # google-auth uses naive utc datetimes
+            expiry = expiry.replace(tzinfo=timezone.utc)
+        return (expiry - datetime.now(timezone.utc)).total_seconds()
+
+    def _get_refresh_window(self, entry: _VertexCredentialsEntry) -> float:
+        # short-lived tokens are refreshed half way through their lifetime
+        if entry.token_lifetime is None:
+            return self.refresh_before_expiry
+        return min(self.refresh_before_expiry, entry.token_lifetime / 2)
+
+    def _should_refresh(self, entry: _VertexCredentialsEntry) -> bool:
+        return self._seconds_until_expiry(entry.credentials) < self._get_refresh_window(
+            entry
+        )
+
+    def _is_token_usable(self, credentials: Any) -> bool:
+        return (
+            bool(credentials.token)
+            and self._seconds_until_expiry(credentials) > VERTEX_TOKEN_EXPIRY_MARGIN
+        )
+
+    def _load_or_refresh(
+        self, key: str, credentials: Optional[str], project_id: Optional[str]
+    ) -> None:
+        """
+        Sync - makes the call to the token endpoint. Callers waiting on the same credentials share one call.
+        """
+        lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                _credentials, _project_id = self.load_auth(
+                    credentials=credentials, project_id=project_id
+                )
+                entry = _VertexCredentialsEntry(
+                    credentials=_credentials, project_id=_project_id
+                )
+                self._entries[key] = entry
+            else:
+                # another caller may have refreshed the token while this one waited on the lock
+                if self._is_token_usable(
+                    entry.credentials
+                ) and not self._should_refresh(entry):
+                    return
+                self.refresh_auth(entry.credentials)
+                entry.refreshed_at = time.time()
+            entry.token_lifetime = self._seconds_until_expiry(entry.credentials)
+
+    def _start_refresh_task(
+        self, key: str, credentials: Optional[str], project_id: Optional[str]
+    ) -> asyncio.Task:
+        task = self._refresh_tasks.get(key)
+        loop = asyncio.get_running_loop()
+        if task is not None and not task.done() and task.get_loop() is loop:
+            return task
+
+        task = loop.create_task(
+            self._async_load_or_refresh(
+                key=key, credentials=credentials, project_id=project_id
+            )
+        )
+        # errors are raised to the requests awaiting the task, and logged in `_async_load_or_refresh`
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._refresh_tasks[key] = task
+        return task
+
+    async def _async_load_or_refresh(
+        self, key: str, credentials: Optional[str], project_id: Optional[str]
+    ) -> None:
+        try:
+            await asyncify(self._load_or_refresh)(
+                key=key, credentials=credentials, project_id=project_id
+            )
+        except Exception as e:
+            verbose_logger.exception(
+                "Failed to load / refresh vertex credentials. Check to see if credentials containing partial/invalid information. Error - %s",
+                str(e),
+            )
+            raise
+        finally:
+            if self._refresh_tasks.get(key) is asyncio.current_task():
+                self._refresh_tasks.pop(key, None)
+        self._schedule_refresh(key=key, credentials=credentials, project_id=project_id)
+
+    def _schedule_refresh(
+        self, key: str, credentials: Optional[str], project_id: Optional[str]
+    ) -> None:
+        """
+        Refresh the token `refresh_before_expiry` seconds before it expires, if it was used since the last refresh
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        seconds_until_expiry = self._seconds_until_expiry(entry.credentials)
+        if seconds_until_expiry == float("inf"):
+            return
+
+        def _refresh_if_used():
+            self._scheduled_refreshes.pop(key, None)
+            _entry = self._entries.get(key)
+            if _entry is None or _entry.last_used_at < _entry.refreshed_at:
+                return
+            self._start_refresh_task(
+                key=key, credentials=credentials, project_id=project_id
+            )
+
+        scheduled_refresh = self._scheduled_refreshes.pop(key, None)
+        if scheduled_refresh is not None:
+            scheduled_refresh.cancel()
+        self._scheduled_refreshes[key] = asyncio.get_running_loop().call_later(
+            max(seconds_until_expiry - self._get_refresh_window(entry), 0),
+            _refresh_if_used,
+        )
@@ -132,6 +132,10 @@ from .llms.prompt_templates.factory import (
     prompt_factory,
     stringify_json_tool_call_content,
 )
+from .llms.prompt_templates.image_handling import (
+    IMAGE_URL_PREFETCH_PROVIDERS,
+    async_prefetch_image_urls,
+)
 from .llms.sagemaker.sagemaker import SagemakerLLM
 from .llms.text_completion_codestral import CodestralTextCompletion
 from .llms.together_ai.completion.handler import TogetherAITextCompletion
@@ -424,6 +428,13 @@ async def acompletion(
             model=model, api_base=completion_kwargs.get("base_url", None)
         )
     try:
+        if (
+            custom_llm_provider in IMAGE_URL_PREFETCH_PROVIDERS
+            and kwargs.get("mock_response", None) is None
+        ):
+            # download image urls concurrently, so the sync prompt conversion reads them from the cache
+            await async_prefetch_image_urls(messages=messages)
+
         # Use a partial function to pass your keyword arguments
         func = partial(completion, **completion_kwargs, **kwargs)
 
@@ -3367,8 +3378,15 @@ def embedding(  # noqa: PLR0915
                 "preset_cache_key": None,
                 "stream_response": {},
                 "cooldown_time": cooldown_time,
+                "no-log": kwargs.get("no-log", False),
             },
         )
+        ## EMBEDDING BATCHING - the router already sent this call's input as part of a batch
+        embedding_batch_response = kwargs.get("embedding_batch_response", None)
+        if isinstance(embedding_batch_response, Exception):
+            raise embedding_batch_response
+        if isinstance(embedding_batch_response, EmbeddingResponse):
+            return embedding_batch_response
         if azure is True or custom_llm_provider == "azure":
             # azure configs
             api_type = get_secret_str("AZURE_API_TYPE") or "azure"
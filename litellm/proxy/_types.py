@@ -438,6 +438,7 @@ class LiteLLM_JWTAuth(LiteLLMBase):
     - user_allowed_email_subdomain: If specified, only emails from specified subdomain will be allowed to access proxy.
     - end_user_id_jwt_field: The field in the JWT token that stores the end-user ID (maps to `LiteLLMEndUserTable`). Turn this off by setting to `None`. Enables end-user cost tracking. Use this for external customers.
     - public_key_ttl: Default - 600s. TTL for caching public JWT keys.
+    - verified_token_cache_size: Default - 1000. Max number of verified tokens whose claims are cached until the token expires. Set to 0 to disable.
 
     See `auth_checks.py` for the specific routes
     """
@@ -466,6 +467,7 @@ class LiteLLM_JWTAuth(LiteLLMBase):
     )
     end_user_id_jwt_field: Optional[str] = None
     public_key_ttl: float = 600
+    verified_token_cache_size: int = 1000
 
     def __init__(self, **kwargs: Any) -> None:
         # get the attribute names for this Pydantic model
@@ -1959,10 +1961,22 @@ class CreatePassThroughEndpoint(LiteLLMBase):
 class LiteLLM_TeamMembership(LiteLLMBase):
     user_id: str
     team_id: str
-    budget_id: str
+    budget_id: Optional[str] = None
     litellm_budget_table: Optional[LiteLLM_BudgetTable]
 
 
+class LiteLLM_KeyAuthObjects(LiteLLMBase):
+    """
+    A key, and the objects it's checked against in `user_api_key_auth`. Read from the db in a single query.
+    """
+
+    key: LiteLLM_VerificationTokenView
+    user: Optional[LiteLLM_UserTable] = None
+    team: Optional[LiteLLM_TeamTableCachedObj] = None
+    team_membership: Optional[LiteLLM_TeamMembership] = None
+    organization: Optional[LiteLLM_OrganizationTable] = None
+
+
 #### Organization / Team Member Requests ####
 
 
@@ -9,10 +9,21 @@ Run checks for:
 3. If end_user ('user' passed to /chat/completions, /embeddings endpoint) is in budget 
 """
 
+import asyncio
 import time
 import traceback
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, List, Literal, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+)
 
 import httpx
 from pydantic import BaseModel
@@ -24,6 +35,7 @@ from litellm.caching.dual_cache import LimitedSizeOrderedDict
 from litellm.proxy._types import (
     LiteLLM_EndUserTable,
     LiteLLM_JWTAuth,
+    LiteLLM_KeyAuthObjects,
     LiteLLM_OrganizationTable,
     LiteLLM_TeamTable,
     LiteLLM_TeamTableCachedObj,
@@ -46,8 +58,10 @@ else:
     Span = Any
 
 
-last_db_access_time = LimitedSizeOrderedDict(max_size=100)
+last_db_access_time = LimitedSizeOrderedDict(max_size=1000)
 db_cache_expiry = 5  # refresh every 5s
+# db lookup key -> result of the in-flight db lookup, shared by concurrent requests for the same key / user / team
+_in_flight_db_lookups: Dict[str, asyncio.Future] = {}
 
 all_routes = LiteLLMRoutes.openai_routes.value + LiteLLMRoutes.management_routes.value
 
@@ -421,7 +435,7 @@ def _should_check_db(
     ):  # check db for non-null values (for refresh operations)
         return True
     elif last_db_access_time[key][0] is None:
-        if current_time - last_db_access_time[key] >= db_cache_expiry:
+        if current_time - last_db_access_time[key][1] >= db_cache_expiry:
             return True
     return False
 
@@ -432,6 +446,41 @@ def _update_last_db_access_time(
     last_db_access_time[key] = (value, time.time())
 
 
+async def _single_flight_db_lookup(
+    key: str, db_lookup: Callable[[], Awaitable[Any]]
+) -> Any:
+    """
+    Runs `db_lookup` once for concurrent requests with the same `key`.
+
+    Concurrent requests wait for the in-flight lookup, and get its result (or exception).
+    """
+    in_flight = _in_flight_db_lookups.get(key)
+    if in_flight is not None:
+        try:
+            return await asyncio.shield(in_flight)
+        except asyncio.CancelledError:
+            if not in_flight.cancelled():
+                raise
+            # the in-flight request was cancelled, run the lookup for this request
+
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    _in_flight_db_lookups[key] = future
+    try:
+        result = await db_lookup()
+        future.set_result(result)
+        return result
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # mark as retrieved, if no request is waiting on it
+        raise
+    finally:
+        if _in_flight_db_lookups.get(key) is future:
+            _in_flight_db_lookups.pop(key, None)
+
+
 @log_db_metrics
 async def get_user_object(
     user_id: str,
@@ -468,21 +517,36 @@ async def get_user_object(
             db_cache_expiry=db_cache_expiry,
         )
 
-        if should_check_db:
-            response = await prisma_client.db.litellm_usertable.find_unique(
-                where={"user_id": user_id}, include={"organization_memberships": True}
+        async def _get_user_from_db():
+            response = None
+            if should_check_db:
+                response = await prisma_client.db.litellm_usertable.find_unique(
+                    where={"user_id": user_id},
+                    include={"organization_memberships": True},
+                )
+            if response is None and user_id_upsert:
+                response = await prisma_client.db.litellm_usertable.create(
+                    data={"user_id": user_id},
+                    include={"organization_memberships": True},
+                )
+            return response
+
+        if should_check_db or user_id_upsert:
+            response = await _single_flight_db_lookup(
+                key=db_access_time_key, db_lookup=_get_user_from_db
             )
         else:
             response = None
 
         if response is None:
-            if user_id_upsert:
-                response = await prisma_client.db.litellm_usertable.create(
-                    data={"user_id": user_id},
-                    include={"organization_memberships": True},
+            if should_check_db:
+                # don't query the db again for this user for `db_cache_expiry` seconds
+                _update_last_db_access_time(
+                    key=db_access_time_key,
+                    value=None,
+                    last_db_access_time=last_db_access_time,
                 )
-            else:
-                raise Exception
+            raise Exception
 
         if (
             response.organization_memberships is not None
@@ -516,6 +580,34 @@ async def get_user_object(
         )
 
 
+def _get_key_db_access_time_key(hashed_token: str) -> str:
+    return "token:{}".format(hashed_token)
+
+
+def _clear_not_found_db_access_time(key: str) -> None:
+    """
+    Lets the next lookup query the db, after an object that was not found is created
+    """
+    if key in last_db_access_time and last_db_access_time[key][0] is None:
+        last_db_access_time.pop(key, None)
+
+
+def _clear_not_found_db_lookups(
+    user_id: Optional[str] = None,
+    team_id: Optional[str] = None,
+    hashed_token: Optional[str] = None,
+) -> None:
+    """
+    Lets the next auth lookup query the db, after a user, team or key is created or updated
+    """
+    if user_id is not None:
+        _clear_not_found_db_access_time(key="user_id:{}".format(user_id))
+    if team_id is not None:
+        _clear_not_found_db_access_time(key="team_id:{}".format(team_id))
+    if hashed_token is not None:
+        _clear_not_found_db_access_time(key=_get_key_db_access_time_key(hashed_token))
+
+
 async def _cache_management_object(
     key: str,
     value: BaseModel,
@@ -539,6 +631,7 @@ async def _cache_team_object(
 
     ## CACHE REFRESH TIME!
     team_table.last_refreshed_at = time.time()
+    _clear_not_found_db_access_time(key=key)
 
     await _cache_management_object(
         key=key,
@@ -558,6 +651,7 @@ async def _cache_key_object(
 
     ## CACHE REFRESH TIME
     user_api_key_obj.last_refreshed_at = time.time()
+    _clear_not_found_db_access_time(key=_get_key_db_access_time_key(hashed_token))
 
     await _cache_management_object(
         key=key,
@@ -567,6 +661,58 @@ async def _cache_key_object(
     )
 
 
+async def _cache_key_auth_objects(
+    hashed_token: str,
+    user_api_key_obj: UserAPIKeyAuth,
+    auth_objects: LiteLLM_KeyAuthObjects,
+    user_api_key_cache: DualCache,
+    proxy_logging_obj: Optional[ProxyLogging],
+):
+    """
+    Caches the key, and its user, team, team membership and org, with a single pipelined write.
+
+    Uses the same cache keys as `get_user_object`, `get_team_object`, `get_org_object` and the team member budget check in `user_api_key_auth`.
+    """
+    current_time = time.time()
+    user_api_key_obj.last_refreshed_at = current_time
+    _clear_not_found_db_access_time(key=_get_key_db_access_time_key(hashed_token))
+    cache_list: List[Tuple[str, Any]] = [(hashed_token, user_api_key_obj)]
+
+    if auth_objects.user is not None:
+        cache_list.append((auth_objects.user.user_id, auth_objects.user.model_dump()))
+    if auth_objects.team is not None:
+        team_key = "team_id:{}".format(auth_objects.team.team_id)
+        auth_objects.team.last_refreshed_at = current_time
+        _clear_not_found_db_access_time(key=team_key)
+        cache_list.append((team_key, auth_objects.team))
+    if auth_objects.team_membership is not None:
+        cache_list.append(
+            (
+                "{}_{}".format(
+                    auth_objects.team_membership.team_id,
+                    auth_objects.team_membership.user_id,
+                ),
+                auth_objects.team_membership,
+            )
+        )
+    if (
+        auth_objects.organization is not None
+        and auth_objects.organization.organization_id is not None
+    ):
+        cache_list.append(
+            (
+                "org_id:{}".format(auth_objects.organization.organization_id),
+                auth_objects.organization,
+            )
+        )
+
+    await user_api_key_cache.async_set_cache_pipeline(cache_list=cache_list)
+    if proxy_logging_obj is not None:
+        await proxy_logging_obj.internal_usage_cache.dual_cache.async_set_cache_pipeline(
+            cache_list=cache_list
+        )
+
+
 async def _delete_cache_key_object(
     hashed_token: str,
     user_api_key_cache: DualCache,
@@ -612,13 +758,23 @@ async def _get_team_object_from_user_api_key_cache(
         db_cache_expiry=db_cache_expiry,
     )
     if should_check_db:
-        response = await _get_team_db_check(
-            team_id=team_id, prisma_client=prisma_client
+        response = await _single_flight_db_lookup(
+            key=db_access_time_key,
+            db_lookup=lambda: _get_team_db_check(
+                team_id=team_id, prisma_client=prisma_client
+            ),
         )
     else:
         response = None
 
     if response is None:
+        if should_check_db:
+            # don't query the db again for this team for `db_cache_expiry` seconds
+            _update_last_db_access_time(
+                key=db_access_time_key,
+                value=None,
+                last_db_access_time=last_db_access_time,
+            )
         raise Exception
 
     _response = LiteLLM_TeamTableCachedObj(**response.dict())
@@ -766,23 +922,40 @@ async def get_key_object(
         )
 
     # else, check db
+    db_access_time_key = _get_key_db_access_time_key(hashed_token)
     try:
-        _valid_token: Optional[BaseModel] = await prisma_client.get_data(
-            token=hashed_token,
-            table_name="combined_view",
-            parent_otel_span=parent_otel_span,
-            proxy_logging_obj=proxy_logging_obj,
+        if not _should_check_db(
+            key=db_access_time_key,
+            last_db_access_time=last_db_access_time,
+            db_cache_expiry=db_cache_expiry,
+        ):
+            raise Exception
+
+        auth_objects: Optional[LiteLLM_KeyAuthObjects] = (
+            await _single_flight_db_lookup(
+                key=db_access_time_key,
+                db_lookup=lambda: prisma_client.get_key_auth_objects(
+                    token=hashed_token, parent_otel_span=parent_otel_span
+                ),
+            )
         )
 
-        if _valid_token is None:
+        if auth_objects is None:
+            # don't query the db again for this key for `db_cache_expiry` seconds
+            _update_last_db_access_time(
+                key=db_access_time_key,
+                value=None,
+                last_db_access_time=last_db_access_time,
+            )
             raise Exception
 
-        _response = UserAPIKeyAuth(**_valid_token.model_dump(exclude_none=True))
+        _response = UserAPIKeyAuth(**auth_objects.key.model_dump(exclude_none=True))
 
-        # save the key object to cache
-        await _cache_key_object(
+        # save the key object + its user, team, team membership and org to cache
+        await _cache_key_auth_objects(
             hashed_token=hashed_token,
             user_api_key_obj=_response,
+            auth_objects=auth_objects,
             user_api_key_cache=user_api_key_cache,
             proxy_logging_obj=proxy_logging_obj,
         )
@@ -796,6 +969,39 @@ async def get_key_object(
         )
 
 
+async def preload_key_object_cache(
+    prisma_client: PrismaClient,
+    user_api_key_cache: DualCache,
+    proxy_logging_obj: Optional[ProxyLogging] = None,
+    limit: int = 1000,
+) -> int:
+    """
+    Loads the most recently used keys into the cache with a single db query.
+
+    Used on proxy startup, so a burst of requests after a restart does not query the db per key.
+
+    Returns the number of keys cached.
+    """
+    valid_tokens = await prisma_client.get_data(
+        table_name="combined_view",
+        query_type="find_all",
+        limit=limit,
+        proxy_logging_obj=proxy_logging_obj,
+    )
+    for valid_token in valid_tokens or []:
+        if valid_token.token is None:
+            continue
+        await _cache_key_object(
+            hashed_token=valid_token.token,
+            user_api_key_obj=UserAPIKeyAuth(
+                **valid_token.model_dump(exclude_none=True)
+            ),
+            user_api_key_cache=user_api_key_cache,
+            proxy_logging_obj=proxy_logging_obj,
+        )
+    return len(valid_tokens or [])
+
+
 async def _handle_failed_db_connection_for_get_key_object(
     e: Exception,
 ) -> UserAPIKeyAuth:
@@ -855,7 +1061,9 @@ async def get_org_object(
         )
 
     # check if in cache
-    cached_org_obj = user_api_key_cache.async_get_cache(key="org_id:{}".format(org_id))
+    cached_org_obj = await user_api_key_cache.async_get_cache(
+        key="org_id:{}".format(org_id)
+    )
     if cached_org_obj is not None:
         if isinstance(cached_org_obj, dict):
             return cached_org_obj
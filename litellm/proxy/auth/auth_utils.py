@@ -447,6 +447,20 @@ def is_pass_through_provider_route(route: str) -> bool:
     return False
 
 
+def is_raw_pass_through_route(
+    route: str, pass_through_endpoints: Optional[List[dict]]
+) -> bool:
+    """
+    Raw pass-through endpoints stream the request body to the target, so it should not be read during auth
+    """
+    if pass_through_endpoints is None:
+        return False
+    for endpoint in pass_through_endpoints:
+        if endpoint.get("path", "") == route:
+            return endpoint.get("raw_pass_through", False) is True
+    return False
+
+
 def should_run_auth_on_pass_through_provider_route(route: str) -> bool:
     """
     Use this to decide if the rest of the LiteLLM Virtual Key auth checks should run on /vertex-ai/{endpoint} routes
@@ -6,9 +6,13 @@ Currently only supports admin.
 JWT token must have 'litellm_proxy_admin' in scope. 
 """
 
+import asyncio
+import hashlib
 import json
 import os
-from typing import Optional, cast
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple, cast
 
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
@@ -20,6 +24,9 @@ from litellm.llms.custom_httpx.httpx_handler import HTTPHandler
 from litellm.proxy._types import JWKKeyValue, JWTKeyItem, LiteLLM_JWTAuth
 from litellm.proxy.utils import PrismaClient
 
+# refresh the public keys in the background once they are this fraction of `public_key_ttl` old
+JWT_PUBLIC_KEY_REFRESH_RATIO = 0.8
+
 
 class JWTHandler:
     """
@@ -36,6 +43,15 @@ class JWTHandler:
         self,
     ) -> None:
         self.http_handler = HTTPHandler()
+        self.litellm_jwtauth = LiteLLM_JWTAuth()
+        # sha256(token) -> (verified claims, token expiry, kid, key it was verified with)
+        self._verified_token_cache: (
+            "OrderedDict[str, Tuple[dict, float, Optional[str], Any]]"
+        ) = OrderedDict()
+        # kid -> parsed public key, for the last fetched public keys
+        self._verification_keys: Dict[Optional[str], Any] = {}
+        self._verification_keys_loaded_at: Optional[float] = None
+        self._public_key_refresh_task: Optional[asyncio.Task] = None
 
     def update_environment(
         self,
@@ -170,21 +186,10 @@ class JWTHandler:
             "litellm_jwt_auth_keys"
         )
         if cached_keys is None:
-            response = await self.http_handler.get(keys_url)
-
-            response_json = response.json()
-            if "keys" in response_json:
-                keys: JWKKeyValue = response.json()["keys"]
-            else:
-                keys = response_json
-
-            await self.user_api_key_cache.async_set_cache(
-                key="litellm_jwt_auth_keys",
-                value=keys,
-                ttl=self.litellm_jwtauth.public_key_ttl,  # cache for 10 mins
-            )
+            keys = await self._fetch_public_keys(keys_url=keys_url)
         else:
             keys = cached_keys
+        self._set_verification_keys(keys=keys)
 
         public_key = self.parse_keys(keys=keys, kid=kid)
         if public_key is None:
@@ -193,6 +198,159 @@ class JWTHandler:
             )
         return cast(dict, public_key)
 
+    async def _fetch_public_keys(self, keys_url: str) -> JWKKeyValue:
+        response = await self.http_handler.get(keys_url)
+
+        response_json = response.json()
+        if "keys" in response_json:
+            keys: JWKKeyValue = response.json()["keys"]
+        else:
+            keys = response_json
+
+        await self.user_api_key_cache.async_set_cache(
+            key="litellm_jwt_auth_keys",
+            value=keys,
+            ttl=self.litellm_jwtauth.public_key_ttl,  # cache for 10 mins
+        )
+        return keys
+
+    async def _refresh_public_keys(self) -> None:
+        keys_url = os.getenv("JWT_PUBLIC_KEY_URL")
+        if keys_url is None:
+            return
+        try:
+            keys = await self._fetch_public_keys(keys_url=keys_url)
+            self._set_verification_keys(keys=keys)
+        except Exception as e:
+            verbose_proxy_logger.warning(
+                "JWTHandler: failed to refresh public keys - %s", str(e)
+            )
+
+    def _set_verification_keys(self, keys: JWKKeyValue) -> None:
+        """
+        Parses each public key once, and indexes it by `kid`
+        """
+        kids: set = {None}
+        for key in keys if isinstance(keys, list) else [keys]:
+            if isinstance(key, dict):
+                kids.add(key.get("kid", None))
+
+        verification_keys: Dict[Optional[str], Any] = {}
+        for kid in kids:
+            public_key = self.parse_keys(keys=keys, kid=kid)
+            if public_key is None:
+                continue
+            try:
+                verification_keys[kid] = self._get_verification_key(public_key)
+            except Exception as e:
+                verbose_proxy_logger.debug(
+                    "JWTHandler: unable to parse public key. kid=%s - %s", kid, str(e)
+                )
+        self._verification_keys = verification_keys
+        self._verification_keys_loaded_at = time.time()
+
+    def _get_verification_key(self, public_key: Any) -> Any:
+        from jwt.algorithms import RSAAlgorithm
+
+        if isinstance(public_key, dict):
+            jwk = {}
+            if "kty" in public_key:
+                jwk["kty"] = public_key["kty"]
+            if "kid" in public_key:
+                jwk["kid"] = public_key["kid"]
+            if "n" in public_key:
+                jwk["n"] = public_key["n"]
+            if "e" in public_key:
+                jwk["e"] = public_key["e"]
+
+            return RSAAlgorithm.from_jwk(json.dumps(jwk))
+        elif isinstance(public_key, str):
+            cert = x509.load_pem_x509_certificate(
+                public_key.encode(), default_backend()
+            )
+
+            # Extract public key
+            return cert.public_key().public_bytes(
+                serialization.Encoding.PEM,
+                serialization.PublicFormat.SubjectPublicKeyInfo,
+            )
+
+        raise Exception("Invalid JWT Submitted")
+
+    async def get_verification_key(self, kid: Optional[str]) -> Any:
+        """
+        Returns the parsed public key for `kid`.
+
+        Parsed keys are reused until `public_key_ttl` expires, and refreshed in the background before that.
+        """
+        loaded_at = self._verification_keys_loaded_at
+        if loaded_at is not None:
+            key_age = time.time() - loaded_at
+            public_key_ttl = self.litellm_jwtauth.public_key_ttl
+            if key_age < public_key_ttl and kid in self._verification_keys:
+                if key_age >= public_key_ttl * JWT_PUBLIC_KEY_REFRESH_RATIO and (
+                    self._public_key_refresh_task is None
+                    or self._public_key_refresh_task.done()
+                ):
+                    self._public_key_refresh_task = asyncio.create_task(
+                        self._refresh_public_keys()
+                    )
+                return self._verification_keys[kid]
+
+        public_key = await self.get_public_key(kid=kid)
+        if kid in self._verification_keys:
+            return self._verification_keys[kid]
+        try:
+            return self._get_verification_key(public_key)
+        except Exception as e:
+            raise Exception(f"Validation fails: {str(e)}")
+
+    def _get_cached_verified_token(
+        self, token_hash: str, kid: Optional[str], verification_key: Any
+    ) -> Optional[dict]:
+        """
+        Returns the cached claims, if the token was verified with the current public key for `kid`.
+
+        A token verified with a key that was since removed / rotated out of the public keys is verified again.
+        """
+        cached_token = self._verified_token_cache.get(token_hash)
+        if cached_token is None:
+            return None
+        claims, expires_at, cached_kid, cached_verification_key = cached_token
+        if (
+            time.time() >= expires_at
+            or cached_kid != kid
+            or cached_verification_key is not verification_key
+        ):
+            self._verified_token_cache.pop(token_hash, None)
+            return None
+        self._verified_token_cache.move_to_end(token_hash)
+        return dict(claims)
+
+    def _set_cached_verified_token(
+        self,
+        token_hash: str,
+        claims: dict,
+        kid: Optional[str],
+        verification_key: Any,
+    ) -> None:
+        """
+        Caches the verified claims until the token expires. Tokens without an `exp` claim are not cached.
+        """
+        max_size = self.litellm_jwtauth.verified_token_cache_size
+        expires_at = claims.get("exp", None)
+        if max_size <= 0 or not isinstance(expires_at, (int, float)):
+            return
+        self._verified_token_cache[token_hash] = (
+            dict(claims),
+            float(expires_at),
+            kid,
+            verification_key,
+        )
+        self._verified_token_cache.move_to_end(token_hash)
+        while len(self._verified_token_cache) > max_size:
+            self._verified_token_cache.popitem(last=False)
+
     def parse_keys(self, keys: JWKKeyValue, kid: Optional[str]) -> Optional[JWTKeyItem]:
         public_key: Optional[JWTKeyItem] = None
         if len(keys) == 1:
@@ -240,7 +398,6 @@ class JWTHandler:
             decode_options = {"verify_aud": False}
 
         import jwt
-        from jwt.algorithms import RSAAlgorithm
 
         header = jwt.get_unverified_header(token)
 
@@ -248,66 +405,38 @@ class JWTHandler:
 
         kid = header.get("kid", None)
 
-        public_key = await self.get_public_key(kid=kid)
-
-        if public_key is not None and isinstance(public_key, dict):
-            jwk = {}
-            if "kty" in public_key:
-                jwk["kty"] = public_key["kty"]
-            if "kid" in public_key:
-                jwk["kid"] = public_key["kid"]
-            if "n" in public_key:
-                jwk["n"] = public_key["n"]
-            if "e" in public_key:
-                jwk["e"] = public_key["e"]
-
-            public_key_rsa = RSAAlgorithm.from_jwk(json.dumps(jwk))
-
-            try:
-                # decode the token using the public key
-                payload = jwt.decode(
-                    token,
-                    public_key_rsa,  # type: ignore
-                    algorithms=algorithms,
-                    options=decode_options,
-                    audience=audience,
-                )
-                return payload
-
-            except jwt.ExpiredSignatureError:
-                # the token is expired, do something to refresh it
-                raise Exception("Token Expired")
-            except Exception as e:
-                raise Exception(f"Validation fails: {str(e)}")
-        elif public_key is not None and isinstance(public_key, str):
-            try:
-                cert = x509.load_pem_x509_certificate(
-                    public_key.encode(), default_backend()
-                )
-
-                # Extract public key
-                key = cert.public_key().public_bytes(
-                    serialization.Encoding.PEM,
-                    serialization.PublicFormat.SubjectPublicKeyInfo,
-                )
-
-                # decode the token using the public key
-                payload = jwt.decode(
-                    token,
-                    key,
-                    algorithms=algorithms,
-                    audience=audience,
-                    options=decode_options,
-                )
-                return payload
+        # also refreshes the public keys, so cached tokens stop being accepted once their key is removed
+        verification_key = await self.get_verification_key(kid=kid)
 
-            except jwt.ExpiredSignatureError:
-                # the token is expired, do something to refresh it
-                raise Exception("Token Expired")
-            except Exception as e:
-                raise Exception(f"Validation fails: {str(e)}")
+        token_hash = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        cached_claims = self._get_cached_verified_token(
+            token_hash=token_hash, kid=kid, verification_key=verification_key
+        )
+        if cached_claims is not None:
+            return cached_claims
 
-        raise Exception("Invalid JWT Submitted")
+        try:
+            # decode the token using the public key
+            payload = jwt.decode(
+                token,
+                verification_key,  # type: ignore
+                algorithms=algorithms,
+                options=decode_options,
+                audience=audience,
+            )
+        except jwt.ExpiredSignatureError:
+            # the token is expired, do something to refresh it
+            raise Exception("Token Expired")
+        except Exception as e:
+            raise Exception(f"Validation fails: {str(e)}")
+
+        self._set_cached_verified_token(
+            token_hash=token_hash,
+            claims=payload,
+            kid=kid,
+            verification_key=verification_key,
+        )
+        return payload
 
     async def close(self):
         await self.http_handler.close()
@@ -65,6 +65,7 @@ from litellm.proxy.auth.auth_utils import (
     _has_user_setup_sso,
     get_request_route,
     is_pass_through_provider_route,
+    is_raw_pass_through_route,
     pre_db_read_auth_checks,
     route_in_additonal_public_routes,
     should_run_auth_on_pass_through_provider_route,
@@ -223,16 +224,21 @@ async def user_api_key_auth(  # noqa: PLR0915
     start_time = datetime.now()
     try:
         route: str = get_request_route(request=request)
+        pass_through_endpoints: Optional[List[dict]] = general_settings.get(
+            "pass_through_endpoints", None
+        )
         # get the request body
-        request_data = await _read_request_body(request=request)
+        if is_raw_pass_through_route(
+            route=route, pass_through_endpoints=pass_through_endpoints
+        ):
+            request_data = {}
+        else:
+            request_data = await _read_request_body(request=request)
         await pre_db_read_auth_checks(
             request_data=request_data,
             request=request,
             route=route,
         )
-        pass_through_endpoints: Optional[List[dict]] = general_settings.get(
-            "pass_through_endpoints", None
-        )
         passed_in_key: Optional[str] = None
         if isinstance(api_key, str):
             passed_in_key = api_key
@@ -114,6 +114,44 @@ async def memory_usage_in_mem_cache_items():
     }
 
 
+@router.get("/connection-pool-metrics", include_in_schema=False)
+async def connection_pool_metrics():
+    # returns the size, idle connections and wait time of each provider connection pool
+    from litellm.llms.custom_httpx.connection_pool_registry import (
+        connection_pool_registry,
+    )
+
+    return {"connection_pools": connection_pool_registry.get_metrics()}
+
+
+@router.get("/secret-cache-metrics", include_in_schema=False)
+async def secret_cache_metrics():
+    # returns the hits, misses and secret manager calls of the secret cache, per key manager
+    from litellm.secret_managers.secret_cache import secret_cache
+
+    return {"secret_cache": secret_cache.get_metrics()}
+
+
+@router.get("/request-hedging-stats", include_in_schema=False)
+async def request_hedging_stats():
+    # returns the hedged requests and hedge wins of each model group, if request hedging is enabled
+    from litellm.proxy.proxy_server import llm_router
+
+    if llm_router is None or llm_router.request_hedger is None:
+        return {"request_hedging": []}
+    return {"request_hedging": llm_router.request_hedger.get_stats()}
+
+
+@router.get("/retry-budget-stats", include_in_schema=False)
+async def retry_budget_stats():
+    # returns the retries made / skipped of each model group, if a retry budget is set
+    from litellm.proxy.proxy_server import llm_router
+
+    if llm_router is None or llm_router.retry_budget is None:
+        return {"retry_budget": []}
+    return {"retry_budget": llm_router.retry_budget.get_stats()}
+
+
 @router.get("/otel-spans", include_in_schema=False)
 async def get_otel_spans():
     from litellm.integrations.opentelemetry import OpenTelemetry
@@ -173,7 +173,7 @@ class BedrockGuardrail(CustomGuardrail, BaseAWSLLM):
         except ImportError:
             raise ImportError("Missing boto3 to call bedrock. Run 'pip install boto3'.")
 
-        sigv4 = SigV4Auth(credentials, "bedrock", aws_region_name)
+        sigv4 = self.get_sigv4_signer(credentials, "bedrock", aws_region_name)
         api_base = f"https://bedrock-runtime.{aws_region_name}.amazonaws.com/guardrail/{self.guardrailIdentifier}/version/{self.guardrailVersion}/apply"
 
         encoded_data = json.dumps(data).encode("utf-8")
@@ -3,13 +3,26 @@
 import asyncio
 import logging
 import random
-from typing import List, Optional
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import litellm
-from litellm._logging import print_verbose
+from litellm._logging import print_verbose, verbose_logger
+
+if TYPE_CHECKING:
+    from litellm.caching.redis_cache import RedisCache
+    from litellm.router import Router
+else:
+    RedisCache = Any
+    Router = Any
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_HEALTH_CHECK_MAX_CONCURRENCY = 10
+DEFAULT_HEALTH_CHECK_TIMEOUT = 60  # seconds
+HEALTH_CHECK_LOCK_PREFIX = "litellm:health_check:lock:"
+HEALTH_CHECK_RESULT_PREFIX = "litellm:health_check:result:"
+
 
 ILLEGAL_DISPLAY_PARAMS = [
     "messages",
@@ -63,43 +76,72 @@ def filter_deployments_by_id(
     return filtered_deployments
 
 
-async def _perform_health_check(model_list: list, details: Optional[bool] = True):
+async def _run_model_health_check(model: dict, timeout: Optional[float] = None):
     """
-    Perform a health check for each model in the list.
+    Run the health check for 1 deployment. Returns an error dict if it takes longer than `timeout` seconds.
     """
-    tasks = []
-    for model in model_list:
-        litellm_params = model["litellm_params"]
-        model_info = model.get("model_info", {})
-        litellm_params["messages"] = _get_random_llm_message()
-        mode = model_info.get("mode", None)
-        tasks.append(
+    litellm_params = model["litellm_params"]
+    model_info = model.get("model_info", {})
+    litellm_params["messages"] = _get_random_llm_message()
+    mode = model_info.get("mode", None)
+    try:
+        return await asyncio.wait_for(
             litellm.ahealth_check(
                 litellm_params,
                 mode=mode,
                 prompt="test from litellm",
                 input=["test from litellm"],
-            )
+            ),
+            timeout=timeout,
         )
+    except asyncio.TimeoutError:
+        return {"error": f"Health check timed out after {timeout}s"}
+
+
+def _is_healthy_response(is_healthy) -> bool:
+    return isinstance(is_healthy, dict) and "error" not in is_healthy
+
+
+def _get_endpoint_data(
+    is_healthy, litellm_params: dict, details: Optional[bool] = True
+) -> dict:
+    if isinstance(is_healthy, dict):
+        return _clean_endpoint_data({**litellm_params, **is_healthy}, details)
+    return _clean_endpoint_data(litellm_params, details)
+
+
+async def _perform_health_check(
+    model_list: list,
+    details: Optional[bool] = True,
+    max_concurrency: Optional[int] = None,
+    timeout: Optional[float] = None,
+):
+    """
+    Perform a health check for each model in the list.
+
+    At most `max_concurrency` health checks run at once, each one is limited to `timeout` seconds.
+    """
+    semaphore = (
+        asyncio.Semaphore(max_concurrency) if max_concurrency is not None else None
+    )
 
-    results = await asyncio.gather(*tasks)
+    async def _check(model: dict):
+        if semaphore is None:
+            return await _run_model_health_check(model, timeout=timeout)
+        async with semaphore:
+            return await _run_model_health_check(model, timeout=timeout)
+
+    results = await asyncio.gather(*[_check(model) for model in model_list])
 
     healthy_endpoints = []
     unhealthy_endpoints = []
 
     for is_healthy, model in zip(results, model_list):
-        litellm_params = model["litellm_params"]
-
-        if isinstance(is_healthy, dict) and "error" not in is_healthy:
-            healthy_endpoints.append(
-                _clean_endpoint_data({**litellm_params, **is_healthy}, details)
-            )
-        elif isinstance(is_healthy, dict):
-            unhealthy_endpoints.append(
-                _clean_endpoint_data({**litellm_params, **is_healthy}, details)
-            )
+        endpoint_data = _get_endpoint_data(is_healthy, model["litellm_params"], details)
+        if _is_healthy_response(is_healthy):
+            healthy_endpoints.append(endpoint_data)
         else:
-            unhealthy_endpoints.append(_clean_endpoint_data(litellm_params, details))
+            unhealthy_endpoints.append(endpoint_data)
 
     return healthy_endpoints, unhealthy_endpoints
 
@@ -109,6 +151,8 @@ async def perform_health_check(
     model: Optional[str] = None,
     cli_model: Optional[str] = None,
     details: Optional[bool] = True,
+    max_concurrency: Optional[int] = None,
+    timeout: Optional[float] = None,
 ):
     """
     Perform a health check on the system.
@@ -136,7 +180,202 @@ async def perform_health_check(
         model_list=model_list
     )  # filter duplicate deployments (e.g. when model alias'es are used)
     healthy_endpoints, unhealthy_endpoints = await _perform_health_check(
-        model_list, details
+        model_list, details, max_concurrency=max_concurrency, timeout=timeout
     )
 
     return healthy_endpoints, unhealthy_endpoints
+
+
+class BackgroundHealthCheckScheduler:
+    """
+    Runs the background health checks for the proxy.
+
+    - checks are spread evenly over `health_check_interval`, instead of all deployments being checked at once
+    - at most `max_concurrency` checks run at once, each one is limited to `timeout` seconds
+    - if `redis_cache` is set, only 1 proxy instance checks a deployment per interval (redis lock per deployment).
+      Results are published to redis, the other instances read them instead of running the check.
+    - if `cooldown_unhealthy_deployments` is set, unhealthy deployments are put in cooldown on `llm_router`
+    """
+
+    def __init__(
+        self,
+        model_list: list,
+        health_check_interval: float,
+        details: Optional[bool] = True,
+        max_concurrency: int = DEFAULT_HEALTH_CHECK_MAX_CONCURRENCY,
+        timeout: Optional[float] = DEFAULT_HEALTH_CHECK_TIMEOUT,
+        redis_cache: Optional[RedisCache] = None,
+        llm_router: Optional[Router] = None,
+        cooldown_unhealthy_deployments: bool = False,
+    ):
+        self.model_list = filter_deployments_by_id(model_list=model_list)
+        self.health_check_interval = float(health_check_interval)
+        self.details = details
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.redis_cache = redis_cache
+        self.llm_router = llm_router
+        self.cooldown_unhealthy_deployments = cooldown_unhealthy_deployments
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        # model id -> {"healthy": bool, "endpoint": dict, "error": Optional[str]}
+        self.deployment_results: Dict[str, dict] = {}
+
+    async def run(self, health_check_results: dict):
+        """
+        Runs the health checks forever, `health_check_results` is updated as each check completes.
+        """
+        while True:
+            try:
+                await self.run_once(health_check_results=health_check_results)
+            except Exception as e:
+                verbose_logger.exception(
+                    "BackgroundHealthCheckScheduler: health check cycle failed - %s",
+                    str(e),
+                )
+                await asyncio.sleep(self.health_check_interval)
+
+    async def run_once(self, health_check_results: Optional[dict] = None):
+        """
+        Checks every deployment once, spread evenly over `health_check_interval`.
+        """
+        if len(self.model_list) == 0:
+            await asyncio.sleep(self.health_check_interval)
+            return
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(max(self.max_concurrency, 1))
+
+        slot_interval = self.health_check_interval / len(self.model_list)
+        start_time = time.monotonic()
+        tasks = []
+        for i, model in enumerate(self.model_list):
+            delay = start_time + i * slot_interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(
+                asyncio.create_task(
+                    self._check_deployment(
+                        model=model, health_check_results=health_check_results
+                    )
+                )
+            )
+        await asyncio.gather(*tasks)
+
+        remaining = start_time + self.health_check_interval - time.monotonic()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+
+    def get_health_check_results(self) -> dict:
+        healthy_endpoints = []
+        unhealthy_endpoints = []
+        for model in self.model_list:
+            result = self.deployment_results.get(model["model_info"]["id"])
+            if result is None:
+                continue
+            if result["healthy"]:
+                healthy_endpoints.append(result["endpoint"])
+            else:
+                unhealthy_endpoints.append(result["endpoint"])
+        return {
+            "healthy_endpoints": healthy_endpoints,
+            "unhealthy_endpoints": unhealthy_endpoints,
+            "healthy_count": len(healthy_endpoints),
+            "unhealthy_count": len(unhealthy_endpoints),
+        }
+
+    async def _check_deployment(
+        self, model: dict, health_check_results: Optional[dict] = None
+    ):
+        model_id = model["model_info"]["id"]
+        try:
+            if await self._acquire_lock(model_id=model_id):
+                result = await self._run_health_check(model=model)
+                await self._publish_result(model_id=model_id, result=result)
+            else:
+                # another proxy instance checks this deployment, use its last result
+                result = await self._get_published_result(model_id=model_id)
+        except Exception as e:
+            verbose_logger.exception(
+                "BackgroundHealthCheckScheduler: health check failed for deployment %s - %s",
+                model_id,
+                str(e),
+            )
+            return
+        if result is None:
+            return
+
+        self.deployment_results[model_id] = result
+        if health_check_results is not None:
+            health_check_results.update(self.get_health_check_results())
+        if result["healthy"] is False:
+            self._cooldown_deployment(model_id=model_id, result=result)
+
+    async def _run_health_check(self, model: dict) -> dict:
+        async with self._semaphore:  # type: ignore
+            is_healthy = await _run_model_health_check(model, timeout=self.timeout)
+        error: Optional[str] = None
+        if isinstance(is_healthy, dict) and "error" in is_healthy:
+            error = str(is_healthy["error"])
+        return {
+            "healthy": _is_healthy_response(is_healthy),
+            "endpoint": _get_endpoint_data(
+                is_healthy, model["litellm_params"], self.details
+            ),
+            "error": error,
+        }
+
+    async def _acquire_lock(self, model_id: str) -> bool:
+        if self.redis_cache is None:
+            return True
+        try:
+            # expire slightly before the next cycle, so the holder can re-acquire it
+            return bool(
+                await self.redis_cache.async_set_cache(
+                    f"{HEALTH_CHECK_LOCK_PREFIX}{model_id}",
+                    "1",
+                    ttl=max(int(self.health_check_interval * 0.9), 1),
+                    nx=True,
+                )
+            )
+        except Exception as e:
+            verbose_logger.debug(
+                "BackgroundHealthCheckScheduler: unable to acquire redis lock, running health check locally - %s",
+                str(e),
+            )
+            return True
+
+    async def _publish_result(self, model_id: str, result: dict):
+        if self.redis_cache is None:
+            return
+        try:
+            await self.redis_cache.async_set_cache(
+                f"{HEALTH_CHECK_RESULT_PREFIX}{model_id}",
+                result,
+                ttl=max(int(self.health_check_interval * 2), 1),
+            )
+        except Exception as e:
+            verbose_logger.debug(
+                "BackgroundHealthCheckScheduler: unable to publish health check result - %s",
+                str(e),
+            )
+
+    async def _get_published_result(self, model_id: str) -> Optional[dict]:
+        if self.redis_cache is None:
+            return None
+        result = await self.redis_cache.async_get_cache(
+            f"{HEALTH_CHECK_RESULT_PREFIX}{model_id}"
+        )
+        if isinstance(result, dict) and "healthy" in result:
+            return result
+        return None
+
+    def _cooldown_deployment(self, model_id: str, result: dict):
+        if self.llm_router is None or self.cooldown_unhealthy_deployments is not True:
+            return
+        self.llm_router.cooldown_cache.add_deployment_to_cooldown(
+            model_id=model_id,
+            original_exception=Exception(
+                "Failed health check - {}".format(result.get("error"))
+            ),
+            exception_status=503,
+            cooldown_time=None,
+        )
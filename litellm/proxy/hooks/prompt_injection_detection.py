@@ -7,11 +7,13 @@
 ## Reject a call if it contains a prompt injection attack.
 
 
+import asyncio
+import bisect
 import json
 import re
 import traceback
 from difflib import SequenceMatcher
-from typing import List, Literal, Optional
+from typing import Dict, List, Literal, Optional, Set, Tuple
 
 from fastapi import HTTPException
 from typing_extensions import overload
@@ -24,6 +26,198 @@ from litellm.llms.prompt_templates.factory import prompt_injection_detection_def
 from litellm.proxy._types import LiteLLMPromptInjectionParams, UserAPIKeyAuth
 from litellm.utils import get_formatted_prompt
 
+PROMPT_INJECTION_NGRAM_SIZE = 3
+# max chars a keyword part can be shifted by, from where it's expected in the user input (e.g. typos)
+PROMPT_INJECTION_ALIGNMENT_SLACK = 3
+# max chars of filler words between 2 keyword parts, e.g. "ignore *all of the* previous"
+PROMPT_INJECTION_MAX_GAP = 12
+# longer prompts are checked off the event loop
+PROMPT_INJECTION_THREAD_CHECK_MIN_LENGTH = 10000
+
+
+class _InjectionKeywordIndex:
+    """
+    Index over the injection keywords (verb + adjective + preposition phrases), to find keyword matches in linear time.
+
+    1. each part of a keyword (e.g. "ignore", "previous", "and start over") is located in the user input by its character n-grams
+    2. keywords are candidates where 2 consecutive parts (or a multi-word verb) are found at the expected distance
+    3. candidates are confirmed with `SequenceMatcher.ratio()` on the input window, same as the full scan
+    """
+
+    def __init__(
+        self, verbs: List[str], adjectives: List[str], prepositions: List[str]
+    ):
+        self.verbs = [verb.lower() for verb in verbs]
+        self.adjectives = [adjective.lower() for adjective in adjectives]
+        self.prepositions = [preposition.lower() for preposition in prepositions]
+
+        # (keyword, verb, adjective, preposition)
+        self.keywords: List[Tuple[str, str, str, str]] = []
+        self.keywords_by_verb_adjective: Dict[
+            Tuple[str, str], List[Tuple[str, str, str, str]]
+        ] = {}
+        self.keywords_by_adjective_preposition: Dict[
+            Tuple[str, str], List[Tuple[str, str, str, str]]
+        ] = {}
+        for verb in self.verbs:
+            for adj in self.adjectives:
+                for prep in self.prepositions:
+                    phrase = " ".join(filter(None, [verb, adj, prep])).strip()
+                    if (
+                        len(phrase.split()) > 2
+                    ):  # additional check to ensure more than 2 words
+                        keyword = (phrase, verb, adj, prep)
+                        self.keywords.append(keyword)
+                        self.keywords_by_verb_adjective.setdefault(
+                            (verb, adj), []
+                        ).append(keyword)
+                        if adj:
+                            self.keywords_by_adjective_preposition.setdefault(
+                                (adj, prep), []
+                            ).append(keyword)
+
+        # n-gram -> [(keyword part, offset of the n-gram in the part)]
+        self.ngram_index: Dict[str, List[Tuple[str, int]]] = {}
+        parts = set(self.verbs + self.adjectives + self.prepositions)
+        parts.discard("")
+        for part in parts:
+            for i in range(len(part) - PROMPT_INJECTION_NGRAM_SIZE + 1):
+                self.ngram_index.setdefault(
+                    part[i : i + PROMPT_INJECTION_NGRAM_SIZE], []
+                ).append((part, i))
+
+    def get_keywords(self) -> List[str]:
+        return [keyword[0] for keyword in self.keywords]
+
+    def find_similar_keyword(
+        self, user_input: str, similarity_threshold: float
+    ) -> Optional[Tuple[str, str, float]]:
+        """
+        Returns (keyword, matching substring, similarity) for the first substring more similar to a keyword than `similarity_threshold`
+        """
+        user_input_lower = user_input.lower()
+        checked: Set[Tuple[str, str]] = set()
+        # SequenceMatcher caches its analysis of the 2nd sequence, so 1 matcher per keyword
+        matchers: Dict[str, SequenceMatcher] = {}
+        for keyword, first_start, last_start in self._get_candidates(user_input_lower):
+            keyword_length = len(keyword)
+            matcher = matchers.get(keyword)
+            if matcher is None:
+                matcher = matchers[keyword] = SequenceMatcher(None, b=keyword)
+            for i in range(
+                max(first_start, 0),
+                min(last_start, len(user_input_lower) - keyword_length) + 1,
+            ):
+                # Extract a substring of the same length as the keyword
+                substring = user_input_lower[i : i + keyword_length]
+                if (keyword, substring) in checked:
+                    continue
+                checked.add((keyword, substring))
+
+                matcher.set_seq1(substring)
+                # quick_ratio() is an upper bound on ratio()
+                if matcher.quick_ratio() <= similarity_threshold:
+                    continue
+                match_ratio = matcher.ratio()
+                if match_ratio > similarity_threshold:
+                    return keyword, substring, match_ratio
+        return None
+
+    def _get_part_starts(self, user_input_lower: str) -> Dict[str, List[int]]:
+        """
+        Returns the sorted positions in the input where each keyword part may start, i.e. where an n-gram of the part occurs
+        """
+        part_starts: Dict[str, Set[int]] = {}
+        for i in range(len(user_input_lower) - PROMPT_INJECTION_NGRAM_SIZE + 1):
+            postings = self.ngram_index.get(
+                user_input_lower[i : i + PROMPT_INJECTION_NGRAM_SIZE]
+            )
+            if postings is None:
+                continue
+            for part, offset in postings:
+                part_starts.setdefault(part, set()).add(i - offset)
+        return {part: sorted(starts) for part, starts in part_starts.items()}
+
+    def _get_candidates(self, user_input_lower: str) -> Set[Tuple[str, int, int]]:
+        """
+        Returns (keyword, first start, last start) of the input windows to compare against the keyword.
+
+        A keyword is a candidate where 2 consecutive parts are found, with at most `PROMPT_INJECTION_MAX_GAP` chars between them.
+        """
+        part_starts = self._get_part_starts(user_input_lower)
+
+        def _find_part(part: str, expected_start: int) -> Optional[int]:
+            """
+            Returns the gap between where the part is expected, and where it's found
+            """
+            starts = part_starts.get(part)
+            if not starts:
+                return None
+            index = bisect.bisect_left(
+                starts, expected_start - PROMPT_INJECTION_ALIGNMENT_SLACK
+            )
+            if (
+                index < len(starts)
+                and starts[index] <= expected_start + PROMPT_INJECTION_MAX_GAP
+            ):
+                return max(starts[index] - expected_start, 0)
+            return None
+
+        candidates: Set[Tuple[str, int, int]] = set()
+
+        def _add_candidate(keyword: str, start: int, gap: int):
+            candidates.add(
+                (
+                    keyword,
+                    start - PROMPT_INJECTION_ALIGNMENT_SLACK,
+                    start + gap + PROMPT_INJECTION_ALIGNMENT_SLACK,
+                )
+            )
+
+        for verb in self.verbs:
+            for start in part_starts.get(verb, ()):
+                next_start = start + len(verb) + 1
+                for adj in self.adjectives:
+                    keywords = self.keywords_by_verb_adjective.get((verb, adj), [])
+                    if adj:
+                        gap = _find_part(adj, next_start)
+                        if gap is not None:
+                            for keyword in keywords:
+                                _add_candidate(keyword[0], start, gap)
+                        continue
+                    for keyword in keywords:
+                        if not keyword[3]:
+                            # multi-word verbs (e.g. "do not follow") are keywords by themselves
+                            _add_candidate(keyword[0], start, 0)
+                            continue
+                        gap = _find_part(keyword[3], next_start)
+                        if gap is not None:
+                            _add_candidate(keyword[0], start, gap)
+
+        # the verb may not be recognizable, e.g. "... previous and start over"
+        for adj in self.adjectives:
+            if not adj:
+                continue
+            for start in part_starts.get(adj, ()):
+                next_start = start + len(adj) + 1
+                for prep in self.prepositions:
+                    if not prep:
+                        continue
+                    gap = _find_part(prep, next_start)
+                    if gap is None:
+                        continue
+                    for keyword in self.keywords_by_adjective_preposition.get(
+                        (adj, prep), []
+                    ):
+                        # the verb may also be followed by filler words
+                        verb_start = start - len(keyword[1]) - 1
+                        _add_candidate(
+                            keyword[0],
+                            verb_start - PROMPT_INJECTION_MAX_GAP,
+                            gap + PROMPT_INJECTION_MAX_GAP,
+                        )
+        return candidates
+
 
 class _OPTIONAL_PromptInjectionDetection(CustomLogger):
     # Class variables or attributes
@@ -64,6 +258,7 @@ class _OPTIONAL_PromptInjectionDetection(CustomLogger):
             "and begin afresh",
             "and start from scratch",
         ]
+        self._keyword_index: Optional[_InjectionKeywordIndex] = None
 
     def print_verbose(self, print_statement, level: Literal["INFO", "DEBUG"] = "DEBUG"):
         if level == "INFO":
@@ -98,42 +293,43 @@ class _OPTIONAL_PromptInjectionDetection(CustomLogger):
                     "PromptInjectionDetection: Invalid LLM API Name. LLM API Name must be a 'model_name' in 'model_list'."
                 )
 
+    def _get_keyword_index(self) -> _InjectionKeywordIndex:
+        if self._keyword_index is None:
+            self._keyword_index = _InjectionKeywordIndex(
+                verbs=self.verbs,
+                adjectives=self.adjectives,
+                prepositions=self.prepositions,
+            )
+        return self._keyword_index
+
     def generate_injection_keywords(self) -> List[str]:
-        combinations = []
-        for verb in self.verbs:
-            for adj in self.adjectives:
-                for prep in self.prepositions:
-                    phrase = " ".join(filter(None, [verb, adj, prep])).strip()
-                    if (
-                        len(phrase.split()) > 2
-                    ):  # additional check to ensure more than 2 words
-                        combinations.append(phrase.lower())
-        return combinations
+        return self._get_keyword_index().get_keywords()
 
     def check_user_input_similarity(
         self, user_input: str, similarity_threshold: float = 0.7
     ) -> bool:
-        user_input_lower = user_input.lower()
-        keywords = self.generate_injection_keywords()
-
-        for keyword in keywords:
-            # Calculate the length of the keyword to extract substrings of the same length from user input
-            keyword_length = len(keyword)
-
-            for i in range(len(user_input_lower) - keyword_length + 1):
-                # Extract a substring of the same length as the keyword
-                substring = user_input_lower[i : i + keyword_length]
-
-                # Calculate similarity
-                match_ratio = SequenceMatcher(None, substring, keyword).ratio()
-                if match_ratio > similarity_threshold:
-                    self.print_verbose(
-                        print_statement=f"Rejected user input - {user_input}. {match_ratio} similar to {keyword}",
-                        level="INFO",
-                    )
-                    return True  # Found a highly similar substring
+        match = self._get_keyword_index().find_similar_keyword(
+            user_input=user_input, similarity_threshold=similarity_threshold
+        )
+        if match is not None:
+            keyword, _, match_ratio = match
+            self.print_verbose(
+                print_statement=f"Rejected user input - {user_input}. {match_ratio} similar to {keyword}",
+                level="INFO",
+            )
+            return True  # Found a highly similar substring
         return False  # No substring crossed the threshold
 
+    async def async_check_user_input_similarity(self, user_input: str) -> bool:
+        """
+        Runs `check_user_input_similarity` in a thread for long prompts, so it doesn't block the event loop
+        """
+        if len(user_input) < PROMPT_INJECTION_THREAD_CHECK_MIN_LENGTH:
+            return self.check_user_input_similarity(user_input=user_input)
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.check_user_input_similarity, user_input
+        )
+
     async def async_pre_call_hook(
         self,
         user_api_key_dict: UserAPIKeyAuth,
@@ -168,7 +364,7 @@ class _OPTIONAL_PromptInjectionDetection(CustomLogger):
             if self.prompt_injection_params is not None:
                 # 1. check if heuristics check turned on
                 if self.prompt_injection_params.heuristics_check is True:
-                    is_prompt_attack = self.check_user_input_similarity(
+                    is_prompt_attack = await self.async_check_user_input_similarity(
                         user_input=formatted_prompt
                     )
                     if is_prompt_attack is True:
@@ -182,7 +378,7 @@ class _OPTIONAL_PromptInjectionDetection(CustomLogger):
                 if self.prompt_injection_params.vector_db_check is True:
                     pass
             else:
-                is_prompt_attack = self.check_user_input_similarity(
+                is_prompt_attack = await self.async_check_user_input_similarity(
                     user_input=formatted_prompt
                 )
 
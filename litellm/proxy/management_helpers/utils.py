@@ -27,6 +27,7 @@ from litellm.proxy._types import (  # key request types; user request types; tea
     UserAPIKeyAuth,
     VirtualKeyEvent,
 )
+from litellm.proxy.auth.auth_checks import _clear_not_found_db_lookups
 from litellm.proxy.common_utils.http_parsing_utils import _read_request_body
 from litellm.proxy.utils import PrismaClient
 
@@ -82,6 +83,7 @@ async def add_new_member(
                 "create": {"teams": [team_id], **new_user_defaults},  # type: ignore
             },
         )
+        _clear_not_found_db_lookups(user_id=new_member.user_id)
         if _returned_user is not None:
             returned_user = LiteLLM_UserTable(**_returned_user.model_dump())
     elif new_member.user_email is not None:
@@ -307,6 +307,43 @@ def get_response_headers(
     return return_headers
 
 
+def _request_has_body(request: Request) -> bool:
+    content_length = request.headers.get("content-length")
+    if content_length is not None:
+        return content_length != "0"
+    return request.headers.get("transfer-encoding") is not None
+
+
+def get_raw_pass_through_request_headers(request: Request, headers: dict) -> dict:
+    """
+    The request body is forwarded unchanged on raw pass-through endpoints, so forward the headers describing it
+    """
+    headers = dict(headers)
+    for header in ("content-type", "content-length"):
+        value = request.headers.get(header)
+        if value is not None and header not in {k.lower() for k in headers}:
+            headers[header] = value
+    return headers
+
+
+def get_raw_pass_through_response_headers(
+    headers: httpx.Headers, litellm_call_id: Optional[str] = None
+) -> dict:
+    """
+    Raw pass-through responses are streamed decoded, so drop the content-length of an encoded response
+    """
+    return_headers = get_response_headers(
+        headers=headers, litellm_call_id=litellm_call_id
+    )
+    if headers.get("content-encoding") is not None:
+        return_headers = {
+            key: value
+            for key, value in return_headers.items()
+            if key.lower() != "content-length"
+        }
+    return return_headers
+
+
 def get_endpoint_type(url: str) -> EndpointType:
     if ("generateContent") in url or ("streamGenerateContent") in url:
         return EndpointType.VERTEX_AI
@@ -324,7 +361,14 @@ async def pass_through_request(  # noqa: PLR0915
     forward_headers: Optional[bool] = False,
     query_params: Optional[dict] = None,
     stream: Optional[bool] = None,
+    raw_pass_through: Optional[bool] = False,
 ):
+    """
+    Forwards the request to `target`.
+
+    If `raw_pass_through` is True, the request body is streamed to the target without being parsed, and the response is
+    streamed back. Only the first `litellm.pass_through_raw_logging_max_bytes` of the response are kept for logging.
+    """
     try:
         import time
         import uuid
@@ -340,10 +384,12 @@ async def pass_through_request(  # noqa: PLR0915
 
         endpoint_type: EndpointType = get_endpoint_type(str(url))
 
+        raw_pass_through = raw_pass_through is True and custom_body is None
+
         _parsed_body = None
         if custom_body:
             _parsed_body = custom_body
-        else:
+        elif not raw_pass_through:
             request_body = await request.body()
             if request_body == b"" or request_body is None:
                 _parsed_body = None
@@ -360,11 +406,19 @@ async def pass_through_request(  # noqa: PLR0915
         )
 
         ### CALL HOOKS ### - modify incoming data / reject request before calling the model
-        _parsed_body = await proxy_logging_obj.pre_call_hook(
-            user_api_key_dict=user_api_key_dict,
-            data=_parsed_body,
-            call_type="pass_through_endpoint",
-        )
+        if raw_pass_through:
+            # the request body is not read - hooks can still reject the request (e.g. rate limits), not modify it
+            await proxy_logging_obj.pre_call_hook(
+                user_api_key_dict=user_api_key_dict,
+                data={},
+                call_type="pass_through_endpoint",
+            )
+        else:
+            _parsed_body = await proxy_logging_obj.pre_call_hook(
+                user_api_key_dict=user_api_key_dict,
+                data=_parsed_body,
+                call_type="pass_through_endpoint",
+            )
         async_client_obj = get_async_httpx_client(
             llm_provider=httpxSpecialProvider.PassThroughEndpoint,
             params={"timeout": 600},
@@ -435,6 +489,39 @@ async def pass_through_request(  # noqa: PLR0915
                 "headers": headers,
             },
         )
+        if raw_pass_through:
+            req = async_client.build_request(
+                request.method,
+                url,
+                content=request.stream() if _request_has_body(request) else None,
+                params=requested_query_params,
+                headers=get_raw_pass_through_request_headers(
+                    request=request, headers=headers
+                ),
+            )
+
+            response = await async_client.send(req, stream=True)
+
+            if response.status_code >= 300:
+                await response.aread()
+                await response.aclose()
+                raise HTTPException(
+                    status_code=response.status_code, detail=response.text
+                )
+
+            return StreamingResponse(
+                PassThroughStreamingHandler.raw_chunk_processor(
+                    response=response,
+                    litellm_logging_obj=logging_obj,
+                    start_time=start_time,
+                ),
+                headers=get_raw_pass_through_response_headers(
+                    headers=response.headers,
+                    litellm_call_id=litellm_call_id,
+                ),
+                status_code=response.status_code,
+            )
+
         if stream:
             req = async_client.build_request(
                 "POST",
@@ -626,6 +713,7 @@ def create_pass_through_route(
     custom_headers: Optional[dict] = None,
     _forward_headers: Optional[bool] = False,
     dependencies: Optional[List] = None,
+    raw_pass_through: Optional[bool] = False,
 ):
     # check if target is an adapter.py or a url
     import uuid
@@ -674,6 +762,7 @@ def create_pass_through_route(
                 query_params=query_params,
                 stream=stream,
                 custom_body=custom_body,
+                raw_pass_through=raw_pass_through,
             )
 
     return endpoint_func
@@ -700,6 +789,7 @@ async def initialize_pass_through_endpoints(pass_through_endpoints: list):
             custom_headers=_custom_headers
         )
         _forward_headers = endpoint.get("forward_headers", None)
+        _raw_pass_through = endpoint.get("raw_pass_through", False)
         _auth = endpoint.get("auth", None)
         _dependencies = None
         if _auth is not None and str(_auth).lower() == "true":
@@ -721,7 +811,12 @@ async def initialize_pass_through_endpoints(pass_through_endpoints: list):
         app.add_api_route(  # type: ignore
             path=_path,
             endpoint=create_pass_through_route(  # type: ignore
-                _path, _target, _custom_headers, _forward_headers, _dependencies
+                _path,
+                _target,
+                _custom_headers,
+                _forward_headers,
+                _dependencies,
+                raw_pass_through=_raw_pass_through,
             ),
             methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
             dependencies=_dependencies,
@@ -1,6 +1,5 @@
 import asyncio
 import json
-import threading
 from datetime import datetime
 from enum import Enum
 from typing import AsyncIterable, Dict, List, Optional, Union
@@ -10,6 +9,7 @@ import httpx
 import litellm
 from litellm._logging import verbose_proxy_logger
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj
+from litellm.litellm_core_utils.logging_worker_pool import logging_worker_pool
 from litellm.llms.anthropic.chat.handler import (
     ModelResponseIterator as AnthropicIterator,
 )
@@ -74,6 +74,76 @@ class PassThroughStreamingHandler:
             verbose_proxy_logger.error(f"Error in chunk_processor: {str(e)}")
             raise
 
+    @staticmethod
+    async def raw_chunk_processor(
+        response: httpx.Response,
+        litellm_logging_obj: LiteLLMLoggingObj,
+        start_time: datetime,
+        max_logged_bytes: Optional[int] = None,
+    ):
+        """
+        Used for raw pass-through endpoints
+
+        - Yields chunks from the response, without collecting them
+        - Keeps the first `max_logged_bytes` (default `litellm.pass_through_raw_logging_max_bytes`) for logging
+        """
+        if max_logged_bytes is None:
+            max_logged_bytes = litellm.pass_through_raw_logging_max_bytes
+        logged_bytes = bytearray()
+        response_size = 0
+        try:
+            async for chunk in response.aiter_bytes():
+                response_size += len(chunk)
+                if len(logged_bytes) < max_logged_bytes:
+                    logged_bytes += chunk[: max_logged_bytes - len(logged_bytes)]
+                yield chunk
+        except Exception as e:
+            verbose_proxy_logger.error(f"Error in raw_chunk_processor: {str(e)}")
+            raise
+        finally:
+            await response.aclose()
+
+        end_time = datetime.now()
+        asyncio.create_task(
+            PassThroughStreamingHandler._log_raw_response(
+                litellm_logging_obj=litellm_logging_obj,
+                logged_bytes=bytes(logged_bytes),
+                response_size=response_size,
+                start_time=start_time,
+                end_time=end_time,
+            )
+        )
+
+    @staticmethod
+    async def _log_raw_response(
+        litellm_logging_obj: LiteLLMLoggingObj,
+        logged_bytes: bytes,
+        response_size: int,
+        start_time: datetime,
+        end_time: datetime,
+    ):
+        response = logged_bytes.decode("utf-8", errors="replace")
+        if response_size > len(logged_bytes):
+            response += "... [truncated, logged {} of {} bytes]".format(
+                len(logged_bytes), response_size
+            )
+        standard_logging_response_object = StandardPassThroughResponseObject(
+            response=response
+        )
+        logging_worker_pool.submit(
+            litellm_logging_obj.success_handler,
+            standard_logging_response_object,
+            start_time,
+            end_time,
+            False,
+        )
+        await litellm_logging_obj.async_success_handler(
+            result=standard_logging_response_object,
+            start_time=start_time,
+            end_time=end_time,
+            cache_hit=False,
+        )
+
     @staticmethod
     async def _route_streaming_logging_to_handler(
         litellm_logging_obj: LiteLLMLoggingObj,
@@ -136,15 +206,13 @@ class PassThroughStreamingHandler:
             standard_logging_response_object = StandardPassThroughResponseObject(
                 response=f"cannot parse chunks to standard response object. Chunks={all_chunks}"
             )
-        threading.Thread(
-            target=litellm_logging_obj.success_handler,
-            args=(
-                standard_logging_response_object,
-                start_time,
-                end_time,
-                False,
-            ),
-        ).start()
+        logging_worker_pool.submit(
+            litellm_logging_obj.success_handler,
+            standard_logging_response_object,
+            start_time,
+            end_time,
+            False,
+        )
         await litellm_logging_obj.async_success_handler(
             result=standard_logging_response_object,
             start_time=start_time,
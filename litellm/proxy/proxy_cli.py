@@ -802,6 +802,20 @@ def run_server(  # noqa: PLR0915
                 gunicorn_options["certfile"] = ssl_certfile_path
                 gunicorn_options["keyfile"] = ssl_keyfile_path
 
+            from litellm.integrations.prometheus_helpers.prometheus_multiprocess import (
+                gunicorn_child_exit,
+                is_prometheus_multiprocess_enabled,
+                setup_prometheus_multiproc_dir,
+            )
+
+            if is_prometheus_multiprocess_enabled():
+                # workers share metrics through PROMETHEUS_MULTIPROC_DIR, so /metrics reports all workers
+                print(  # noqa
+                    f"\033[1;32mLiteLLM Proxy: Using prometheus multiprocess mode, metrics dir: {os.getenv('PROMETHEUS_MULTIPROC_DIR')}\033[0m\n"  # noqa
+                )
+                setup_prometheus_multiproc_dir()
+                gunicorn_options["child_exit"] = gunicorn_child_exit
+
             StandaloneApplication(
                 app=app, options=gunicorn_options
             ).run()  # Run gunicorn
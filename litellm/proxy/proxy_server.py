@@ -120,12 +120,13 @@ from litellm.litellm_core_utils.core_helpers import (
     _get_parent_otel_span_from_kwargs,
     get_litellm_metadata_from_kwargs,
 )
+from litellm.llms.custom_httpx.connection_pool_registry import connection_pool_registry
 from litellm.llms.custom_httpx.httpx_handler import HTTPHandler
 from litellm.proxy._types import *
 from litellm.proxy.analytics_endpoints.analytics_endpoints import (
     router as analytics_router,
 )
-from litellm.proxy.auth.auth_checks import log_db_metrics
+from litellm.proxy.auth.auth_checks import log_db_metrics, preload_key_object_cache
 from litellm.proxy.auth.auth_utils import check_response_size_is_safe
 from litellm.proxy.auth.handle_jwt import JWTHandler
 from litellm.proxy.auth.litellm_license import LicenseCheck
@@ -168,7 +169,12 @@ from litellm.proxy.guardrails.init_guardrails import (
     init_guardrails_v2,
     initialize_guardrails,
 )
-from litellm.proxy.health_check import perform_health_check
+from litellm.proxy.health_check import (
+    DEFAULT_HEALTH_CHECK_MAX_CONCURRENCY,
+    DEFAULT_HEALTH_CHECK_TIMEOUT,
+    BackgroundHealthCheckScheduler,
+    perform_health_check,
+)
 from litellm.proxy.health_endpoints._health_endpoints import router as health_router
 from litellm.proxy.hooks.prompt_injection_detection import (
     _OPTIONAL_PromptInjectionDetection,
@@ -253,6 +259,7 @@ from litellm.scheduler import DefaultPriorities, FlowItem, Scheduler
 from litellm.secret_managers.aws_secret_manager import load_aws_kms
 from litellm.secret_managers.google_kms import load_google_kms
 from litellm.secret_managers.main import (
+    async_get_secret,
     get_secret,
     get_secret_bool,
     get_secret_str,
@@ -1337,7 +1344,7 @@ async def _run_background_health_check():
 
     Update health_check_results, based on this.
     """
-    global health_check_results, llm_model_list, health_check_interval, health_check_details
+    global health_check_results, llm_model_list, health_check_interval, health_check_details, redis_usage_cache, llm_router
 
     # make 1 deep copy of llm_model_list -> use this for all background health checks
     _llm_model_list = copy.deepcopy(llm_model_list)
@@ -1345,21 +1352,23 @@ async def _run_background_health_check():
     if _llm_model_list is None:
         return
 
-    while True:
-        healthy_endpoints, unhealthy_endpoints = await perform_health_check(
-            model_list=_llm_model_list, details=health_check_details
-        )
-
-        # Update the global variable with the health check results
-        health_check_results["healthy_endpoints"] = healthy_endpoints
-        health_check_results["unhealthy_endpoints"] = unhealthy_endpoints
-        health_check_results["healthy_count"] = len(healthy_endpoints)
-        health_check_results["unhealthy_count"] = len(unhealthy_endpoints)
-
-        if health_check_interval is not None and isinstance(
-            health_check_interval, float
-        ):
-            await asyncio.sleep(health_check_interval)
+    health_check_scheduler = BackgroundHealthCheckScheduler(
+        model_list=_llm_model_list,
+        health_check_interval=health_check_interval or 300,
+        details=health_check_details,
+        max_concurrency=general_settings.get(
+            "health_check_max_concurrency", DEFAULT_HEALTH_CHECK_MAX_CONCURRENCY
+        ),
+        timeout=general_settings.get(
+            "health_check_timeout", DEFAULT_HEALTH_CHECK_TIMEOUT
+        ),
+        redis_cache=redis_usage_cache,
+        llm_router=llm_router,
+        cooldown_unhealthy_deployments=general_settings.get(
+            "health_check_cooldown_unhealthy_deployments", False
+        ),
+    )
+    await health_check_scheduler.run(health_check_results=health_check_results)
 
 
 class ProxyConfig:
@@ -1748,10 +1757,12 @@ class ProxyConfig:
                                 verbose_proxy_logger.debug(
                                     "Starting Prometheus Metrics on /metrics"
                                 )
-                                from prometheus_client import make_asgi_app
+                                from litellm.integrations.prometheus_helpers.prometheus_multiprocess import (
+                                    get_prometheus_metrics_asgi_app,
+                                )
 
                                 # Add prometheus asgi middleware to route /metrics requests
-                                metrics_app = make_asgi_app()
+                                metrics_app = get_prometheus_metrics_asgi_app()
                                 app.mount("/metrics", metrics_app)
                     print(  # noqa
                         f"{blue_color_code} Initialized Success Callbacks - {litellm.success_callback} {reset_color_code}"
@@ -1992,7 +2003,7 @@ class ProxyConfig:
                 ### LOAD FROM os.environ/ ###
                 for k, v in model["litellm_params"].items():
                     if isinstance(v, str) and v.startswith("os.environ/"):
-                        model["litellm_params"][k] = get_secret(v)
+                        model["litellm_params"][k] = await async_get_secret(v)
                 print(f"\033[32m    {model.get('model_name', '')}\033[0m")  # noqa
                 litellm_model_name = model["litellm_params"]["model"]
                 litellm_model_api_base = model["litellm_params"].get("api_base", None)
@@ -2118,7 +2129,7 @@ class ProxyConfig:
                 ### LOAD FROM os.environ/ ###
                 for k, v in model["litellm_params"].items():
                     if isinstance(v, str) and v.startswith("os.environ/"):
-                        model["litellm_params"][k] = get_secret(v)
+                        model["litellm_params"][k] = await async_get_secret(v)
 
                 ## check if they have model-id's ##
                 model_id = model.get("model_info", {}).get("id", None)
@@ -2930,6 +2941,27 @@ class ProxyStartupEvent:
             )
         )
 
+    @classmethod
+    async def _preload_key_object_cache(
+        cls,
+        prisma_client: PrismaClient,
+        proxy_logging_obj: ProxyLogging,
+        limit: int,
+    ):
+        """Loads the most recently used keys into `user_api_key_cache`"""
+        try:
+            num_keys = await preload_key_object_cache(
+                prisma_client=prisma_client,
+                user_api_key_cache=user_api_key_cache,
+                proxy_logging_obj=proxy_logging_obj,
+                limit=limit,
+            )
+            verbose_proxy_logger.debug("Preloaded %s keys into the cache", num_keys)
+        except Exception as e:
+            verbose_proxy_logger.warning(
+                "Unable to preload keys into the cache - %s", str(e)
+            )
+
     @classmethod
     async def initialize_scheduled_background_jobs(
         cls,
@@ -2950,6 +2982,17 @@ class ProxyStartupEvent:
             proxy_batch_write_at - 3, proxy_batch_write_at + 3
         )  # random interval, so multiple workers avoid batch writing at the same time
 
+        ### PRELOAD KEY CACHE ###
+        preload_key_cache_limit = general_settings.get("preload_key_cache_limit", 1000)
+        if preload_key_cache_limit:
+            asyncio.create_task(
+                ProxyStartupEvent._preload_key_object_cache(
+                    prisma_client=prisma_client,
+                    proxy_logging_obj=proxy_logging_obj,
+                    limit=preload_key_cache_limit,
+                )
+            )
+
         ### RESET BUDGET ###
         if general_settings.get("disable_reset_budget", False) is False:
             scheduler.add_job(
@@ -9104,6 +9147,9 @@ async def shutdown_event():
             # [DO NOT BLOCK shutdown events for this]
             pass
 
+    # close the provider connection pools
+    await connection_pool_registry.aclose()
+
     ## RESET CUSTOM VARIABLES ##
     cleanup_router_config_variables()
 
@@ -7,7 +7,6 @@ import os
 import re
 import smtplib
 import subprocess
-import threading
 import time
 import traceback
 from datetime import datetime, timedelta
@@ -63,11 +62,17 @@ from litellm.integrations.custom_logger import CustomLogger
 from litellm.integrations.SlackAlerting.slack_alerting import SlackAlerting
 from litellm.integrations.SlackAlerting.utils import _add_langfuse_trace_id_to_alert
 from litellm.litellm_core_utils.litellm_logging import Logging
+from litellm.litellm_core_utils.logging_worker_pool import logging_worker_pool
 from litellm.llms.custom_httpx.httpx_handler import HTTPHandler
 from litellm.proxy._types import (
     AlertType,
     CallInfo,
     DynamoDBArgs,
+    LiteLLM_KeyAuthObjects,
+    LiteLLM_OrganizationTable,
+    LiteLLM_TeamMembership,
+    LiteLLM_TeamTableCachedObj,
+    LiteLLM_UserTable,
     LiteLLM_VerificationTokenView,
     LitellmUserRoles,
     Member,
@@ -846,13 +851,11 @@ class ProxyLogging:
                     traceback_exception=traceback.format_exc(),
                 )
 
-                threading.Thread(
-                    target=litellm_logging_obj.failure_handler,
-                    args=(
-                        original_exception,
-                        traceback.format_exc(),
-                    ),
-                ).start()
+                logging_worker_pool.submit(
+                    litellm_logging_obj.failure_handler,
+                    original_exception,
+                    traceback.format_exc(),
+                )
 
         for callback in litellm.callbacks:
             try:
@@ -992,6 +995,29 @@ def on_backoff(details):
     print_verbose(f"Backing off... this was attempt #{details['tries']}")
 
 
+COMBINED_VIEW_COLUMNS = """
+    v.*,
+    t.spend AS team_spend,
+    t.max_budget AS team_max_budget,
+    t.tpm_limit AS team_tpm_limit,
+    t.rpm_limit AS team_rpm_limit,
+    t.models AS team_models,
+    t.metadata AS team_metadata,
+    t.blocked AS team_blocked,
+    t.team_alias AS team_alias,
+    t.metadata AS team_metadata,
+    t.members_with_roles AS team_members_with_roles,
+    tm.spend AS team_member_spend,
+    m.aliases as team_model_aliases
+"""
+COMBINED_VIEW_JOINS = """
+    "LiteLLM_VerificationToken" AS v
+    LEFT JOIN "LiteLLM_TeamTable" AS t ON v.team_id = t.team_id
+    LEFT JOIN "LiteLLM_TeamMembership" AS tm ON v.team_id = tm.team_id AND tm.user_id = v.user_id
+    LEFT JOIN "LiteLLM_ModelTable" m ON t.model_id = m.id
+"""
+
+
 class PrismaClient:
     user_list_transactons: dict = {}
     end_user_list_transactons: dict = {}
@@ -1380,6 +1406,114 @@ class PrismaClient:
 
             raise e
 
+    def _get_verification_token_view(self, row: dict) -> LiteLLM_VerificationTokenView:
+        """
+        Converts a `combined_view` row into a LiteLLM_VerificationTokenView
+        """
+        if row["team_models"] is None:
+            row["team_models"] = []
+        if row["team_blocked"] is None:
+            row["team_blocked"] = False
+
+        team_member: Optional[Member] = None
+        if row["team_members_with_roles"] is not None and row["user_id"] is not None:
+            ## find the team member corresponding to user id
+            """
+            [
+                {
+                    "role": "admin",
+                    "user_id": "default_user_id",
+                    "user_email": null
+                },
+                {
+                    "role": "user",
+                    "user_id": null,
+                    "user_email": "test@email.com"
+                }
+            ]
+            """
+            for tm in row["team_members_with_roles"]:
+                if tm.get("user_id") is not None and row["user_id"] == tm.get(
+                    "user_id"
+                ):
+                    team_member = Member(**tm)
+        row["team_member"] = team_member
+        view = LiteLLM_VerificationTokenView(**row, last_refreshed_at=time.time())
+        # for prisma we need to cast the expires time to str
+        if view.expires is not None and isinstance(view.expires, datetime):
+            view.expires = view.expires.isoformat()
+        return view
+
+    @backoff.on_exception(
+        backoff.expo,
+        Exception,  # base exception to catch for the backoff
+        max_tries=3,  # maximum number of retries
+        max_time=10,  # maximum total time to retry for
+        on_backoff=on_backoff,  # specifying the function to call on backoff
+    )
+    @log_db_metrics
+    async def get_key_auth_objects(
+        self, token: str, parent_otel_span: Optional[Span] = None
+    ) -> Optional[LiteLLM_KeyAuthObjects]:
+        """
+        Returns the key, and its user, team, team membership and organization, in a single query.
+        """
+        hashed_token = _hash_token_if_needed(token=token)
+        sql_query = f"""
+        SELECT {COMBINED_VIEW_COLUMNS},
+        to_jsonb(u) AS auth_user,
+        (
+            SELECT json_agg(om) FROM "LiteLLM_OrganizationMembership" AS om
+            WHERE om.user_id = v.user_id
+        ) AS auth_user_organization_memberships,
+        to_jsonb(t) AS auth_team,
+        to_jsonb(tm) AS auth_team_membership,
+        to_jsonb(tmb) AS auth_team_membership_budget,
+        to_jsonb(o) AS auth_organization
+        FROM {COMBINED_VIEW_JOINS}
+        LEFT JOIN "LiteLLM_UserTable" AS u ON v.user_id = u.user_id
+        LEFT JOIN "LiteLLM_BudgetTable" AS tmb ON tm.budget_id = tmb.budget_id
+        LEFT JOIN "LiteLLM_OrganizationTable" AS o ON t.organization_id = o.organization_id
+        WHERE v.token = '{hashed_token}'
+        """
+        row = await self.db.query_first(query=sql_query)
+        if row is None:
+            return None
+
+        user_row = row.pop("auth_user", None)
+        user_organization_memberships = row.pop(
+            "auth_user_organization_memberships", None
+        )
+        team_row = row.pop("auth_team", None)
+        team_membership_row = row.pop("auth_team_membership", None)
+        team_membership_budget_row = row.pop("auth_team_membership_budget", None)
+        organization_row = row.pop("auth_organization", None)
+
+        auth_objects = LiteLLM_KeyAuthObjects(
+            key=self._get_verification_token_view(row=row)
+        )
+        # the key is all that's required for auth, the other objects are only cached if they parse
+        try:
+            if user_row is not None:
+                user_row["organization_memberships"] = user_organization_memberships
+                auth_objects.user = LiteLLM_UserTable(**user_row)
+            if team_row is not None:
+                auth_objects.team = LiteLLM_TeamTableCachedObj(**team_row)
+            if team_membership_row is not None:
+                auth_objects.team_membership = LiteLLM_TeamMembership(
+                    **team_membership_row,
+                    litellm_budget_table=team_membership_budget_row,
+                )
+            if organization_row is not None:
+                auth_objects.organization = LiteLLM_OrganizationTable(
+                    **organization_row
+                )
+        except Exception as e:
+            verbose_proxy_logger.debug(
+                "PrismaClient: unable to parse auth objects for key - %s", str(e)
+            )
+        return auth_objects
+
     @backoff.on_exception(
         backoff.expo,
         Exception,  # base exception to catch for the backoff
@@ -1635,6 +1769,10 @@ class PrismaClient:
                         verbose_proxy_logger.debug(
                             f"PrismaClient: find_unique for token: {hashed_token}"
                         )
+                combined_view_query = f"""
+                    SELECT {COMBINED_VIEW_COLUMNS}
+                    FROM {COMBINED_VIEW_JOINS}
+                    """
                 if query_type == "find_unique":
                     if token is None:
                         raise HTTPException(
@@ -1643,24 +1781,7 @@ class PrismaClient:
                         )
 
                     sql_query = f"""
-                    SELECT 
-                    v.*,
-                    t.spend AS team_spend, 
-                    t.max_budget AS team_max_budget, 
-                    t.tpm_limit AS team_tpm_limit,
-                    t.rpm_limit AS team_rpm_limit,
-                    t.models AS team_models,
-                    t.metadata AS team_metadata,
-                    t.blocked AS team_blocked,
-                    t.team_alias AS team_alias,
-                    t.metadata AS team_metadata,
-                    t.members_with_roles AS team_members_with_roles,
-                    tm.spend AS team_member_spend,
-                    m.aliases as team_model_aliases
-                    FROM "LiteLLM_VerificationToken" AS v
-                    LEFT JOIN "LiteLLM_TeamTable" AS t ON v.team_id = t.team_id
-                    LEFT JOIN "LiteLLM_TeamMembership" AS tm ON v.team_id = tm.team_id AND tm.user_id = v.user_id
-                    LEFT JOIN "LiteLLM_ModelTable" m ON t.model_id = m.id
+                    {combined_view_query}
                     WHERE v.token = '{token}'
                     """
 
@@ -1668,46 +1789,19 @@ class PrismaClient:
                     response = await self.db.query_first(query=sql_query)
 
                     if response is not None:
-                        if response["team_models"] is None:
-                            response["team_models"] = []
-                        if response["team_blocked"] is None:
-                            response["team_blocked"] = False
-
-                        team_member: Optional[Member] = None
-                        if (
-                            response["team_members_with_roles"] is not None
-                            and response["user_id"] is not None
-                        ):
-                            ## find the team member corresponding to user id
-                            """
-                            [
-                                {
-                                    "role": "admin",
-                                    "user_id": "default_user_id",
-                                    "user_email": null
-                                },
-                                {
-                                    "role": "user",
-                                    "user_id": null,
-                                    "user_email": "test@email.com"
-                                }
-                            ]
-                            """
-                            for tm in response["team_members_with_roles"]:
-                                if tm.get("user_id") is not None and response[
-                                    "user_id"
-                                ] == tm.get("user_id"):
-                                    team_member = Member(**tm)
-                        response["team_member"] = team_member
-                        response = LiteLLM_VerificationTokenView(
-                            **response, last_refreshed_at=time.time()
-                        )
-                        # for prisma we need to cast the expires time to str
-                        if response.expires is not None and isinstance(
-                            response.expires, datetime
-                        ):
-                            response.expires = response.expires.isoformat()
+                        response = self._get_verification_token_view(row=response)
                     return response
+                elif query_type == "find_all":
+                    # most recently used keys first, e.g. for preloading the key cache
+                    sql_query = f"""
+                    {combined_view_query}
+                    ORDER BY v.updated_at DESC NULLS LAST
+                    LIMIT {int(limit or 100)}
+                    """
+                    response = await self.db.query_raw(query=sql_query)
+                    return [
+                        self._get_verification_token_view(row=row) for row in response
+                    ]
         except Exception as e:
             import traceback
 
@@ -1747,6 +1841,8 @@ class PrismaClient:
         """
         Add a key to the database. If it already exists, do nothing.
         """
+        from litellm.proxy.auth.auth_checks import _clear_not_found_db_lookups
+
         start_time = time.time()
         try:
             verbose_proxy_logger.debug("PrismaClient: insert_data: %s", data)
@@ -1767,6 +1863,7 @@ class PrismaClient:
                         "update": {},  # don't do anything if it already exists
                     },
                 )
+                _clear_not_found_db_lookups(hashed_token=hashed_token)
                 verbose_proxy_logger.info("Data Inserted into Keys Table")
                 return new_verification_token
             elif table_name == "user":
@@ -1791,6 +1888,7 @@ class PrismaClient:
                             },
                         )
                     raise e
+                _clear_not_found_db_lookups(user_id=data["user_id"])
                 verbose_proxy_logger.info("Data Inserted into User Table")
                 return new_user_row
             elif table_name == "team":
@@ -1808,6 +1906,7 @@ class PrismaClient:
                         "update": {},  # don't do anything if it already exists
                     },
                 )
+                _clear_not_found_db_lookups(team_id=data["team_id"])
                 verbose_proxy_logger.info("Data Inserted into Team Table")
                 return new_team_row
             elif table_name == "config":
@@ -1900,6 +1999,8 @@ class PrismaClient:
         """
         Update existing data
         """
+        from litellm.proxy.auth.auth_checks import _clear_not_found_db_lookups
+
         verbose_proxy_logger.debug(
             f"PrismaClient: update_data, table_name: {table_name}"
         )
@@ -1917,6 +2018,7 @@ class PrismaClient:
                     where={"token": token},  # type: ignore
                     data={**db_data},  # type: ignore
                 )
+                _clear_not_found_db_lookups(hashed_token=token)
                 verbose_proxy_logger.debug(
                     "\033[91m"
                     + f"DB Token Table update succeeded {response}"
@@ -1953,6 +2055,7 @@ class PrismaClient:
                         },  # just update user-specified values, if it already exists
                     },
                 )
+                _clear_not_found_db_lookups(user_id=user_id)
                 verbose_proxy_logger.info(
                     "\033[91m"
                     + f"DB User Table - update succeeded {update_user_row}"
@@ -1994,6 +2097,7 @@ class PrismaClient:
                         },  # just update user-specified values, if it already exists
                     },
                 )
+                _clear_not_found_db_lookups(team_id=team_id)
                 verbose_proxy_logger.info(
                     "\033[91m"
                     + f"DB Team Table - update succeeded {update_team_row}"
@@ -18,7 +18,6 @@ import json
 import logging
 import random
 import re
-import threading
 import time
 import traceback
 import uuid
@@ -53,6 +52,7 @@ from litellm.caching.caching import DualCache, InMemoryCache, RedisCache
 from litellm.integrations.custom_logger import CustomLogger
 from litellm.litellm_core_utils.core_helpers import _get_parent_otel_span_from_kwargs
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLogging
+from litellm.litellm_core_utils.logging_worker_pool import logging_worker_pool
 from litellm.llms.AzureOpenAI.azure import get_azure_ad_token_from_oidc
 from litellm.router_strategy.least_busy import LeastBusyLoggingHandler
 from litellm.router_strategy.lowest_cost import LowestCostLoggingHandler
@@ -75,6 +75,16 @@ from litellm.router_utils.cooldown_handlers import (
     _async_get_cooldown_deployments_with_debug_info,
     _get_cooldown_deployments,
     _set_cooldown_deployments,
+    _should_run_cooldown_logic,
+    cast_exception_status_to_int,
+)
+from litellm.router_utils.deployment_health import (
+    DeploymentHealthTracker,
+    _get_response_time_seconds,
+)
+from litellm.router_utils.embedding_batcher import (
+    EmbeddingBatcher,
+    get_embedding_batch_limits,
 )
 from litellm.router_utils.fallback_event_handlers import (
     log_failure_fallback_event,
@@ -86,6 +96,16 @@ from litellm.router_utils.handle_error import (
     async_raise_no_deployment_exception,
     send_llm_exception_alert,
 )
+from litellm.router_utils.request_deadline import (
+    get_remaining_time,
+    has_time_for_attempt,
+    set_request_deadline,
+)
+from litellm.router_utils.request_hedging import (
+    RequestHedger,
+    async_wait_for_first_chunk,
+)
+from litellm.router_utils.retry_budget import RetryBudget
 from litellm.router_utils.router_callbacks.track_deployment_metrics import (
     increment_deployment_failures_for_current_minute,
     increment_deployment_successes_for_current_minute,
@@ -116,11 +136,15 @@ from litellm.types.router import (
     CustomRoutingStrategyBase,
     Deployment,
     DeploymentTypedDict,
+    EmbeddingBatchingArgs,
     LiteLLM_Params,
     LiteLLMParamsTypedDict,
     ModelGroupInfo,
     ModelInfo,
+    PassiveHealthCheckArgs,
     ProviderBudgetConfigType,
+    RequestHedgingArgs,
+    RetryBudgetArgs,
     RetryPolicy,
     RouterErrors,
     RouterGeneralSettings,
@@ -134,6 +158,7 @@ from litellm.types.router import (
 from litellm.types.services import ServiceLoggerPayload, ServiceTypes
 from litellm.types.utils import OPENAI_RESPONSE_HEADERS
 from litellm.types.utils import ModelInfo as ModelMapInfo
+from litellm.types.utils import all_litellm_params
 from litellm.utils import (
     CustomStreamWrapper,
     ModelResponse,
@@ -195,6 +220,9 @@ class Router:
             int
         ] = None,  # max fallbacks to try before exiting the call. Defaults to 5.
         timeout: Optional[float] = None,
+        end_to_end_timeout: Optional[
+            float
+        ] = None,  # max time for a request, across all retries and fallbacks
         default_litellm_params: Optional[
             dict
         ] = None,  # default params for Router.chat.completion.create
@@ -239,6 +267,10 @@ class Router:
         ] = "simple-shuffle",
         routing_strategy_args: dict = {},  # just for latency-based
         provider_budget_config: Optional[ProviderBudgetConfigType] = None,
+        passive_health_check_args: Optional[Union[PassiveHealthCheckArgs, dict]] = None,
+        request_hedging_args: Optional[Union[RequestHedgingArgs, dict]] = None,
+        retry_budget_args: Optional[Union[RetryBudgetArgs, dict]] = None,
+        embedding_batching_args: Optional[Union[EmbeddingBatchingArgs, dict]] = None,
         semaphore: Optional[asyncio.Semaphore] = None,
         alerting_config: Optional[AlertingConfig] = None,
         router_general_settings: Optional[
@@ -262,6 +294,7 @@ class Router:
             default_priority: (Optional[int]): the default priority for a request. Only for '.scheduler_acompletion()'. Default is None.
             num_retries (Optional[int]): Number of retries for failed requests. Defaults to 2.
             timeout (Optional[float]): Timeout for requests. Defaults to None.
+            end_to_end_timeout (Optional[float]): Max time for a request, across all retries and fallbacks. Retries / fallbacks that can't start before it are skipped. Defaults to None.
             default_litellm_params (dict): Default parameters for Router.chat.completion.create. Defaults to {}.
             set_verbose (bool): Flag to set verbose mode. Defaults to False.
             debug_level (Literal["DEBUG", "INFO"]): Debug level for logging. Defaults to "INFO".
@@ -276,6 +309,10 @@ class Router:
             routing_strategy_args (dict): Additional args for latency-based routing. Defaults to {}.
             alerting_config (AlertingConfig): Slack alerting configuration. Defaults to None.
             provider_budget_config (ProviderBudgetConfig): Provider budget configuration. Use this to set llm_provider budget limits. example $100/day to OpenAI, $100/day to Azure, etc. Defaults to None.
+            passive_health_check_args (Optional[PassiveHealthCheckArgs]): If set, scores deployment health from live traffic and routes away from degrading deployments. Defaults to None.
+            request_hedging_args (Optional[RequestHedgingArgs]): If set, `acompletion` sends a second request to another deployment when the first one is slower than the model group's latency percentile. Defaults to None.
+            retry_budget_args (Optional[RetryBudgetArgs]): If set, limits retries per model group with a token bucket, to prevent retry storms during provider outages. Defaults to None.
+            embedding_batching_args (Optional[EmbeddingBatchingArgs]): If set, concurrent `aembedding` calls to the same deployment are sent as one request. Defaults to None.
         Returns:
             Router: An instance of the litellm.Router class.
 
@@ -421,6 +458,7 @@ class Router:
             self.max_fallbacks = litellm.ROUTER_MAX_FALLBACKS
 
         self.timeout = timeout or litellm.request_timeout
+        self.end_to_end_timeout = end_to_end_timeout
 
         self.retry_after = retry_after
         self.routing_strategy = routing_strategy
@@ -527,6 +565,36 @@ class Router:
                 router_cache=self.cache,
                 provider_budget_config=self.provider_budget_config,
             )
+        self.deployment_health_tracker: Optional[DeploymentHealthTracker] = None
+        if passive_health_check_args is not None:
+            if isinstance(passive_health_check_args, dict):
+                passive_health_check_args = PassiveHealthCheckArgs(
+                    **passive_health_check_args
+                )
+            self.deployment_health_tracker = DeploymentHealthTracker(
+                passive_health_check_args=passive_health_check_args
+            )
+        self.request_hedger: Optional[RequestHedger] = None
+        if request_hedging_args is not None:
+            if isinstance(request_hedging_args, dict):
+                request_hedging_args = RequestHedgingArgs(**request_hedging_args)
+            self.request_hedger = RequestHedger(
+                request_hedging_args=request_hedging_args
+            )
+        self.retry_budget: Optional[RetryBudget] = None
+        if retry_budget_args is not None:
+            if isinstance(retry_budget_args, dict):
+                retry_budget_args = RetryBudgetArgs(**retry_budget_args)
+            self.retry_budget = RetryBudget(retry_budget_args=retry_budget_args)
+        self.embedding_batcher: Optional[EmbeddingBatcher] = None
+        if embedding_batching_args is not None:
+            if isinstance(embedding_batching_args, dict):
+                embedding_batching_args = EmbeddingBatchingArgs(
+                    **embedding_batching_args
+                )
+            self.embedding_batcher = EmbeddingBatcher(
+                embedding_batching_args=embedding_batching_args
+            )
         self.retry_policy: Optional[RetryPolicy] = None
         if retry_policy is not None:
             if isinstance(retry_policy, dict):
@@ -834,18 +902,18 @@ class Router:
         - call it with a semaphore over the call
         - semaphore specific to it's rpm
         - in the semaphore,  make a check against it's local rpm before running
+        - if request hedging is enabled, send a second request to another deployment if the first one is slow
         """
-        model_name = None
         try:
             verbose_router_logger.debug(
                 f"Inside _acompletion()- model: {model}; kwargs: {kwargs}"
             )
-            parent_otel_span = _get_parent_otel_span_from_kwargs(kwargs)
             start_time = time.time()
+            specific_deployment = kwargs.pop("specific_deployment", None)
             deployment = await self.async_get_available_deployment(
                 model=model,
                 messages=messages,
-                specific_deployment=kwargs.pop("specific_deployment", None),
+                specific_deployment=specific_deployment,
                 request_kwargs=kwargs,
             )
             end_time = time.time()
@@ -860,7 +928,64 @@ class Router:
                     parent_otel_span=_get_parent_otel_span_from_kwargs(kwargs),
                 )
             )
+        except Exception as e:
+            verbose_router_logger.info(
+                f"litellm.acompletion(model=None)\033[31m Exception {str(e)}\033[0m"
+            )
+            raise e
+
+        if self.request_hedger is None or specific_deployment is True:
+            return await self._acompletion_with_deployment(
+                deployment=deployment, model=model, messages=messages, kwargs=kwargs
+            )
+
+        stream = kwargs.get("stream", False) is True
+        # the hedged request can't share the caller's logging object, it's logged on its own
+        hedge_kwargs = {k: v for k, v in kwargs.items() if k != "litellm_logging_obj"}
+        hedge_kwargs["metadata"] = dict(kwargs.get("metadata") or {})
+
+        async def get_hedge_call():
+            hedge_deployment = await self._async_get_hedge_deployment(
+                model=model, deployment=deployment, request_kwargs=hedge_kwargs
+            )
+            if hedge_deployment is None:
+                return None
+            return lambda: self._acompletion_with_deployment(
+                deployment=hedge_deployment,
+                model=model,
+                messages=messages,
+                kwargs=hedge_kwargs,
+                wait_for_first_chunk=stream,
+            )
+
+        return await self.request_hedger.async_run_with_hedging(
+            model_group=model,
+            primary_call=lambda: self._acompletion_with_deployment(
+                deployment=deployment,
+                model=model,
+                messages=messages,
+                kwargs=kwargs,
+                wait_for_first_chunk=stream,
+            ),
+            get_hedge_call=get_hedge_call,
+        )
+
+    async def _acompletion_with_deployment(
+        self,
+        deployment: dict,
+        model: str,
+        messages: List[Dict[str, str]],
+        kwargs: dict,
+        wait_for_first_chunk: bool = False,
+    ) -> Union[ModelResponse, CustomStreamWrapper]:
+        """
+        Makes the `_acompletion` call to the selected deployment.
 
+        - wait_for_first_chunk: for streaming requests, only return once the deployment sent its first chunk (used for request hedging)
+        """
+        model_name = None
+        try:
+            parent_otel_span = _get_parent_otel_span_from_kwargs(kwargs)
             # debug how often this deployment picked
 
             self._track_deployment_metrics(
@@ -924,6 +1049,9 @@ class Router:
 
                 response = await _response
 
+            if wait_for_first_chunk and isinstance(response, CustomStreamWrapper):
+                response = await async_wait_for_first_chunk(response)
+
             ## CHECK CONTENT FILTER ERROR ##
             if isinstance(response, ModelResponse):
                 _should_raise = self._should_raise_content_policy_error(
@@ -2160,15 +2288,28 @@ class Router:
             )
 
             self.total_calls[model_name] += 1
-            response = litellm.aembedding(
-                **{
-                    **data,
-                    "input": input,
-                    "caching": self.cache_responses,
-                    "client": model_client,
-                    **kwargs,
-                }
+            batch_limits = self._get_embedding_batch_limits(
+                deployment=deployment, input=input, kwargs=kwargs
             )
+            if batch_limits is not None:
+                response = self._abatch_embedding(
+                    deployment=deployment,
+                    data=data,
+                    input=input,
+                    model_client=model_client,
+                    batch_limits=batch_limits,
+                    kwargs=kwargs,
+                )
+            else:
+                response = litellm.aembedding(
+                    **{
+                        **data,
+                        "input": input,
+                        "caching": self.cache_responses,
+                        "client": model_client,
+                        **kwargs,
+                    }
+                )
 
             ### CONCURRENCY-SAFE RPM CHECKS ###
             rpm_semaphore = self._get_client(
@@ -2208,6 +2349,103 @@ class Router:
                 self.fail_calls[model_name] += 1
             raise e
 
+    def _get_embedding_batch_limits(
+        self, deployment: dict, input: Union[str, List], kwargs: dict
+    ) -> Optional[Tuple[int, Optional[int]]]:
+        """
+        Returns the (max inputs, max input tokens) per batch, or None if the embedding call can't be batched
+
+        Not batched if caching is on (cache keys are per call), the input is not text,
+        or the caller passed its own credentials.
+        """
+        if self.embedding_batcher is None:
+            return None
+        if self.cache_responses is True or kwargs.get("caching", False) is True:
+            return None
+        if not isinstance(input, str) and not (
+            isinstance(input, list)
+            and len(input) > 0
+            and all(isinstance(text, str) for text in input)
+        ):
+            return None
+        if any(
+            kwargs.get(param) is not None
+            for param in ("api_key", "api_base", "base_url", "api_version")
+        ):
+            return None
+        model = deployment["litellm_params"]["model"]
+        _, custom_llm_provider, _, _ = get_llm_provider(
+            model=model,
+            custom_llm_provider=deployment["litellm_params"].get("custom_llm_provider"),
+        )
+        return get_embedding_batch_limits(
+            custom_llm_provider=custom_llm_provider,
+            model=model,
+            embedding_batching_args=self.embedding_batcher.args,
+        )
+
+    async def _abatch_embedding(
+        self,
+        deployment: dict,
+        data: dict,
+        input: Union[str, List[str]],
+        model_client: Any,
+        batch_limits: Tuple[int, Optional[int]],
+        kwargs: dict,
+    ) -> litellm.EmbeddingResponse:
+        """
+        Sends the call's input as part of a batch, then calls `litellm.aembedding` with the caller's part of the
+        batch response - so logging, cost and spend tracking run per caller.
+        """
+        if self.embedding_batcher is None:
+            raise ValueError("embedding_batcher is not set")
+
+        # params sent to the provider - calls are only batched if these match
+        request_kwargs = {
+            k: v
+            for k, v in kwargs.items()
+            if k not in all_litellm_params and k != "litellm_parent_otel_span"
+        }
+
+        async def send_batch(inputs: List[str]) -> litellm.EmbeddingResponse:
+            return await litellm.aembedding(
+                **{
+                    **data,
+                    **request_kwargs,
+                    "input": inputs,
+                    "caching": False,
+                    "client": model_client,
+                    "no-log": True,  # logged per caller
+                }
+            )
+
+        try:
+            batch_response: Union[litellm.EmbeddingResponse, Exception] = (
+                await self.embedding_batcher.async_embed(
+                    batch_key=(
+                        deployment["model_info"]["id"],
+                        json.dumps(request_kwargs, sort_keys=True, default=str),
+                    ),
+                    input=[input] if isinstance(input, str) else input,
+                    model=data["model"],
+                    max_batch_size=batch_limits[0],
+                    max_batch_tokens=batch_limits[1],
+                    send_batch=send_batch,
+                )
+            )
+        except Exception as e:
+            batch_response = e
+        return await litellm.aembedding(
+            **{
+                **data,
+                "input": input,
+                "caching": self.cache_responses,
+                "client": model_client,
+                **kwargs,
+                "embedding_batch_response": batch_response,
+            }
+        )
+
     #### FILES API ####
     async def acreate_file(
         self,
@@ -2628,6 +2866,11 @@ class Router:
         content_policy_fallbacks: Optional[List] = kwargs.get(
             "content_policy_fallbacks", self.content_policy_fallbacks
         )
+        set_request_deadline(
+            kwargs=kwargs,
+            end_to_end_timeout=kwargs.pop("end_to_end_timeout", None)
+            or self.end_to_end_timeout,
+        )
 
         try:
             self._handle_mock_testing_fallbacks(
@@ -2651,6 +2894,14 @@ class Router:
             if disable_fallbacks is True or original_model_group is None:
                 raise e
 
+            if not has_time_for_attempt(kwargs=kwargs):
+                verbose_router_logger.info(
+                    "Request deadline reached, skipping fallbacks for model_group={}".format(
+                        model_group
+                    )
+                )
+                raise e
+
             input_kwargs = {
                 "litellm_router": self,
                 "original_exception": original_exception,
@@ -2870,6 +3121,8 @@ class Router:
         )
         model_group: Optional[str] = kwargs.get("model")
         num_retries = kwargs.pop("num_retries")
+        if self.retry_budget is not None and model_group is not None:
+            self.retry_budget.record_request(model_group=model_group)
 
         ## ADD MODEL GROUP SIZE TO METADATA - used for model_group_rate_limit_error tracking
         _metadata: dict = kwargs.get("metadata") or {}
@@ -2937,8 +3190,12 @@ class Router:
                 healthy_deployments=_healthy_deployments,
             )
 
-            await asyncio.sleep(retry_after)
             for current_attempt in range(num_retries):
+                if not self._should_make_retry_attempt(
+                    model_group=model_group, kwargs=kwargs, retry_after=retry_after
+                ):
+                    break
+                await asyncio.sleep(retry_after)
                 try:
                     # if the function call is successful, no exception will be raised and we'll break out of the loop
                     response = await self.make_call(original_function, *args, **kwargs)
@@ -2962,13 +3219,12 @@ class Router:
                         )
                     else:
                         _healthy_deployments = []
-                    _timeout = self._time_to_sleep_before_retry(
+                    retry_after = self._time_to_sleep_before_retry(
                         e=original_exception,
                         remaining_retries=remaining_retries,
                         num_retries=num_retries,
                         healthy_deployments=_healthy_deployments,
                     )
-                    await asyncio.sleep(_timeout)
 
             if type(original_exception) in litellm.LITELLM_EXCEPTION_TYPES:
                 setattr(original_exception, "max_retries", num_retries)
@@ -2981,14 +3237,65 @@ class Router:
         Handler for making a call to the .completion()/.embeddings()/etc. functions.
         """
         model_group = kwargs.get("model")
+        remaining_time = get_remaining_time(kwargs)
+        if remaining_time is not None and remaining_time <= 0:
+            raise litellm.Timeout(
+                message="Request deadline reached before calling model_group={}".format(
+                    model_group
+                ),
+                model=model_group,
+                llm_provider="",
+            )
         response = original_function(*args, **kwargs)
         if inspect.iscoroutinefunction(response) or inspect.isawaitable(response):
-            response = await response
+            if remaining_time is None:
+                response = await response
+            else:
+                try:
+                    response = await asyncio.wait_for(response, timeout=remaining_time)
+                except asyncio.TimeoutError:
+                    if has_time_for_attempt(kwargs=kwargs):  # not a deadline timeout
+                        raise
+                    raise litellm.Timeout(
+                        message="Request deadline reached while calling model_group={}".format(
+                            model_group
+                        ),
+                        model=model_group,
+                        llm_provider="",
+                    )
         ## PROCESS RESPONSE HEADERS
         await self.set_response_headers(response=response, model_group=model_group)
 
         return response
 
+    def _should_make_retry_attempt(
+        self, model_group: Optional[str], kwargs: dict, retry_after: float
+    ) -> bool:
+        """
+        Returns False if the retry should be skipped:
+        - the request deadline passes before the retry can be made
+        - the model group's retry budget is used up
+        """
+        if not has_time_for_attempt(kwargs=kwargs, wait_before_attempt=retry_after):
+            verbose_router_logger.info(
+                "Request deadline reached, skipping retries for model_group={}".format(
+                    model_group
+                )
+            )
+            return False
+        if (
+            self.retry_budget is not None
+            and model_group is not None
+            and not self.retry_budget.try_acquire_retry(model_group=model_group)
+        ):
+            verbose_router_logger.info(
+                "Retry budget used up, skipping retries for model_group={}".format(
+                    model_group
+                )
+            )
+            return False
+        return True
+
     def _handle_mock_testing_rate_limit_error(
         self, kwargs: dict, model_group: Optional[str] = None
     ):
@@ -3199,6 +3506,8 @@ class Router:
             "content_policy_fallbacks", self.content_policy_fallbacks
         )
         model_group = kwargs.get("model")
+        if self.retry_budget is not None and model_group is not None:
+            self.retry_budget.record_request(model_group=model_group)
 
         try:
             # if the function call is successful, no exception will be raised and we'll break out of the loop
@@ -3243,8 +3552,12 @@ class Router:
             if num_retries > 0:
                 kwargs = self.log_retry(kwargs=kwargs, e=original_exception)
 
-            time.sleep(_timeout)
             for current_attempt in range(num_retries):
+                if not self._should_make_retry_attempt(
+                    model_group=model_group, kwargs=kwargs, retry_after=_timeout
+                ):
+                    break
+                time.sleep(_timeout)
                 verbose_router_logger.debug(
                     f"retrying request. Current attempt - {current_attempt}; retries left: {num_retries}"
                 )
@@ -3272,7 +3585,6 @@ class Router:
                         num_retries=num_retries,
                         healthy_deployments=_healthy_deployments,
                     )
-                    time.sleep(_timeout)
 
             if type(original_exception) in litellm.LITELLM_EXCEPTION_TYPES:
                 setattr(original_exception, "max_retries", num_retries)
@@ -3338,6 +3650,27 @@ class Router:
                     litellm_router_instance=self,
                     deployment_id=id,
                 )
+                if self.deployment_health_tracker is not None:
+                    self.deployment_health_tracker.record_success(
+                        deployment_id=id,
+                        latency=_get_response_time_seconds(start_time, end_time),
+                    )
+                if (
+                    self.request_hedger is not None
+                    and kwargs.get("cache_hit") is not True
+                ):
+                    # streaming requests are hedged on their time to first chunk
+                    self.request_hedger.record_latency(
+                        model_group=model_group,
+                        latency=_get_response_time_seconds(
+                            start_time,
+                            (
+                                kwargs.get("completion_start_time") or end_time
+                                if kwargs.get("stream") is True
+                                else end_time
+                            ),
+                        ),
+                    )
 
                 return tpm_key
 
@@ -3380,6 +3713,11 @@ class Router:
                 litellm_router_instance=self,
                 deployment_id=id,
             )
+            if self.deployment_health_tracker is not None:
+                self.deployment_health_tracker.record_success(
+                    deployment_id=id,
+                    latency=_get_response_time_seconds(start_time, end_time),
+                )
             return key
 
         return None
@@ -3438,6 +3776,19 @@ class Router:
                     deployment=deployment_id,
                     time_to_cooldown=_time_to_cooldown,
                 )  # setting deployment_id in cooldown deployments
+                if (
+                    self.deployment_health_tracker is not None
+                    and deployment_id is not None
+                ):
+                    result = self._passive_health_check_on_failure(
+                        deployment_id=deployment_id,
+                        exception=exception,
+                        exception_status=exception_status,
+                        start_time=start_time,
+                        end_time=end_time,
+                        time_to_cooldown=_time_to_cooldown,
+                        is_cooled_down=result,
+                    )
 
                 return result
             else:
@@ -3446,6 +3797,57 @@ class Router:
         except Exception as e:
             raise e
 
+    def _passive_health_check_on_failure(
+        self,
+        deployment_id: str,
+        exception: Any,
+        exception_status: Union[str, int],
+        start_time,
+        end_time,
+        time_to_cooldown: Optional[float],
+        is_cooled_down: bool,
+    ) -> bool:
+        """
+        Records the failure on the deployment's health score, and puts the deployment in cooldown if its score is too low
+
+        Returns:
+        - True if the deployment is in cooldown
+        """
+        if self.deployment_health_tracker is None:
+            return is_cooled_down
+        self.deployment_health_tracker.record_failure(
+            deployment_id=deployment_id,
+            exception=exception,
+            latency=_get_response_time_seconds(start_time, end_time),
+        )
+        if is_cooled_down is True:
+            self.deployment_health_tracker.reset(deployment_id=deployment_id)
+            return True
+        if (
+            self.deployment_health_tracker.should_cooldown(deployment_id=deployment_id)
+            and _should_run_cooldown_logic(
+                self, deployment_id, exception_status, exception
+            )
+            is True
+        ):
+            verbose_router_logger.info(
+                "passive health checks: putting deployment %s in cooldown, stats=%s",
+                deployment_id,
+                self.deployment_health_tracker.get_deployment_stats(
+                    deployment_id=deployment_id
+                ),
+            )
+            self.cooldown_cache.add_deployment_to_cooldown(
+                model_id=deployment_id,
+                original_exception=exception,
+                exception_status=cast_exception_status_to_int(exception_status),
+                cooldown_time=time_to_cooldown,
+            )
+            # start with a clean score once the cooldown ends
+            self.deployment_health_tracker.reset(deployment_id=deployment_id)
+            return True
+        return False
+
     def log_retry(self, kwargs: dict, e: Exception) -> dict:
         """
         When a retry or fallback happens, log the details of the just failed model call - similar to Sentry breadcrumbing
@@ -3666,6 +4068,32 @@ class Router:
                 healthy_deployments.append(deployment)
         return healthy_deployments, _all_deployments
 
+    async def _async_get_hedge_deployment(
+        self, model: str, deployment: dict, request_kwargs: dict
+    ) -> Optional[Dict]:
+        """
+        Returns a healthy deployment in the model group, other than `deployment`, to send a hedged request to.
+
+        Returns None if there is no other healthy deployment.
+        """
+        healthy_deployments, _ = await self._async_get_healthy_deployments(
+            model=model,
+            parent_otel_span=_get_parent_otel_span_from_kwargs(request_kwargs),
+        )
+        deployment_id = deployment.get("model_info", {}).get("id")
+        healthy_deployments = [
+            _deployment
+            for _deployment in healthy_deployments
+            if _deployment.get("model_info", {}).get("id") != deployment_id
+        ]
+        if self.deployment_health_tracker is not None:
+            healthy_deployments = self.deployment_health_tracker.filter_deployments(
+                healthy_deployments=healthy_deployments
+            )
+        if len(healthy_deployments) == 0:
+            return None
+        return random.choice(healthy_deployments)
+
     def routing_strategy_pre_call_checks(self, deployment: dict):
         """
         Mimics 'async_routing_strategy_pre_call_checks'
@@ -3714,10 +4142,9 @@ class Router:
                             )
                         )
                         ## LOGGING
-                        threading.Thread(
-                            target=logging_obj.failure_handler,
-                            args=(e, traceback.format_exc()),
-                        ).start()  # log response
+                        logging_worker_pool.submit(
+                            logging_obj.failure_handler, e, traceback.format_exc()
+                        )  # log response
                     _set_cooldown_deployments(
                         litellm_router_instance=self,
                         exception_status=e.status_code,
@@ -3737,10 +4164,9 @@ class Router:
                             )
                         )
                         ## LOGGING
-                        threading.Thread(
-                            target=logging_obj.failure_handler,
-                            args=(e, traceback.format_exc()),
-                        ).start()  # log response
+                        logging_worker_pool.submit(
+                            logging_obj.failure_handler, e, traceback.format_exc()
+                        )  # log response
                     raise e
 
     def _generate_model_id(self, model_group: str, litellm_params: dict):
@@ -4595,6 +5021,7 @@ class Router:
             "cooldown_time",
             "num_retries",
             "timeout",
+            "end_to_end_timeout",
             "max_retries",
             "retry_after",
             "fallbacks",
@@ -4624,6 +5051,7 @@ class Router:
             "cooldown_time",
             "num_retries",
             "timeout",
+            "end_to_end_timeout",
             "max_retries",
             "retry_after",
             "fallbacks",
@@ -5095,6 +5523,10 @@ class Router:
                 healthy_deployments=healthy_deployments,
                 cooldown_deployments=cooldown_deployments,
             )
+            if self.deployment_health_tracker is not None:
+                healthy_deployments = self.deployment_health_tracker.filter_deployments(
+                    healthy_deployments=healthy_deployments
+                )
 
             # filter pre-call checks
             _allowed_model_region = (
@@ -5223,10 +5655,9 @@ class Router:
 
                 if logging_obj is not None:
                     ## LOGGING
-                    threading.Thread(
-                        target=logging_obj.failure_handler,
-                        args=(e, traceback_exception),
-                    ).start()  # log response
+                    logging_worker_pool.submit(
+                        logging_obj.failure_handler, e, traceback_exception
+                    )  # log response
                     # Handle any exceptions that might occur during streaming
                     asyncio.create_task(
                         logging_obj.async_failure_handler(e, traceback_exception)  # type: ignore
@@ -5267,6 +5698,10 @@ class Router:
             healthy_deployments=healthy_deployments,
             cooldown_deployments=cooldown_deployments,
         )
+        if self.deployment_health_tracker is not None:
+            healthy_deployments = self.deployment_health_tracker.filter_deployments(
+                healthy_deployments=healthy_deployments
+            )
 
         # filter pre-call checks
         if self.enable_pre_call_checks and messages is not None:
@@ -3,13 +3,13 @@ import os
 import traceback
 from typing import TYPE_CHECKING, Any, Callable, Optional
 
-import httpx
 import openai
 
 import litellm
 from litellm import get_secret, get_secret_str
 from litellm._logging import verbose_router_logger
 from litellm.llms.AzureOpenAI.azure import get_azure_ad_token_from_oidc
+from litellm.llms.custom_httpx.connection_pool_registry import connection_pool_registry
 from litellm.secret_managers.get_azure_ad_token_provider import (
     get_azure_ad_token_provider,
 )
@@ -251,11 +251,10 @@ class InitalizeOpenAISDKClient:
                         api_version=api_version,
                         timeout=timeout,  # type: ignore
                         max_retries=max_retries,  # type: ignore
-                        http_client=httpx.AsyncClient(
-                            limits=httpx.Limits(
-                                max_connections=1000, max_keepalive_connections=100
-                            ),
-                            verify=litellm.ssl_verify,
+                        http_client=connection_pool_registry.get_async_client(
+                            llm_provider=custom_llm_provider,
+                            api_base=api_base,
+                            max_keepalive_connections=100,
                         ),  # type: ignore
                     )
                     litellm_router_instance.cache.set_cache(
@@ -277,11 +276,10 @@ class InitalizeOpenAISDKClient:
                             api_version=api_version,
                             timeout=timeout,  # type: ignore
                             max_retries=max_retries,  # type: ignore
-                            http_client=httpx.Client(
-                                limits=httpx.Limits(
-                                    max_connections=1000, max_keepalive_connections=100
-                                ),
-                                verify=litellm.ssl_verify,
+                            http_client=connection_pool_registry.get_sync_client(
+                                llm_provider=custom_llm_provider,
+                                api_base=api_base,
+                                max_keepalive_connections=100,
                             ),  # type: ignore
                         )
                         litellm_router_instance.cache.set_cache(
@@ -300,11 +298,10 @@ class InitalizeOpenAISDKClient:
                         api_version=api_version,
                         timeout=stream_timeout,  # type: ignore
                         max_retries=max_retries,  # type: ignore
-                        http_client=httpx.AsyncClient(
-                            limits=httpx.Limits(
-                                max_connections=1000, max_keepalive_connections=100
-                            ),
-                            verify=litellm.ssl_verify,
+                        http_client=connection_pool_registry.get_async_client(
+                            llm_provider=custom_llm_provider,
+                            api_base=api_base,
+                            max_keepalive_connections=100,
                         ),  # type: ignore
                     )
                     litellm_router_instance.cache.set_cache(
@@ -326,11 +323,10 @@ class InitalizeOpenAISDKClient:
                             api_version=api_version,
                             timeout=stream_timeout,  # type: ignore
                             max_retries=max_retries,  # type: ignore
-                            http_client=httpx.Client(
-                                limits=httpx.Limits(
-                                    max_connections=1000, max_keepalive_connections=100
-                                ),
-                                verify=litellm.ssl_verify,
+                            http_client=connection_pool_registry.get_sync_client(
+                                llm_provider=custom_llm_provider,
+                                api_base=api_base,
+                                max_keepalive_connections=100,
                             ),  # type: ignore
                         )
                         litellm_router_instance.cache.set_cache(
@@ -374,11 +370,10 @@ class InitalizeOpenAISDKClient:
                         **azure_client_params,
                         timeout=timeout,  # type: ignore
                         max_retries=max_retries,  # type: ignore
-                        http_client=httpx.AsyncClient(
-                            limits=httpx.Limits(
-                                max_connections=1000, max_keepalive_connections=100
-                            ),
-                            verify=litellm.ssl_verify,
+                        http_client=connection_pool_registry.get_async_client(
+                            llm_provider=custom_llm_provider,
+                            api_base=api_base,
+                            max_keepalive_connections=100,
                         ),  # type: ignore
                     )
                     litellm_router_instance.cache.set_cache(
@@ -395,11 +390,10 @@ class InitalizeOpenAISDKClient:
                             **azure_client_params,
                             timeout=timeout,  # type: ignore
                             max_retries=max_retries,  # type: ignore
-                            http_client=httpx.Client(
-                                limits=httpx.Limits(
-                                    max_connections=1000, max_keepalive_connections=100
-                                ),
-                                verify=litellm.ssl_verify,
+                            http_client=connection_pool_registry.get_sync_client(
+                                llm_provider=custom_llm_provider,
+                                api_base=api_base,
+                                max_keepalive_connections=100,
                             ),  # type: ignore
                         )
                         litellm_router_instance.cache.set_cache(
@@ -415,11 +409,10 @@ class InitalizeOpenAISDKClient:
                         **azure_client_params,
                         timeout=stream_timeout,  # type: ignore
                         max_retries=max_retries,  # type: ignore
-                        http_client=httpx.AsyncClient(
-                            limits=httpx.Limits(
-                                max_connections=1000, max_keepalive_connections=100
-                            ),
-                            verify=litellm.ssl_verify,
+                        http_client=connection_pool_registry.get_async_client(
+                            llm_provider=custom_llm_provider,
+                            api_base=api_base,
+                            max_keepalive_connections=100,
                         ),
                     )
                     litellm_router_instance.cache.set_cache(
@@ -437,11 +430,10 @@ class InitalizeOpenAISDKClient:
                             **azure_client_params,
                             timeout=stream_timeout,  # type: ignore
                             max_retries=max_retries,  # type: ignore
-                            http_client=httpx.Client(
-                                limits=httpx.Limits(
-                                    max_connections=1000, max_keepalive_connections=100
-                                ),
-                                verify=litellm.ssl_verify,
+                            http_client=connection_pool_registry.get_sync_client(
+                                llm_provider=custom_llm_provider,
+                                api_base=api_base,
+                                max_keepalive_connections=100,
                             ),
                         )
                         litellm_router_instance.cache.set_cache(
@@ -466,11 +458,10 @@ class InitalizeOpenAISDKClient:
                     timeout=timeout,  # type: ignore
                     max_retries=max_retries,  # type: ignore
                     organization=organization,
-                    http_client=httpx.AsyncClient(
-                        limits=httpx.Limits(
-                            max_connections=1000, max_keepalive_connections=100
-                        ),
-                        verify=litellm.ssl_verify,
+                    http_client=connection_pool_registry.get_async_client(
+                        llm_provider=custom_llm_provider,
+                        api_base=api_base,
+                        max_keepalive_connections=100,
                     ),  # type: ignore
                 )
                 litellm_router_instance.cache.set_cache(
@@ -490,11 +481,10 @@ class InitalizeOpenAISDKClient:
                         timeout=timeout,  # type: ignore
                         max_retries=max_retries,  # type: ignore
                         organization=organization,
-                        http_client=httpx.Client(
-                            limits=httpx.Limits(
-                                max_connections=1000, max_keepalive_connections=100
-                            ),
-                            verify=litellm.ssl_verify,
+                        http_client=connection_pool_registry.get_sync_client(
+                            llm_provider=custom_llm_provider,
+                            api_base=api_base,
+                            max_keepalive_connections=100,
                         ),  # type: ignore
                     )
                     litellm_router_instance.cache.set_cache(
@@ -512,11 +502,10 @@ class InitalizeOpenAISDKClient:
                     timeout=stream_timeout,  # type: ignore
                     max_retries=max_retries,  # type: ignore
                     organization=organization,
-                    http_client=httpx.AsyncClient(
-                        limits=httpx.Limits(
-                            max_connections=1000, max_keepalive_connections=100
-                        ),
-                        verify=litellm.ssl_verify,
+                    http_client=connection_pool_registry.get_async_client(
+                        llm_provider=custom_llm_provider,
+                        api_base=api_base,
+                        max_keepalive_connections=100,
                     ),  # type: ignore
                 )
                 litellm_router_instance.cache.set_cache(
@@ -537,11 +526,10 @@ class InitalizeOpenAISDKClient:
                         timeout=stream_timeout,  # type: ignore
                         max_retries=max_retries,  # type: ignore
                         organization=organization,
-                        http_client=httpx.Client(
-                            limits=httpx.Limits(
-                                max_connections=1000, max_keepalive_connections=100
-                            ),
-                            verify=litellm.ssl_verify,
+                        http_client=connection_pool_registry.get_sync_client(
+                            llm_provider=custom_llm_provider,
+                            api_base=api_base,
+                            max_keepalive_connections=100,
                         ),  # type: ignore
                     )
                     litellm_router_instance.cache.set_cache(
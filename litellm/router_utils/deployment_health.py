@@ -0,0 +1,196 @@
+"""
+Passive health checks - scores deployment health from live traffic
+
+For each deployment the router keeps the outcome of its most recent requests (success / error class / latency).
+These are turned into a health score between 0 and 1:
+
+- health score = success rate of the recent requests. Errors caused by the request (e.g. 400 bad request, context window exceeded) don't count against the deployment.
+- when routing, a deployment whose p90 latency is more than 2x the fastest deployment in the group is scored down in proportion
+
+Deployments scoring below `min_health_score` get no traffic while a healthier deployment is available.
+Other deployments get a share of traffic proportional to their score, so traffic moves away from a degrading deployment before it fails hard.
+Deployments scoring below `cooldown_health_score` are put in cooldown.
+
+No synthetic requests are made, the scores only come from `Router.deployment_callback_on_success` / `deployment_callback_on_failure`.
+"""
+
+import random
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from litellm._logging import verbose_router_logger
+from litellm.types.router import DeploymentHealthStats, PassiveHealthCheckArgs
+
+# a deployment is only scored down for latency when it's this many times slower than the fastest deployment in the group
+LATENCY_TOLERANCE_MULTIPLIER = 2.0
+# status codes caused by the request, not the deployment
+REQUEST_ERROR_STATUS_CODES = {400, 413, 422}
+
+# (timestamp, success, latency in seconds, error class, counts against the deployment)
+_RequestOutcome = Tuple[float, bool, Optional[float], Optional[str], bool]
+
+
+def _get_response_time_seconds(start_time: Any, end_time: Any) -> Optional[float]:
+    if isinstance(start_time, datetime) and isinstance(end_time, datetime):
+        return (end_time - start_time).total_seconds()
+    if isinstance(start_time, (int, float)) and isinstance(end_time, (int, float)):
+        return end_time - start_time
+    return None
+
+
+def _percentile(sorted_values: List[float], percentile: float) -> Optional[float]:
+    if len(sorted_values) == 0:
+        return None
+    index = min(int(len(sorted_values) * percentile), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+class DeploymentHealthTracker:
+    def __init__(self, passive_health_check_args: PassiveHealthCheckArgs):
+        self.args = passive_health_check_args
+        self._requests: Dict[str, Deque[_RequestOutcome]] = {}
+
+    def record_success(self, deployment_id: str, latency: Optional[float]):
+        self._get_requests(deployment_id).append(
+            (time.time(), True, latency, None, False)
+        )
+
+    def record_failure(
+        self,
+        deployment_id: str,
+        exception: Optional[Exception],
+        latency: Optional[float] = None,
+    ):
+        status_code = getattr(exception, "status_code", None)
+        counts_against_deployment = status_code not in REQUEST_ERROR_STATUS_CODES
+        error_class = type(exception).__name__ if exception is not None else "Unknown"
+        self._get_requests(deployment_id).append(
+            (time.time(), False, latency, error_class, counts_against_deployment)
+        )
+
+    def reset(self, deployment_id: str):
+        """
+        Forget the deployment's requests, e.g. once it's put in cooldown, so it starts with a clean score after
+        """
+        self._requests.pop(deployment_id, None)
+
+    def get_health_score(self, deployment_id: str) -> float:
+        return self._get_health_score(self._get_recent_requests(deployment_id))
+
+    def get_deployment_stats(self, deployment_id: str) -> DeploymentHealthStats:
+        requests = self._get_recent_requests(deployment_id)
+        error_classes: Dict[str, int] = {}
+        num_successes = 0
+        for _, success, _, error_class, _ in requests:
+            if success:
+                num_successes += 1
+            elif error_class is not None:
+                error_classes[error_class] = error_classes.get(error_class, 0) + 1
+        latencies = self._get_latencies(requests)
+        return DeploymentHealthStats(
+            num_requests=len(requests),
+            success_rate=num_successes / len(requests) if requests else 1.0,
+            error_classes=error_classes,
+            latency_p50=_percentile(latencies, 0.5),
+            latency_p90=_percentile(latencies, 0.9),
+            latency_p99=_percentile(latencies, 0.99),
+            health_score=self._get_health_score(requests),
+        )
+
+    def should_cooldown(self, deployment_id: str) -> bool:
+        return self.get_health_score(deployment_id) < self.args.cooldown_health_score
+
+    def filter_deployments(self, healthy_deployments: List[Dict]) -> List[Dict]:
+        """
+        Route away from unhealthy deployments.
+
+        - deployments below `min_health_score` are removed, if a deployment above it is available
+        - the others are kept with probability `score / best score`
+        """
+        if len(healthy_deployments) <= 1:
+            return healthy_deployments
+
+        scores = self._get_routing_scores(healthy_deployments)
+        best_score = max(scores)
+        if best_score <= 0:
+            return healthy_deployments
+
+        filtered_deployments = []
+        for deployment, score in zip(healthy_deployments, scores):
+            if score >= best_score:
+                filtered_deployments.append(deployment)
+            elif score < self.args.min_health_score <= best_score:
+                continue
+            elif random.random() < score / best_score:
+                filtered_deployments.append(deployment)
+
+        if len(filtered_deployments) < len(healthy_deployments):
+            verbose_router_logger.debug(
+                "passive health checks: routing away from %s deployments, scores=%s",
+                len(healthy_deployments) - len(filtered_deployments),
+                scores,
+            )
+        return filtered_deployments
+
+    def _get_routing_scores(self, healthy_deployments: List[Dict]) -> List[float]:
+        health_scores = []
+        latency_p90s: List[Optional[float]] = []
+        for deployment in healthy_deployments:
+            requests = self._get_recent_requests(
+                deployment.get("model_info", {}).get("id", "")
+            )
+            health_scores.append(self._get_health_score(requests))
+            latencies = self._get_latencies(requests)
+            latency_p90s.append(
+                _percentile(latencies, 0.9)
+                if len(latencies) >= self.args.min_requests
+                else None
+            )
+
+        known_latencies = [
+            latency for latency in latency_p90s if latency is not None and latency > 0
+        ]
+        if len(known_latencies) == 0:
+            return health_scores
+        fastest_p90 = min(known_latencies)
+
+        routing_scores = []
+        for health_score, latency_p90 in zip(health_scores, latency_p90s):
+            if latency_p90 is not None and latency_p90 > 0:
+                health_score *= min(
+                    1.0, LATENCY_TOLERANCE_MULTIPLIER * fastest_p90 / latency_p90
+                )
+            routing_scores.append(health_score)
+        return routing_scores
+
+    def _get_health_score(self, requests: List[_RequestOutcome]) -> float:
+        scored_requests = [
+            success
+            for _, success, _, _, counts_against_deployment in requests
+            if success or counts_against_deployment
+        ]
+        if len(scored_requests) < self.args.min_requests:
+            return 1.0
+        return sum(scored_requests) / len(scored_requests)
+
+    def _get_latencies(self, requests: List[_RequestOutcome]) -> List[float]:
+        return sorted(
+            latency for _, _, latency, _, _ in requests if latency is not None
+        )
+
+    def _get_requests(self, deployment_id: str) -> Deque[_RequestOutcome]:
+        requests = self._requests.get(deployment_id)
+        if requests is None:
+            requests = self._requests.setdefault(
+                deployment_id, deque(maxlen=max(self.args.window_size, 1))
+            )
+        return requests
+
+    def _get_recent_requests(self, deployment_id: str) -> List[_RequestOutcome]:
+        requests = self._requests.get(deployment_id)
+        if requests is None:
+            return []
+        cutoff = time.time() - self.args.window_seconds
+        return [request for request in list(requests) if request[0] >= cutoff]
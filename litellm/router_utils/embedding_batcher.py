@@ -0,0 +1,221 @@
+"""
+Embedding batching - sends concurrent `Router.aembedding` calls to the same deployment as one request
+
+- a call waits up to `max_wait_ms` for other calls to the same deployment (with the same request params)
+- the batch is sent early once it reaches the provider's max inputs / input tokens per request,
+  see `DEFAULT_EMBEDDING_BATCH_LIMITS`
+- the vectors are split back to the callers, each caller gets the `usage` of its own inputs,
+  so cost and spend are tracked per caller
+- if the batched request fails, every call in the batch gets the exception
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+import litellm
+from litellm._logging import verbose_router_logger
+from litellm.types.router import EmbeddingBatchingArgs
+from litellm.types.utils import Embedding, EmbeddingResponse, Usage
+
+# provider: (max inputs, max input tokens) per embedding request. Providers not listed here are not batched
+DEFAULT_EMBEDDING_BATCH_LIMITS: Dict[str, Tuple[int, Optional[int]]] = {
+    "openai": (2048, 300_000),
+    "azure": (2048, 300_000),
+    "vertex_ai": (250, 20_000),
+    # cohere embedding models only, titan takes 1 input per request
+    "bedrock": (96, None),
+}
+
+
+def get_embedding_batch_limits(
+    custom_llm_provider: Optional[str],
+    model: str,
+    embedding_batching_args: EmbeddingBatchingArgs,
+) -> Optional[Tuple[int, Optional[int]]]:
+    """
+    Returns the (max inputs, max input tokens) per request for the deployment, or None if it can't be batched
+    """
+    if custom_llm_provider is None:
+        return None
+    limits = DEFAULT_EMBEDDING_BATCH_LIMITS.get(custom_llm_provider)
+    if limits is None:
+        return None
+    if custom_llm_provider == "bedrock" and "cohere" not in model:
+        return None
+    max_batch_size, max_batch_tokens = limits
+    if embedding_batching_args.max_batch_size is not None:
+        max_batch_size = min(embedding_batching_args.max_batch_size, max_batch_size)
+    if embedding_batching_args.max_batch_tokens is not None:
+        max_batch_tokens = embedding_batching_args.max_batch_tokens
+    return max_batch_size, max_batch_tokens
+
+
+class _BatchedCall:
+    def __init__(self, future: asyncio.Future, input: List[str], num_tokens: int):
+        self.future = future
+        self.input = input
+        self.num_tokens = num_tokens
+
+
+class _PendingBatch:
+    def __init__(self, send_batch: Callable[[List[str]], Awaitable[EmbeddingResponse]]):
+        self.send_batch = send_batch
+        self.calls: List[_BatchedCall] = []
+        self.num_inputs = 0
+        self.num_tokens = 0
+        self.flush_handle: Optional[asyncio.TimerHandle] = None
+
+
+class EmbeddingBatcher:
+    def __init__(self, embedding_batching_args: EmbeddingBatchingArgs):
+        self.args = embedding_batching_args
+        self._pending: Dict[Hashable, _PendingBatch] = {}
+        self._send_tasks: Set[asyncio.Task] = set()
+
+    async def async_embed(
+        self,
+        batch_key: Hashable,
+        input: List[str],
+        model: str,
+        max_batch_size: int,
+        max_batch_tokens: Optional[int],
+        send_batch: Callable[[List[str]], Awaitable[EmbeddingResponse]],
+    ) -> EmbeddingResponse:
+        """
+        Embeds `input` as part of a batch, returns the caller's part of the batch response.
+
+        - batch_key: calls with the same key are batched, e.g. the deployment id + request params
+        - send_batch: sends the batched inputs to the deployment. The first call of a batch sets it.
+        """
+        num_tokens = self._count_tokens(model=model, input=input)
+        if len(input) >= max_batch_size or (
+            max_batch_tokens is not None and num_tokens >= max_batch_tokens
+        ):  # a full batch on its own
+            return await send_batch(input)
+
+        batch = self._pending.get(batch_key)
+        if batch is not None and (
+            batch.num_inputs + len(input) > max_batch_size
+            or (
+                max_batch_tokens is not None
+                and batch.num_tokens + num_tokens > max_batch_tokens
+            )
+        ):
+            self._flush(batch_key=batch_key, batch=batch)
+            batch = None
+
+        loop = asyncio.get_running_loop()
+        if batch is None:
+            batch = _PendingBatch(send_batch=send_batch)
+            self._pending[batch_key] = batch
+            batch.flush_handle = loop.call_later(
+                self.args.max_wait_ms / 1000, self._flush, batch_key, batch
+            )
+
+        future = loop.create_future()
+        batch.calls.append(
+            _BatchedCall(future=future, input=input, num_tokens=num_tokens)
+        )
+        batch.num_inputs += len(input)
+        batch.num_tokens += num_tokens
+        if batch.num_inputs >= max_batch_size:
+            self._flush(batch_key=batch_key, batch=batch)
+        return await future
+
+    def _count_tokens(self, model: str, input: List[str]) -> int:
+        try:
+            return litellm.token_counter(model=model, text=input)
+        except Exception:
+            return sum(len(text) // 4 for text in input)
+
+    def _flush(self, batch_key: Hashable, batch: _PendingBatch):
+        if self._pending.get(batch_key) is batch:
+            self._pending.pop(batch_key)
+        if batch.flush_handle is not None:
+            batch.flush_handle.cancel()
+            batch.flush_handle = None
+        if not batch.calls:
+            return
+        calls, batch.calls = batch.calls, []
+        task = asyncio.get_running_loop().create_task(
+            self._send(send_batch=batch.send_batch, calls=calls)
+        )
+        self._send_tasks.add(task)
+        task.add_done_callback(self._send_tasks.discard)
+
+    async def _send(
+        self,
+        send_batch: Callable[[List[str]], Awaitable[EmbeddingResponse]],
+        calls: List[_BatchedCall],
+    ):
+        verbose_router_logger.debug(
+            "embedding batching: sending %s calls as one request", len(calls)
+        )
+        try:
+            response = await send_batch([text for call in calls for text in call.input])
+            responses = _split_embedding_response(response=response, calls=calls)
+        except Exception as e:
+            for call in calls:
+                if not call.future.done():
+                    call.future.set_exception(e)
+            return
+        for call, caller_response in zip(calls, responses):
+            if not call.future.done():
+                call.future.set_result(caller_response)
+
+
+def _split_embedding_response(
+    response: EmbeddingResponse, calls: List[_BatchedCall]
+) -> List[EmbeddingResponse]:
+    """
+    Splits the batch response into one response per call.
+
+    The batch's prompt tokens are split by each call's share of the counted input tokens,
+    the last call gets the rest, so the callers' usage adds up to the batch usage.
+    """
+    num_inputs = sum(len(call.input) for call in calls)
+    data = sorted(response.data, key=lambda item: item["index"])
+    if len(data) != num_inputs:
+        raise ValueError(
+            f"Embedding batch of {num_inputs} inputs returned {len(data)} embeddings"
+        )
+    prompt_tokens = response.usage.prompt_tokens if response.usage else 0
+    total_counted_tokens = sum(call.num_tokens for call in calls)
+
+    responses: List[EmbeddingResponse] = []
+    start = 0
+    assigned_tokens = 0
+    for i, call in enumerate(calls):
+        end = start + len(call.input)
+        if i == len(calls) - 1:
+            caller_tokens = prompt_tokens - assigned_tokens
+        elif total_counted_tokens > 0:
+            caller_tokens = round(
+                prompt_tokens * call.num_tokens / total_counted_tokens
+            )
+        else:
+            caller_tokens = round(prompt_tokens * len(call.input) / num_inputs)
+        assigned_tokens += caller_tokens
+
+        caller_response = EmbeddingResponse(
+            model=response.model,
+            data=[
+                _with_index(item=item, index=index)
+                for index, item in enumerate(data[start:end])
+            ],
+            usage=Usage(
+                prompt_tokens=caller_tokens,
+                completion_tokens=0,
+                total_tokens=caller_tokens,
+            ),
+            _response_headers=response._response_headers,
+        )
+        responses.append(caller_response)
+        start = end
+    return responses
+
+
+def _with_index(item, index: int):
+    if isinstance(item, dict):
+        return {**item, "index": index}
+    return Embedding(embedding=item["embedding"], index=index, object="embedding")
@@ -4,6 +4,7 @@ import litellm
 from litellm._logging import verbose_router_logger
 from litellm.integrations.custom_logger import CustomLogger
 from litellm.main import verbose_logger
+from litellm.router_utils.request_deadline import has_time_for_attempt
 
 if TYPE_CHECKING:
     from litellm.router import Router as _Router
@@ -52,6 +53,11 @@ async def run_async_fallback(
     for mg in fallback_model_group:
         if mg == original_model_group:
             continue
+        if not has_time_for_attempt(kwargs=kwargs):
+            verbose_router_logger.info(
+                f"Request deadline reached, not falling back to model_group = {mg}"
+            )
+            break
         try:
             # LOGGING
             kwargs = litellm_router.log_retry(kwargs=kwargs, e=original_exception)
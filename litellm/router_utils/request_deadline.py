@@ -0,0 +1,42 @@
+"""
+End-to-end request deadline for the Router
+
+With `end_to_end_timeout` set, a request gets an absolute deadline (`kwargs["request_deadline"]`) when it enters
+`Router.async_function_with_fallbacks`. Every attempt, retry sleep and fallback hop uses time from the same deadline:
+
+- each call to a deployment is cancelled once the deadline passes
+- retries are skipped if the deadline passes before the retry could be made (i.e. during the sleep before it)
+- fallbacks are skipped once the deadline has passed
+"""
+
+import time
+from typing import Optional
+
+REQUEST_DEADLINE_KEY = "request_deadline"
+
+
+def set_request_deadline(kwargs: dict, end_to_end_timeout: Optional[float]) -> None:
+    """
+    Sets the request deadline, if it's not set yet - fallbacks keep the deadline of the original request
+    """
+    if end_to_end_timeout is None or kwargs.get(REQUEST_DEADLINE_KEY) is not None:
+        return
+    kwargs[REQUEST_DEADLINE_KEY] = time.time() + float(end_to_end_timeout)
+
+
+def get_remaining_time(kwargs: dict) -> Optional[float]:
+    """
+    Returns the seconds left until the request deadline, or None if the request has no deadline
+    """
+    request_deadline: Optional[float] = kwargs.get(REQUEST_DEADLINE_KEY)
+    if request_deadline is None:
+        return None
+    return request_deadline - time.time()
+
+
+def has_time_for_attempt(kwargs: dict, wait_before_attempt: float = 0) -> bool:
+    """
+    Returns False if the request deadline passes before an attempt, made after `wait_before_attempt` seconds, could start
+    """
+    remaining_time = get_remaining_time(kwargs)
+    return remaining_time is None or remaining_time - wait_before_attempt > 0
@@ -0,0 +1,244 @@
+"""
+Request hedging - cuts tail latency of `Router.acompletion`
+
+If the selected deployment hasn't responded (or for streaming requests, sent its first chunk) after the model group's
+`latency_percentile` latency, the same request is sent to another healthy deployment in the group.
+The first successful response is returned and the other request is cancelled.
+
+- latencies are recorded per model group from `Router.deployment_callback_on_success` - time to first chunk for streaming requests.
+  A primary request cancelled because its hedge won is recorded with the time it ran for, so slow requests are not
+  left out of the percentile.
+  The hedger keeps its own latencies - the latency-based routing stats are per output token, keep 10 samples per
+  deployment and only exist with `routing_strategy="latency-based-routing"`, and the passive health check
+  latencies are opt-in and don't have the time to first chunk.
+- model groups with fewer than `min_samples` latencies are not hedged
+- each request adds `max_hedge_ratio` to the model group's hedge budget, each hedge uses 1. Slow requests are not hedged
+  when the budget is used up, so hedging adds at most `max_hedge_ratio` extra load to a model group.
+"""
+
+import asyncio
+import inspect
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+from litellm._logging import verbose_router_logger
+from litellm.litellm_core_utils.streaming_handler import CustomStreamWrapper
+from litellm.types.router import RequestHedgingArgs, RequestHedgingStats
+
+# max hedges a model group can save up, limits bursts of hedges after a quiet period
+MAX_HEDGE_BUDGET = 10.0
+
+
+class _ModelGroupHedgingState:
+    def __init__(self, window_size: int):
+        self.latencies: Deque[float] = deque(maxlen=max(window_size, 1))
+        self.budget = 0.0
+        self.num_requests = 0
+        self.num_hedged_requests = 0
+        self.num_hedge_wins = 0
+        self.num_skipped_no_budget = 0
+
+
+class RequestHedger:
+    def __init__(self, request_hedging_args: RequestHedgingArgs):
+        self.args = request_hedging_args
+        self._model_groups: Dict[str, _ModelGroupHedgingState] = {}
+
+    def record_latency(self, model_group: str, latency: Optional[float]):
+        if latency is None or latency < 0:
+            return
+        self._get_state(model_group).latencies.append(latency)
+
+    def get_hedge_delay(self, model_group: str) -> Optional[float]:
+        """
+        Returns the model group's `latency_percentile` latency, or None if there are not enough latencies recorded
+        """
+        state = self._model_groups.get(model_group)
+        if state is None or len(state.latencies) < self.args.min_samples:
+            return None
+        latencies = sorted(state.latencies)
+        index = min(
+            int(len(latencies) * self.args.latency_percentile), len(latencies) - 1
+        )
+        return latencies[index]
+
+    def get_stats(self) -> List[RequestHedgingStats]:
+        return [
+            RequestHedgingStats(
+                model_group=model_group,
+                num_requests=state.num_requests,
+                num_hedged_requests=state.num_hedged_requests,
+                num_hedge_wins=state.num_hedge_wins,
+                num_skipped_no_budget=state.num_skipped_no_budget,
+                hedge_delay=self.get_hedge_delay(model_group),
+            )
+            for model_group, state in list(self._model_groups.items())
+        ]
+
+    async def async_run_with_hedging(
+        self,
+        model_group: str,
+        primary_call: Callable[[], Awaitable[Any]],
+        get_hedge_call: Callable[[], Awaitable[Optional[Callable[[], Awaitable[Any]]]]],
+    ) -> Any:
+        """
+        Runs `primary_call`. If it's slower than the hedge delay, `get_hedge_call` is used to get a call to another
+        deployment, which races `primary_call`.
+
+        - get_hedge_call: returns None if there's no other deployment to send the request to
+        - if both calls fail, the primary call's exception is raised
+        """
+        state = self._get_state(model_group)
+        state.num_requests += 1
+        state.budget = min(state.budget + self.args.max_hedge_ratio, MAX_HEDGE_BUDGET)
+
+        hedge_delay = self.get_hedge_delay(model_group)
+        primary_start_time = time.time()
+        primary_task = asyncio.ensure_future(primary_call())
+        if hedge_delay is None:
+            return await primary_task
+
+        hedge_task: Optional[asyncio.Future] = None
+        winner: Optional[asyncio.Future] = None
+        try:
+            done, _ = await asyncio.wait({primary_task}, timeout=hedge_delay)
+            if primary_task in done:
+                winner = primary_task
+                return primary_task.result()
+
+            if state.budget < 1:
+                state.num_skipped_no_budget += 1
+                winner = primary_task
+                return await primary_task
+
+            hedge_call = await self._async_get_hedge_call(get_hedge_call)
+            if hedge_call is None:
+                winner = primary_task
+                return await primary_task
+            state.budget -= 1
+            state.num_hedged_requests += 1
+            verbose_router_logger.debug(
+                "request hedging: no response from model group=%s after %ss, sending a second request",
+                model_group,
+                hedge_delay,
+            )
+            hedge_task = asyncio.ensure_future(hedge_call())
+
+            pending = {primary_task, hedge_task}
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in (primary_task, hedge_task):
+                    if task in done and task.exception() is None:
+                        winner = task
+                        if task is hedge_task:
+                            state.num_hedge_wins += 1
+                        return task.result()
+            return primary_task.result()  # both calls failed
+        finally:
+            for task in (primary_task, hedge_task):
+                if task is None or task is winner:
+                    continue
+                if not task.done():
+                    task.cancel()
+                    if task is primary_task:
+                        # only a lower bound of the primary's latency, but leaving it out biases the percentile low
+                        self.record_latency(
+                            model_group=model_group,
+                            latency=time.time() - primary_start_time,
+                        )
+                elif not task.cancelled() and task.exception() is None:
+                    # both calls returned, close the stream not returned to the caller
+                    await _close_response(task.result())
+
+    async def _async_get_hedge_call(
+        self,
+        get_hedge_call: Callable[[], Awaitable[Optional[Callable[[], Awaitable[Any]]]]],
+    ) -> Optional[Callable[[], Awaitable[Any]]]:
+        try:
+            return await get_hedge_call()
+        except Exception as e:
+            verbose_router_logger.debug(
+                "request hedging: no deployment to send the second request to - %s",
+                str(e),
+            )
+            return None
+
+    def _get_state(self, model_group: str) -> _ModelGroupHedgingState:
+        state = self._model_groups.get(model_group)
+        if state is None:
+            state = self._model_groups.setdefault(
+                model_group,
+                _ModelGroupHedgingState(window_size=self.args.window_size),
+            )
+        return state
+
+
+async def async_wait_for_first_chunk(
+    response: CustomStreamWrapper,
+) -> CustomStreamWrapper:
+    """
+    Waits for the first chunk of the provider stream, and puts it back in front of the stream.
+
+    Used so a streaming request only counts as answered once it sends its first chunk.
+    """
+    completion_stream = await response.fetch_stream()
+    if completion_stream is None or not hasattr(completion_stream, "__aiter__"):
+        return response
+
+    stream_iterator = completion_stream.__aiter__()
+    try:
+        first_chunk = await stream_iterator.__anext__()
+    except StopAsyncIteration:
+        response.completion_stream = _PrependedStream(
+            chunks=[], stream=completion_stream, stream_iterator=stream_iterator
+        )
+        return response
+    except asyncio.CancelledError:  # lost the race - close the provider stream
+        await _close_stream(completion_stream)
+        raise
+    response.completion_stream = _PrependedStream(
+        chunks=[first_chunk], stream=completion_stream, stream_iterator=stream_iterator
+    )
+    return response
+
+
+class _PrependedStream:
+    """
+    Provider stream with already read chunks put back in front. Closing it closes the provider stream.
+    """
+
+    def __init__(self, chunks: List[Any], stream: Any, stream_iterator: Any):
+        self.chunks = chunks
+        self.stream = stream
+        self.stream_iterator = stream_iterator
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.chunks:
+            return self.chunks.pop(0)
+        return await self.stream_iterator.__anext__()
+
+    async def aclose(self):
+        await _close_stream(self.stream)
+
+
+async def _close_stream(stream: Any):
+    close = getattr(stream, "aclose", None) or getattr(stream, "close", None)
+    if close is None:
+        return
+    try:
+        result = close()
+        if inspect.isawaitable(result):
+            await result
+    except Exception as e:
+        verbose_router_logger.debug("request hedging: failed to close stream - %s", e)
+
+
+async def _close_response(response: Any):
+    if isinstance(response, CustomStreamWrapper):
+        await _close_stream(response.completion_stream)
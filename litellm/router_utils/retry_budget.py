@@ -0,0 +1,69 @@
+"""
+Retry budget - token bucket per model group, limits retries during provider outages
+
+- a model group starts with `max_tokens` retries
+- each request to the model group adds `retry_ratio` retries, up to `max_tokens`
+- each retry uses 1. Once the budget is used up, failed requests are not retried (fallbacks still run)
+
+So while a provider is failing every request, retries add at most `retry_ratio` extra load instead of `num_retries` x.
+"""
+
+import threading
+from typing import Dict, List
+
+from litellm.types.router import RetryBudgetArgs, RetryBudgetStats
+
+
+class _ModelGroupRetryBudget:
+    def __init__(self, tokens: float):
+        self.tokens = tokens
+        self.num_requests = 0
+        self.num_retries = 0
+        self.num_retries_skipped = 0
+
+
+class RetryBudget:
+    def __init__(self, retry_budget_args: RetryBudgetArgs):
+        self.args = retry_budget_args
+        self._model_groups: Dict[str, _ModelGroupRetryBudget] = {}
+        self._lock = threading.Lock()
+
+    def record_request(self, model_group: str):
+        with self._lock:
+            budget = self._get_budget(model_group)
+            budget.num_requests += 1
+            budget.tokens = min(
+                budget.tokens + self.args.retry_ratio, self.args.max_tokens
+            )
+
+    def try_acquire_retry(self, model_group: str) -> bool:
+        """
+        Returns True and uses a token if the model group can make a retry
+        """
+        with self._lock:
+            budget = self._get_budget(model_group)
+            if budget.tokens < 1:
+                budget.num_retries_skipped += 1
+                return False
+            budget.tokens -= 1
+            budget.num_retries += 1
+            return True
+
+    def get_stats(self) -> List[RetryBudgetStats]:
+        return [
+            RetryBudgetStats(
+                model_group=model_group,
+                tokens=budget.tokens,
+                num_requests=budget.num_requests,
+                num_retries=budget.num_retries,
+                num_retries_skipped=budget.num_retries_skipped,
+            )
+            for model_group, budget in list(self._model_groups.items())
+        ]
+
+    def _get_budget(self, model_group: str) -> _ModelGroupRetryBudget:
+        budget = self._model_groups.get(model_group)
+        if budget is None:
+            budget = _ModelGroupRetryBudget(tokens=self.args.max_tokens)
+            self._model_groups[model_group] = budget
+        return budget
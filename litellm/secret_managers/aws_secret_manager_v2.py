@@ -291,7 +291,7 @@ class AWSSecretsManagerV2(BaseAWSLLM):
         request = AWSRequest(
             method="POST", url=endpoint_url, data=body, headers=headers
         )
-        SigV4Auth(
+        self.get_sigv4_signer(
             boto3_credentials_info.credentials,
             "secretsmanager",
             boto3_credentials_info.aws_region_name,
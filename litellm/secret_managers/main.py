@@ -5,18 +5,17 @@ import json
 import os
 import sys
 import traceback
-from typing import TYPE_CHECKING, Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Hashable, Optional, Union
 
 import httpx
 from dotenv import load_dotenv
 
 import litellm
 from litellm._logging import print_verbose, verbose_logger
-from litellm.caching.caching import DualCache
+from litellm.litellm_core_utils.asyncify import asyncify
 from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler, HTTPHandler
 from litellm.proxy._types import KeyManagementSystem
-
-oidc_cache = DualCache()
+from litellm.secret_managers.secret_cache import secret_cache
 
 
 ######### Secret Manager ############################
@@ -94,8 +93,6 @@ def get_secret(  # noqa: PLR0915
     secret_name: str,
     default_value: Optional[Union[str, bool]] = None,
 ):
-    key_management_system = litellm._key_management_system
-    key_management_settings = litellm._key_management_settings
     secret = None
 
     if secret_name.startswith("os.environ/"):
@@ -105,25 +102,12 @@ def get_secret(  # noqa: PLR0915
     if secret_name.startswith("oidc/"):
         secret_name_split = secret_name.replace("oidc/", "")
         oidc_provider, oidc_aud = secret_name_split.split("/", 1)
-        # TODO: Add caching for HTTP requests
         if oidc_provider == "google":
-            oidc_token = oidc_cache.get_cache(key=secret_name)
-            if oidc_token is not None:
-                return oidc_token
-
-            oidc_client = HTTPHandler(timeout=httpx.Timeout(timeout=600.0, connect=5.0))
-            # https://cloud.google.com/compute/docs/instances/verifying-instance-identity#request_signature
-            response = oidc_client.get(
-                "http://metadata.google.internal/computeMetadata/v1/instance/service-accounts/default/identity",
-                params={"audience": oidc_aud},
-                headers={"Metadata-Flavor": "Google"},
+            return secret_cache.get_secret(
+                source="oidc_google",
+                cache_key=oidc_aud,
+                fetch=lambda: _get_google_oidc_token(oidc_aud=oidc_aud),
             )
-            if response.status_code == 200:
-                oidc_token = response.text
-                oidc_cache.set_cache(key=secret_name, value=oidc_token, ttl=3600 - 60)
-                return oidc_token
-            else:
-                raise ValueError("Google OIDC provider failed")
         elif oidc_provider == "circleci":
             # https://circleci.com/docs/openid-connect-tokens/
             env_secret = os.getenv("CIRCLE_OIDC_TOKEN")
@@ -148,25 +132,15 @@ def get_secret(  # noqa: PLR0915
                     "ACTIONS_ID_TOKEN_REQUEST_URL or ACTIONS_ID_TOKEN_REQUEST_TOKEN not found in environment"
                 )
 
-            oidc_token = oidc_cache.get_cache(key=secret_name)
-            if oidc_token is not None:
-                return oidc_token
-
-            oidc_client = HTTPHandler(timeout=httpx.Timeout(timeout=600.0, connect=5.0))
-            response = oidc_client.get(
-                actions_id_token_request_url,
-                params={"audience": oidc_aud},
-                headers={
-                    "Authorization": f"Bearer {actions_id_token_request_token}",
-                    "Accept": "application/json; api-version=2.0",
-                },
+            return secret_cache.get_secret(
+                source="oidc_github",
+                cache_key=oidc_aud,
+                fetch=lambda: _get_github_oidc_token(
+                    oidc_aud=oidc_aud,
+                    actions_id_token_request_url=actions_id_token_request_url,
+                    actions_id_token_request_token=actions_id_token_request_token,
+                ),
             )
-            if response.status_code == 200:
-                oidc_token = response.json().get("value", None)
-                oidc_cache.set_cache(key=secret_name, value=oidc_token, ttl=300 - 5)
-                return oidc_token
-            else:
-                raise ValueError("Github OIDC provider failed")
         elif oidc_provider == "azure":
             # https://azure.github.io/azure-workload-identity/docs/quick-start.html
             azure_federated_token_file = os.getenv("AZURE_FEDERATED_TOKEN_FILE")
@@ -204,112 +178,23 @@ def get_secret(  # noqa: PLR0915
         ):
             try:
                 client = litellm.secret_manager_client
-                key_manager = "local"
-                if key_management_system is not None:
-                    key_manager = key_management_system.value
-
-                if key_management_settings is not None:
-                    if (
-                        key_management_settings.hosted_keys is not None
-                        and secret_name not in key_management_settings.hosted_keys
-                    ):  # allow user to specify which keys to check in hosted key manager
-                        key_manager = "local"
-
-                if (
-                    key_manager == KeyManagementSystem.AZURE_KEY_VAULT.value
-                    or type(client).__module__ + "." + type(client).__name__
-                    == "azure.keyvault.secrets._client.SecretClient"
-                ):  # support Azure Secret Client - from azure.keyvault.secrets import SecretClient
-                    secret = client.get_secret(secret_name).value
-                elif (
-                    key_manager == KeyManagementSystem.GOOGLE_KMS.value
-                    or client.__class__.__name__ == "KeyManagementServiceClient"
-                ):
-                    encrypted_secret: Any = os.getenv(secret_name)
-                    if encrypted_secret is None:
-                        raise ValueError(
-                            "Google KMS requires the encrypted secret to be in the environment!"
-                        )
-                    b64_flag = _is_base64(encrypted_secret)
-                    if b64_flag is True:  # if passed in as encoded b64 string
-                        encrypted_secret = base64.b64decode(encrypted_secret)
-                        ciphertext = encrypted_secret
-                    else:
-                        raise ValueError(
-                            "Google KMS requires the encrypted secret to be encoded in base64"
-                        )  # fix for this vulnerability https://huntr.com/bounties/ae623c2f-b64b-4245-9ed4-f13a0a5824ce
-                    response = client.decrypt(
-                        request={
-                            "name": litellm._google_kms_resource_name,
-                            "ciphertext": ciphertext,
-                        }
-                    )
-                    secret = response.plaintext.decode(
-                        "utf-8"
-                    )  # assumes the original value was encoded with utf-8
-                elif key_manager == KeyManagementSystem.AWS_KMS.value:
-                    """
-                    Only check the tokens which start with 'aws_kms/'. This prevents latency impact caused by checking all keys.
-                    """
-                    encrypted_value = os.getenv(secret_name, None)
-                    if encrypted_value is None:
-                        raise Exception(
-                            "AWS KMS - Encrypted Value of Key={} is None".format(
-                                secret_name
-                            )
-                        )
-                    # Decode the base64 encoded ciphertext
-                    ciphertext_blob = base64.b64decode(encrypted_value)
-
-                    # Set up the parameters for the decrypt call
-                    params = {"CiphertextBlob": ciphertext_blob}
-                    # Perform the decryption
-                    response = client.decrypt(**params)
-
-                    # Extract and decode the plaintext
-                    plaintext = response["Plaintext"]
-                    secret = plaintext.decode("utf-8")
-                    if isinstance(secret, str):
-                        secret = secret.strip()
-                elif key_manager == KeyManagementSystem.AWS_SECRET_MANAGER.value:
-                    from litellm.secret_managers.aws_secret_manager_v2 import (
-                        AWSSecretsManagerV2,
-                    )
-
-                    if isinstance(client, AWSSecretsManagerV2):
-                        secret = client.sync_read_secret(secret_name=secret_name)
-                        print_verbose(f"get_secret_value_response: {secret}")
-                elif key_manager == KeyManagementSystem.GOOGLE_SECRET_MANAGER.value:
-                    try:
-                        secret = client.get_secret_from_google_secret_manager(
-                            secret_name
-                        )
-                        print_verbose(f"secret from google secret manager:  {secret}")
-                        if secret is None:
-                            raise ValueError(
-                                f"No secret found in Google Secret Manager for {secret_name}"
-                            )
-                    except Exception as e:
-                        print_verbose(f"An error occurred - {str(e)}")
-                        raise e
-                elif key_manager == "local":
-                    secret = os.getenv(secret_name)
-                else:  # assume the default is infisicial client
-                    secret = client.get_secret(secret_name).secret_value
+                source = _get_secret_source(client=client, secret_name=secret_name)
+                secret = secret_cache.get_secret(
+                    source=source,
+                    cache_key=_get_secret_cache_key(
+                        source=source, secret_name=secret_name
+                    ),
+                    fetch=lambda: _read_secret_from_secret_manager(
+                        client=client, source=source, secret_name=secret_name
+                    ),
+                    client=client,
+                )
             except Exception as e:  # check if it's in os.environ
                 verbose_logger.error(
                     f"Defaulting to os.environ value for key={secret_name}. An exception occurred - {str(e)}.\n\n{traceback.format_exc()}"
                 )
                 secret = os.getenv(secret_name)
-            try:
-                if isinstance(secret, str):
-                    secret_value_as_bool = ast.literal_eval(secret)
-                    if isinstance(secret_value_as_bool, bool):
-                        return secret_value_as_bool
-                    else:
-                        return secret
-            except Exception:
-                return secret
+            return _convert_secret_manager_value(secret)
         else:
             secret = os.environ.get(secret_name)
             secret_value_as_bool = str_to_bool(secret) if secret is not None else None
@@ -326,6 +211,208 @@ def get_secret(  # noqa: PLR0915
             raise e
 
 
+async def async_get_secret(
+    secret_name: str,
+    default_value: Optional[Union[str, bool]] = None,
+):
+    """
+    Async version of `get_secret`.
+
+    Secrets from a secret manager are read through `secret_cache`, a cache miss calls the secret manager in a thread
+    instead of blocking the event loop.
+    """
+    if secret_name.startswith("os.environ/"):
+        secret_name = secret_name.replace("os.environ/", "")
+
+    if secret_name.startswith("oidc/"):
+        return await asyncify(get_secret)(
+            secret_name=secret_name, default_value=default_value
+        )
+    if not (
+        _should_read_secret_from_secret_manager()
+        and litellm.secret_manager_client is not None
+    ):
+        return get_secret(secret_name=secret_name, default_value=default_value)
+
+    try:
+        client = litellm.secret_manager_client
+        source = _get_secret_source(client=client, secret_name=secret_name)
+        secret = await secret_cache.async_get_secret(
+            source=source,
+            cache_key=_get_secret_cache_key(source=source, secret_name=secret_name),
+            fetch=lambda: _read_secret_from_secret_manager(
+                client=client, source=source, secret_name=secret_name
+            ),
+            client=client,
+        )
+    except Exception as e:  # check if it's in os.environ
+        verbose_logger.error(
+            f"Defaulting to os.environ value for key={secret_name}. An exception occurred - {str(e)}.\n\n{traceback.format_exc()}"
+        )
+        secret = os.getenv(secret_name)
+    return _convert_secret_manager_value(secret)
+
+
+def _convert_secret_manager_value(secret: Any):
+    """
+    Returns "True" / "False" secrets as booleans
+    """
+    try:
+        if isinstance(secret, str):
+            secret_value_as_bool = ast.literal_eval(secret)
+            if isinstance(secret_value_as_bool, bool):
+                return secret_value_as_bool
+    except Exception:
+        pass
+    return secret
+
+
+def _get_secret_source(client: Any, secret_name: str) -> str:
+    """
+    Returns where the secret is read from - the key management system, or "local" for os.environ
+    """
+    key_manager = "local"
+    if litellm._key_management_system is not None:
+        key_manager = litellm._key_management_system.value
+
+    key_management_settings = litellm._key_management_settings
+    if key_management_settings is not None:
+        if (
+            key_management_settings.hosted_keys is not None
+            and secret_name not in key_management_settings.hosted_keys
+        ):  # allow user to specify which keys to check in hosted key manager
+            key_manager = "local"
+
+    if (
+        key_manager == KeyManagementSystem.AZURE_KEY_VAULT.value
+        or type(client).__module__ + "." + type(client).__name__
+        == "azure.keyvault.secrets._client.SecretClient"
+    ):  # support Azure Secret Client - from azure.keyvault.secrets import SecretClient
+        return KeyManagementSystem.AZURE_KEY_VAULT.value
+    elif (
+        key_manager == KeyManagementSystem.GOOGLE_KMS.value
+        or client.__class__.__name__ == "KeyManagementServiceClient"
+    ):
+        return KeyManagementSystem.GOOGLE_KMS.value
+    return key_manager
+
+
+def _get_secret_cache_key(source: str, secret_name: str) -> Hashable:
+    if source in (
+        KeyManagementSystem.GOOGLE_KMS.value,
+        KeyManagementSystem.AWS_KMS.value,
+    ):  # kms decrypts the ciphertext in the environment, so re-decrypt if it changes
+        return (secret_name, os.getenv(secret_name))
+    return secret_name
+
+
+def _read_secret_from_secret_manager(client: Any, source: str, secret_name: str):
+    secret = None
+    if source == KeyManagementSystem.AZURE_KEY_VAULT.value:
+        secret = client.get_secret(secret_name).value
+    elif source == KeyManagementSystem.GOOGLE_KMS.value:
+        encrypted_secret: Any = os.getenv(secret_name)
+        if encrypted_secret is None:
+            raise ValueError(
+                "Google KMS requires the encrypted secret to be in the environment!"
+            )
+        b64_flag = _is_base64(encrypted_secret)
+        if b64_flag is True:  # if passed in as encoded b64 string
+            encrypted_secret = base64.b64decode(encrypted_secret)
+            ciphertext = encrypted_secret
+        else:
+            raise ValueError(
+                "Google KMS requires the encrypted secret to be encoded in base64"
+            )  # fix for this vulnerability https://huntr.com/bounties/ae623c2f-b64b-4245-9ed4-f13a0a5824ce
+        response = client.decrypt(
+            request={
+                "name": litellm._google_kms_resource_name,
+                "ciphertext": ciphertext,
+            }
+        )
+        secret = response.plaintext.decode(
+            "utf-8"
+        )  # assumes the original value was encoded with utf-8
+    elif source == KeyManagementSystem.AWS_KMS.value:
+        """
+        Only check the tokens which start with 'aws_kms/'. This prevents latency impact caused by checking all keys.
+        """
+        encrypted_value = os.getenv(secret_name, None)
+        if encrypted_value is None:
+            raise Exception(
+                "AWS KMS - Encrypted Value of Key={} is None".format(secret_name)
+            )
+        # Decode the base64 encoded ciphertext
+        ciphertext_blob = base64.b64decode(encrypted_value)
+
+        # Set up the parameters for the decrypt call
+        params = {"CiphertextBlob": ciphertext_blob}
+        # Perform the decryption
+        response = client.decrypt(**params)
+
+        # Extract and decode the plaintext
+        plaintext = response["Plaintext"]
+        secret = plaintext.decode("utf-8")
+        if isinstance(secret, str):
+            secret = secret.strip()
+    elif source == KeyManagementSystem.AWS_SECRET_MANAGER.value:
+        from litellm.secret_managers.aws_secret_manager_v2 import AWSSecretsManagerV2
+
+        if isinstance(client, AWSSecretsManagerV2):
+            secret = client.sync_read_secret(secret_name=secret_name)
+            print_verbose(f"get_secret_value_response: {secret}")
+    elif source == KeyManagementSystem.GOOGLE_SECRET_MANAGER.value:
+        try:
+            secret = client.get_secret_from_google_secret_manager(secret_name)
+            print_verbose(f"secret from google secret manager:  {secret}")
+            if secret is None:
+                raise ValueError(
+                    f"No secret found in Google Secret Manager for {secret_name}"
+                )
+        except Exception as e:
+            print_verbose(f"An error occurred - {str(e)}")
+            raise e
+    elif source == KeyManagementSystem.LOCAL.value:
+        secret = os.getenv(secret_name)
+    else:  # assume the default is infisicial client
+        secret = client.get_secret(secret_name).secret_value
+    return secret
+
+
+def _get_google_oidc_token(oidc_aud: str) -> str:
+    oidc_client = HTTPHandler(timeout=httpx.Timeout(timeout=600.0, connect=5.0))
+    # https://cloud.google.com/compute/docs/instances/verifying-instance-identity#request_signature
+    response = oidc_client.get(
+        "http://metadata.google.internal/computeMetadata/v1/instance/service-accounts/default/identity",
+        params={"audience": oidc_aud},
+        headers={"Metadata-Flavor": "Google"},
+    )
+    if response.status_code == 200:
+        return response.text
+    else:
+        raise ValueError("Google OIDC provider failed")
+
+
+def _get_github_oidc_token(
+    oidc_aud: str,
+    actions_id_token_request_url: str,
+    actions_id_token_request_token: str,
+) -> str:
+    oidc_client = HTTPHandler(timeout=httpx.Timeout(timeout=600.0, connect=5.0))
+    response = oidc_client.get(
+        actions_id_token_request_url,
+        params={"audience": oidc_aud},
+        headers={
+            "Authorization": f"Bearer {actions_id_token_request_token}",
+            "Accept": "application/json; api-version=2.0",
+        },
+    )
+    if response.status_code == 200:
+        return response.json().get("value", None)
+    else:
+        raise ValueError("Github OIDC provider failed")
+
+
 def _should_read_secret_from_secret_manager() -> bool:
     """
     Returns True if the secret manager should be used to read the secret, False otherwise
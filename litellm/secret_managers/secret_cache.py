@@ -0,0 +1,228 @@
+"""
+In-memory cache for secrets read from secret managers / OIDC providers
+
+- secrets are cached for a ttl per source (key manager / oidc provider), see `DEFAULT_SECRET_CACHE_TTLS`.
+  Override them with `litellm.secret_manager_cache_ttl`, a ttl <= 0 disables caching for the source.
+- a secret read after `SECRET_CACHE_REFRESH_RATIO` of its ttl is refreshed in the background, while callers keep
+  getting the cached value
+- concurrent reads of a missing secret share one call to the secret manager
+- hits / misses / fetches are counted per source, see `get_metrics`
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+import litellm
+from litellm._logging import verbose_logger
+from litellm.litellm_core_utils.asyncify import asyncify
+from litellm.types.secret_managers import SecretCacheMetrics
+
+DEFAULT_SECRET_CACHE_TTL = 300  # seconds
+DEFAULT_SECRET_CACHE_TTLS: Dict[str, float] = {
+    "azure_key_vault": 300,
+    "aws_secret_manager": 300,
+    "google_secret_manager": 300,
+    # kms decrypts the ciphertext in the environment - the ciphertext is part of the cache key
+    "google_kms": 3600,
+    "aws_kms": 3600,
+    "oidc_google": 3600 - 60,  # google identity tokens are valid for 1 hour
+    "oidc_github": 300 - 5,  # github identity tokens are valid for 5 minutes
+    "local": 0,
+}
+SECRET_CACHE_REFRESH_RATIO = 0.8
+
+_SecretCacheKey = Tuple[str, Hashable]
+
+
+class _CachedSecret:
+    def __init__(self, value: Any, client: Any, ttl: float):
+        self.value = value
+        self.client = client
+        self.fetched_at = time.time()
+        self.expires_at = self.fetched_at + ttl
+        self.refresh_at = self.fetched_at + ttl * SECRET_CACHE_REFRESH_RATIO
+
+
+class SecretCache:
+    def __init__(self) -> None:
+        self._entries: Dict[_SecretCacheKey, _CachedSecret] = {}
+        self._locks: Dict[_SecretCacheKey, threading.Lock] = {}
+        self._async_fetches: Dict[_SecretCacheKey, asyncio.Task] = {}
+        self._refreshing: set = set()
+        self._metrics: Dict[str, Dict[str, int]] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def get_ttl(self, source: str) -> float:
+        if (
+            litellm.secret_manager_cache_ttl is not None
+            and source in litellm.secret_manager_cache_ttl
+        ):
+            return litellm.secret_manager_cache_ttl[source]
+        return DEFAULT_SECRET_CACHE_TTLS.get(source, DEFAULT_SECRET_CACHE_TTL)
+
+    def get_secret(
+        self,
+        source: str,
+        cache_key: Hashable,
+        fetch: Callable[[], Any],
+        client: Any = None,
+    ) -> Any:
+        """
+        Returns the cached secret, or calls `fetch` to read it from the secret manager.
+
+        - source: the key manager / oidc provider, used for the ttl and metrics
+        - cache_key: identifies the secret within the source, e.g. the secret name
+        - client: the secret manager client - cached secrets read with a different client are not used
+        """
+        if self.get_ttl(source) <= 0:
+            return fetch()
+        key = (source, cache_key)
+        entry = self._get_cached_secret(key=key, client=client)
+        if entry is not None:
+            if time.time() > entry.refresh_at:
+                self._start_background_refresh(key=key, fetch=fetch, client=client)
+            return entry.value
+
+        self._record(source, "misses")
+        lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            # another caller may have fetched the secret while this one waited on the lock
+            entry = self._get_valid_entry(key=key, client=client)
+            if entry is not None:
+                return entry.value
+            return self._fetch(key=key, fetch=fetch, client=client)
+
+    async def async_get_secret(
+        self,
+        source: str,
+        cache_key: Hashable,
+        fetch: Callable[[], Any],
+        client: Any = None,
+    ) -> Any:
+        """
+        Async version of `get_secret` - `fetch` runs in a thread, concurrent misses for the same secret share one call
+        """
+        if self.get_ttl(source) <= 0:
+            return await asyncify(fetch)()
+        key = (source, cache_key)
+        entry = self._get_cached_secret(key=key, client=client)
+        if entry is not None:
+            if time.time() > entry.refresh_at:
+                self._start_background_refresh(key=key, fetch=fetch, client=client)
+            return entry.value
+
+        self._record(source, "misses")
+        loop = asyncio.get_running_loop()
+        task = self._async_fetches.get(key)
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = loop.create_task(
+                self._async_fetch(key=key, fetch=fetch, client=client)
+            )
+            # errors are raised to the callers awaiting the task
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._async_fetches[key] = task
+        return await asyncio.shield(task)
+
+    def get_metrics(self) -> List[SecretCacheMetrics]:
+        cached_secrets: Dict[str, int] = {}
+        for source, _ in list(self._entries):
+            cached_secrets[source] = cached_secrets.get(source, 0) + 1
+        return [
+            SecretCacheMetrics(
+                source=source,
+                cached_secrets=cached_secrets.get(source, 0),
+                hits=metrics.get("hits", 0),
+                misses=metrics.get("misses", 0),
+                fetches=metrics.get("fetches", 0),
+                background_refreshes=metrics.get("background_refreshes", 0),
+                errors=metrics.get("errors", 0),
+            )
+            for source, metrics in self._metrics.items()
+        ]
+
+    def flush_cache(self):
+        self._entries.clear()
+        self._metrics.clear()
+
+    def _get_valid_entry(
+        self, key: _SecretCacheKey, client: Any
+    ) -> Optional[_CachedSecret]:
+        entry = self._entries.get(key)
+        if entry is None or entry.client is not client:
+            return None
+        if time.time() > entry.expires_at:
+            return None
+        return entry
+
+    def _get_cached_secret(
+        self, key: _SecretCacheKey, client: Any
+    ) -> Optional[_CachedSecret]:
+        entry = self._get_valid_entry(key=key, client=client)
+        if entry is not None:
+            self._record(key[0], "hits")
+        return entry
+
+    def _record(self, source: str, metric: str):
+        metrics = self._metrics.setdefault(source, {})
+        metrics[metric] = metrics.get(metric, 0) + 1
+
+    def _set(self, key: _SecretCacheKey, value: Any, client: Any):
+        if value is None:  # not found - check the secret manager again on the next read
+            return
+        self._entries[key] = _CachedSecret(
+            value=value, client=client, ttl=self.get_ttl(key[0])
+        )
+
+    def _fetch(
+        self, key: _SecretCacheKey, fetch: Callable[[], Any], client: Any
+    ) -> Any:
+        self._record(key[0], "fetches")
+        try:
+            value = fetch()
+        except Exception:
+            self._record(key[0], "errors")
+            raise
+        self._set(key=key, value=value, client=client)
+        return value
+
+    async def _async_fetch(
+        self, key: _SecretCacheKey, fetch: Callable[[], Any], client: Any
+    ) -> Any:
+        try:
+            return await asyncify(self._fetch)(key=key, fetch=fetch, client=client)
+        finally:
+            if self._async_fetches.get(key) is asyncio.current_task():
+                self._async_fetches.pop(key, None)
+
+    def _start_background_refresh(
+        self, key: _SecretCacheKey, fetch: Callable[[], Any], client: Any
+    ):
+        """
+        Refreshes the secret without blocking the caller. The cached value is kept if the refresh fails.
+        """
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        self._record(key[0], "background_refreshes")
+
+        def _on_refresh_done(error: Optional[BaseException]):
+            self._refreshing.discard(key)
+            if error is not None:
+                verbose_logger.warning(
+                    "Failed to refresh secret from %s, using the cached value. Error - %s",
+                    key[0],
+                    str(error),
+                )
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="litellm-secret-refresh"
+            )
+        future = self._executor.submit(self._fetch, key=key, fetch=fetch, client=client)
+        future.add_done_callback(lambda f: _on_refresh_done(f.exception()))
+
+
+secret_cache = SecretCache()
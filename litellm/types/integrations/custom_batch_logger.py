@@ -0,0 +1,21 @@
+from typing import Literal, Optional, TypedDict
+
+BatchLoggerOverflowPolicy = Literal[
+    "drop_oldest", "drop_newest", "sample", "spill_to_disk"
+]
+
+
+class BatchLoggerQueueMetrics(TypedDict):
+    """
+    Per-logger queue metrics tracked by CustomBatchLogger
+    """
+
+    queue_depth: int
+    max_queue_size: int
+    dropped_events: int
+    spilled_events: int  # total events spilled to disk, including ones restored since
+    failed_flushes: int
+    skipped_flushes: int
+    last_flush_latency_seconds: Optional[float]
+    total_flush_latency_seconds: float
+    total_flushes: int
@@ -2,6 +2,9 @@ REQUESTED_MODEL = "requested_model"
 EXCEPTION_STATUS = "exception_status"
 EXCEPTION_CLASS = "exception_class"
 EXCEPTION_LABELS = [EXCEPTION_STATUS, EXCEPTION_CLASS]
+# How gauges are aggregated across gunicorn workers in prometheus multiprocess mode.
+# Budgets / remaining limits / deployment state are "last value written", so report the most recent value of any live worker
+GAUGE_MULTIPROCESS_MODE = "livemostrecent"
 LATENCY_BUCKETS = (
     0.005,
     0.00625,
@@ -1,4 +1,7 @@
 from enum import Enum
+from typing import Optional
+
+from typing_extensions import TypedDict
 
 import litellm
 
@@ -18,3 +21,19 @@ class httpxSpecialProvider(str, Enum):
     Oauth2Check = "oauth2_check"
     SecretManager = "secret_manager"
     PassThroughEndpoint = "pass_through_endpoint"
+
+
+class ConnectionPoolMetrics(TypedDict):
+    llm_provider: str
+    api_base: str
+    is_async: bool
+    http2: bool
+    max_connections: Optional[int]
+    max_keepalive_connections: Optional[int]
+    connections: int  # open connections
+    idle_connections: int
+    in_flight_requests: int
+    clients: int  # httpx clients using the pool
+    total_requests: int
+    avg_pool_wait_time: float  # seconds a request waited for a connection
+    max_pool_wait_time: float
@@ -574,6 +574,93 @@ class CustomRoutingStrategyBase:
         pass
 
 
+class PassiveHealthCheckArgs(BaseModel):
+    """
+    Use this to score deployment health from live traffic, and route away from degrading deployments
+
+    - window_size: number of recent requests kept per deployment
+    - window_seconds: requests older than this are not scored
+    - min_requests: deployments with fewer scored requests have a health score of 1.0
+    - min_health_score: deployments below this score get no traffic, if a deployment above it is available
+    - cooldown_health_score: deployments below this score are put in cooldown
+    """
+
+    window_size: int = 100
+    window_seconds: float = 300
+    min_requests: int = 10
+    min_health_score: float = 0.5
+    cooldown_health_score: float = 0.2
+
+
+class DeploymentHealthStats(TypedDict):
+    num_requests: int
+    success_rate: float
+    error_classes: Dict[str, int]
+    latency_p50: Optional[float]
+    latency_p90: Optional[float]
+    latency_p99: Optional[float]
+    health_score: float
+
+
+class RequestHedgingArgs(BaseModel):
+    """
+    Use this to cut tail latency, by sending a second request to another deployment when the first one is slow
+
+    - latency_percentile: a second request is sent if there's no response (or first streamed chunk) after this latency percentile of the model group
+    - max_hedge_ratio: max extra requests sent, as a fraction of the model group's requests
+    - min_samples: model groups with fewer recorded latencies are not hedged
+    - window_size: number of recent latencies kept per model group
+    """
+
+    latency_percentile: float = 0.95
+    max_hedge_ratio: float = 0.1
+    min_samples: int = 20
+    window_size: int = 200
+
+
+class RequestHedgingStats(TypedDict):
+    model_group: str
+    num_requests: int
+    num_hedged_requests: int
+    num_hedge_wins: int  # hedged requests answered by the second deployment
+    num_skipped_no_budget: int  # not hedged, `max_hedge_ratio` was reached
+    hedge_delay: Optional[float]  # current latency percentile, in seconds
+
+
+class RetryBudgetArgs(BaseModel):
+    """
+    Use this to limit retries per model group, so retries don't multiply the load on a failing provider
+
+    - retry_ratio: each request to the model group adds this many retries to its budget, e.g. 0.2 = retries are at most ~20% of requests
+    - max_tokens: max retries the budget can save up, and the budget of a new model group
+    """
+
+    retry_ratio: float = 0.2
+    max_tokens: float = 10.0
+
+
+class RetryBudgetStats(TypedDict):
+    model_group: str
+    tokens: float  # retries currently allowed
+    num_requests: int
+    num_retries: int
+    num_retries_skipped: int  # retries not made, because the budget was used up
+
+
+class EmbeddingBatchingArgs(BaseModel):
+    """
+    Use this to send concurrent `aembedding` calls to the same deployment as one request
+
+    - max_wait_ms: how long a call waits for other calls to batch with
+    - max_batch_size: max inputs per request. Defaults to the provider's limit, see `DEFAULT_EMBEDDING_BATCH_LIMITS`
+    - max_batch_tokens: max input tokens per request. Defaults to the provider's limit
+    """
+
+    max_wait_ms: float = 5
+    max_batch_size: Optional[int] = None
+    max_batch_tokens: Optional[int] = None
+
+
 class RouterGeneralSettings(BaseModel):
     async_only_mode: bool = Field(
         default=False
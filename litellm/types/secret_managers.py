@@ -0,0 +1,11 @@
+from typing import TypedDict
+
+
+class SecretCacheMetrics(TypedDict):
+    source: str
+    cached_secrets: int
+    hits: int
+    misses: int
+    fetches: int  # calls to the secret manager, incl. background refreshes
+    background_refreshes: int
+    errors: int
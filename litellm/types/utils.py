@@ -1406,6 +1406,9 @@ all_litellm_params = [
     "user_continue_message",
     "fallback_depth",
     "max_fallbacks",
+    "end_to_end_timeout",
+    "request_deadline",
+    "embedding_batch_response",
 ]
 
 
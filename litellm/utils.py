@@ -29,7 +29,6 @@ import subprocess
 ## Generic utils.py file. Problem-specific utils (e.g. 'cost calculation), should all be in `litellm_core_utils/`.
 import sys
 import textwrap
-import threading
 import time
 import traceback
 import uuid
@@ -89,6 +88,7 @@ from litellm.litellm_core_utils.llm_response_utils.convert_dict_to_response impo
 from litellm.litellm_core_utils.llm_response_utils.get_headers import (
     get_response_headers,
 )
+from litellm.litellm_core_utils.logging_worker_pool import logging_worker_pool
 from litellm.litellm_core_utils.redact_messages import (
     LiteLLMLoggingObject,
     redact_message_input_output_from_logging,
@@ -136,7 +136,6 @@ with resources.open_text("litellm.llms.tokenizers", "anthropic_tokenizer.json")
 # Convert to str (if necessary)
 claude_json_str = json.dumps(json_data)
 import importlib.metadata
-from concurrent.futures import ThreadPoolExecutor
 from typing import (
     Any,
     Callable,
@@ -188,11 +187,8 @@ from .types.llms.openai import (
 from .types.router import LiteLLM_Params
 
 ####### ENVIRONMENT VARIABLES ####################
-# Adjust to your specific application needs / system capabilities.
-MAX_THREADS = 100
-
-# Create a ThreadPoolExecutor
-executor = ThreadPoolExecutor(max_workers=MAX_THREADS)
+# backwards compatible alias, `executor.submit(fn, ...)` queues on the logging worker pool
+executor = logging_worker_pool
 sentry_sdk_instance = None
 capture_exception = None
 add_breadcrumb = None
@@ -888,9 +884,9 @@ def client(original_function):  # noqa: PLR0915
 
             # LOG SUCCESS - handle streaming success logging in the _next_ object, remove `handle_success` once it's deprecated
             verbose_logger.info("Wrapper: Completed Call, calling success_handler")
-            threading.Thread(
-                target=logging_obj.success_handler, args=(result, start_time, end_time)
-            ).start()
+            logging_worker_pool.submit(
+                logging_obj.success_handler, result, start_time, end_time
+            )
             # RETURN RESULT
             if hasattr(result, "_hidden_params"):
                 result._hidden_params["model_id"] = kwargs.get("model_info", {}).get(
@@ -1042,6 +1038,7 @@ def client(original_function):  # noqa: PLR0915
                         chunks, messages=kwargs.get("messages", None)
                     )
                 else:
+                    _llm_caching_handler._release_single_flight_when_stream_ends(result)
                     return result
             elif call_type == CallTypes.arealtime.value:
                 return result
@@ -1096,10 +1093,9 @@ def client(original_function):  # noqa: PLR0915
             asyncio.create_task(
                 logging_obj.async_success_handler(result, start_time, end_time)
             )
-            threading.Thread(
-                target=logging_obj.success_handler,
-                args=(result, start_time, end_time),
-            ).start()
+            logging_worker_pool.submit(
+                logging_obj.success_handler, result, start_time, end_time
+            )
 
             # REBUILD EMBEDDING CACHING
             if (
@@ -1118,6 +1114,8 @@ def client(original_function):  # noqa: PLR0915
         except Exception as e:
             traceback_exception = traceback.format_exc()
             end_time = datetime.datetime.now()
+            # let coalesced requests waiting on this request through
+            await _llm_caching_handler._async_release_single_flight()
             if logging_obj:
                 try:
                     logging_obj.failure_handler(
@@ -1334,6 +1334,69 @@ def test_base_aws_llm_get_credentials():
     )
 
 
+def test_base_aws_llm_get_credentials_cached():
+    from litellm.llms.base_aws_llm import BaseAWSLLM, aws_credentials_cache
+
+    aws_credentials_cache.flush_cache()
+    with patch("boto3.Session") as mock_session:
+        credentials = BaseAWSLLM().get_credentials(aws_region_name="us-east-1")
+        # a new instance shares the cache
+        assert BaseAWSLLM().get_credentials(aws_region_name="us-east-1") is credentials
+        assert mock_session.call_count == 1
+
+        BaseAWSLLM().get_credentials(aws_region_name="us-west-2")
+        assert mock_session.call_count == 2
+
+
+@pytest.mark.parametrize("expires_in, expected_sts_calls", [(3600, 1), (30, 2)])
+def test_base_aws_llm_sts_credentials_expiry(expires_in, expected_sts_calls):
+    from datetime import datetime, timedelta, timezone
+
+    from litellm.llms.base_aws_llm import BaseAWSLLM, aws_credentials_cache
+
+    aws_credentials_cache.flush_cache()
+    with patch("boto3.client") as mock_client:
+        mock_client.return_value.assume_role.return_value = {
+            "Credentials": {
+                "AccessKeyId": "test",
+                "SecretAccessKey": "test2",
+                "SessionToken": "test3",
+                "Expiration": datetime.now(timezone.utc)
+                + timedelta(seconds=expires_in),
+            }
+        }
+        for _ in range(2):
+            credentials = BaseAWSLLM().get_credentials(
+                aws_role_name="arn:aws:iam::123456789012:role/test",
+                aws_session_name="test-session",
+            )
+            assert credentials.token == "test3"
+
+        assert (
+            mock_client.return_value.assume_role.call_count == expected_sts_calls
+        )
+
+
+def test_base_aws_llm_get_sigv4_signer():
+    from botocore.credentials import Credentials
+
+    from litellm.llms.base_aws_llm import BaseAWSLLM
+
+    credentials = Credentials(access_key="test", secret_key="test2")
+    signer = BaseAWSLLM().get_sigv4_signer(credentials, "bedrock", "us-east-1")
+    assert BaseAWSLLM().get_sigv4_signer(credentials, "bedrock", "us-east-1") is signer
+    assert (
+        BaseAWSLLM().get_sigv4_signer(credentials, "sagemaker", "us-east-1")
+        is not signer
+    )
+    assert (
+        BaseAWSLLM().get_sigv4_signer(
+            Credentials(access_key="test", secret_key="test2"), "bedrock", "us-east-1"
+        )
+        is not signer
+    )
+
+
 def test_bedrock_completion_test_2():
     litellm.set_verbose = True
     data = {
@@ -700,3 +700,100 @@ def test_convert_generic_image_chunk_to_openai_image_obj():
     url_str = convert_generic_image_chunk_to_openai_image_obj(image_obj)
     image_obj = convert_to_anthropic_image_obj(url_str)
     print(image_obj)
+
+
+def _image_response(status_code: int = 200, etag: str = '"v1"'):
+    import httpx
+
+    return httpx.Response(
+        status_code=status_code,
+        content=b"image-bytes" if status_code == 200 else b"",
+        headers={"Content-Type": "image/png", "ETag": etag},
+        request=httpx.Request("GET", "https://example.com/image.png"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_prefetch_image_urls_concurrently():
+    import asyncio
+    from unittest.mock import patch
+
+    from litellm.llms.prompt_templates.image_handling import (
+        async_prefetch_image_urls,
+        in_memory_cache,
+    )
+
+    in_memory_cache.flush_cache()
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _get(url, headers=None, follow_redirects=None):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return _image_response()
+
+    image_urls = ["https://example.com/image-{}.png".format(i) for i in range(6)]
+    messages = [
+        {
+            "role": "user",
+            "content": [{"type": "text", "text": "describe these images"}]
+            + [
+                {"type": "image_url", "image_url": {"url": url}}
+                for url in image_urls
+            ]
+            + [{"type": "image_url", "image_url": image_urls[0]}],
+        }
+    ]
+    with patch.object(litellm.module_level_aclient, "get", side_effect=_get):
+        await async_prefetch_image_urls(messages=messages, max_concurrency=3)
+    assert max_in_flight == 3
+
+    # the sync prompt conversion reads the prefetched images from the cache
+    with patch.object(litellm.module_level_client, "get") as mock_get:
+        for url in image_urls:
+            image = convert_to_anthropic_image_obj(url)
+            assert image["media_type"] == "image/png"
+        mock_get.assert_not_called()
+
+
+def test_image_url_cache_is_byte_bounded_and_revalidated():
+    from unittest.mock import patch
+
+    from litellm.llms.prompt_templates.image_handling import (
+        ImageURLCache,
+        in_memory_cache,
+    )
+
+    cache = ImageURLCache(max_size_bytes=100, ttl=300)
+    cache.set_cache("a", "x" * 40)
+    cache.set_cache("b", "x" * 40)
+    cache.get_cache("a")
+    cache.set_cache("c", "x" * 40)
+    # least recently used image is evicted
+    assert cache.get_cache("b") is None
+    assert cache.get_cache("a") is not None
+    assert cache.current_size_bytes == 80
+    # images bigger than the cache are not cached
+    cache.set_cache("d", "x" * 101)
+    assert cache.get_cache("d") is None
+
+    in_memory_cache.flush_cache()
+    url = "https://example.com/revalidate.png"
+    with patch.object(
+        litellm.module_level_client, "get", return_value=_image_response()
+    ):
+        data_url = convert_url_to_base64(url)
+
+    # stale entry - revalidated with the etag, 304 reuses the cached image
+    in_memory_cache._cache[url] = in_memory_cache._cache[url]._replace(fetched_at=0)
+    with patch.object(
+        litellm.module_level_client,
+        "get",
+        return_value=_image_response(status_code=304),
+    ) as mock_get:
+        assert convert_url_to_base64(url) == data_url
+    assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+    assert in_memory_cache.get_fresh_cache(url) == data_url
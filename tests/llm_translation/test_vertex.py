@@ -1224,3 +1224,142 @@ def test_vertex_embedding_url(model, expected_url):
 
     assert url == expected_url
     assert endpoint == "predict"
+
+
+class _StubTokenEndpoint:
+    """
+    Issues tokens for stub google credentials, counts calls
+    """
+
+    def __init__(self, token_lifetime: float = 3600, latency: float = 0):
+        self.token_lifetime = token_lifetime
+        self.latency = latency
+        self.calls = 0
+
+    def issue_token(self, credentials):
+        import time
+        from datetime import datetime, timedelta
+
+        time.sleep(self.latency)
+        self.calls += 1
+        self.credentials = credentials
+        credentials.token = "{}-token-{}".format(credentials.name, self.calls)
+        credentials.expiry = datetime.utcnow() + timedelta(seconds=self.token_lifetime)
+
+    def load_auth(self, credentials, project_id):
+        _credentials = MagicMock(token=None, expiry=None)
+        _credentials.name = credentials
+        self.issue_token(_credentials)
+        return _credentials, project_id or "{}-project".format(credentials)
+
+
+def _token_manager(endpoint: _StubTokenEndpoint):
+    from litellm.llms.vertex_ai_and_google_ai_studio.vertex_token_manager import (
+        VertexTokenManager,
+    )
+
+    return VertexTokenManager(
+        load_auth=endpoint.load_auth, refresh_auth=endpoint.issue_token
+    )
+
+
+def test_vertex_token_manager_caches_token_per_credentials():
+    endpoint = _StubTokenEndpoint()
+    token_manager = _token_manager(endpoint)
+
+    for _ in range(3):
+        assert token_manager.get_access_token(
+            credentials="sa-1", project_id=None
+        ) == ("sa-1-token-1", "sa-1-project")
+        assert token_manager.get_access_token(
+            credentials="sa-2", project_id="my-project"
+        ) == ("sa-2-token-2", "my-project")
+    assert endpoint.calls == 2
+
+
+def test_vertex_token_manager_raises_if_project_id_is_not_resolved():
+    endpoint = _StubTokenEndpoint()
+
+    def load_auth(credentials, project_id):
+        _credentials, _ = _StubTokenEndpoint.load_auth(
+            endpoint, credentials=credentials, project_id=project_id
+        )
+        _credentials.quota_project_id = None
+        return _credentials, None
+
+    endpoint.load_auth = load_auth
+    token_manager = _token_manager(endpoint)
+
+    with pytest.raises(ValueError, match="Could not resolve project_id"):
+        token_manager.get_access_token(credentials="sa-1", project_id=None)
+    assert token_manager.get_access_token(
+        credentials="sa-1", project_id="my-project"
+    ) == ("sa-1-token-2", "my-project")
+
+
+@pytest.mark.asyncio
+async def test_vertex_token_manager_deduplicates_concurrent_loads():
+    import asyncio
+
+    endpoint = _StubTokenEndpoint(latency=0.1)
+    token_manager = _token_manager(endpoint)
+
+    results = await asyncio.gather(
+        *[
+            token_manager.async_get_access_token(credentials="sa-1", project_id=None)
+            for _ in range(10)
+        ]
+    )
+    assert results == [("sa-1-token-1", "sa-1-project")] * 10
+    assert endpoint.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_vertex_token_manager_refreshes_before_expiry_in_background():
+    import asyncio
+    import time
+
+    from datetime import datetime, timedelta
+
+    endpoint = _StubTokenEndpoint(latency=0.2)
+    token_manager = _token_manager(endpoint)
+
+    assert await token_manager.async_get_access_token(
+        credentials="sa-1", project_id=None
+    ) == ("sa-1-token-1", "sa-1-project")
+    endpoint.credentials.expiry = datetime.utcnow() + timedelta(seconds=60)
+
+    # token expires within the refresh window - the current token is returned, without waiting on the refresh
+    start_time = time.perf_counter()
+    assert await token_manager.async_get_access_token(
+        credentials="sa-1", project_id=None
+    ) == ("sa-1-token-1", "sa-1-project")
+    assert time.perf_counter() - start_time < 0.1
+
+    await asyncio.sleep(0.5)
+    assert endpoint.calls >= 2
+    assert await token_manager.async_get_access_token(
+        credentials="sa-1", project_id=None
+    ) == ("sa-1-token-{}".format(endpoint.calls), "sa-1-project")
+
+
+@pytest.mark.asyncio
+async def test_vertex_base_uses_token_per_credentials():
+    from litellm.llms.vertex_ai_and_google_ai_studio.vertex_llm_base import (
+        VertexBase,
+    )
+
+    endpoint = _StubTokenEndpoint()
+    with patch.object(VertexBase, "load_auth", side_effect=endpoint.load_auth):
+        vertex_base = VertexBase()
+
+    assert await vertex_base._ensure_access_token_async(
+        credentials="sa-1", project_id=None, custom_llm_provider="vertex_ai"
+    ) == ("sa-1-token-1", "sa-1-project")
+    # a deployment with different credentials doesn't get the cached token of the first one
+    assert await vertex_base._ensure_access_token_async(
+        credentials="sa-2", project_id=None, custom_llm_provider="vertex_ai"
+    ) == ("sa-2-token-2", "sa-2-project")
+    assert vertex_base._ensure_access_token(
+        credentials="sa-1", project_id=None, custom_llm_provider="vertex_ai"
+    ) == ("sa-1-token-1", "sa-1-project")
@@ -0,0 +1,77 @@
+"""
+Benchmark - p99 request latency while a batch logger flushes a large queue.
+
+Compares encoding the batch inline on the event loop vs. `CustomBatchLogger.async_encode_payload`
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import asyncio
+import gzip
+import json
+import time
+import uuid
+
+from litellm.integrations.custom_batch_logger import CustomBatchLogger
+
+NUM_LOGS = 512
+NUM_REQUESTS = 200
+
+
+class InlineEncodeLogger(CustomBatchLogger):
+    async def async_send_batch(self):
+        gzip.compress(json.dumps(self.log_queue).encode("utf-8"))
+
+
+class OffLoopEncodeLogger(CustomBatchLogger):
+    async def async_send_batch(self):
+        await self.async_encode_payload(list(self.log_queue), compression="gzip")
+
+
+def _large_log_payload(idx: int) -> dict:
+    return {
+        "id": f"chatcmpl-{idx}",
+        "messages": [{"role": "user", "content": uuid.uuid4().hex * 200}],
+        "response": {"choices": [{"message": {"content": uuid.uuid4().hex * 200}}]},
+    }
+
+
+async def _timed_request(arrival_time: float) -> float:
+    # each request waits ~5ms on "network i/o"
+    await asyncio.sleep(arrival_time - time.perf_counter())
+    await asyncio.sleep(0.005)
+    return time.perf_counter() - arrival_time
+
+
+async def _p99_latency_during_flush(logger: CustomBatchLogger) -> float:
+    latencies = []
+    for _ in range(5):
+        logger.log_queue = [_large_log_payload(i) for i in range(NUM_LOGS)]
+        # requests arrive every 1ms, the flush starts while they are in flight
+        start_time = time.perf_counter()
+        requests = [
+            asyncio.create_task(_timed_request(start_time + i * 0.001))
+            for i in range(NUM_REQUESTS)
+        ]
+        await asyncio.sleep(0.05)
+        await logger.flush_queue()
+        latencies.extend(await asyncio.gather(*requests))
+    latencies.sort()
+    return latencies[int(len(latencies) * 0.99) - 1]
+
+
+def test_batch_logger_flush_p99_latency():
+    inline_p99 = asyncio.run(
+        _p99_latency_during_flush(InlineEncodeLogger(flush_lock=asyncio.Lock()))
+    )
+    off_loop_p99 = asyncio.run(
+        _p99_latency_during_flush(OffLoopEncodeLogger(flush_lock=asyncio.Lock()))
+    )
+
+    print(f"p99 latency with inline encoding: {inline_p99 * 1000:.2f}ms")
+    print(f"p99 latency with off-loop encoding: {off_loop_p99 * 1000:.2f}ms")
+
+    assert off_loop_p99 <= inline_p99
@@ -0,0 +1,72 @@
+"""
+Benchmark - JWT auth latency for a reused bearer token.
+
+Compares verifying the token on every request vs. the verified token cache
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+
+import jwt
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from litellm.caching.caching import DualCache
+from litellm.proxy._types import LiteLLM_JWTAuth
+from litellm.proxy.auth.handle_jwt import JWTHandler
+
+NUM_REQUESTS = 2000
+
+
+def _generate_token_and_jwk():
+    key = rsa.generate_private_key(
+        public_exponent=65537, key_size=2048, backend=default_backend()
+    )
+    private_key = key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode("utf-8")
+    public_jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(key.public_key()))
+    expiration_time = int((datetime.now() + timedelta(hours=1)).timestamp())
+    token = jwt.encode(
+        {"sub": "service-a", "exp": expiration_time}, private_key, algorithm="RS256"
+    )
+    return token, public_jwk
+
+
+async def _avg_auth_latency(token: str, public_jwk: dict, cache_size: int) -> float:
+    cache = DualCache()
+    await cache.async_set_cache(key="litellm_jwt_auth_keys", value=[public_jwk])
+    jwt_handler = JWTHandler()
+    jwt_handler.update_environment(
+        prisma_client=None,
+        user_api_key_cache=cache,
+        litellm_jwtauth=LiteLLM_JWTAuth(verified_token_cache_size=cache_size),
+    )
+    start_time = time.perf_counter()
+    for _ in range(NUM_REQUESTS):
+        await jwt_handler.auth_jwt(token=token)
+    return (time.perf_counter() - start_time) / NUM_REQUESTS
+
+
+def test_jwt_auth_latency_with_verified_token_cache():
+    os.environ["JWT_PUBLIC_KEY_URL"] = "https://example.com/jwks"
+    os.environ.pop("JWT_AUDIENCE", None)
+    token, public_jwk = _generate_token_and_jwk()
+
+    uncached_latency = asyncio.run(_avg_auth_latency(token, public_jwk, cache_size=0))
+    cached_latency = asyncio.run(_avg_auth_latency(token, public_jwk, cache_size=1000))
+
+    print(f"avg auth latency, verify every request: {uncached_latency * 1e6:.1f}us")
+    print(f"avg auth latency, verified token cache: {cached_latency * 1e6:.1f}us")
+
+    assert cached_latency < uncached_latency
@@ -0,0 +1,63 @@
+"""
+Benchmark - sync logging throughput and thread count.
+
+Compares starting a new thread per logging call (old behaviour) vs. `LoggingWorkerPool`
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import threading
+import time
+
+from litellm.litellm_core_utils.logging_worker_pool import LoggingWorkerPool
+
+NUM_CALLS = 2000
+
+
+def _success_handler():
+    # sync callbacks do a little cpu work + a blocking network call
+    sum(range(1000))
+    time.sleep(0.02)
+
+
+def _run_benchmark(submit, wait_for_completion):
+    peak_threads = threading.active_count()
+    start_time = time.perf_counter()
+    for i in range(NUM_CALLS):
+        submit()
+        if i % 50 == 0:
+            peak_threads = max(peak_threads, threading.active_count())
+    submit_rps = NUM_CALLS / (time.perf_counter() - start_time)
+    wait_for_completion()
+    return submit_rps, peak_threads
+
+
+def test_logging_worker_pool_rps_and_thread_count():
+    threads = []
+
+    def _thread_per_call():
+        thread = threading.Thread(target=_success_handler)
+        thread.start()
+        threads.append(thread)
+
+    def _join_threads():
+        for thread in threads:
+            thread.join()
+
+    thread_rps, thread_peak = _run_benchmark(_thread_per_call, _join_threads)
+
+    pool = LoggingWorkerPool(num_workers=16, max_queue_size=NUM_CALLS)
+    pool_rps, pool_peak = _run_benchmark(
+        lambda: pool.submit(_success_handler), lambda: pool.flush(timeout=60)
+    )
+
+    print(f"thread per call: {thread_rps:.0f} calls/s, peak threads {thread_peak}")
+    print(f"logging worker pool: {pool_rps:.0f} calls/s, peak threads {pool_peak}")
+    print(f"logging worker pool metrics: {pool.get_metrics()}")
+
+    assert pool.get_metrics()["completed"] == NUM_CALLS
+    assert pool_peak < thread_peak
+    assert pool_rps > thread_rps
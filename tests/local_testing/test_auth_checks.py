@@ -95,3 +95,331 @@ async def test_handle_failed_db_connection():
     print("_handle_failed_db_connection_for_get_key_object got exception", exc_info)
 
     assert str(exc_info.value) == "Failed to connect to DB"
+
+
+def _mock_prisma_client(get_data_response=None, get_data_delay: float = 0.05):
+    from unittest.mock import MagicMock
+
+    async def _get_data(*args, **kwargs):
+        await asyncio.sleep(get_data_delay)
+        return get_data_response
+
+    prisma_client = MagicMock()
+    prisma_client.get_data = MagicMock(side_effect=_get_data)
+    prisma_client.get_key_auth_objects = MagicMock(side_effect=_get_data)
+    return prisma_client
+
+
+@pytest.mark.asyncio
+async def test_get_key_object_single_flight():
+    """
+    Concurrent requests for a key that is not in the cache only query the db once
+    """
+    from litellm.proxy._types import (
+        LiteLLM_KeyAuthObjects,
+        LiteLLM_VerificationTokenView,
+    )
+    from litellm.proxy.auth.auth_checks import get_key_object
+
+    hashed_token = uuid.uuid4().hex
+    prisma_client = _mock_prisma_client(
+        get_data_response=LiteLLM_KeyAuthObjects(
+            key=LiteLLM_VerificationTokenView(token=hashed_token, user_id="my-user")
+        )
+    )
+
+    responses = await asyncio.gather(
+        *[
+            get_key_object(
+                hashed_token=hashed_token,
+                prisma_client=prisma_client,
+                user_api_key_cache=DualCache(),
+            )
+            for _ in range(10)
+        ]
+    )
+
+    assert prisma_client.get_key_auth_objects.call_count == 1
+    assert all(response.user_id == "my-user" for response in responses)
+
+
+@pytest.mark.asyncio
+async def test_get_key_object_negative_cache(monkeypatch):
+    """
+    A key that is not in the db is not looked up again for `db_cache_expiry` seconds
+    """
+    import litellm.proxy.auth.auth_checks as auth_checks
+
+    hashed_token = uuid.uuid4().hex
+    prisma_client = _mock_prisma_client(get_data_response=None, get_data_delay=0)
+
+    for _ in range(3):
+        with pytest.raises(Exception, match="Key doesn't exist in db"):
+            await auth_checks.get_key_object(
+                hashed_token=hashed_token,
+                prisma_client=prisma_client,
+                user_api_key_cache=DualCache(),
+            )
+    assert prisma_client.get_key_auth_objects.call_count == 1
+
+    monkeypatch.setattr(auth_checks, "db_cache_expiry", 0)
+    with pytest.raises(Exception, match="Key doesn't exist in db"):
+        await auth_checks.get_key_object(
+            hashed_token=hashed_token,
+            prisma_client=prisma_client,
+            user_api_key_cache=DualCache(),
+        )
+    assert prisma_client.get_key_auth_objects.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_team_object_single_flight_and_negative_cache():
+    from unittest.mock import MagicMock
+
+    from litellm.proxy.auth.auth_checks import get_team_object
+
+    async def _find_unique(*args, **kwargs):
+        await asyncio.sleep(0.05)
+        return None
+
+    prisma_client = MagicMock()
+    prisma_client.db.litellm_teamtable.find_unique = MagicMock(side_effect=_find_unique)
+    team_id = uuid.uuid4().hex
+
+    results = await asyncio.gather(
+        *[
+            get_team_object(
+                team_id=team_id,
+                prisma_client=prisma_client,
+                user_api_key_cache=DualCache(),
+            )
+            for _ in range(10)
+        ],
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, Exception) for result in results)
+
+    with pytest.raises(Exception, match="Team doesn't exist in db"):
+        await get_team_object(
+            team_id=team_id,
+            prisma_client=prisma_client,
+            user_api_key_cache=DualCache(),
+        )
+    assert prisma_client.db.litellm_teamtable.find_unique.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_negative_cache_is_cleared_when_object_is_created():
+    """
+    A team / user / key that was not found is looked up again once it's created
+    """
+    from unittest.mock import AsyncMock, MagicMock
+
+    import litellm.proxy.auth.auth_checks as auth_checks
+
+    team_id = uuid.uuid4().hex
+    user_id = uuid.uuid4().hex
+    hashed_token = uuid.uuid4().hex
+    for key in [
+        "team_id:{}".format(team_id),
+        "user_id:{}".format(user_id),
+        "token:{}".format(hashed_token),
+    ]:
+        auth_checks._update_last_db_access_time(
+            key=key, value=None, last_db_access_time=auth_checks.last_db_access_time
+        )
+
+    prisma_client = PrismaClient.__new__(PrismaClient)
+    prisma_client.db = MagicMock()
+    prisma_client.db.litellm_teamtable.upsert = AsyncMock()
+    prisma_client.db.litellm_usertable.upsert = AsyncMock()
+    prisma_client.db.litellm_verificationtoken.update = AsyncMock()
+    await prisma_client.insert_data(data={"team_id": team_id}, table_name="team")
+    await prisma_client.update_data(user_id=user_id, data={"user_id": user_id})
+    await prisma_client.update_data(token=hashed_token, data={"spend": 1})
+
+    assert "team_id:{}".format(team_id) not in auth_checks.last_db_access_time
+    assert "user_id:{}".format(user_id) not in auth_checks.last_db_access_time
+    assert "token:{}".format(hashed_token) not in auth_checks.last_db_access_time
+
+    prisma_client.db.litellm_teamtable.find_unique = AsyncMock(return_value=None)
+    with pytest.raises(Exception, match="Team doesn't exist in db"):
+        await auth_checks.get_team_object(
+            team_id=team_id,
+            prisma_client=prisma_client,
+            user_api_key_cache=DualCache(),
+        )
+    prisma_client.db.litellm_teamtable.find_unique.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_preload_key_object_cache():
+    from litellm.proxy._types import LiteLLM_VerificationTokenView
+    from litellm.proxy.auth.auth_checks import (
+        get_key_object,
+        preload_key_object_cache,
+    )
+
+    hashed_tokens = [uuid.uuid4().hex for _ in range(3)]
+    prisma_client = _mock_prisma_client(
+        get_data_response=[
+            LiteLLM_VerificationTokenView(token=hashed_token, user_id="my-user")
+            for hashed_token in hashed_tokens
+        ]
+    )
+    user_api_key_cache = DualCache()
+
+    num_keys = await preload_key_object_cache(
+        prisma_client=prisma_client, user_api_key_cache=user_api_key_cache, limit=3
+    )
+
+    assert num_keys == 3
+    assert prisma_client.get_data.call_args.kwargs["query_type"] == "find_all"
+    for hashed_token in hashed_tokens:
+        key_object = await get_key_object(
+            hashed_token=hashed_token,
+            prisma_client=prisma_client,
+            user_api_key_cache=user_api_key_cache,
+            check_cache_only=True,
+        )
+        assert key_object.user_id == "my-user"
+
+
+@pytest.mark.asyncio
+async def test_get_key_object_caches_auth_objects():
+    """
+    The key's user, team and team membership are cached with the key, so the auth checks after the key lookup don't query the db
+    """
+    from unittest.mock import AsyncMock
+
+    from litellm.proxy._types import (
+        LiteLLM_BudgetTable,
+        LiteLLM_KeyAuthObjects,
+        LiteLLM_TeamMembership,
+        LiteLLM_TeamTableCachedObj,
+        LiteLLM_UserTable,
+        LiteLLM_VerificationTokenView,
+    )
+    from litellm.proxy.auth.auth_checks import (
+        get_key_object,
+        get_team_object,
+        get_user_object,
+    )
+
+    hashed_token = uuid.uuid4().hex
+    user_id = "user-{}".format(uuid.uuid4().hex)
+    team_id = "team-{}".format(uuid.uuid4().hex)
+    prisma_client = _mock_prisma_client(
+        get_data_response=LiteLLM_KeyAuthObjects(
+            key=LiteLLM_VerificationTokenView(
+                token=hashed_token, user_id=user_id, team_id=team_id
+            ),
+            user=LiteLLM_UserTable(user_id=user_id, max_budget=10, user_email=None),
+            team=LiteLLM_TeamTableCachedObj(team_id=team_id, max_budget=100),
+            team_membership=LiteLLM_TeamMembership(
+                user_id=user_id,
+                team_id=team_id,
+                litellm_budget_table=LiteLLM_BudgetTable(max_budget=5),
+            ),
+        )
+    )
+    user_api_key_cache = DualCache()
+    user_api_key_cache.async_set_cache_pipeline = AsyncMock(
+        wraps=user_api_key_cache.async_set_cache_pipeline
+    )
+
+    await get_key_object(
+        hashed_token=hashed_token,
+        prisma_client=prisma_client,
+        user_api_key_cache=user_api_key_cache,
+    )
+
+    user_api_key_cache.async_set_cache_pipeline.assert_called_once()
+    user_obj = await get_user_object(
+        user_id=user_id,
+        prisma_client=prisma_client,
+        user_api_key_cache=user_api_key_cache,
+        user_id_upsert=False,
+    )
+    assert user_obj.max_budget == 10
+    team_obj = await get_team_object(
+        team_id=team_id,
+        prisma_client=prisma_client,
+        user_api_key_cache=user_api_key_cache,
+        check_cache_only=True,
+    )
+    assert team_obj.max_budget == 100
+    team_member_info = await user_api_key_cache.async_get_cache(
+        key="{}_{}".format(team_id, user_id)
+    )
+    assert team_member_info.litellm_budget_table.max_budget == 5
+    prisma_client.db.litellm_usertable.find_unique.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_key_auth_objects_single_query():
+    from unittest.mock import AsyncMock, MagicMock
+
+    hashed_token = uuid.uuid4().hex
+    prisma_client = PrismaClient.__new__(PrismaClient)
+    prisma_client.db = MagicMock()
+    prisma_client.db.query_first = AsyncMock(
+        return_value={
+            "token": hashed_token,
+            "user_id": "my-user",
+            "team_id": "my-team",
+            "team_models": None,
+            "team_blocked": None,
+            "team_members_with_roles": None,
+            "auth_user": {
+                "user_id": "my-user",
+                "max_budget": 10,
+                "user_email": None,
+                "spend": 1,
+            },
+            "auth_user_organization_memberships": None,
+            "auth_team": {"team_id": "my-team", "max_budget": 100, "spend": 2},
+            "auth_team_membership": {
+                "user_id": "my-user",
+                "team_id": "my-team",
+                "budget_id": "my-budget",
+            },
+            "auth_team_membership_budget": {"budget_id": "my-budget", "max_budget": 5},
+            "auth_organization": None,
+        }
+    )
+
+    auth_objects = await prisma_client.get_key_auth_objects(token=hashed_token)
+
+    prisma_client.db.query_first.assert_called_once()
+    assert auth_objects.key.token == hashed_token
+    assert auth_objects.key.team_models == []
+    assert auth_objects.user.max_budget == 10
+    assert auth_objects.team.max_budget == 100
+    assert auth_objects.team_membership.litellm_budget_table.max_budget == 5
+    assert auth_objects.organization is None
+
+
+@pytest.mark.asyncio
+async def test_get_key_auth_objects_retries_db_errors():
+    from unittest.mock import AsyncMock, MagicMock
+
+    hashed_token = uuid.uuid4().hex
+    prisma_client = PrismaClient.__new__(PrismaClient)
+    prisma_client.db = MagicMock()
+    prisma_client.db.query_first = AsyncMock(
+        side_effect=[
+            Exception("connection reset"),
+            {
+                "token": hashed_token,
+                "team_models": None,
+                "team_blocked": None,
+                "team_members_with_roles": None,
+            },
+        ]
+    )
+
+    auth_objects = await prisma_client.get_key_auth_objects(token=hashed_token)
+
+    assert prisma_client.db.query_first.call_count == 2
+    assert auth_objects.key.token == hashed_token
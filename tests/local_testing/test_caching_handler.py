@@ -341,3 +341,231 @@ def test_combine_cached_embedding_response_multiple_missing_values():
     assert result.data[1].embedding == [0.4, 0.5, 0.6]
     assert result.data[2].embedding == [0.4, 0.5, 0.6]
     assert result.data[3].embedding == [0.7, 0.8, 0.9]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stream", [False, True])
+async def test_request_coalescing_single_flight(stream):
+    """
+    Concurrent identical requests that miss the cache should only make 1 LLM API call
+    """
+    import json
+
+    import httpx
+    import respx
+
+    litellm.cache = Cache(request_coalescing=True)
+    try:
+        messages = [{"role": "user", "content": f"Unique message {uuid.uuid4()}"}]
+        chunk = {
+            "id": "chatcmpl-123",
+            "object": "chat.completion.chunk",
+            "created": 1,
+            "model": "gpt-3.5-turbo",
+        }
+        stream_body = "".join(
+            f"data: {json.dumps(event)}\n\n"
+            for event in [
+                {
+                    **chunk,
+                    "choices": [
+                        {
+                            "index": 0,
+                            "delta": {"role": "assistant", "content": "Hello!"},
+                            "finish_reason": None,
+                        }
+                    ],
+                },
+                {
+                    **chunk,
+                    "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+                },
+            ]
+        )
+        completion_body = {
+            "id": "chatcmpl-123",
+            "object": "chat.completion",
+            "created": 1,
+            "model": "gpt-3.5-turbo",
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "Hello!"},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+        }
+
+        async def slow_llm_api(request):
+            await asyncio.sleep(0.5)
+            if stream:
+                return httpx.Response(
+                    200,
+                    content=stream_body + "data: [DONE]\n\n",
+                    headers={"content-type": "text/event-stream"},
+                )
+            return httpx.Response(200, json=completion_body)
+
+        async def make_request():
+            response = await litellm.acompletion(
+                model="gpt-3.5-turbo",
+                messages=messages,
+                api_key="sk-1234",
+                stream=stream,
+            )
+            if stream:
+                content = ""
+                async for chunk in response:
+                    content += chunk.choices[0].delta.content or ""
+                return content
+            return response.choices[0].message.content
+
+        with respx.mock(assert_all_called=False) as respx_mock:
+            llm_api_route = respx_mock.post(
+                "https://api.openai.com/v1/chat/completions"
+            ).mock(side_effect=slow_llm_api)
+            contents = await asyncio.wait_for(
+                asyncio.gather(*[make_request() for _ in range(5)]), timeout=30
+            )
+
+        assert contents == ["Hello!"] * 5
+        assert llm_api_route.call_count == 1
+    finally:
+        litellm.cache = None
+
+
+@pytest.mark.asyncio
+async def test_request_coalescing_releases_on_failure():
+    """
+    If the leader fails, waiting requests should call the LLM API themselves instead of waiting for the timeout
+    """
+    litellm.cache = Cache(request_coalescing=True, request_coalescing_timeout=30)
+    try:
+        messages = [{"role": "user", "content": f"Unique message {uuid.uuid4()}"}]
+        failing_request = litellm.acompletion(
+            model="gpt-3.5-turbo",
+            messages=messages,
+            mock_response=Exception("this is an error"),
+            mock_delay=0.5,
+        )
+        succeeding_request = litellm.acompletion(
+            model="gpt-3.5-turbo",
+            messages=messages,
+            mock_response="Hello, how can I help you today?",
+        )
+        start_time = time.time()
+        results = await asyncio.gather(
+            failing_request, succeeding_request, return_exceptions=True
+        )
+
+        assert isinstance(results[0], Exception)
+        assert (
+            results[1].choices[0].message.content == "Hello, how can I help you today?"
+        )
+        assert time.time() - start_time < 10
+    finally:
+        litellm.cache = None
+
+
+@pytest.mark.asyncio
+async def test_request_coalescer_redis_lock():
+    """
+    If another instance holds the redis lock, wait for it to be released instead of calling the LLM API
+    """
+    from litellm.caching.request_coalescer import RequestCoalescer
+
+    redis_cache = MagicMock()
+    redis_cache.async_set_cache = AsyncMock(side_effect=[True, None])
+    # lock is released after 2 polls
+    redis_cache.async_get_cache = AsyncMock(side_effect=["1", "1", None])
+    redis_cache.async_delete_cache = AsyncMock()
+    coalescer = RequestCoalescer(redis_cache=redis_cache, poll_interval=0.01)
+
+    assert await coalescer.async_acquire("cache-key-1") is True
+    await coalescer.async_release("cache-key-1")
+    redis_cache.async_delete_cache.assert_called_once()
+
+    assert await coalescer.async_acquire("cache-key-2") is False
+    assert redis_cache.async_get_cache.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_request_coalescing_releases_abandoned_stream():
+    """
+    If the leader's stream is dropped before it completes, waiting requests should not wait for the timeout
+    """
+    import gc
+    import json
+
+    import httpx
+    import respx
+
+    litellm.cache = Cache(request_coalescing=True, request_coalescing_timeout=30)
+    try:
+        messages = [{"role": "user", "content": f"Unique message {uuid.uuid4()}"}]
+        chunk = {
+            "id": "chatcmpl-123",
+            "object": "chat.completion.chunk",
+            "created": 1,
+            "model": "gpt-3.5-turbo",
+        }
+        stream_body = "".join(
+            f"data: {json.dumps(event)}\n\n"
+            for event in [
+                {
+                    **chunk,
+                    "choices": [
+                        {
+                            "index": 0,
+                            "delta": {"role": "assistant", "content": "Hello!"},
+                            "finish_reason": None,
+                        }
+                    ],
+                },
+                {
+                    **chunk,
+                    "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+                },
+            ]
+        )
+
+        async def slow_llm_api(request):
+            await asyncio.sleep(0.5)
+            return httpx.Response(
+                200,
+                content=stream_body + "data: [DONE]\n\n",
+                headers={"content-type": "text/event-stream"},
+            )
+
+        async def abandoning_request():
+            response = await litellm.acompletion(
+                model="gpt-3.5-turbo", messages=messages, api_key="sk-1234", stream=True
+            )
+            await response.__anext__()
+            del response
+            gc.collect()
+
+        async def waiting_request():
+            await asyncio.sleep(0.1)
+            response = await litellm.acompletion(
+                model="gpt-3.5-turbo", messages=messages, api_key="sk-1234", stream=True
+            )
+            content = ""
+            async for chunk in response:
+                content += chunk.choices[0].delta.content or ""
+            return content
+
+        with respx.mock(assert_all_called=False) as respx_mock:
+            respx_mock.post("https://api.openai.com/v1/chat/completions").mock(
+                side_effect=slow_llm_api
+            )
+            start_time = time.time()
+            _, content = await asyncio.wait_for(
+                asyncio.gather(abandoning_request(), waiting_request()), timeout=30
+            )
+
+        assert content == "Hello!"
+        assert time.time() - start_time < 10
+    finally:
+        litellm.cache = None
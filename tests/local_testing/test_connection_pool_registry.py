@@ -0,0 +1,204 @@
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+import litellm
+from litellm.llms.custom_httpx.connection_pool_registry import ConnectionPoolRegistry
+from litellm.llms.custom_httpx.http_handler import get_async_httpx_client
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def api_base():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:{}".format(server.server_address[1])
+    server.shutdown()
+
+
+def test_connection_pools_are_shared_per_key():
+    registry = ConnectionPoolRegistry()
+    client_1 = registry.get_async_client(
+        llm_provider="openai", api_base="https://api.openai.com/v1"
+    )
+    client_2 = registry.get_async_client(
+        llm_provider="openai", api_base="https://api.openai.com/v1/chat"
+    )
+    client_3 = registry.get_async_client(
+        llm_provider="openai", api_base="https://my-endpoint.com/v1"
+    )
+
+    assert client_1 is not client_2
+    assert client_1._transport._pool is client_2._transport._pool
+    assert client_1._transport._pool is not client_3._transport._pool
+    metrics = registry.get_metrics()
+    assert [(m["api_base"], m["clients"]) for m in metrics] == [
+        ("https://api.openai.com", 2),
+        ("https://my-endpoint.com", 1),
+    ]
+
+
+def test_connection_pool_limits_per_provider():
+    registry = ConnectionPoolRegistry()
+    litellm.connection_pool_limits = {
+        "anthropic": {"max_connections": 10, "keepalive_expiry": 30}
+    }
+    try:
+        registry.get_async_client(llm_provider="anthropic")
+        registry.get_async_client(llm_provider="openai", concurrent_limit=50)
+    finally:
+        litellm.connection_pool_limits = None
+
+    metrics = {m["llm_provider"]: m for m in registry.get_metrics()}
+    assert metrics["anthropic"]["max_connections"] == 10
+    assert metrics["openai"]["max_connections"] == 50
+    assert metrics["openai"]["max_keepalive_connections"] == 50
+
+
+@pytest.mark.asyncio
+async def test_closed_client_keeps_warm_connections(api_base):
+    registry = ConnectionPoolRegistry()
+    client = registry.get_async_client(llm_provider="openai", api_base=api_base)
+    response = await client.get(api_base)
+    assert response.text == "ok"
+    await client.aclose()
+
+    metrics = registry.get_metrics()[0]
+    assert metrics["clients"] == 0
+    assert metrics["connections"] == 1
+    assert metrics["idle_connections"] == 1
+
+    # a new client for the same key re-uses the keep-alive connection
+    new_client = registry.get_async_client(llm_provider="openai", api_base=api_base)
+    async with new_client.stream("GET", api_base) as response:
+        assert registry.get_metrics()[0]["in_flight_requests"] == 1
+        await response.aread()
+
+    metrics = registry.get_metrics()[0]
+    assert metrics["connections"] == 1
+    assert metrics["in_flight_requests"] == 0
+    assert metrics["total_requests"] == 2
+    assert metrics["max_pool_wait_time"] > 0
+
+    await registry.aclose()
+    assert registry.get_metrics() == []
+
+
+@pytest.mark.asyncio
+async def test_idle_connection_pools_are_closed(api_base):
+    registry = ConnectionPoolRegistry()
+    client = registry.get_async_client(llm_provider="openai", api_base=api_base)
+    await client.get(api_base)
+    connection_pool = client._transport.connection_pool
+    del client  # garbage collected clients release their reference
+
+    litellm.connection_pool_idle_ttl = -1
+    try:
+        registry.get_async_client(llm_provider="anthropic")
+    finally:
+        litellm.connection_pool_idle_ttl = 3600
+
+    assert [m["llm_provider"] for m in registry.get_metrics()] == ["anthropic"]
+    await asyncio_sleep_until(
+        lambda: len(connection_pool.httpcore_pool.connections) == 0
+    )
+
+
+async def asyncio_sleep_until(condition, timeout: float = 5):
+    import asyncio
+
+    for _ in range(int(timeout / 0.01)):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    assert condition()
+
+
+def test_get_async_httpx_client_reuses_pool_after_cache_expiry():
+    client = get_async_httpx_client(llm_provider=litellm.LlmProviders.ANTHROPIC)
+    litellm.in_memory_llm_clients_cache.flush_cache()
+    new_client = get_async_httpx_client(llm_provider=litellm.LlmProviders.ANTHROPIC)
+
+    assert new_client is not client
+    assert new_client.client._transport._pool is client.client._transport._pool
+
+
+@pytest.fixture
+def environment_proxies(monkeypatch):
+    for name in ["HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY"]:
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.lower(), raising=False)
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.internal:3128")
+    monkeypatch.setenv("NO_PROXY", "my-endpoint.com")
+    return "http://proxy.internal:3128"
+
+
+def _get_proxy(transport) -> str:
+    return transport.connection_pool.key[3]
+
+
+def test_environment_proxy_is_used_for_api_base(environment_proxies):
+    import httpx
+
+    registry = ConnectionPoolRegistry()
+    proxied_client = registry.get_async_client(
+        llm_provider="openai", api_base="https://api.openai.com/v1"
+    )
+    no_proxy_client = registry.get_sync_client(
+        llm_provider="openai", api_base="https://my-endpoint.com/v1"
+    )
+    trust_env_false_client = registry.get_async_client(
+        llm_provider="openai", api_base="https://api.openai.com/v1", trust_env=False
+    )
+
+    proxied_transport = proxied_client._transport_for_url(
+        httpx.URL("https://api.openai.com/v1/chat/completions")
+    )
+    assert _get_proxy(proxied_transport) == environment_proxies
+    assert type(proxied_transport._pool).__name__ == "AsyncHTTPProxy"
+    assert _get_proxy(no_proxy_client._transport) is None
+    assert _get_proxy(trust_env_false_client._transport) is None
+
+
+def test_environment_proxies_are_mounted_without_api_base(environment_proxies):
+    import httpx
+
+    registry = ConnectionPoolRegistry()
+    client = registry.get_async_client(llm_provider="openai")
+
+    proxied_transport = client._transport_for_url(
+        httpx.URL("https://api.openai.com/v1/chat/completions")
+    )
+    assert _get_proxy(proxied_transport) == environment_proxies
+    assert (
+        client._transport_for_url(httpx.URL("https://my-endpoint.com/v1"))
+        is client._transport
+    )
+    local_transport = client._transport_for_url(httpx.URL("http://localhost:4000"))
+    assert local_transport is client._transport
+    # the proxied pool is shared too
+    other_client = registry.get_async_client(llm_provider="openai")
+    assert (
+        other_client._transport_for_url(httpx.URL("https://api.openai.com"))._pool
+        is proxied_transport._pool
+    )
@@ -28,3 +28,97 @@ async def test_azure_kms():
         litellm._key_management_system = KeyManagementSystem.AZURE_KEY_VAULT
         secret = get_secret(secret_name="ishaan-test-key")
         assert secret == "mocked_secret_value"
+
+
+class CountingSecretClient:
+    """
+    Fake Azure Key Vault client, counts calls to the secret manager
+    """
+
+    def __init__(self, delay: float = 0):
+        self.calls = 0
+        self.delay = delay
+
+    def get_secret(self, secret_name):
+        import time
+
+        self.calls += 1
+        time.sleep(self.delay)
+        return Mock(value="secret-value-{}".format(self.calls))
+
+
+@pytest.fixture
+def counting_secret_client():
+    from litellm.secret_managers.secret_cache import secret_cache
+
+    client = CountingSecretClient(delay=0.1)
+    secret_cache.flush_cache()
+    litellm._key_management_system = KeyManagementSystem.AZURE_KEY_VAULT
+    with patch("litellm.secret_manager_client", new=client):
+        yield client
+    litellm._key_management_system = None
+    litellm.secret_manager_cache_ttl = None
+    secret_cache.flush_cache()
+
+
+def test_get_secret_cached(counting_secret_client):
+    from litellm.secret_managers.secret_cache import secret_cache
+
+    for _ in range(3):
+        assert get_secret("os.environ/my-secret") == "secret-value-1"
+    assert counting_secret_client.calls == 1
+
+    metrics = secret_cache.get_metrics()
+    assert metrics == [
+        {
+            "source": "azure_key_vault",
+            "cached_secrets": 1,
+            "hits": 2,
+            "misses": 1,
+            "fetches": 1,
+            "background_refreshes": 0,
+            "errors": 0,
+        }
+    ]
+
+    # secrets read with another client are not re-used
+    with patch("litellm.secret_manager_client", new=CountingSecretClient()):
+        assert get_secret("my-secret") == "secret-value-1"
+    assert counting_secret_client.calls == 1
+
+
+def test_get_secret_cache_ttl_disabled(counting_secret_client):
+    litellm.secret_manager_cache_ttl = {"azure_key_vault": 0}
+    get_secret("my-secret")
+    get_secret("my-secret")
+    assert counting_secret_client.calls == 2
+
+
+def test_get_secret_background_refresh(counting_secret_client):
+    import time
+
+    from litellm.secret_managers.secret_cache import secret_cache
+
+    assert get_secret("my-secret") == "secret-value-1"
+    # secret is close to expiring - the cached value is returned, and refreshed in the background
+    secret_cache._entries[("azure_key_vault", "my-secret")].refresh_at = 0
+    assert get_secret("my-secret") == "secret-value-1"
+    assert get_secret("my-secret") == "secret-value-1"
+
+    for _ in range(50):
+        if get_secret("my-secret") == "secret-value-2":
+            break
+        time.sleep(0.05)
+    assert get_secret("my-secret") == "secret-value-2"
+    assert counting_secret_client.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_async_get_secret_single_flight(counting_secret_client):
+    import asyncio
+
+    from litellm.secret_managers.main import async_get_secret
+
+    secrets = await asyncio.gather(*[async_get_secret("my-secret") for _ in range(10)])
+    assert secrets == ["secret-value-1"] * 10
+    assert counting_secret_client.calls == 1
@@ -11,6 +11,7 @@ sys.path.insert(
     0, os.path.abspath("../..")
 )  # Adds the parent directory to the system path
 import asyncio
+import time
 
 import litellm
 
@@ -151,3 +152,167 @@ async def test_cohere_rerank_health_check():
     assert "error" not in response
 
     print(response)
+
+
+def _health_check_model_list(num_deployments: int):
+    return [
+        {
+            "model_name": "gpt-3.5-turbo",
+            "litellm_params": {"model": "openai/gpt-3.5-turbo-{}".format(i)},
+            "model_info": {"id": "deployment-{}".format(i)},
+        }
+        for i in range(num_deployments)
+    ]
+
+
+class _InMemoryRedisCache:
+    """
+    Stand-in for the shared redis cache, for multiple proxy instances in 1 test
+    """
+
+    def __init__(self):
+        self.cache = {}
+
+    async def async_set_cache(self, key, value, nx=False, **kwargs):
+        if nx and key in self.cache:
+            return False
+        self.cache[key] = value
+        return True
+
+    async def async_get_cache(self, key, **kwargs):
+        return self.cache.get(key)
+
+
+@pytest.mark.asyncio
+async def test_perform_health_check_max_concurrency_and_timeout():
+    from unittest.mock import patch
+
+    from litellm.proxy.health_check import perform_health_check
+
+    running = 0
+    max_running = 0
+
+    async def _ahealth_check(model_params, **kwargs):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        try:
+            if model_params["model"].endswith("-0"):
+                await asyncio.sleep(5)
+            await asyncio.sleep(0.01)
+            return {}
+        finally:
+            running -= 1
+
+    with patch.object(litellm, "ahealth_check", new=_ahealth_check):
+        healthy_endpoints, unhealthy_endpoints = await perform_health_check(
+            model_list=_health_check_model_list(10), max_concurrency=2, timeout=0.5
+        )
+
+    assert max_running == 2
+    assert len(healthy_endpoints) == 9
+    assert len(unhealthy_endpoints) == 1
+    assert "timed out" in unhealthy_endpoints[0]["error"]
+
+
+@pytest.mark.asyncio
+async def test_background_health_checks_are_staggered():
+    from unittest.mock import patch
+
+    from litellm.proxy.health_check import BackgroundHealthCheckScheduler
+
+    check_times = []
+
+    async def _ahealth_check(model_params, **kwargs):
+        check_times.append(time.monotonic())
+        return {}
+
+    health_check_results = {}
+    scheduler = BackgroundHealthCheckScheduler(
+        model_list=_health_check_model_list(5), health_check_interval=0.5
+    )
+    with patch.object(litellm, "ahealth_check", new=_ahealth_check):
+        await scheduler.run_once(health_check_results=health_check_results)
+
+    assert len(check_times) == 5
+    # 1 check every interval / num deployments
+    for previous, current in zip(check_times, check_times[1:]):
+        assert current - previous >= 0.08
+    assert health_check_results["healthy_count"] == 5
+    assert health_check_results["unhealthy_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_background_health_checks_shared_across_instances():
+    """
+    Only 1 proxy instance runs the health check for a deployment, the others use its published result
+    """
+    from unittest.mock import patch
+
+    from litellm.proxy.health_check import BackgroundHealthCheckScheduler
+
+    checked_models = []
+
+    async def _ahealth_check(model_params, **kwargs):
+        checked_models.append(model_params["model"])
+        if model_params["model"].endswith("-1"):
+            return {"error": "invalid api key"}
+        return {}
+
+    redis_cache = _InMemoryRedisCache()
+    schedulers = [
+        BackgroundHealthCheckScheduler(
+            model_list=_health_check_model_list(3),
+            health_check_interval=0.1,
+            redis_cache=redis_cache,
+        )
+        for _ in range(3)
+    ]
+    with patch.object(litellm, "ahealth_check", new=_ahealth_check):
+        for scheduler in schedulers:
+            await scheduler.run_once()
+
+    assert sorted(checked_models) == [
+        "openai/gpt-3.5-turbo-0",
+        "openai/gpt-3.5-turbo-1",
+        "openai/gpt-3.5-turbo-2",
+    ]
+    for scheduler in schedulers:
+        results = scheduler.get_health_check_results()
+        assert results["healthy_count"] == 2
+        assert results["unhealthy_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_background_health_check_cooldown_unhealthy_deployments():
+    from unittest.mock import patch
+
+    from litellm.proxy.health_check import BackgroundHealthCheckScheduler
+
+    model_list = _health_check_model_list(2)
+    for model in model_list:
+        model["litellm_params"]["api_key"] = "my-fake-key"
+    router = litellm.Router(model_list=model_list)
+
+    async def _ahealth_check(model_params, **kwargs):
+        if model_params["model"].endswith("-1"):
+            return {"error": "invalid api key"}
+        return {}
+
+    scheduler = BackgroundHealthCheckScheduler(
+        model_list=model_list,
+        health_check_interval=0.1,
+        llm_router=router,
+        cooldown_unhealthy_deployments=True,
+    )
+    with patch.object(litellm, "ahealth_check", new=_ahealth_check):
+        await scheduler.run_once()
+
+    from litellm.router_utils.cooldown_handlers import (
+        _async_get_cooldown_deployments,
+    )
+
+    cooldown_deployments = await _async_get_cooldown_deployments(
+        litellm_router_instance=router, parent_otel_span=None
+    )
+    assert cooldown_deployments == ["deployment-1"]
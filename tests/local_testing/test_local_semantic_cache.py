@@ -0,0 +1,193 @@
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+import pytest
+
+import litellm
+from litellm.caching.caching import Cache, LiteLLMCacheType
+from litellm.caching.local_semantic_cache import LocalSemanticCache
+
+PROMPT_EMBEDDINGS = {
+    "what is the capital of france?": [1.0, 0.0, 0.0],
+    "what's the capital of france?": [0.99, 0.1, 0.0],
+    "write a poem about the sea": [0.0, 1.0, 0.0],
+    "how do i bake bread?": [0.0, 0.0, 1.0],
+}
+
+
+def _embedding_response(input, **kwargs):
+    return {"data": [{"embedding": PROMPT_EMBEDDINGS[input]}]}
+
+
+def _messages(prompt: str):
+    return [{"role": "user", "content": prompt}]
+
+
+@pytest.mark.asyncio
+async def test_local_semantic_cache_hit_and_miss():
+    cache = LocalSemanticCache(similarity_threshold=0.95)
+    with patch.object(
+        litellm, "aembedding", new=AsyncMock(side_effect=_embedding_response)
+    ):
+        messages = _messages("what is the capital of france?")
+        assert await cache.async_get_cache("key-1", messages=messages) is None
+        await cache.async_set_cache("key-1", "Paris", messages=messages)
+
+        metadata = {}
+        assert (
+            await cache.async_get_cache(
+                "key-2",
+                messages=_messages("what's the capital of france?"),
+                metadata=metadata,
+            )
+            == "Paris"
+        )
+        assert metadata["semantic-similarity"] > 0.95
+        assert (
+            await cache.async_get_cache(
+                "key-3", messages=_messages("write a poem about the sea")
+            )
+            is None
+        )
+
+
+@pytest.mark.asyncio
+async def test_local_semantic_cache_reuses_lookup_embedding():
+    """
+    A cache miss + storing the response should only cost 1 embedding call
+    """
+    cache = LocalSemanticCache(similarity_threshold=0.95)
+    mock_aembedding = AsyncMock(side_effect=_embedding_response)
+    with patch.object(litellm, "aembedding", new=mock_aembedding):
+        messages = _messages("how do i bake bread?")
+        assert await cache.async_get_cache("key-1", messages=messages) is None
+        await cache.async_set_cache("key-1", "knead it", messages=messages)
+
+    assert mock_aembedding.call_count == 1
+
+
+def test_local_semantic_cache_evicts_least_recently_used():
+    cache = LocalSemanticCache(similarity_threshold=0.95, max_size=2)
+    with patch.object(
+        litellm, "embedding", new=MagicMock(side_effect=_embedding_response)
+    ):
+        cache.set_cache(
+            "key-1", "Paris", messages=_messages("what is the capital of france?")
+        )
+        cache.set_cache(
+            "key-2", "waves", messages=_messages("write a poem about the sea")
+        )
+        # use the first entry, so the second one is the least recently used
+        assert (
+            cache.get_cache(
+                "key-1", messages=_messages("what is the capital of france?")
+            )
+            == "Paris"
+        )
+        cache.set_cache("key-3", "knead it", messages=_messages("how do i bake bread?"))
+
+        assert (
+            cache.get_cache("key-2", messages=_messages("write a poem about the sea"))
+            is None
+        )
+        assert (
+            cache.get_cache(
+                "key-1", messages=_messages("what is the capital of france?")
+            )
+            == "Paris"
+        )
+        assert (
+            cache.get_cache("key-3", messages=_messages("how do i bake bread?"))
+            == "knead it"
+        )
+
+
+def test_local_semantic_cache_ttl():
+    cache = LocalSemanticCache(similarity_threshold=0.95)
+    with patch.object(
+        litellm, "embedding", new=MagicMock(side_effect=_embedding_response)
+    ):
+        messages = _messages("what is the capital of france?")
+        cache.set_cache("key-1", "Paris", messages=messages, ttl=-1)
+        assert cache.get_cache("key-1", messages=messages) is None
+
+
+def test_local_semantic_cache_persistence(tmp_path):
+    with patch.object(
+        litellm, "embedding", new=MagicMock(side_effect=_embedding_response)
+    ):
+        cache = LocalSemanticCache(similarity_threshold=0.95, persist_dir=str(tmp_path))
+        cache.set_cache(
+            "key-1",
+            {"timestamp": 1, "response": "Paris"},
+            messages=_messages("what is the capital of france?"),
+        )
+
+        reloaded_cache = LocalSemanticCache(
+            similarity_threshold=0.95, persist_dir=str(tmp_path)
+        )
+        assert reloaded_cache.get_cache(
+            "key-2", messages=_messages("what's the capital of france?")
+        ) == {"timestamp": 1, "response": "Paris"}
+
+
+def test_local_semantic_cache_compacts_payloads_file(tmp_path):
+    """
+    Overwritten lines in the payloads file are dropped once there are more than 2 * max_size of them
+    """
+    with patch.object(
+        litellm, "embedding", new=MagicMock(side_effect=_embedding_response)
+    ):
+        cache = LocalSemanticCache(
+            similarity_threshold=0.95, max_size=2, persist_dir=str(tmp_path)
+        )
+        for i in range(20):
+            cache.set_cache(
+                f"key-{i}",
+                f"response-{i}",
+                messages=_messages("what is the capital of france?"),
+            )
+
+        with open(tmp_path / "payloads.jsonl") as f:
+            num_lines = len(f.readlines())
+        assert num_lines <= 3 * cache.max_size
+
+        reloaded_cache = LocalSemanticCache(
+            similarity_threshold=0.95, max_size=2, persist_dir=str(tmp_path)
+        )
+        assert sorted(
+            payload["response"] for payload in reloaded_cache._payloads  # type: ignore
+        ) == ["response-18", "response-19"]
+
+
+@pytest.mark.asyncio
+async def test_local_semantic_cache_with_litellm_cache():
+    litellm.cache = Cache(
+        type=LiteLLMCacheType.LOCAL_SEMANTIC, similarity_threshold=0.95
+    )
+    try:
+        with patch.object(
+            litellm, "aembedding", new=AsyncMock(side_effect=_embedding_response)
+        ):
+            response = await litellm.acompletion(
+                model="gpt-3.5-turbo",
+                messages=_messages("what is the capital of france?"),
+                mock_response="Paris",
+            )
+            await litellm.cache.async_add_cache(
+                response,
+                model="gpt-3.5-turbo",
+                messages=_messages("what is the capital of france?"),
+            )
+            cached_response = await litellm.cache.async_get_cache(
+                model="gpt-3.5-turbo",
+                messages=_messages("what's the capital of france?"),
+            )
+        assert cached_response["choices"][0]["message"]["content"] == "Paris"
+    finally:
+        litellm.cache = None
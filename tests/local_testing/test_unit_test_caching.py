@@ -102,6 +102,145 @@ def test_get_cache_key_embedding():
     assert cache_key_2 == cache_key_3
 
 
+def test_get_embedding_cache_keys():
+    """
+    Keys built for a list input should match the keys built for each input on its own
+    """
+    cache = Cache(namespace="test-namespace")
+    kwargs = {
+        "model": "text-embedding-3-small",
+        "input": ["Hello, world!", "Hello, world!", "How are you?"],
+        "dimensions": 1536,
+        "metadata": {"user": "test"},
+    }
+    cache_keys = cache.get_embedding_cache_keys(**kwargs)
+    assert cache_keys == [
+        cache.get_cache_key(**{**kwargs, "input": i}) for i in kwargs["input"]
+    ]
+    assert cache_keys[0] == cache_keys[1]
+    assert cache_keys[0] != cache_keys[2]
+    assert cache_keys[0].startswith("test-namespace:")
+
+
+@pytest.mark.asyncio
+async def test_async_batch_get_cache_embedding_partial_hit():
+    cache = Cache()
+    kwargs = {
+        "model": "text-embedding-3-small",
+        "input": ["cached input", "new input"],
+    }
+    cache.add_cache(
+        Embedding(embedding=[0.1, 0.2], index=0, object="embedding"),
+        **{**kwargs, "input": "cached input"},
+    )
+
+    cached_results = await cache.async_batch_get_cache(
+        cache_keys=cache.get_embedding_cache_keys(**kwargs), **kwargs
+    )
+    assert cached_results[0]["embedding"] == [0.1, 0.2]
+    assert cached_results[1] is None
+
+
+@pytest.mark.asyncio
+async def test_async_batch_get_cache_uses_single_redis_mget():
+    from litellm.caching.redis_cache import RedisCache
+
+    cache = Cache(type=LiteLLMCacheType.REDIS, host="localhost", port=6379)
+    kwargs = {
+        "model": "text-embedding-3-small",
+        "input": [f"input-{i}" for i in range(100)],
+    }
+    cache_keys = cache.get_embedding_cache_keys(**kwargs)
+    with patch.object(
+        RedisCache,
+        "async_batch_get_cache",
+        new=AsyncMock(
+            return_value={
+                cache_keys[0]: {
+                    "timestamp": time.time(),
+                    "response": '{"embedding": [0.1]}',
+                }
+            }
+        ),
+    ) as mock_batch_get, patch.object(
+        RedisCache, "async_get_cache", new=AsyncMock()
+    ) as mock_get:
+        cached_results = await cache.async_batch_get_cache(
+            cache_keys=cache_keys, **kwargs
+        )
+
+    mock_batch_get.assert_called_once()
+    mock_get.assert_not_called()
+    assert cached_results[0] == {"embedding": [0.1]}
+    assert all(result is None for result in cached_results[1:])
+
+
+@pytest.mark.parametrize("compression_threshold_bytes", [None, 10])
+def test_binary_cache_serialization(compression_threshold_bytes):
+    from litellm.caching.cache_serialization import is_cache_envelope
+
+    cache = Cache(
+        serialization_format="binary",
+        compression_threshold_bytes=compression_threshold_bytes,
+    )
+    kwargs = {
+        "model": "gpt-3.5-turbo",
+        "messages": [{"role": "user", "content": "Hello, world!"}],
+    }
+    response = ModelResponse(
+        choices=[
+            litellm.Choices(message=litellm.Message(role="assistant", content="Hi!"))
+        ]
+    )
+    cache.add_cache(response, **kwargs)
+
+    stored_value = cache.cache.cache_dict[cache.get_cache_key(**kwargs)]
+    assert is_cache_envelope(stored_value)
+    cached_response = cache.get_cache(**kwargs)
+    assert cached_response["id"] == response.id
+    assert cached_response["choices"][0]["message"]["content"] == "Hi!"
+
+
+def test_binary_cache_serialization_packs_embeddings():
+    cache = Cache(serialization_format="binary")
+    kwargs = {"model": "text-embedding-3-small", "input": "Hello, world!"}
+    embedding = [0.1, -0.25, 3.5] * 512
+    cache.add_cache(
+        EmbeddingResponse(
+            data=[Embedding(embedding=embedding, index=0, object="embedding")]
+        ),
+        **kwargs,
+    )
+
+    stored_value = cache.cache.cache_dict[cache.get_cache_key(**kwargs)]
+    # 4 bytes per float, instead of a json list of floats
+    assert len(stored_value) < len(embedding) * 4 + 500
+    cached_response = cache.get_cache(**kwargs)
+    assert cached_response["data"][0]["embedding"] == pytest.approx(embedding)
+
+
+def test_binary_cache_serialization_reads_json_entries():
+    """
+    Entries written in the json format are still readable after switching to the binary format
+    """
+    json_cache = Cache()
+    kwargs = {
+        "model": "gpt-3.5-turbo",
+        "messages": [{"role": "user", "content": "Hello, world!"}],
+    }
+    response = ModelResponse(
+        choices=[
+            litellm.Choices(message=litellm.Message(role="assistant", content="Hi!"))
+        ]
+    )
+    json_cache.add_cache(response, **kwargs)
+
+    binary_cache = Cache(serialization_format="binary")
+    binary_cache.cache = json_cache.cache
+    cached_response = binary_cache.get_cache(**kwargs)
+    assert cached_response["id"] == response.id
+
+
 def test_get_cache_key_text_completion():
     cache = Cache()
     kwargs = {
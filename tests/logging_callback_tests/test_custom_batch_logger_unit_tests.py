@@ -0,0 +1,290 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import asyncio
+import gzip
+import json
+import threading
+from datetime import datetime
+
+import httpx
+import pytest
+
+import litellm
+from litellm.integrations.custom_batch_logger import (
+    CustomBatchLogger,
+    encode_batch_payload,
+)
+
+
+@pytest.mark.parametrize("json_backend", ["json", "orjson"])
+def test_encode_batch_payload(json_backend):
+    data = [{"message": "hello", "count": 1}, {"message": "world", "count": 2}]
+
+    encoded = encode_batch_payload(data, json_backend=json_backend)
+    assert json.loads(encoded) == data
+
+    compressed = encode_batch_payload(
+        data, json_backend=json_backend, compression="gzip"
+    )
+    assert json.loads(gzip.decompress(compressed)) == data
+
+
+def test_encode_batch_payload_default():
+    now = datetime.now()
+    encoded = encode_batch_payload({"time": now}, default=str)
+    assert json.loads(encoded) == {"time": str(now)}
+
+
+@pytest.mark.asyncio
+async def test_async_encode_payload_runs_off_event_loop():
+    """
+    Encoding should happen on the shared encode thread pool, not the event loop thread
+    """
+    encode_threads = []
+
+    def _default(obj):
+        encode_threads.append(threading.current_thread().name)
+        return str(obj)
+
+    logger = CustomBatchLogger(flush_lock=asyncio.Lock())
+    encoded = await logger.async_encode_payload(
+        [{"time": datetime.now()}], compression="gzip", default=_default
+    )
+
+    assert len(json.loads(gzip.decompress(encoded))) == 1
+    assert encode_threads[0].startswith("litellm-batch-encode")
+    assert encode_threads[0] != threading.current_thread().name
+
+
+@pytest.mark.parametrize(
+    "overflow_policy, expected_queue",
+    [
+        ("drop_oldest", [2, 3, 4]),
+        ("drop_newest", [0, 1, 2]),
+    ],
+)
+def test_log_queue_overflow_policy(overflow_policy, expected_queue):
+    logger = CustomBatchLogger(
+        batch_size=1, max_queue_size=3, overflow_policy=overflow_policy
+    )
+    for i in range(5):
+        logger.log_queue.append(i)
+
+    assert logger.log_queue == expected_queue
+    metrics = logger.get_queue_metrics()
+    assert metrics["queue_depth"] == 3
+    assert metrics["dropped_events"] == 2
+
+
+def test_log_queue_bounded_when_reassigned_by_subclass():
+    """
+    Subclasses set `self.log_queue = []` in their __init__, the queue should stay bounded
+    """
+
+    class TestLogger(CustomBatchLogger):
+        def __init__(self, **kwargs):
+            self.log_queue = []
+            super().__init__(**kwargs)
+
+    logger = TestLogger(batch_size=1, max_queue_size=2)
+    logger.log_queue.extend([1, 2, 3])
+    assert logger.log_queue == [2, 3]
+
+
+def test_log_queue_sample_overflow_policy():
+    logger = CustomBatchLogger(
+        batch_size=1, max_queue_size=10, overflow_policy="sample"
+    )
+    for i in range(1000):
+        logger.log_queue.append(i)
+
+    assert len(logger.log_queue) == 10
+    assert logger.get_queue_metrics()["dropped_events"] == 990
+    # later events should have a chance of replacing early ones
+    assert any(item >= 10 for item in logger.log_queue)
+
+
+@pytest.mark.asyncio
+async def test_log_queue_spill_to_disk():
+    sent_batches = []
+
+    class TestLogger(CustomBatchLogger):
+        async def async_send_batch(self):
+            sent_batches.append(list(self.log_queue))
+
+    logger = TestLogger(
+        flush_lock=asyncio.Lock(),
+        batch_size=2,
+        max_queue_size=2,
+        overflow_policy="spill_to_disk",
+    )
+    for i in range(5):
+        logger.log_queue.append({"event": i})
+
+    assert len(logger.log_queue) == 2
+    assert logger.get_queue_metrics()["spilled_events"] == 3
+
+    for _ in range(3):
+        await logger.flush_queue()
+
+    assert sent_batches == [
+        [{"event": 0}, {"event": 1}],
+        [{"event": 2}, {"event": 3}],
+        [{"event": 4}],
+    ]
+    assert logger.get_queue_metrics()["spilled_events"] == 3
+    assert not os.path.exists(logger._get_spill_file_path())
+
+
+@pytest.mark.asyncio
+async def test_flush_queue_retries_failed_batches(monkeypatch):
+    monkeypatch.setattr(
+        "litellm.integrations.custom_batch_logger.DEFAULT_FLUSH_RETRY_BASE_BACKOFF_SECONDS",
+        0.01,
+    )
+    attempts = []
+
+    class TestLogger(CustomBatchLogger):
+        async def async_send_batch(self):
+            attempts.append(len(self.log_queue))
+            if len(attempts) < 3:
+                raise Exception("logging backend is down")
+
+    logger = TestLogger(flush_lock=asyncio.Lock(), max_flush_retries=2)
+    logger.log_queue.append({"event": 1})
+    await logger.flush_queue()
+
+    assert attempts == [1, 1, 1]
+    assert logger.log_queue == []
+    metrics = logger.get_queue_metrics()
+    assert metrics["failed_flushes"] == 0
+    assert metrics["total_flushes"] == 1
+    assert metrics["last_flush_latency_seconds"] is not None
+
+
+@pytest.mark.asyncio
+async def test_flush_queue_drops_batch_after_retries_exhausted():
+    class TestLogger(CustomBatchLogger):
+        async def async_send_batch(self):
+            raise Exception("logging backend is down")
+
+    logger = TestLogger(flush_lock=asyncio.Lock(), max_flush_retries=0)
+    logger.log_queue.extend([1, 2])
+    await logger.flush_queue()
+
+    assert logger.log_queue == []
+    metrics = logger.get_queue_metrics()
+    assert metrics["failed_flushes"] == 1
+    assert metrics["dropped_events"] == 2
+
+
+@pytest.mark.asyncio
+async def test_flush_queue_does_not_retry_client_errors():
+    """
+    4xx responses other than 408 / 429 would fail again, so the batch is dropped without retrying
+    """
+    request = httpx.Request("POST", "https://logging-backend.example.com")
+    attempts = []
+
+    class TestLogger(CustomBatchLogger):
+        async def async_send_batch(self):
+            attempts.append(len(self.log_queue))
+            raise httpx.HTTPStatusError(
+                "bad request",
+                request=request,
+                response=httpx.Response(400, request=request),
+            )
+
+    logger = TestLogger(flush_lock=asyncio.Lock(), max_flush_retries=2)
+    logger.log_queue.append({"event": 1})
+    await logger.flush_queue()
+
+    assert attempts == [1]
+    assert logger.get_queue_metrics()["failed_flushes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_flush_queue_max_in_flight_flushes():
+    send_started = asyncio.Event()
+    release_send = asyncio.Event()
+
+    class TestLogger(CustomBatchLogger):
+        async def async_send_batch(self):
+            send_started.set()
+            await release_send.wait()
+
+    logger = TestLogger(flush_lock=asyncio.Lock(), max_in_flight_flushes=1)
+    logger.log_queue.append(1)
+    first_flush = asyncio.create_task(logger.flush_queue())
+    await send_started.wait()
+
+    # events queued while a flush is in flight are kept for the next flush
+    logger.log_queue.append(2)
+    await logger.flush_queue()
+    assert logger.get_queue_metrics()["skipped_flushes"] == 1
+
+    release_send.set()
+    await first_flush
+    assert logger.log_queue == [2]
+
+
+@pytest.mark.asyncio
+async def test_flush_queue_retries_only_the_flushed_batch(monkeypatch):
+    """
+    Events queued during a retry backoff are sent once, by the next flush
+    """
+    monkeypatch.setattr(
+        "litellm.integrations.custom_batch_logger.DEFAULT_FLUSH_RETRY_BASE_BACKOFF_SECONDS",
+        0.01,
+    )
+    sent_events = []
+    attempts = []
+
+    class TestLogger(CustomBatchLogger):
+        async def async_send_batch(self):
+            attempts.append(list(self.log_queue))
+            if len(attempts) == 1:
+                for i in range(3, 6):
+                    self.log_queue.append(i)
+                raise Exception("logging backend is down")
+            sent_events.extend(self.log_queue)
+
+    logger = TestLogger(flush_lock=asyncio.Lock(), max_flush_retries=1)
+    logger.log_queue.extend([0, 1, 2])
+    await logger.flush_queue()
+    assert logger.log_queue == [3, 4, 5]
+    await logger.flush_queue()
+
+    assert attempts[:2] == [[0, 1, 2], [0, 1, 2]]
+    assert sent_events == [0, 1, 2, 3, 4, 5]
+    assert logger.log_queue == []
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_during_flush_keeps_the_flushed_batch():
+    send_started = asyncio.Event()
+    release_send = asyncio.Event()
+    sent_batches = []
+
+    class TestLogger(CustomBatchLogger):
+        async def async_send_batch(self):
+            send_started.set()
+            await release_send.wait()
+            sent_batches.append(list(self.log_queue))
+
+    logger = TestLogger(flush_lock=asyncio.Lock(), batch_size=1, max_queue_size=2)
+    logger.log_queue.extend([0, 1])
+    flush = asyncio.create_task(logger.flush_queue())
+    await send_started.wait()
+
+    for i in range(2, 5):
+        logger.log_queue.append(i)
+    release_send.set()
+    await flush
+
+    assert sent_batches == [[0, 1]]
+    assert logger.log_queue == [3, 4]
+    assert logger.get_queue_metrics()["dropped_events"] == 1
@@ -201,6 +201,44 @@ async def test_async_send_batch():
     call_args = logger.async_httpx_client.post.call_args
     assert "runs/batch" in call_args[1]["url"]
     assert "x-api-key" in call_args[1]["headers"]
+    assert json.loads(call_args[1]["data"]) == {"post": [{"test": "data"}]}
+
+
+@pytest.mark.asyncio
+async def test_flush_queue_retries_failed_langsmith_batch(monkeypatch):
+    """
+    A failed POST to /runs/batch is raised, so the batch is retried instead of being dropped
+    """
+    import httpx
+
+    monkeypatch.setattr(
+        "litellm.integrations.custom_batch_logger.DEFAULT_FLUSH_RETRY_BASE_BACKOFF_SECONDS",
+        0.01,
+    )
+    logger = LangsmithLogger(langsmith_api_key="test-key")
+    logger.max_flush_retries = 2
+
+    request = httpx.Request("POST", "https://api.smith.langchain.com/runs/batch")
+    logger.async_httpx_client = AsyncMock()
+    logger.async_httpx_client.post.side_effect = [
+        httpx.HTTPStatusError(
+            "service unavailable",
+            request=request,
+            response=httpx.Response(503, request=request),
+        ),
+        httpx.Response(200, request=request),
+    ]
+
+    logger.log_queue.append(
+        LangsmithQueueObject(
+            data={"test": "data"}, credentials=logger.default_credentials
+        )
+    )
+    await logger.flush_queue()
+
+    assert logger.async_httpx_client.post.call_count == 2
+    assert logger.log_queue == []
+    assert logger.get_queue_metrics()["failed_flushes"] == 0
 
 
 @pytest.mark.asyncio
@@ -245,7 +283,7 @@ async def test_langsmith_key_based_logging(mocker):
         assert call_args[1]["headers"]["x-api-key"] == "fake_key_project2"
 
         # Verify the request body contains the expected data
-        request_body = call_args[1]["json"]
+        request_body = json.loads(call_args[1]["data"])
         assert "post" in request_body
         assert len(request_body["post"]) == 1  # Should contain one run
 
@@ -293,7 +331,7 @@ async def test_langsmith_key_based_logging(mocker):
         }
 
         # Print both bodies for debugging
-        actual_body = call_args[1]["json"]
+        actual_body = json.loads(call_args[1]["data"])
         print("\nExpected body:")
         print(json.dumps(expected_body, indent=2))
         print("\nActual body:")
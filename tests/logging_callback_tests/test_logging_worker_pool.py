@@ -0,0 +1,181 @@
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import litellm
+from litellm.integrations.custom_logger import CustomLogger
+from litellm.litellm_core_utils.logging_worker_pool import (
+    LoggingWorkerPool,
+    logging_worker_pool,
+)
+
+
+def _blocked_pool(overflow_policy: str):
+    """
+    Returns a pool with 1 busy worker and a queue of size 2
+    """
+    pool = LoggingWorkerPool(
+        num_workers=1, max_queue_size=2, overflow_policy=overflow_policy
+    )
+    started = threading.Event()
+    unblock = threading.Event()
+
+    def _block():
+        started.set()
+        unblock.wait(5)
+
+    pool.submit(_block)
+    assert started.wait(5)
+    return pool, unblock
+
+
+def test_logging_worker_pool_runs_submitted_calls():
+    pool = LoggingWorkerPool(num_workers=2, max_queue_size=100)
+    results = []
+    for i in range(50):
+        assert pool.submit(results.append, i) is True
+
+    assert pool.flush(timeout=5) is True
+    assert sorted(results) == list(range(50))
+    metrics = pool.get_metrics()
+    assert metrics["workers"] == 2
+    assert metrics["submitted"] == 50
+    assert metrics["completed"] == 50
+    assert metrics["dropped"] == 0
+
+
+def test_logging_worker_pool_failed_call_does_not_stop_worker():
+    pool = LoggingWorkerPool(num_workers=1, max_queue_size=10)
+    results = []
+
+    def _raise():
+        raise ValueError("callback failed")
+
+    pool.submit(_raise)
+    pool.submit(results.append, 1)
+
+    assert pool.flush(timeout=5) is True
+    assert results == [1]
+    assert pool.get_metrics()["failed"] == 1
+
+
+def test_logging_worker_pool_drop_newest():
+    pool, unblock = _blocked_pool(overflow_policy="drop_newest")
+    results = []
+    assert pool.submit(results.append, 1) is True
+    assert pool.submit(results.append, 2) is True
+    assert pool.submit(results.append, 3) is False
+
+    unblock.set()
+    assert pool.flush(timeout=5) is True
+    assert results == [1, 2]
+    assert pool.get_metrics()["dropped"] == 1
+
+
+def test_logging_worker_pool_drop_oldest():
+    pool, unblock = _blocked_pool(overflow_policy="drop_oldest")
+    results = []
+    for i in range(1, 5):
+        assert pool.submit(results.append, i) is True
+
+    unblock.set()
+    assert pool.flush(timeout=5) is True
+    assert results == [3, 4]
+    assert pool.get_metrics()["dropped"] == 2
+
+
+def test_logging_worker_pool_drop_oldest_keeps_no_drop_calls():
+    pool, unblock = _blocked_pool(overflow_policy="drop_oldest")
+    results = []
+    pool.submit_no_drop(results.append, "chunk-1")
+    pool.submit_no_drop(results.append, "chunk-2")
+    pool.submit_no_drop(results.append, "chunk-3")
+    assert pool.submit(results.append, 1) is False
+    pool.submit_no_drop(results.append, "chunk-4")
+
+    unblock.set()
+    assert pool.flush(timeout=5) is True
+    assert results == ["chunk-1", "chunk-2", "chunk-3", "chunk-4"]
+    assert pool.get_metrics()["dropped"] == 1
+
+
+def test_logging_worker_pool_block_does_not_block_event_loop():
+    import asyncio
+
+    pool, unblock = _blocked_pool(overflow_policy="block")
+    results = []
+
+    async def _submit():
+        for i in range(5):
+            assert pool.submit(results.append, i) is True
+
+    try:
+        asyncio.run(asyncio.wait_for(_submit(), timeout=2))
+    finally:
+        unblock.set()
+    assert pool.flush(timeout=5) is True
+    assert results == [0, 1, 2, 3, 4]
+    assert pool.get_metrics()["dropped"] == 0
+
+
+def test_logging_worker_pool_counters_are_thread_safe():
+    pool = LoggingWorkerPool(num_workers=4, max_queue_size=100_000)
+
+    def _submit():
+        for _ in range(1000):
+            pool.submit(lambda: None)
+
+    threads = [threading.Thread(target=_submit) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert pool.flush(timeout=10) is True
+    metrics = pool.get_metrics()
+    assert metrics["submitted"] == 8000
+    assert metrics["completed"] == 8000
+
+
+def test_executor_aliases():
+    from litellm import utils
+    from litellm.litellm_core_utils import streaming_handler
+
+    assert utils.executor is logging_worker_pool
+    assert streaming_handler.executor is logging_worker_pool
+
+
+def test_sync_logging_does_not_start_a_thread_per_call():
+    class SyncSuccessLogger(CustomLogger):
+        def __init__(self):
+            self.success_count = 0
+            super().__init__()
+
+        def log_success_event(self, kwargs, response_obj, start_time, end_time):
+            self.success_count += 1
+
+    custom_logger = SyncSuccessLogger()
+    litellm.callbacks = [custom_logger]
+    try:
+        litellm.completion(
+            model="gpt-3.5-turbo",
+            messages=[{"role": "user", "content": "hi"}],
+            mock_response="hello",
+        )
+        assert logging_worker_pool.flush(timeout=10)
+        thread_count = threading.active_count()
+
+        for _ in range(20):
+            litellm.completion(
+                model="gpt-3.5-turbo",
+                messages=[{"role": "user", "content": "hi"}],
+                mock_response="hello",
+            )
+        assert logging_worker_pool.flush(timeout=10)
+
+        assert custom_logger.success_count == 21
+        assert threading.active_count() == thread_count
+    finally:
+        litellm.callbacks = []
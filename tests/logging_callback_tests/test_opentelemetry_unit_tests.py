@@ -56,3 +56,85 @@ class TestOpentelemetryUnitTests(BaseLoggingCallbackTest):
         await asyncio.sleep(1)
 
         parent_otel_span.end.assert_called_once()
+
+
+def test_opentelemetry_sampler():
+    from litellm.integrations.opentelemetry_sampling import OpenTelemetrySampler
+
+    sampler = OpenTelemetrySampler(sampling_rate=0.5, slow_span_threshold_ms=1000)
+
+    # head sampling is decided on the trace id
+    assert sampler.should_export(trace_id=1) is True
+    assert sampler.should_export(trace_id=(1 << 64) - 1) is False
+
+    # tail sampling - errors and slow spans are always kept
+    assert sampler.should_export(trace_id=(1 << 64) - 1, is_error=True) is True
+    assert (
+        sampler.should_export(trace_id=(1 << 64) - 1, duration_ns=int(2 * 1e9))
+        is True
+    )
+
+    assert OpenTelemetrySampler(sampling_rate=0).should_export(trace_id=1) is False
+    assert OpenTelemetrySampler().should_export(trace_id=(1 << 64) - 1) is True
+
+
+@pytest.mark.asyncio
+async def test_opentelemetry_tail_sampling_keeps_errors():
+    """
+    With sampling_rate=0, successful requests are dropped but failed requests are exported
+    """
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    from litellm.integrations.opentelemetry import OpenTelemetry, OpenTelemetryConfig
+
+    exporter = InMemorySpanExporter()
+    # the global tracer provider can only be set once per process, use this logger's provider directly
+    with patch("opentelemetry.trace.set_tracer_provider") as mock_set_tracer_provider:
+        otel_logger = OpenTelemetry(
+            config=OpenTelemetryConfig(exporter=exporter, sampling_rate=0.0)
+        )
+    otel_logger.tracer = mock_set_tracer_provider.call_args.args[0].get_tracer(
+        "litellm"
+    )
+    litellm.callbacks = [otel_logger]
+
+    with patch.object(otel_logger, "set_attributes") as mock_set_attributes:
+        await litellm.acompletion(
+            model="gpt-3.5-turbo",
+            messages=[{"role": "user", "content": "Hello, world!"}],
+            mock_response="Hey!",
+        )
+        await asyncio.sleep(1)
+        # dropped spans don't pay for building attributes
+        mock_set_attributes.assert_not_called()
+    assert len(exporter.get_finished_spans()) == 0
+
+    with pytest.raises(Exception):
+        await litellm.acompletion(
+            model="gpt-3.5-turbo",
+            messages=[{"role": "user", "content": "Hello, world!"}],
+            mock_response=Exception("this is an error"),
+        )
+    await asyncio.sleep(1)
+    spans = exporter.get_finished_spans()
+    assert len(spans) == 1
+    assert spans[0].name == "litellm_request"
+
+
+def test_opentelemetry_max_attribute_length():
+    from litellm.integrations.opentelemetry import OpenTelemetry, OpenTelemetryConfig
+
+    otel_logger = OpenTelemetry(
+        config=OpenTelemetryConfig(exporter="console", max_attribute_length=10)
+    )
+    span = MagicMock()
+    otel_logger.safe_set_attribute(span=span, key="gen_ai.prompt", value="a" * 100)
+    otel_logger.safe_set_attribute(span=span, key="gen_ai.system", value="openai")
+
+    assert span.set_attribute.call_args_list[0].args == (
+        "gen_ai.prompt",
+        "a" * 10 + "...(truncated)",
+    )
+    assert span.set_attribute.call_args_list[1].args == ("gen_ai.system", "openai")
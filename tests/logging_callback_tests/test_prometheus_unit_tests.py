@@ -9,7 +9,7 @@ import logging
 import uuid
 
 import pytest
-from prometheus_client import REGISTRY, CollectorRegistry
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Gauge
 
 import litellm
 from litellm import completion
@@ -774,3 +774,250 @@ def test_increment_deployment_cooled_down(prometheus_logger):
         "gpt-3.5-turbo", "model-123", "https://api.openai.com", "openai", "429"
     )
     prometheus_logger.litellm_deployment_cooled_down.labels().inc.assert_called_once()
+
+
+_MULTIPROCESS_TEST_SCRIPT = """
+import multiprocessing
+import os
+
+from prometheus_client import CollectorRegistry, multiprocess
+
+from litellm.integrations.prometheus_helpers.prometheus_multiprocess import (
+    mark_prometheus_worker_dead,
+    setup_prometheus_multiproc_dir,
+)
+
+
+def worker(remaining_budget):
+    import litellm.proxy.proxy_server
+    from litellm.integrations.prometheus import PrometheusLogger
+
+    litellm.proxy.proxy_server.premium_user = True
+
+    logger = PrometheusLogger()
+    logger.litellm_requests_metric.labels(
+        "end_user", "hashed_key", "key_alias", "gpt-4o", "team", "team_alias", "user"
+    ).inc()
+    logger.litellm_remaining_team_budget_metric.labels("team", "team_alias").set(
+        remaining_budget
+    )
+
+
+if __name__ == "__main__":
+    setup_prometheus_multiproc_dir()
+    ctx = multiprocessing.get_context("fork")
+    for remaining_budget in [10, 5]:
+        p = ctx.Process(target=worker, args=(remaining_budget,))
+        p.start()
+        p.join()
+        assert p.exitcode == 0
+        if remaining_budget == 10:
+            mark_prometheus_worker_dead(p.pid)
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    print("requests", registry.get_sample_value("litellm_requests_metric_total", {
+        "end_user": "end_user", "hashed_api_key": "hashed_key", "api_key_alias": "key_alias",
+        "model": "gpt-4o", "team": "team", "team_alias": "team_alias", "user": "user",
+    }))
+    print("budget", registry.get_sample_value("litellm_remaining_team_budget_metric", {
+        "team_id": "team", "team_alias": "team_alias",
+    }))
+"""
+
+
+def test_prometheus_multiprocess_mode(tmp_path):
+    """
+    Metrics from all gunicorn workers are aggregated when PROMETHEUS_MULTIPROC_DIR is set
+
+    - counters are summed across workers
+    - remaining budget gauges report the most recent value of a live worker
+    """
+    import subprocess
+
+    script_path = tmp_path / "multiprocess_test.py"
+    script_path.write_text(_MULTIPROCESS_TEST_SCRIPT)
+    env = {
+        **os.environ,
+        "PROMETHEUS_MULTIPROC_DIR": str(tmp_path / "metrics"),
+        "PYTHONPATH": os.path.abspath("../.."),
+    }
+    result = subprocess.run(
+        [sys.executable, str(script_path)],
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    assert "requests 2.0" in result.stdout
+    assert "budget 5.0" in result.stdout
+
+
+def test_get_prometheus_metrics_asgi_app_multiprocess(tmp_path, monkeypatch):
+    from litellm.integrations.prometheus_helpers import prometheus_multiprocess
+
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    with patch("prometheus_client.multiprocess.MultiProcessCollector") as collector:
+        prometheus_multiprocess.get_prometheus_metrics_asgi_app()
+        collector.assert_called_once()
+
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR")
+    with patch("prometheus_client.multiprocess.MultiProcessCollector") as collector:
+        prometheus_multiprocess.get_prometheus_metrics_asgi_app()
+        collector.assert_not_called()
+
+
+def test_bounded_labels_metric_cardinality_limit():
+    from litellm.integrations.prometheus_helpers.prometheus_label_limiter import (
+        BoundedLabelsMetric,
+    )
+
+    registry = CollectorRegistry()
+    counter = BoundedLabelsMetric(
+        metric=Counter(
+            "test_requests", "test", labelnames=["end_user", "model"], registry=registry
+        ),
+        label_cardinality_limits={"end_user": 2},
+    )
+    for end_user in ["user-1", "user-2", "user-1", "user-3", "user-4"]:
+        counter.labels(end_user, "gpt-4o").inc()
+
+    def _value(end_user):
+        return registry.get_sample_value(
+            "test_requests_total", {"end_user": end_user, "model": "gpt-4o"}
+        )
+
+    # end users above the limit go to __other__, the existing counters keep their totals
+    assert _value("user-1") == 2
+    assert _value("user-2") == 1
+    assert _value("user-3") is None
+    assert _value("user-4") is None
+    assert _value("__other__") == 2
+
+
+def test_bounded_labels_metric_frees_label_slot_when_series_expire(monkeypatch):
+    from litellm.integrations.prometheus_helpers import prometheus_label_limiter
+    from litellm.integrations.prometheus_helpers.prometheus_label_limiter import (
+        BoundedLabelsMetric,
+    )
+
+    registry = CollectorRegistry()
+    counter = BoundedLabelsMetric(
+        metric=Counter(
+            "test_tokens", "test", labelnames=["end_user"], registry=registry
+        ),
+        label_cardinality_limits={"end_user": 1},
+        series_ttl_seconds=10,
+    )
+    counter.labels("user-1").inc(5)
+    counter.labels("user-2").inc(3)
+    assert registry.get_sample_value("test_tokens_total", {"end_user": "user-1"}) == 5
+    assert (
+        registry.get_sample_value("test_tokens_total", {"end_user": "__other__"}) == 3
+    )
+
+    # user-1's series expires, its slot is given to the next new value
+    now = time.time()
+    monkeypatch.setattr(prometheus_label_limiter.time, "time", lambda: now + 3600)
+    counter.labels("user-2").inc(1)
+    assert (
+        registry.get_sample_value("test_tokens_total", {"end_user": "user-1"}) is None
+    )
+    assert registry.get_sample_value("test_tokens_total", {"end_user": "user-2"}) == 1
+
+
+def test_bounded_labels_metric_label_profile():
+    from litellm.integrations.prometheus_helpers.prometheus_label_limiter import (
+        BoundedLabelsMetric,
+    )
+
+    registry = CollectorRegistry()
+    counter = BoundedLabelsMetric(
+        metric=Counter(
+            "test_spend", "test", labelnames=["end_user", "model"], registry=registry
+        ),
+        label_profile=["model"],
+    )
+    counter.labels(end_user="user-1", model="gpt-4o").inc(1.5)
+    counter.labels(end_user="user-2", model="gpt-4o").inc(1.5)
+
+    assert (
+        registry.get_sample_value(
+            "test_spend_total", {"end_user": "", "model": "gpt-4o"}
+        )
+        == 3.0
+    )
+
+
+def test_bounded_labels_metric_expires_series(monkeypatch):
+    from litellm.integrations.prometheus_helpers import prometheus_label_limiter
+    from litellm.integrations.prometheus_helpers.prometheus_label_limiter import (
+        BoundedLabelsMetric,
+    )
+
+    registry = CollectorRegistry()
+    gauge = BoundedLabelsMetric(
+        metric=Gauge("test_budget", "test", labelnames=["team"], registry=registry),
+        series_ttl_seconds=10,
+        max_series=2,
+    )
+
+    # least recently used series is removed above max_series
+    gauge.labels("team-1").set(1)
+    gauge.labels("team-2").set(2)
+    gauge.labels("team-3").set(3)
+    assert registry.get_sample_value("test_budget", {"team": "team-1"}) is None
+    assert registry.get_sample_value("test_budget", {"team": "team-3"}) == 3
+
+    # stale series are removed after series_ttl_seconds
+    now = time.time()
+    monkeypatch.setattr(prometheus_label_limiter.time, "time", lambda: now + 3600)
+    gauge.labels("team-4").set(4)
+    assert registry.get_sample_value("test_budget", {"team": "team-2"}) is None
+    assert registry.get_sample_value("test_budget", {"team": "team-3"}) is None
+    assert registry.get_sample_value("test_budget", {"team": "team-4"}) == 4
+
+
+def test_prometheus_logger_bounds_end_user_cardinality(monkeypatch):
+    """
+    PrometheusLogger metrics are wrapped, end users above the limit are emitted as __other__
+    """
+    from litellm.integrations.prometheus_helpers.prometheus_label_limiter import (
+        BoundedLabelsMetric,
+    )
+
+    monkeypatch.setattr(litellm, "prometheus_label_cardinality_limits", {"end_user": 2})
+    for collector in list(REGISTRY._collector_to_names.keys()):
+        REGISTRY.unregister(collector)
+    with patch("litellm.proxy.proxy_server.premium_user", True):
+        prometheus_logger = PrometheusLogger()
+
+    assert isinstance(prometheus_logger.litellm_spend_metric, BoundedLabelsMetric)
+    for i in range(3):
+        prometheus_logger.litellm_spend_metric.labels(
+            f"end-user-{i}", "hash", "alias", "gpt-4o", "team", "team_alias", "user"
+        ).inc(0.1)
+
+    def _value(end_user):
+        return REGISTRY.get_sample_value(
+            "litellm_spend_metric_total",
+            {
+                "end_user": end_user,
+                "hashed_api_key": "hash",
+                "api_key_alias": "alias",
+                "model": "gpt-4o",
+                "team": "team",
+                "team_alias": "team_alias",
+                "user": "user",
+            },
+        )
+
+    assert _value("end-user-0") == 0.1
+    assert _value("end-user-1") == 0.1
+    assert _value("end-user-2") is None
+    assert _value("__other__") == 0.1
+
+
+def test_prometheus_label_cardinality_is_not_limited_by_default():
+    assert litellm.prometheus_label_cardinality_limits is None
@@ -320,3 +320,65 @@ async def test_pass_through_request_logging_failure_with_stream(
         assert content is not None
         if isinstance(content, bytes):
             assert len(content) > 0
+
+
+@pytest.mark.asyncio
+async def test_pass_through_request_raw(mock_user_api_key_dict):
+    """
+    Test that raw pass-through endpoints stream the request body unchanged, and stream back the response
+    """
+    request_chunks = [b"\x00\x01 not json", b" - file upload \xff"]
+
+    class MockRawRequest:
+        def __init__(self):
+            self.headers = {
+                "content-type": "application/octet-stream",
+                "content-length": str(sum(len(c) for c in request_chunks)),
+            }
+            self.query_params = type("QueryParams", (), {"_dict": {}})()
+            self.method = "PUT"
+
+        async def body(self) -> bytes:
+            raise AssertionError("raw pass-through should not read the request body")
+
+        async def stream(self):
+            for chunk in request_chunks:
+                yield chunk
+
+    sent_requests = []
+
+    async def mock_send(self, request, stream=False):
+        sent_requests.append((request, await request.aread()))
+        assert stream is True
+
+        async def response_stream():
+            for chunk in [b"hello", b" world"]:
+                yield chunk
+
+        return httpx.Response(
+            status_code=200,
+            headers={"content-type": "text/plain"},
+            content=response_stream(),
+            request=request,
+        )
+
+    with patch("httpx.AsyncClient.send", new=mock_send), patch(
+        "litellm.proxy.pass_through_endpoints.streaming_handler.PassThroughStreamingHandler._log_raw_response",
+        new=AsyncMock(),
+    ) as mock_log_raw_response:
+        response = await pass_through_request(
+            request=MockRawRequest(),
+            target="https://example.com/v1/files",
+            custom_headers={"Authorization": "Bearer sk-1234"},
+            user_api_key_dict=mock_user_api_key_dict,
+            raw_pass_through=True,
+        )
+        chunks = [chunk async for chunk in response.body_iterator]
+
+    assert b"".join(chunks) == b"hello world"
+    request, request_body = sent_requests[0]
+    assert request.method == "PUT"
+    assert request_body == b"".join(request_chunks)
+    assert request.headers["content-type"] == "application/octet-stream"
+    assert request.headers["authorization"] == "Bearer sk-1234"
+    assert mock_log_raw_response.call_args.kwargs["logged_bytes"] == b"hello world"
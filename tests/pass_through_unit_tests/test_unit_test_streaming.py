@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 import sys
@@ -117,3 +118,35 @@ def test_convert_raw_bytes_to_str_lines():
     raw_bytes = [b'data: {"content": "Hello"}\n\n', b'\ndata: {"content": "World"}\n']
     result = PassThroughStreamingHandler._convert_raw_bytes_to_str_lines(raw_bytes)
     assert result == ['data: {"content": "Hello"}', 'data: {"content": "World"}']
+
+
+@pytest.mark.asyncio
+async def test_raw_chunk_processor_caps_logged_bytes():
+    """
+    Test that raw_chunk_processor yields every chunk, but only keeps max_logged_bytes for logging
+    """
+    raw_chunks = [b"a" * 10, b"b" * 10, b"c" * 10]
+
+    async def response_stream():
+        for chunk in raw_chunks:
+            yield chunk
+
+    response = httpx.Response(status_code=200, content=response_stream())
+    litellm_logging_obj = MagicMock()
+    litellm_logging_obj.async_success_handler = AsyncMock()
+
+    received_chunks = [
+        chunk
+        async for chunk in PassThroughStreamingHandler.raw_chunk_processor(
+            response=response,
+            litellm_logging_obj=litellm_logging_obj,
+            start_time=datetime.now(),
+            max_logged_bytes=15,
+        )
+    ]
+    assert received_chunks == raw_chunks
+    assert response.is_closed
+
+    await asyncio.sleep(0.1)  # logging runs on a background task
+    result = litellm_logging_obj.async_success_handler.call_args.kwargs["result"]
+    assert result["response"] == "a" * 10 + "b" * 5 + "... [truncated, logged 15 of 30 bytes]"
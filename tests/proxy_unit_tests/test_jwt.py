@@ -1026,3 +1026,154 @@ def test_get_public_key_from_jwk_url():
 
     assert public_key is not None
     assert public_key == jwk_response[0]
+
+
+def _generate_jwt_key_pair():
+    import json
+
+    import jwt
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    key = rsa.generate_private_key(
+        public_exponent=65537, key_size=2048, backend=default_backend()
+    )
+    private_key = key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode("utf-8")
+    public_jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(key.public_key()))
+    public_jwk["kid"] = "test-kid"
+    return private_key, public_jwk
+
+
+async def _setup_jwt_handler(public_jwk: dict, **jwtauth_kwargs) -> JWTHandler:
+    cache = DualCache()
+    await cache.async_set_cache(key="litellm_jwt_auth_keys", value=[public_jwk])
+    jwt_handler = JWTHandler()
+    jwt_handler.update_environment(
+        prisma_client=None,
+        user_api_key_cache=cache,
+        litellm_jwtauth=LiteLLM_JWTAuth(**jwtauth_kwargs),
+    )
+    return jwt_handler
+
+
+def _generate_token(private_key: str, sub: str) -> str:
+    import jwt
+
+    expiration_time = int((datetime.now() + timedelta(minutes=10)).timestamp())
+    return jwt.encode(
+        {"sub": sub, "exp": expiration_time},
+        private_key,
+        algorithm="RS256",
+        headers={"kid": "test-kid"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_auth_jwt_caches_verified_claims(monkeypatch):
+    """
+    A token is only verified once, until it expires
+    """
+    import jwt
+
+    monkeypatch.setenv("JWT_PUBLIC_KEY_URL", "https://example.com/jwks")
+    monkeypatch.delenv("JWT_AUDIENCE", raising=False)
+    private_key, public_jwk = _generate_jwt_key_pair()
+    jwt_handler = await _setup_jwt_handler(public_jwk)
+    token = _generate_token(private_key, sub="service-a")
+
+    with patch.object(jwt, "decode", wraps=jwt.decode) as mock_decode:
+        for _ in range(3):
+            response = await jwt_handler.auth_jwt(token=token)
+            assert response["sub"] == "service-a"
+        assert mock_decode.call_count == 1
+
+        # expired cache entries are verified again
+        token_hash, (claims, _, kid, verification_key) = next(
+            iter(jwt_handler._verified_token_cache.items())
+        )
+        jwt_handler._verified_token_cache[token_hash] = (
+            claims,
+            time.time() - 1,
+            kid,
+            verification_key,
+        )
+        await jwt_handler.auth_jwt(token=token)
+        assert mock_decode.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_auth_jwt_cached_token_rejected_after_key_is_removed(monkeypatch):
+    """
+    A cached token is not accepted once its key is no longer in the refreshed public keys
+    """
+    monkeypatch.setenv("JWT_PUBLIC_KEY_URL", "https://example.com/jwks")
+    monkeypatch.delenv("JWT_AUDIENCE", raising=False)
+    private_key, public_jwk = _generate_jwt_key_pair()
+    jwt_handler = await _setup_jwt_handler(public_jwk)
+    token = _generate_token(private_key, sub="service-a")
+
+    response = await jwt_handler.auth_jwt(token=token)
+    assert response["sub"] == "service-a"
+
+    # the public keys expire, and the refreshed keys no longer include the token's key
+    _, other_public_jwk = _generate_jwt_key_pair()
+    other_public_jwk["kid"] = "other-kid"
+    await jwt_handler.user_api_key_cache.async_set_cache(
+        key="litellm_jwt_auth_keys", value=[other_public_jwk]
+    )
+    jwt_handler._verification_keys_loaded_at = (
+        time.time() - jwt_handler.litellm_jwtauth.public_key_ttl - 1
+    )
+
+    with pytest.raises(Exception, match="No matching public key found"):
+        await jwt_handler.auth_jwt(token=token)
+
+
+@pytest.mark.asyncio
+async def test_auth_jwt_verified_token_cache_is_bounded(monkeypatch):
+    monkeypatch.setenv("JWT_PUBLIC_KEY_URL", "https://example.com/jwks")
+    monkeypatch.delenv("JWT_AUDIENCE", raising=False)
+    private_key, public_jwk = _generate_jwt_key_pair()
+    jwt_handler = await _setup_jwt_handler(public_jwk, verified_token_cache_size=2)
+
+    for sub in ["service-a", "service-b", "service-c"]:
+        await jwt_handler.auth_jwt(token=_generate_token(private_key, sub=sub))
+
+    assert len(jwt_handler._verified_token_cache) == 2
+    cached_subs = [
+        claims["sub"] for claims, *_ in jwt_handler._verified_token_cache.values()
+    ]
+    assert cached_subs == ["service-b", "service-c"]
+
+
+@pytest.mark.asyncio
+async def test_public_keys_refreshed_in_background(monkeypatch):
+    """
+    Parsed public keys are reused, and refreshed in the background before `public_key_ttl` expires
+    """
+    monkeypatch.setenv("JWT_PUBLIC_KEY_URL", "https://example.com/jwks")
+    _, public_jwk = _generate_jwt_key_pair()
+    jwt_handler = await _setup_jwt_handler(public_jwk, public_key_ttl=600)
+
+    verification_key = await jwt_handler.get_verification_key(kid="test-kid")
+    assert verification_key is not None
+    assert await jwt_handler.get_verification_key(kid="test-kid") is verification_key
+
+    jwt_handler._verification_keys_loaded_at = time.time() - 500
+    with patch.object(
+        jwt_handler, "_fetch_public_keys", new=AsyncMock(return_value=[public_jwk])
+    ) as mock_fetch_public_keys:
+        # stale keys are still served while the refresh runs
+        assert (
+            await jwt_handler.get_verification_key(kid="test-kid") is verification_key
+        )
+        await jwt_handler._public_key_refresh_task
+
+    mock_fetch_public_keys.assert_called_once()
+    assert time.time() - jwt_handler._verification_keys_loaded_at < 5
+    assert "test-kid" in jwt_handler._verification_keys
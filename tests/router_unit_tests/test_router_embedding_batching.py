@@ -0,0 +1,189 @@
+import asyncio
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+import litellm
+from litellm import Router
+from litellm.llms.OpenAI.openai import OpenAIChatCompletion
+from litellm.router_utils.embedding_batcher import (
+    EmbeddingBatcher,
+    get_embedding_batch_limits,
+)
+from litellm.types.router import EmbeddingBatchingArgs
+
+
+def _embedding_response(inputs, prompt_tokens):
+    return litellm.EmbeddingResponse(
+        model="text-embedding-3-small",
+        data=[
+            {"embedding": [float(len(text))], "index": i, "object": "embedding"}
+            for i, text in enumerate(inputs)
+        ],
+        usage=litellm.Usage(
+            prompt_tokens=prompt_tokens, completion_tokens=0, total_tokens=prompt_tokens
+        ),
+    )
+
+
+def test_embedding_batch_limits():
+    args = EmbeddingBatchingArgs(max_batch_size=100)
+    assert get_embedding_batch_limits("openai", "text-embedding-3-small", args) == (
+        100,
+        300_000,
+    )
+    assert get_embedding_batch_limits("bedrock", "cohere.embed-english-v3", args) == (
+        96,
+        None,
+    )
+    assert (
+        get_embedding_batch_limits("bedrock", "amazon.titan-embed-text-v1", args)
+        is None
+    )
+    assert get_embedding_batch_limits("cohere", "embed-english-v3.0", args) is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_are_batched():
+    batcher = EmbeddingBatcher(embedding_batching_args=EmbeddingBatchingArgs())
+    sent_batches = []
+
+    async def send_batch(inputs):
+        sent_batches.append(inputs)
+        return _embedding_response(inputs, prompt_tokens=100)
+
+    inputs = [["a"], ["bb", "ccc"], ["dddd"]]
+    responses = await asyncio.gather(
+        *[
+            batcher.async_embed(
+                batch_key="deployment-1",
+                input=input,
+                model="text-embedding-3-small",
+                max_batch_size=2048,
+                max_batch_tokens=None,
+                send_batch=send_batch,
+            )
+            for input in inputs
+        ]
+    )
+
+    assert sent_batches == [["a", "bb", "ccc", "dddd"]]
+    for input, response in zip(inputs, responses):
+        assert [item["embedding"] for item in response.data] == [
+            [float(len(text))] for text in input
+        ]
+        assert [item["index"] for item in response.data] == list(range(len(input)))
+    assert sum(response.usage.prompt_tokens for response in responses) == 100
+    assert responses[1].usage.prompt_tokens > responses[0].usage.prompt_tokens
+
+
+@pytest.mark.asyncio
+async def test_batch_is_sent_at_max_batch_size():
+    batcher = EmbeddingBatcher(
+        embedding_batching_args=EmbeddingBatchingArgs(max_wait_ms=10_000)
+    )
+    sent_batches = []
+
+    async def send_batch(inputs):
+        sent_batches.append(inputs)
+        return _embedding_response(inputs, prompt_tokens=len(inputs))
+
+    await asyncio.wait_for(
+        asyncio.gather(
+            *[
+                batcher.async_embed(
+                    batch_key="deployment-1",
+                    input=[str(i)],
+                    model="text-embedding-3-small",
+                    max_batch_size=2,
+                    max_batch_tokens=None,
+                    send_batch=send_batch,
+                )
+                for i in range(4)
+            ]
+        ),
+        timeout=1,
+    )
+
+    assert sent_batches == [["0", "1"], ["2", "3"]]
+
+
+@pytest.mark.asyncio
+async def test_batch_error_is_raised_to_every_call():
+    batcher = EmbeddingBatcher(embedding_batching_args=EmbeddingBatchingArgs())
+
+    async def send_batch(inputs):
+        raise litellm.RateLimitError(
+            message="rate limited",
+            llm_provider="openai",
+            model="text-embedding-3-small",
+        )
+
+    results = await asyncio.gather(
+        *[
+            batcher.async_embed(
+                batch_key="deployment-1",
+                input=["hello"],
+                model="text-embedding-3-small",
+                max_batch_size=2048,
+                max_batch_tokens=None,
+                send_batch=send_batch,
+            )
+            for _ in range(3)
+        ],
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, litellm.RateLimitError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_router_batches_aembedding_calls():
+    router = Router(
+        model_list=[
+            {
+                "model_name": "text-embedding-3-small",
+                "litellm_params": {
+                    "model": "openai/text-embedding-3-small",
+                    "api_key": "my-fake-key",
+                },
+            }
+        ],
+        embedding_batching_args={"max_wait_ms": 50},
+    )
+    sent_batches = []
+
+    class _FakeResponse:
+        def __init__(self, inputs):
+            self.inputs = inputs
+
+        def model_dump(self):
+            return _embedding_response(self.inputs, prompt_tokens=30).model_dump()
+
+    async def make_openai_embedding_request(self, openai_aclient, data, timeout):
+        sent_batches.append(data["input"])
+        return {}, _FakeResponse(data["input"])
+
+    with patch.object(
+        OpenAIChatCompletion,
+        "make_openai_embedding_request",
+        make_openai_embedding_request,
+    ):
+        responses = await asyncio.gather(
+            *[
+                router.aembedding(model="text-embedding-3-small", input=input)
+                for input in ["hello", ["good", "morning"], "hi"]
+            ]
+        )
+
+    assert sent_batches == [["hello", "good", "morning", "hi"]]
+    assert [len(response.data) for response in responses] == [1, 2, 1]
+    assert responses[1].data[1]["embedding"] == [float(len("morning"))]
+    assert sum(response.usage.prompt_tokens for response in responses) == 30
+    for response in responses:
+        assert response._hidden_params["model_id"] is not None
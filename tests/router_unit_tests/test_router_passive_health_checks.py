@@ -0,0 +1,157 @@
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+import litellm
+from litellm import Router
+from litellm.router_utils.cooldown_handlers import _async_get_cooldown_deployments
+from litellm.router_utils.deployment_health import DeploymentHealthTracker
+from litellm.types.router import PassiveHealthCheckArgs
+
+
+def _router(**passive_health_check_args) -> Router:
+    return Router(
+        model_list=[
+            {
+                "model_name": "gpt-3.5-turbo",
+                "litellm_params": {
+                    "model": "openai/gpt-3.5-turbo",
+                    "api_key": "my-fake-key",
+                    "mock_response": "hello",
+                },
+                "model_info": {"id": "deployment-{}".format(i)},
+            }
+            for i in range(2)
+        ],
+        passive_health_check_args=passive_health_check_args,
+        allowed_fails=100,  # only passive health checks put deployments in cooldown
+    )
+
+
+def _request_kwargs(deployment_id: str, exception=None) -> dict:
+    return {
+        "litellm_params": {
+            "metadata": {"model_group": "gpt-3.5-turbo"},
+            "model_info": {"id": deployment_id},
+        },
+        "exception": exception,
+    }
+
+
+def _record_failures(router: Router, deployment_id: str, num_failures: int):
+    start_time = datetime.now()
+    for _ in range(num_failures):
+        router.deployment_callback_on_failure(
+            kwargs=_request_kwargs(
+                deployment_id,
+                exception=litellm.InternalServerError(
+                    message="server error",
+                    llm_provider="openai",
+                    model="gpt-3.5-turbo",
+                ),
+            ),
+            completion_response=None,
+            start_time=start_time,
+            end_time=start_time + timedelta(seconds=1),
+        )
+
+
+def test_deployment_health_score():
+    tracker = DeploymentHealthTracker(PassiveHealthCheckArgs(min_requests=4))
+    for _ in range(3):
+        tracker.record_success(deployment_id="1", latency=0.1)
+    # not enough requests to score yet
+    assert tracker.get_health_score(deployment_id="1") == 1.0
+
+    tracker.record_failure(
+        deployment_id="1",
+        exception=litellm.Timeout(
+            message="timeout", model="gpt-3.5-turbo", llm_provider="openai"
+        ),
+        latency=10,
+    )
+    stats = tracker.get_deployment_stats(deployment_id="1")
+    assert stats["health_score"] == 0.75
+    assert stats["error_classes"] == {"Timeout": 1}
+    assert stats["latency_p50"] == 0.1
+    assert stats["latency_p99"] == 10
+
+
+def test_deployment_health_score_ignores_request_errors():
+    tracker = DeploymentHealthTracker(PassiveHealthCheckArgs(min_requests=1))
+    tracker.record_success(deployment_id="1", latency=0.1)
+    for _ in range(5):
+        tracker.record_failure(
+            deployment_id="1",
+            exception=litellm.BadRequestError(
+                message="bad request", model="gpt-3.5-turbo", llm_provider="openai"
+            ),
+        )
+
+    assert tracker.get_health_score(deployment_id="1") == 1.0
+    assert tracker.get_deployment_stats(deployment_id="1")["error_classes"] == {
+        "BadRequestError": 5
+    }
+
+
+def test_filter_deployments_routes_away_from_unhealthy_and_slow_deployments():
+    tracker = DeploymentHealthTracker(PassiveHealthCheckArgs(min_requests=5))
+    deployments = [{"model_info": {"id": str(i)}} for i in range(3)]
+    for _ in range(10):
+        tracker.record_success(deployment_id="0", latency=0.1)
+        tracker.record_failure(deployment_id="1", exception=Exception("error"))
+        tracker.record_success(deployment_id="2", latency=5)
+
+    for _ in range(20):
+        assert tracker.filter_deployments(healthy_deployments=deployments) == [
+            {"model_info": {"id": "0"}}
+        ]
+
+
+@pytest.mark.asyncio
+async def test_router_passive_health_checks():
+    router = _router(min_requests=5, cooldown_health_score=0.2)
+    start_time = datetime.now()
+    for _ in range(5):
+        await router.deployment_callback_on_success(
+            kwargs=_request_kwargs("deployment-0"),
+            completion_response={},
+            start_time=start_time,
+            end_time=start_time + timedelta(seconds=0.5),
+        )
+    _record_failures(router, "deployment-1", num_failures=4)
+    assert router.deployment_health_tracker.get_health_score("deployment-1") == 1.0
+    assert (
+        await _async_get_cooldown_deployments(
+            litellm_router_instance=router, parent_otel_span=None
+        )
+        == []
+    )
+
+    for _ in range(10):
+        deployment = await router.async_get_available_deployment(
+            model="gpt-3.5-turbo",
+            messages=[{"role": "user", "content": "hi"}],
+        )
+        assert deployment["model_info"]["id"] in ["deployment-0", "deployment-1"]
+
+    # 5th failure, health score drops below the cooldown threshold
+    _record_failures(router, "deployment-1", num_failures=1)
+
+    cooldown_deployments = await _async_get_cooldown_deployments(
+        litellm_router_instance=router, parent_otel_span=None
+    )
+    assert cooldown_deployments == ["deployment-1"]
+    # a clean score after the cooldown
+    assert router.deployment_health_tracker.get_health_score("deployment-1") == 1.0
+    for _ in range(10):
+        deployment = await router.async_get_available_deployment(
+            model="gpt-3.5-turbo",
+            messages=[{"role": "user", "content": "hi"}],
+        )
+        assert deployment["model_info"]["id"] == "deployment-0"
@@ -0,0 +1,214 @@
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+from litellm import Router
+from litellm.litellm_core_utils.streaming_handler import CustomStreamWrapper
+from litellm.router_utils.request_hedging import (
+    RequestHedger,
+    _close_response,
+    async_wait_for_first_chunk,
+)
+from litellm.types.router import RequestHedgingArgs
+
+
+def _hedger(**request_hedging_args) -> RequestHedger:
+    hedger = RequestHedger(
+        request_hedging_args=RequestHedgingArgs(min_samples=10, **request_hedging_args)
+    )
+    for _ in range(10):
+        hedger.record_latency(model_group="gpt-3.5-turbo", latency=0.05)
+    return hedger
+
+
+def _router(**request_hedging_args) -> Router:
+    return Router(
+        model_list=[
+            {
+                "model_name": "gpt-3.5-turbo",
+                "litellm_params": {
+                    "model": "openai/gpt-3.5-turbo",
+                    "api_key": "my-fake-key",
+                    "mock_response": mock_response,
+                    "mock_delay": mock_delay,
+                },
+                "model_info": {"id": mock_response},
+            }
+            for mock_response, mock_delay in [("slow", 2), ("fast", None)]
+        ],
+        request_hedging_args=request_hedging_args,
+    )
+
+
+def test_hedge_delay_is_latency_percentile():
+    hedger = RequestHedger(
+        request_hedging_args=RequestHedgingArgs(min_samples=10, latency_percentile=0.9)
+    )
+    for i in range(9):
+        hedger.record_latency(model_group="gpt-3.5-turbo", latency=i)
+    assert hedger.get_hedge_delay(model_group="gpt-3.5-turbo") is None
+
+    hedger.record_latency(model_group="gpt-3.5-turbo", latency=9)
+    assert hedger.get_hedge_delay(model_group="gpt-3.5-turbo") == 9
+    assert hedger.get_hedge_delay(model_group="gpt-4") is None
+
+
+@pytest.mark.asyncio
+async def test_slow_request_is_hedged():
+    hedger = _hedger(max_hedge_ratio=1.0)
+    primary_cancelled = asyncio.Event()
+
+    async def slow_call():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            primary_cancelled.set()
+            raise
+        return "slow"
+
+    async def fast_call():
+        return "fast"
+
+    async def get_hedge_call():
+        return fast_call
+
+    result = await hedger.async_run_with_hedging(
+        model_group="gpt-3.5-turbo",
+        primary_call=slow_call,
+        get_hedge_call=get_hedge_call,
+    )
+
+    assert result == "fast"
+    await asyncio.wait_for(primary_cancelled.wait(), timeout=1)
+    stats = hedger.get_stats()[0]
+    assert stats["num_requests"] == 1
+    assert stats["num_hedged_requests"] == 1
+    assert stats["num_hedge_wins"] == 1
+    # the cancelled primary's latency is recorded, as a lower bound
+    assert max(hedger._model_groups["gpt-3.5-turbo"].latencies) >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_failed_hedge_waits_for_primary():
+    hedger = _hedger(max_hedge_ratio=1.0)
+
+    async def slow_call():
+        await asyncio.sleep(0.2)
+        return "slow"
+
+    async def failing_call():
+        raise Exception("hedge failed")
+
+    async def get_hedge_call():
+        return failing_call
+
+    result = await hedger.async_run_with_hedging(
+        model_group="gpt-3.5-turbo",
+        primary_call=slow_call,
+        get_hedge_call=get_hedge_call,
+    )
+
+    assert result == "slow"
+    assert hedger.get_stats()[0]["num_hedge_wins"] == 0
+
+
+@pytest.mark.asyncio
+async def test_hedges_are_limited_by_budget():
+    hedger = _hedger(max_hedge_ratio=0.5)
+
+    async def slow_call():
+        await asyncio.sleep(0.1)
+        return "slow"
+
+    async def get_hedge_call():
+        return slow_call
+
+    for _ in range(4):
+        await hedger.async_run_with_hedging(
+            model_group="gpt-3.5-turbo",
+            primary_call=slow_call,
+            get_hedge_call=get_hedge_call,
+        )
+
+    stats = hedger.get_stats()[0]
+    assert stats["num_requests"] == 4
+    assert stats["num_hedged_requests"] == 2
+    assert stats["num_skipped_no_budget"] == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stream", [False, True])
+async def test_router_hedges_slow_deployment(stream):
+    router = _router(max_hedge_ratio=1.0, min_samples=10)
+    for _ in range(10):
+        router.request_hedger.record_latency(model_group="gpt-3.5-turbo", latency=0.1)
+
+    for _ in range(4):
+        start_time = time.time()
+        response = await router.acompletion(
+            model="gpt-3.5-turbo",
+            messages=[{"role": "user", "content": "hi"}],
+            stream=stream,
+        )
+        if stream:
+            content = ""
+            async for chunk in response:
+                content += chunk.choices[0].delta.content or ""
+        else:
+            content = response.choices[0].message.content
+        assert content == "fast"
+        assert time.time() - start_time < 1.5
+
+    stats = router.request_hedger.get_stats()[0]
+    assert stats["num_requests"] == 4
+    assert stats["num_hedge_wins"] == stats["num_hedged_requests"]
+
+
+@pytest.mark.asyncio
+async def test_router_records_latency_per_model_group():
+    router = Router(
+        model_list=[
+            {
+                "model_name": "gpt-3.5-turbo",
+                "litellm_params": {
+                    "model": "openai/gpt-3.5-turbo",
+                    "api_key": "my-fake-key",
+                    "mock_response": "hello",
+                },
+            }
+        ],
+        request_hedging_args={"min_samples": 1},
+    )
+    await router.acompletion(
+        model="gpt-3.5-turbo", messages=[{"role": "user", "content": "hi"}]
+    )
+    await asyncio.sleep(0.5)  # success callbacks run in the background
+
+    assert router.request_hedger.get_hedge_delay(model_group="gpt-3.5-turbo") >= 0
+
+
+@pytest.mark.asyncio
+async def test_closing_peeked_stream_closes_provider_stream():
+    provider_stream_closed = asyncio.Event()
+
+    async def provider_stream():
+        try:
+            for chunk in ["a", "b", "c"]:
+                yield chunk
+        finally:
+            provider_stream_closed.set()
+
+    class _Response(CustomStreamWrapper):
+        def __init__(self):
+            self.completion_stream = provider_stream()
+
+    response = await async_wait_for_first_chunk(_Response())
+    await _close_response(response)
+
+    assert provider_stream_closed.is_set()
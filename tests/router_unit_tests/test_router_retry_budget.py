@@ -0,0 +1,111 @@
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+import litellm
+from litellm import Router
+from litellm.router_utils.retry_budget import RetryBudget
+from litellm.types.router import RetryBudgetArgs
+
+
+def _router(model_list_params: dict, **router_kwargs) -> Router:
+    return Router(
+        model_list=[
+            {
+                "model_name": model_name,
+                "litellm_params": {
+                    "model": "openai/gpt-3.5-turbo",
+                    "api_key": "my-fake-key",
+                    **litellm_params,
+                },
+            }
+            for model_name, litellm_params in model_list_params.items()
+        ],
+        **router_kwargs,
+    )
+
+
+def test_retry_budget_token_bucket():
+    retry_budget = RetryBudget(
+        retry_budget_args=RetryBudgetArgs(retry_ratio=0.5, max_tokens=2)
+    )
+    assert retry_budget.try_acquire_retry(model_group="gpt-3.5-turbo") is True
+    assert retry_budget.try_acquire_retry(model_group="gpt-3.5-turbo") is True
+    assert retry_budget.try_acquire_retry(model_group="gpt-3.5-turbo") is False
+
+    retry_budget.record_request(model_group="gpt-3.5-turbo")
+    assert retry_budget.try_acquire_retry(model_group="gpt-3.5-turbo") is False
+    retry_budget.record_request(model_group="gpt-3.5-turbo")
+    assert retry_budget.try_acquire_retry(model_group="gpt-3.5-turbo") is True
+
+    # each model group has its own budget
+    assert retry_budget.try_acquire_retry(model_group="gpt-4") is True
+
+    stats = {s["model_group"]: s for s in retry_budget.get_stats()}
+    assert stats["gpt-3.5-turbo"]["num_requests"] == 2
+    assert stats["gpt-3.5-turbo"]["num_retries"] == 3
+    assert stats["gpt-3.5-turbo"]["num_retries_skipped"] == 2
+    assert stats["gpt-4"]["tokens"] == 1
+
+
+@pytest.mark.asyncio
+async def test_router_retries_limited_by_budget():
+    router = _router(
+        {"gpt-3.5-turbo": {"mock_response": "litellm.InternalServerError"}},
+        num_retries=3,
+        retry_budget_args={"retry_ratio": 0, "max_tokens": 1},
+    )
+
+    for _ in range(2):
+        with pytest.raises(litellm.InternalServerError):
+            await router.acompletion(
+                model="gpt-3.5-turbo", messages=[{"role": "user", "content": "hi"}]
+            )
+
+    stats = router.retry_budget.get_stats()[0]
+    assert stats["num_requests"] == 2
+    assert stats["num_retries"] == 1
+    assert stats["num_retries_skipped"] == 2
+
+
+@pytest.mark.asyncio
+async def test_router_skips_retries_after_deadline():
+    router = _router(
+        {"gpt-3.5-turbo": {"mock_response": "litellm.InternalServerError"}},
+        num_retries=3,
+        retry_after=5,  # sleep before each retry is longer than the deadline
+        end_to_end_timeout=1,
+    )
+
+    start_time = time.time()
+    with pytest.raises(litellm.InternalServerError):
+        await router.acompletion(
+            model="gpt-3.5-turbo", messages=[{"role": "user", "content": "hi"}]
+        )
+    assert time.time() - start_time < 1
+
+
+@pytest.mark.asyncio
+async def test_router_deadline_covers_fallbacks():
+    router = _router(
+        {
+            "slow-model": {"mock_response": "hello", "mock_delay": 2},
+            "fallback-model": {"mock_response": "hello"},
+        },
+        num_retries=0,
+        fallbacks=[{"slow-model": ["fallback-model"]}],
+    )
+
+    start_time = time.time()
+    with pytest.raises(litellm.Timeout):
+        await router.acompletion(
+            model="slow-model",
+            messages=[{"role": "user", "content": "hi"}],
+            end_to_end_timeout=0.5,
+        )
+    assert time.time() - start_time < 1.5